@@ -0,0 +1,231 @@
+"""
+Synthetic data generator for the benchmark suite
+
+Builds a reproducible database (same seed = same categories, items, tags,
+lists and usage history) of any size through DBManager. Timestamps are
+relative to the generation time, so date-windowed statistics ("today",
+"last 7 days") always see the same share of the history.
+
+Usage:
+    python benchmark_data.py bench.db --items 10000 --history 100000 --seed 42
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from database.frecency import frecency_weight
+from utils.logger import set_log_level
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEED = 42
+
+# Mismo esquema que crean los tests de frecencia/uso
+USAGE_HISTORY_DDL = """
+    CREATE TABLE IF NOT EXISTS item_usage_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, item_id INTEGER, used_at TIMESTAMP,
+        execution_time_ms INTEGER, success INTEGER, error_message TEXT
+    )
+"""
+
+WORDS = [
+    'git', 'docker', 'python', 'deploy', 'build', 'test', 'server', 'backup', 'logs', 'config',
+    'kubectl', 'npm', 'ssh', 'database', 'query', 'cache', 'proxy', 'token', 'release', 'branch',
+    'linux', 'windows', 'script', 'network', 'monitor', 'report', 'cliente', 'factura', 'ruta', 'proyecto',
+]
+TAGS = [f"{word}" for word in WORDS] + [f"tag{n}" for n in range(20)]
+ITEM_TYPES = ('TEXT', 'CODE', 'URL', 'PATH')
+ERRORS = ("Command not found", "Permission denied", "Timeout", "Exit code 1")
+
+# Historial repartido en los últimos 180 días
+HISTORY_DAYS = 180
+HISTORY_CHUNK = 50_000
+
+
+def _content(rng: random.Random, item_type: str, words: list) -> str:
+    """Plausible content for an item type"""
+    if item_type == 'URL':
+        return f"https://{words[0]}.example.com/{'/'.join(words[1:])}"
+    if item_type == 'PATH':
+        return "/home/user/" + "/".join(words)
+    if item_type == 'CODE':
+        return f"{words[0]} {' '.join('--' + word for word in words[1:])}"
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 25)))
+
+
+def generate_items(rng: random.Random, category_ids: list, n_items: int,
+                   sensitive_ratio: float = 0.05, list_ratio: float = 0.10) -> list:
+    """
+    Item dicts for DBManager.add_items_bulk
+
+    Args:
+        rng: Seeded random generator
+        category_ids: Categories to spread the items over
+        n_items: Number of items
+        sensitive_ratio: Share of encrypted items
+        list_ratio: Share of items grouped in lists (5 steps per list)
+
+    Returns:
+        List[Dict]: Item data, deterministic for a given rng state
+    """
+    items = []
+    list_steps = 0
+    list_group = None
+    for n in range(n_items):
+        words = rng.sample(WORDS, rng.randint(2, 4))
+        item_type = rng.choice(ITEM_TYPES)
+        data = {
+            'category_id': rng.choice(category_ids),
+            'label': f"{' '.join(words)} {n}",
+            'content': _content(rng, item_type, words),
+            'item_type': item_type,
+            'tags': rng.sample(TAGS, rng.randint(0, 4)),
+            'description': f"Descripción de {words[0]}" if rng.random() < 0.3 else None,
+            'is_sensitive': rng.random() < sensitive_ratio,
+            'is_favorite': rng.random() < 0.10,
+            'is_active': rng.random() >= 0.02,
+            'is_archived': rng.random() < 0.02,
+        }
+
+        # Los items de una lista comparten categoría y grupo
+        if list_steps == 0 and rng.random() < list_ratio / 5:
+            list_steps, list_group = 5, (data['category_id'], f"Lista {n}")
+        if list_steps:
+            data.update(category_id=list_group[0], is_list=True, list_group=list_group[1],
+                        orden_lista=5 - list_steps, item_type='CODE', is_sensitive=False)
+            list_steps -= 1
+        items.append(data)
+    return items
+
+
+def generate_history(rng: random.Random, item_ids: list, n_rows: int, now: float):
+    """
+    Usage history rows, yielded in chunks
+
+    Usage follows a skewed distribution (a few items get most uses), like
+    a real sidebar.
+
+    Args:
+        rng: Seeded random generator
+        item_ids: Items the uses refer to
+        n_rows: Number of history rows
+        now: Epoch seconds the history ends at
+
+    Yields:
+        List[tuple]: (item_id, used_at epoch, execution_time_ms, success, error_message)
+    """
+    n_ids = len(item_ids)
+    chunk = []
+    for _ in range(n_rows):
+        item_id = item_ids[min(n_ids - 1, int(rng.paretovariate(1.2)) - 1) if rng.random() < 0.7
+                           else rng.randrange(n_ids)]
+        used_at = now - rng.random() ** 2 * HISTORY_DAYS * 86400
+        success = rng.random() >= 0.05
+        chunk.append((item_id, used_at, int(rng.lognormvariate(4, 1)), success,
+                      None if success else rng.choice(ERRORS)))
+        if len(chunk) >= HISTORY_CHUNK:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _sqlite_time(epoch: float) -> str:
+    """Epoch seconds as a SQLite datetime('now') string (UTC)"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(epoch))
+
+
+def build_database(db_path: str, n_items: int, n_history: int = None, seed: int = DEFAULT_SEED,
+                   n_categories: int = None) -> dict:
+    """
+    Create a benchmark database
+
+    Args:
+        db_path: New database file (must not exist)
+        n_items: Number of items
+        n_history: Usage history rows (default: 10 per item)
+        seed: Random seed; the same seed always builds the same data
+        n_categories: Number of categories (default: scales with the items)
+
+    Returns:
+        Dict: Counts of the generated data and the generation time
+    """
+    if Path(db_path).exists():
+        raise FileExistsError(f"Benchmark database already exists: {db_path}")
+
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    now = time.time()
+    n_history = 10 * n_items if n_history is None else n_history
+    n_categories = n_categories or max(8, min(200, n_items // 100))
+
+    db = DBManager(db_path)
+    try:
+        category_ids = [db.add_category(f"{WORDS[n % len(WORDS)].capitalize()} {n}", "📁")
+                        for n in range(n_categories)]
+        items = generate_items(rng, category_ids, n_items)
+        item_ids = db.add_items_bulk(items)
+
+        db.execute_update(USAGE_HISTORY_DDL)
+        use_count, last_used, frecency = {}, {}, {}
+        with db.transaction():
+            conn = db.connect()
+            for chunk in generate_history(rng, item_ids, n_history, now):
+                conn.executemany(
+                    "INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success, error_message) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(item_id, _sqlite_time(used_at), ms, 1 if ok else 0, error)
+                     for item_id, used_at, ms, ok, error in chunk]
+                )
+                for item_id, used_at, _, _, _ in chunk:
+                    use_count[item_id] = use_count.get(item_id, 0) + 1
+                    if used_at > last_used.get(item_id, 0):
+                        last_used[item_id] = used_at
+                    frecency[item_id] = frecency.get(item_id, 0.0) + frecency_weight(used_at)
+
+            # Contadores de items coherentes con el historial
+            conn.executemany(
+                "UPDATE items SET use_count = ?, last_used = ?, frecency = ? WHERE id = ?",
+                [(count, _sqlite_time(last_used[item_id]), frecency[item_id], item_id)
+                 for item_id, count in use_count.items()]
+            )
+    finally:
+        db.close()
+
+    summary = {
+        'seed': seed,
+        'categories': n_categories,
+        'items': n_items,
+        'sensitive_items': sum(1 for item in items if item['is_sensitive']),
+        'list_items': sum(1 for item in items if item.get('is_list')),
+        'tagged_items': sum(1 for item in items if item['tags']),
+        'history_rows': n_history,
+        'generation_s': round(time.perf_counter() - start, 3),
+    }
+    logger.info(f"Benchmark database {db_path}: {summary}")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument('db_path', help="Database file to create")
+    parser.add_argument('--items', type=int, default=10_000, help="Number of items")
+    parser.add_argument('--history', type=int, default=None, help="Usage history rows (default: 10 per item)")
+    parser.add_argument('--categories', type=int, default=None, help="Number of categories")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Random seed")
+    args = parser.parse_args()
+
+    set_log_level('WARNING')
+    summary = build_database(args.db_path, args.items, args.history, args.seed, args.categories)
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,31 +8,54 @@ License: MIT
 """
 
 import sys
+import time
+
+_STARTUP_TIME = time.perf_counter()
+
+import os
 import logging
 import traceback
 from pathlib import Path
 from datetime import datetime
+
+# Startup profile mode: `python main.py --profile-startup` (or
+# WIDGET_SIDEBAR_PROFILE_STARTUP=1) writes startup_profile.txt with
+# import times (-X importtime style) and startup milestones
+PROFILE_STARTUP = '--profile-startup' in sys.argv or bool(os.environ.get('WIDGET_SIDEBAR_PROFILE_STARTUP'))
+startup_profiler = None
+
+if PROFILE_STARTUP:
+    if '--profile-startup' in sys.argv:
+        sys.argv.remove('--profile-startup')
+    sys.path.insert(0, str(Path(__file__).parent / 'src'))
+    from utils.startup_profiler import StartupProfiler
+    startup_profiler = StartupProfiler(start_time=_STARTUP_TIME)
+    startup_profiler.install()
+
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QTimer
 
 # Fix encoding for Windows console
 if sys.platform == 'win32' and sys.stdout:
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# Handle path for both script and bundled exe
+if not getattr(sys, 'frozen', False):
+    # Add src directory to Python path when running as a script
+    src_path = Path(__file__).parent / 'src'
+    sys.path.insert(0, str(src_path))
+
+from utils.logger import DEFAULT_LOG_LEVEL, set_log_level, setup_logging as setup_log_pipeline
+
+
 # Setup logging
 def setup_logging():
-    """Configure detailed logging to file"""
+    """Configure logging to a rotating file (written by a background thread)"""
     log_file = Path("widget_sidebar_error.log")
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8', mode='w'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # INFO until the database is open; main() applies the 'log_level' setting
+    setup_log_pipeline(log_file, level=os.environ.get('WIDGET_SIDEBAR_LOG_LEVEL', DEFAULT_LOG_LEVEL))
 
     logger = logging.getLogger(__name__)
     logger.info("="*70)
@@ -60,18 +83,11 @@ sys.excepthook = exception_hook
 # Setup logging
 logger = setup_logging()
 
-# Handle path for both script and bundled exe
-if not getattr(sys, 'frozen', False):
-    # Add src directory to Python path when running as a script
-    src_path = Path(__file__).parent / 'src'
-    sys.path.insert(0, str(src_path))
-
 from controllers.main_controller import MainController
 from views.main_window import MainWindow
+from views.theme import apply_theme
 from core.auth_manager import AuthManager
 from core.session_manager import SessionManager
-from views.first_time_wizard import FirstTimeWizard
-from views.login_dialog import LoginDialog
 
 
 def get_app_dir() -> Path:
@@ -126,6 +142,7 @@ def authenticate() -> bool:
     # Check if first time
     if auth_manager.is_first_time():
         logger.info("First time execution - showing FirstTimeWizard")
+        from views.first_time_wizard import FirstTimeWizard
         wizard = FirstTimeWizard()
         result = wizard.exec()
 
@@ -138,6 +155,7 @@ def authenticate() -> bool:
 
     # Show login dialog
     logger.info("No valid session - showing LoginDialog")
+    from views.login_dialog import LoginDialog
     login = LoginDialog()
     result = login.exec()
 
@@ -149,8 +167,34 @@ def authenticate() -> bool:
         return False
 
 
+def mark_startup(name: str) -> None:
+    """Record a startup milestone when running in profile mode"""
+    if startup_profiler:
+        startup_profiler.mark(name)
+
+
+def finish_startup_profile(app_dir: Path) -> None:
+    """
+    Mark first paint and write the startup profile once deferred work has run
+
+    Args:
+        app_dir: Directory where startup_profile.txt is written
+    """
+    mark_startup("first paint")
+
+    def write_report():
+        mark_startup("deferred startup done")
+        startup_profiler.uninstall()
+        report_path = startup_profiler.write_report(app_dir / "startup_profile.txt")
+        logger.info(f"Startup profile written to {report_path}")
+
+    # Deferred startup tasks were queued when the window was shown, so they run first
+    QTimer.singleShot(0, write_report)
+
+
 def main():
     """Main entry point for Widget Sidebar application"""
+    mark_startup("module imports done")
     try:
         logger.info("=" * 60)
         logger.info("Widget Sidebar v2.0.1 - SQLite Edition")
@@ -173,7 +217,9 @@ def main():
         logger.info("Initializing PyQt6 application...")
         app = QApplication(sys.argv)
         app.setApplicationName("Widget Sidebar")
+        apply_theme(app)  # Hoja de estilos compilada una sola vez para toda la app
         logger.info("PyQt6 application initialized")
+        mark_startup("QApplication created")
 
         # Authentication flow
         logger.info("=" * 60)
@@ -183,17 +229,22 @@ def main():
             logger.info("Authentication cancelled - exiting application")
             sys.exit(0)
         logger.info("Authentication successful")
+        mark_startup("authenticated")
         logger.info("=" * 60)
 
         # Initialize main controller with database path
         logger.info("Initializing MVC architecture...")
         controller = MainController()
         logger.info("MainController initialized")
+        if 'WIDGET_SIDEBAR_LOG_LEVEL' not in os.environ:
+            set_log_level(controller.get_setting('log_level', DEFAULT_LOG_LEVEL))
+        mark_startup("MainController initialized")
 
         # Create main window with controller
         logger.info("Creating main window...")
         window = MainWindow(controller)
         logger.info("MainWindow created")
+        mark_startup("MainWindow created")
 
         # Set controller's main_window reference for bidirectional communication
         controller.main_window = window
@@ -209,8 +260,12 @@ def main():
 
         # Show window
         logger.info("Showing window...")
+        if startup_profiler:
+            # Scheduled before show() so it runs ahead of the deferred startup tasks
+            QTimer.singleShot(0, lambda: finish_startup_profile(app_dir))
         window.show()
         logger.info("Window shown")
+        mark_startup("window shown")
 
         logger.info(f"[OK] Loaded {len(categories)} categories from SQLite")
         logger.info("[OK] UI fully functional")
@@ -221,6 +276,15 @@ def main():
         logger.info("Starting Qt event loop...")
         exit_code = app.exec()
         logger.info(f"Application exited with code: {exit_code}")
+
+        # Write pending clipboard history entries
+        controller.clipboard_manager.close()
+
+        # Clean shutdown: write startup snapshot for the next launch
+        if exit_code == 0:
+            controller.save_startup_snapshot()
+            # Repair blob reference counts (rows deleted with raw SQL)
+            controller.config_manager.db.collect_content_garbage()
         sys.exit(exit_code)
 
     except Exception as e:
@@ -0,0 +1,352 @@
+"""
+Performance benchmark suite
+
+Generates seeded synthetic databases (see benchmark_data.py) and times the
+hot paths of the application on each size: category loading, global and
+dashboard search, item and category filters, every StatsManager query and
+UsageTracker.track_usage throughput. Results are written as JSON so two
+runs (e.g. two commits) can be compared with --compare.
+
+Usage:
+    python run_benchmarks.py --sizes 1000 10000 --output bench.json
+    python run_benchmarks.py --sizes 100000 --history 2000000 --rounds 3
+    python run_benchmarks.py --compare before.json after.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from benchmark_data import DEFAULT_SEED, build_database
+from core.advanced_filter_engine import AdvancedFilterEngine
+from core.category_filter_engine import CategoryFilterEngine
+from core.config_manager import ConfigManager
+from core.dashboard_manager import DashboardManager
+from core.encryption_manager import EncryptionManager
+from core.metrics import metrics
+from core.search_engine import SearchEngine
+from core.stats_manager import StatsManager
+from core.usage_tracker import UsageTracker
+from utils.logger import set_log_level
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (1_000, 10_000)
+DEFAULT_ROUNDS = 5
+TRACK_USAGE_CALLS = 200
+
+# Consultas que no se refinan entre sí (cada ronda es una búsqueda nueva)
+SEARCH_QUERIES = ('docker', 'deploy 1', 'ruta', 'cache proxy', 'tag1')
+
+ITEM_FILTERS = {
+    'type': ['CODE', 'URL'],
+    'tags': {'values': ['git'], 'mode': 'OR'},
+    'use_count': {'operator': '>', 'value': 2},
+}
+CATEGORY_FILTERS = {
+    'is_active': True,
+    'item_count_min': 5,
+    'order_by': 'total_uses',
+    'order_direction': 'DESC',
+}
+DASHBOARD_SCOPES = {'categories': True, 'items': True, 'tags': True, 'content': True, 'fuzzy': False}
+
+# Regresión a partir de la cual --compare marca un benchmark
+REGRESSION_THRESHOLD = 0.10
+
+
+def measure(func, rounds: int, setup=None, warmup: int = 1) -> dict:
+    """
+    Time a function over several rounds
+
+    Args:
+        func: Called with the round number
+        rounds: Timed rounds
+        setup: Called before every round, outside the timing (e.g. to drop caches)
+        warmup: Untimed rounds run first
+
+    Returns:
+        Dict: min/median/mean/max milliseconds and the number of rounds
+    """
+    times = []
+    for n in range(warmup + rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func(n)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        if n >= warmup:
+            times.append(elapsed)
+    return {
+        'rounds': rounds,
+        'min_ms': round(min(times), 3),
+        'median_ms': round(statistics.median(times), 3),
+        'mean_ms': round(statistics.fmean(times), 3),
+        'max_ms': round(max(times), 3),
+    }
+
+
+class ErrorLog(logging.Handler):
+    """Collect the errors logged while a benchmark runs (StatsManager logs them and returns a fallback)"""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def stats_queries(stats: StatsManager, category_id: int) -> dict:
+    """Every StatsManager query, by name"""
+    return {
+        'get_most_used_items': lambda: stats.get_most_used_items(limit=10),
+        'get_most_used_items_week': lambda: stats.get_most_used_items(limit=10, days=7),
+        'get_trending_items': lambda: stats.get_trending_items(),
+        'get_top_items_by_category': lambda: stats.get_top_items_by_category(category_id),
+        'get_top_frecency_items': lambda: stats.get_top_frecency_items(),
+        'get_most_used_by_period': lambda: stats.get_most_used_by_period(),
+        'get_never_used_items': lambda: stats.get_never_used_items(),
+        'get_abandoned_items': lambda: stats.get_abandoned_items(),
+        'get_least_used_items': lambda: stats.get_least_used_items(),
+        'suggest_favorites': lambda: stats.suggest_favorites(),
+        'suggest_cleanup': lambda: stats.suggest_cleanup(),
+        'suggest_shortcuts': lambda: stats.suggest_shortcuts(),
+        'get_dashboard_stats': lambda: stats.get_dashboard_stats(),
+        'get_productivity_stats': lambda: stats.get_productivity_stats(),
+        'get_usage_by_category': lambda: stats.get_usage_by_category(),
+        'get_slowest_items': lambda: stats.get_slowest_items(),
+        'get_most_failing_items': lambda: stats.get_most_failing_items(),
+        'get_health_report': lambda: stats.get_health_report(),
+    }
+
+
+def run_size(db_path: str, rounds: int) -> tuple:
+    """
+    Run every benchmark against one generated database
+
+    Args:
+        db_path: Database built by benchmark_data.build_database
+        rounds: Timed rounds per benchmark
+
+    Returns:
+        Tuple: ({benchmark name: timing dict}, {failed benchmark name: error message})
+    """
+    results = {}
+    failed = {}
+
+    config = ConfigManager(db_path=db_path)
+    try:
+        def drop_categories_cache():
+            config._categories_cache = None
+        results['config.get_categories'] = measure(
+            lambda n: config.get_categories(), rounds, setup=drop_categories_cache
+        )
+        categories = config.get_categories()
+        all_items = [item for category in categories for item in category.items]
+
+        engine = SearchEngine()
+        results['search_engine.search'] = measure(
+            lambda n: engine.search(SEARCH_QUERIES[n % len(SEARCH_QUERIES)], categories), rounds
+        )
+        results['advanced_filter.apply_filters'] = measure(
+            lambda n: AdvancedFilterEngine().apply_filters(all_items, ITEM_FILTERS), rounds
+        )
+
+        dashboard = DashboardManager(config.db)
+        structure = dashboard.get_full_structure()
+        results['dashboard.search'] = measure(
+            lambda n: dashboard.search(SEARCH_QUERIES[n % len(SEARCH_QUERIES)], DASHBOARD_SCOPES, structure),
+            rounds
+        )
+        first_category_id = int(categories[0].id) if categories else 1
+    finally:
+        config.close()
+
+    category_filter = CategoryFilterEngine(db_path, cache_enabled=False)
+    results['category_filter.apply_filters'] = measure(
+        lambda n: category_filter.apply_filters(CATEGORY_FILTERS), rounds
+    )
+
+    # Una consulta que falla devuelve un resultado vacío: se marca como fallida, sin tiempos
+    stats = StatsManager(db_path)
+    errors = ErrorLog()
+    stats_logger = logging.getLogger(StatsManager.__module__)
+    stats_logger.addHandler(errors)
+    try:
+        for name, query in stats_queries(stats, first_category_id).items():
+            errors.messages.clear()
+            try:
+                timing = measure(lambda n: query(), rounds)
+            except Exception as e:
+                errors.messages.append(str(e))
+            if errors.messages:
+                failed[f'stats.{name}'] = errors.messages[0]
+            else:
+                results[f'stats.{name}'] = timing
+    finally:
+        stats_logger.removeHandler(errors)
+
+    # Rendimiento de escritura: un commit por uso, como en la aplicación
+    tracker = UsageTracker(db_path)
+    item_ids = [int(item.id) for item in all_items[:TRACK_USAGE_CALLS]] or [1]
+    timing = measure(
+        lambda n: [tracker.track_usage(item_ids[i % len(item_ids)], 10) for i in range(TRACK_USAGE_CALLS)],
+        rounds=1, warmup=0
+    )
+    timing['calls'] = TRACK_USAGE_CALLS
+    timing['ops_per_s'] = round(TRACK_USAGE_CALLS / (timing['mean_ms'] / 1000.0), 1)
+    results['usage_tracker.track_usage'] = timing
+
+    return results, failed
+
+
+def git_commit() -> str:
+    """Current commit of the repository ('' outside a git checkout)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def run_benchmarks(sizes, rounds: int = DEFAULT_ROUNDS, seed: int = DEFAULT_SEED,
+                   history_per_item: int = 10, history: int = None, workdir: str = None) -> dict:
+    """
+    Generate a database per size and benchmark it
+
+    The databases (and the encryption key of the sensitive items) live in
+    workdir, a temporary directory unless one is given.
+
+    Args:
+        sizes: Item counts to benchmark
+        rounds: Timed rounds per benchmark
+        seed: Generator seed
+        history_per_item: Usage history rows per item
+        history: Fixed number of usage history rows (overrides history_per_item)
+        workdir: Directory for the generated databases
+
+    Returns:
+        Dict: Run metadata and, per size, the dataset summary, timings and metrics
+    """
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'rounds': rounds,
+        'sizes': {},
+    }
+
+    cwd, previous_key = os.getcwd(), os.environ.get('ENCRYPTION_KEY')
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(workdir or tmp).resolve()
+        workdir.mkdir(parents=True, exist_ok=True)
+        os.chdir(workdir)  # EncryptionManager guarda la clave en .env del directorio actual
+        try:
+            # Fijar la clave en el entorno: ConfigManager carga después el .env de la aplicación
+            EncryptionManager()
+            load_dotenv(workdir / '.env', override=True)
+
+            for size in sizes:
+                db_path = str(workdir / f"bench_{size}_{seed}.db")
+                if Path(db_path).exists():
+                    Path(db_path).unlink()
+                print(f"Generating {size} items...")
+                dataset = build_database(db_path, size, history if history is not None else size * history_per_item,
+                                         seed)
+                print(f"  {dataset['history_rows']} history rows in {dataset['generation_s']} s")
+
+                metrics.reset()
+                benchmarks, failed = run_size(db_path, rounds)
+                report['sizes'][str(size)] = {
+                    'dataset': dataset,
+                    'benchmarks': benchmarks,
+                    'failed': failed,
+                    'metrics': metrics.snapshot()['histograms'],
+                }
+                for name, timing in benchmarks.items():
+                    print(f"  {name:<45} {timing['median_ms']:>10.2f} ms")
+                for name, error in failed.items():
+                    print(f"  {name:<45}     FAILED ({error})")
+        finally:
+            os.chdir(cwd)
+            if previous_key is None:
+                os.environ.pop('ENCRYPTION_KEY', None)
+            else:
+                os.environ['ENCRYPTION_KEY'] = previous_key
+
+    return report
+
+
+def compare(before: dict, after: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """
+    Median time changes between two reports
+
+    Args:
+        before: Baseline report
+        after: New report
+        threshold: Relative slowdown reported as a regression
+
+    Returns:
+        List[tuple]: (size, benchmark, before ms, after ms, relative change, is_regression)
+    """
+    rows = []
+    for size, data in after.get('sizes', {}).items():
+        baseline = before.get('sizes', {}).get(size, {}).get('benchmarks', {})
+        for name, timing in data['benchmarks'].items():
+            if name not in baseline:
+                continue
+            old, new = baseline[name]['median_ms'], timing['median_ms']
+            change = (new - old) / old if old else 0.0
+            rows.append((size, name, old, new, change, change > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the performance benchmark suite")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="Item counts to benchmark (e.g. 1000 10000 100000)")
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help="Timed rounds per benchmark")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Generator seed")
+    parser.add_argument('--history-per-item', type=int, default=10, help="Usage history rows per item")
+    parser.add_argument('--history', type=int, default=None, help="Fixed number of usage history rows")
+    parser.add_argument('--workdir', default=None, help="Keep the generated databases in this directory")
+    parser.add_argument('--output', default=None, help="JSON results file (default: benchmark_<commit>.json)")
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help="Compare two result files instead of running")
+    args = parser.parse_args()
+
+    set_log_level('WARNING')
+
+    if args.compare:
+        before, after = (json.loads(Path(path).read_text(encoding='utf-8')) for path in args.compare)
+        rows = compare(before, after)
+        for size, name, old, new, change, regression in rows:
+            flag = "  REGRESSION" if regression else ""
+            print(f"{size:>8} {name:<45} {old:>10.2f} -> {new:>10.2f} ms ({change:+.1%}){flag}")
+        sys.exit(1 if any(row[5] for row in rows) else 0)
+
+    report = run_benchmarks(args.sizes, args.rounds, args.seed, args.history_per_item, args.history, args.workdir)
+    output = Path(args.output or f"benchmark_{report['commit'] or 'local'}.json")
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
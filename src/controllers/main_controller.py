@@ -8,7 +8,7 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config_manager import ConfigManager
 from core.clipboard_manager import ClipboardManager
-from core.category_filter_engine import CategoryFilterEngine
+from core.clipboard_history_store import ClipboardHistoryStore
 from core.pinned_panels_manager import PinnedPanelsManager
 from controllers.clipboard_controller import ClipboardController
 from controllers.list_controller import ListController
@@ -25,8 +25,10 @@ class MainController:
     def __init__(self):
         # Initialize managers
         self.config_manager = ConfigManager(db_path="widget_sidebar.db")
-        self.clipboard_manager = ClipboardManager()
-        self.category_filter_engine = CategoryFilterEngine(db_path="widget_sidebar.db")
+        self.clipboard_manager = ClipboardManager(history_store=ClipboardHistoryStore(
+            self.config_manager.db, capacity=self.config_manager.get_setting('max_history', 20)
+        ))
+        self._category_filter_engine = None  # Created on first use (after first paint)
         self.pinned_panels_manager = PinnedPanelsManager(self.config_manager.db)
 
         # Initialize controllers
@@ -38,19 +40,49 @@ class MainController:
         self._all_categories: List[Category] = []  # Master list: ALL categories from DB
         self._filtered_categories: List[Category] = []  # Filtered categories for UI
         self._filters_active: bool = False  # Flag to track if filters are active
+        self._snapshot_pending: bool = False  # Categories come from the startup snapshot
         self.current_category: Optional[Category] = None
         self.main_window = None  # Will be set by main.py
 
-        # Load initial data
-        self.load_data()
+        # Load initial data (from the startup snapshot if available)
+        self.load_data(use_snapshot=True)
 
-    def load_data(self) -> None:
-        """Load configuration and categories"""
+    @property
+    def category_filter_engine(self):
+        """CategoryFilterEngine, created on first access"""
+        if self._category_filter_engine is None:
+            self.init_category_filter_engine()
+        return self._category_filter_engine
+
+    def init_category_filter_engine(self) -> None:
+        """Create the category filter engine if it doesn't exist yet"""
+        if self._category_filter_engine is None:
+            from core.category_filter_engine import CategoryFilterEngine
+            self._category_filter_engine = CategoryFilterEngine(db_path="widget_sidebar.db")
+            logger.debug("CategoryFilterEngine initialized")
+
+    def load_data(self, use_snapshot: bool = False) -> None:
+        """
+        Load configuration and categories
+
+        Args:
+            use_snapshot: Load categories from the startup snapshot when available.
+                          reconcile_startup_snapshot() must be called afterwards.
+        """
         print("Loading configuration...")
         self.config_manager.load_config()
 
-        print("Loading categories...")
-        self._all_categories = self.config_manager.load_default_categories()
+        snapshot_categories = self.config_manager.load_snapshot_categories() if use_snapshot else None
+
+        if snapshot_categories is not None:
+            print("Loading categories from startup snapshot...")
+            self._all_categories = snapshot_categories
+            self._snapshot_pending = True
+        else:
+            print("Loading categories...")
+            self._all_categories = self.config_manager.load_default_categories()
+            self._snapshot_pending = False
+
         self.categories = self._all_categories  # Initially, categories = all categories
         self._filters_active = False
 
@@ -58,6 +90,72 @@ class MainController:
         for cat in self.categories:
             print(f"  - {cat.name}: {len(cat.items)} items")
 
+    def read_startup_data(self) -> Optional[dict]:
+        """
+        Read what reconcile_startup_snapshot() applies (safe on a worker thread)
+
+        Returns:
+            Optional[dict]: ConfigManager.read_category_rows() data, or None if
+                            there is no snapshot to reconcile
+        """
+        if not self._snapshot_pending:
+            return None
+        try:
+            return self.config_manager.read_category_rows()
+        except Exception as e:
+            logger.error(f"Error reading startup data: {e}", exc_info=True)
+            return None
+
+    def reconcile_startup_snapshot(self, data: Optional[dict] = None) -> bool:
+        """
+        Replace snapshot categories with the real ones from the database
+
+        The sidebar is only reloaded if the database changed since the
+        snapshot was written (watermark mismatch).
+
+        Args:
+            data: Rows from read_startup_data() (read on a worker); read now if None
+
+        Returns:
+            bool: True if the database had changed
+        """
+        if not self._snapshot_pending:
+            return False
+
+        try:
+            if data is None:
+                data = self.config_manager.read_category_rows(self.config_manager.db)
+            changed = not self.config_manager.is_snapshot_current(data['watermark'])
+
+            # Snapshot items have no content: the real Items replace them even if
+            # nothing changed, but the painted sidebar is kept
+            self._all_categories = self.config_manager.load_categories_from_rows(data)
+            if not self._filters_active:
+                self.categories = self._all_categories
+            self._snapshot_pending = False
+
+            if changed:
+                logger.info("Startup snapshot is stale - refreshing sidebar")
+                if self.main_window and not self._filters_active:
+                    self.main_window.load_categories(self.categories)
+            else:
+                logger.info("Startup snapshot is up to date")
+
+            return changed
+
+        except Exception as e:
+            logger.error(f"Error reconciling startup snapshot: {e}", exc_info=True)
+            self._snapshot_pending = False
+            return False
+
+    def save_startup_snapshot(self) -> bool:
+        """Write the startup snapshot (called on clean shutdown)"""
+        try:
+            return self.config_manager.save_startup_snapshot()
+        except Exception as e:
+            logger.error(f"Error writing startup snapshot: {e}", exc_info=True)
+            return False
+
     def get_categories(self, include_filtered: bool = True) -> List[Category]:
         """
         Get categories
@@ -80,6 +178,10 @@ class MainController:
         """Get a specific category by ID"""
         return self.config_manager.get_category(category_id)
 
+    def get_categories_by_ids(self, category_ids: list) -> dict:
+        """Get several categories (with items) by ID in one bulk query"""
+        return self.config_manager.get_categories_by_ids(category_ids)
+
     def set_current_category(self, category_id: str) -> bool:
         """Set the currently active category"""
         category = self.get_category(category_id)
@@ -186,13 +288,35 @@ class MainController:
         except Exception as e:
             logger.error(f"Error loading all categories: {e}", exc_info=True)
 
+    def refresh_categories(self) -> None:
+        """
+        Re-read the categories after a category change, keeping active filters
+
+        With filters active only the master list is refreshed; the filtered
+        view is updated the next time the filters are applied.
+        """
+        try:
+            self.invalidate_filter_cache()
+            self._all_categories = self.config_manager.load_default_categories()
+            if self._filters_active:
+                return
+
+            self.categories = self._all_categories
+            if self.main_window:
+                self.main_window.load_categories(self.categories)
+            logger.info(f"Categories refreshed: {len(self.categories)} categories")
+
+        except Exception as e:
+            logger.error(f"Error refreshing categories: {e}", exc_info=True)
+
     def invalidate_filter_cache(self) -> None:
         """
         Invalidate filter engine cache when database changes
         This should be called after any category/item modifications
         """
         logger.debug("Invalidating filter engine cache")
-        self.category_filter_engine.clear_cache()
+        if self._category_filter_engine is not None:
+            self._category_filter_engine.clear_cache()
         # Also clear config manager cache
         if hasattr(self.config_manager, '_categories_cache'):
             self.config_manager._categories_cache = None
@@ -5,11 +5,16 @@ Motor de filtrado avanzado para items
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+import logging
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.item import Item, ItemType
+from core import item_columns
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
 
 
 class AdvancedFilterEngine:
@@ -22,12 +27,25 @@ class AdvancedFilterEngine:
     - Uso y popularidad (use_count, last_used)
     - Tags (multi-selección con AND/OR)
     - Fechas (created_at, last_used)
+
+    Con un ItemStore, los filtros de tipo/estado/uso/fechas y el orden numérico
+    se calculan sobre sus columnas (NumPy si está instalado) en vez de item a item.
     """
 
-    def __init__(self):
-        """Inicializar el motor de filtrado"""
+    def __init__(self, item_store=None):
+        """
+        Inicializar el motor de filtrado
+
+        Args:
+            item_store: ItemStore compartido (opcional) para el filtrado por columnas
+        """
         self.cache = {}  # Caché para resultados de filtros (optimización futura)
+        self.item_store = item_store
+        self._columns = None  # ColumnSnapshot del item_store
+        self._rows_key = None  # (id(lista), len, versión) de la última lista mapeada
+        self._rows = None  # Fila del store de cada item de esa lista
 
+    @metrics.timed('filter.items')
     def apply_filters(self, items: List[Item], filters: Dict[str, Any]) -> List[Item]:
         """
         Aplicar todos los filtros a la lista de items
@@ -50,6 +68,10 @@ class AdvancedFilterEngine:
         if not filters:
             return items
 
+        rows = self._store_rows(items)
+        if rows is not None:
+            return self._apply_column_filters(items, rows, filters)
+
         filtered = items.copy()
 
         # Aplicar cada filtro secuencialmente
@@ -90,6 +112,63 @@ class AdvancedFilterEngine:
 
         return filtered
 
+    def _store_rows(self, items: List[Item]):
+        """
+        Map each item to its row in the item store
+
+        Returns:
+            Rows (NumPy array or list) aligned with `items`, or None if some item
+            is not the store's shared Item (then the per-item filters are used)
+        """
+        store = self.item_store
+        if store is None or not items:
+            return None
+
+        key = (id(items), len(items), store.version)
+        if key == self._rows_key:
+            return self._rows
+
+        rows = []
+        for item in items:
+            row = store.row_of(item.id)
+            if row is None or store.item_at(row) is not item:
+                return None
+            rows.append(row)
+
+        if item_columns.HAS_NUMPY:
+            rows = item_columns.np.asarray(rows, dtype=item_columns.np.int64)
+        self._rows_key, self._rows = key, rows
+        return rows
+
+    def _apply_column_filters(self, items: List[Item], rows, filters: Dict[str, Any]) -> List[Item]:
+        """Apply the filters using the item store columns (same semantics as apply_filters)"""
+        self._columns = item_columns.snapshot(self.item_store, self._columns)
+        columns = self._columns
+
+        mask = item_columns.build_mask(columns, filters)
+        positions = item_columns.select_positions(mask, rows)
+
+        # Tags y orden alfabético siguen siendo por item
+        if filters.get('tags'):
+            matching = set(map(id, self._filter_by_tags([items[p] for p in positions], filters['tags'])))
+            positions = [p for p in positions if id(items[p]) in matching]
+
+        sort_by = filters.get('sort_by')
+        top_n = filters.get('top_n') or None
+        if sort_by in item_columns.VECTOR_SORTS:
+            column_name, descending = item_columns.VECTOR_SORTS[sort_by]
+            positions = item_columns.order_positions(
+                getattr(columns, column_name), rows, positions, descending, top_n
+            )
+            return [items[p] for p in positions]
+
+        filtered = [items[p] for p in positions]
+        if sort_by:
+            filtered = self._sort_items(filtered, sort_by)
+        if top_n:
+            filtered = filtered[:top_n]
+        return filtered
+
     def _filter_by_type(self, items: List[Item], types: List[str]) -> List[Item]:
         """
         Filtrar por tipo de item
@@ -120,20 +199,15 @@ class AdvancedFilterEngine:
         Returns:
             Items filtrados
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.debug(f"_filter_by_favorite called with {len(items)} items, is_favorite={is_favorite}")
-
         filtered = [
             item for item in items
             if hasattr(item, 'is_favorite') and item.is_favorite == is_favorite
         ]
 
-        logger.debug(f"_filter_by_favorite returning {len(filtered)} items")
-        for item in items[:3]:  # Log first 3 items for debugging
-            has_attr = hasattr(item, 'is_favorite')
-            value = getattr(item, 'is_favorite', None) if has_attr else None
-            logger.debug(f"  Item '{item.label}': has_is_favorite={has_attr}, value={value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"_filter_by_favorite: {len(filtered)}/{len(items)} items, is_favorite={is_favorite}")
+            for item in items[:3]:  # Log first 3 items for debugging
+                logger.debug(f"  Item '{item.label}': is_favorite={getattr(item, 'is_favorite', None)}")
 
         return filtered
 
@@ -377,6 +451,7 @@ class AdvancedFilterEngine:
             Items ordenados
 
         Opciones de sort_by:
+            - frecency: Frecuentes y recientes primero
             - use_count_desc: Más usados primero
             - use_count_asc: Menos usados primero
             - recent: Usados recientemente primero
@@ -384,7 +459,9 @@ class AdvancedFilterEngine:
             - label_asc: Alfabético A-Z
             - label_desc: Alfabético Z-A
         """
-        if sort_by == 'use_count_desc':
+        if sort_by == 'frecency':
+            return sorted(items, key=lambda x: x.frecency, reverse=True)
+        elif sort_by == 'use_count_desc':
             return sorted(items, key=lambda x: getattr(x, 'use_count', 0), reverse=True)
         elif sort_by == 'use_count_asc':
             return sorted(items, key=lambda x: getattr(x, 'use_count', 0))
@@ -24,6 +24,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.models.category import Category
+from core.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +70,7 @@ class CategoryFilterEngine:
         self._cache_hits = 0
         self._cache_misses = 0
 
+    @metrics.timed('filter.categories')
     def apply_filters(self, filters: Dict[str, Any]) -> List[Category]:
         """
         Aplicar filtros a las categorías
@@ -0,0 +1,243 @@
+"""
+Clipboard History Store
+In-memory ring (collections.deque) of recent copies, mirrored to the
+fixed-slot clipboard_history_ring table by a background writer thread.
+Adding an entry is O(1) and never touches the database on the calling thread.
+"""
+import logging
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from models.item import Item
+
+logger = logging.getLogger(__name__)
+
+# Reintentos de una escritura bloqueada por otra conexión (espera 0.05, 0.1, 0.2... s)
+WRITE_RETRIES = 6
+WRITE_RETRY_DELAY = 0.05
+
+
+class ClipboardHistory:
+    """Simple history entry for clipboard operations"""
+    def __init__(self, item: Item, timestamp: datetime, seq: int = 0):
+        self.item = item
+        self.timestamp = timestamp
+        self.seq = seq
+
+
+class ClipboardHistoryStore:
+    """Ring buffer of clipboard history entries with an optional SQLite mirror"""
+
+    def __init__(self, db=None, capacity: int = 20):
+        """
+        Args:
+            db: DBManager to mirror the history to (None = memory only)
+            capacity: Maximum number of entries (max_history)
+        """
+        self.db = db
+        self.capacity = max(int(capacity), 1)
+        self._entries = deque(maxlen=self.capacity)  # Newest first
+        self._seq = 0
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+
+        if self.db is not None:
+            self._load()
+
+    # ========== PUBLIC API ==========
+
+    def append(self, item: Item) -> ClipboardHistory:
+        """
+        Add a copied item (O(1); the database write happens off this thread)
+
+        Args:
+            item: Copied item
+
+        Returns:
+            ClipboardHistory: New entry
+        """
+        self._seq += 1
+        entry = ClipboardHistory(item, datetime.now(), self._seq)
+        self._entries.appendleft(entry)
+
+        if self.db is not None:
+            item_id = int(item.id) if str(item.id).isdigit() else None
+            # Sensitive content is never written to the history table in plain text
+            content = '' if item.is_sensitive else (item.content or '')
+            copied_at = entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+            capacity = self.capacity
+            self._submit(lambda db: db.write_history_slot(entry.seq, capacity, item_id, content, copied_at))
+
+        return entry
+
+    def get(self, limit: Optional[int] = None) -> List[ClipboardHistory]:
+        """
+        Get entries, newest first
+
+        Args:
+            limit: Maximum number of entries (None = all)
+        """
+        if limit is None:
+            return list(self._entries)
+        return list(islice(self._entries, limit))
+
+    def latest(self) -> Optional[ClipboardHistory]:
+        """Get the newest entry, or None if the history is empty"""
+        return self._entries[0] if self._entries else None
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._entries.clear()
+        if self.db is not None:
+            self._submit(lambda db: db.clear_history())
+
+    def set_capacity(self, capacity: int) -> None:
+        """
+        Change the ring capacity (max_history), keeping the newest entries
+
+        Args:
+            capacity: New maximum number of entries
+        """
+        capacity = max(int(capacity), 1)
+        if capacity == self.capacity:
+            return
+
+        self.capacity = capacity
+        self._entries = deque(islice(self._entries, capacity), maxlen=capacity)
+        if self.db is not None:
+            self._submit(lambda db: db.trim_history(keep_latest=capacity))
+        logger.info(f"Clipboard history capacity set to {capacity}")
+
+    def flush(self) -> None:
+        """Wait until all pending database writes are done"""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========== PRIVATE ==========
+
+    def _load(self) -> None:
+        """Load the persisted ring into memory"""
+        try:
+            self._seq = self.db.get_history_last_seq()
+            rows = self.db.get_history(self.capacity + 1)
+
+            # Rows written with another capacity are re-slotted once
+            if len(rows) > self.capacity or any(row['slot'] != row['seq'] % self.capacity for row in rows):
+                self.db.trim_history(keep_latest=self.capacity)
+                rows = rows[:self.capacity]
+
+            for row in rows:  # Newest first
+                item = Item(
+                    item_id=str(row['item_id']) if row.get('item_id') is not None else f"history_{row['seq']}",
+                    label=row.get('label') or (row['content'] or '')[:50],
+                    content=row['content'] or ''
+                )
+                try:
+                    timestamp = datetime.fromisoformat(str(row['copied_at']))
+                except ValueError:
+                    timestamp = datetime.now()
+                self._entries.append(ClipboardHistory(item, timestamp, row['seq']))
+
+            logger.debug(f"Clipboard history loaded: {len(self._entries)} entries")
+        except Exception as e:
+            logger.error(f"Error loading clipboard history: {e}", exc_info=True)
+
+    def _submit(self, operation: Callable) -> None:
+        """
+        Run a database operation on the writer thread
+
+        In-memory databases can't be opened from another connection, so their
+        operations run synchronously on the shared connection.
+        """
+        if str(self.db.db_path) == ":memory:":
+            self._run(operation, self.db)
+            return
+
+        if self._writer is None:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._writer_loop, args=(self._queue,), name="ClipboardHistoryWriter", daemon=True
+            )
+            self._writer.start()
+        self._queue.put(operation)
+
+    def _writer_loop(self, operations: queue.Queue) -> None:
+        """
+        Writer thread: own connection, so it never joins a UI-thread transaction
+
+        A write that still fails after its retries is kept and tried again
+        (before newer writes, to keep their order) when the next one arrives
+        and at close, instead of being dropped.
+        """
+        from database.db_manager import DBManager
+        db = DBManager(str(self.db.db_path))
+        failed = deque()
+        try:
+            while True:
+                operation = operations.get()
+                try:
+                    if operation is None:
+                        break
+                    failed.append(operation)
+                    while failed and self._run_with_retry(failed[0], db):
+                        failed.popleft()
+                finally:
+                    operations.task_done()
+
+            while failed and self._run_with_retry(failed[0], db):
+                failed.popleft()
+            if failed:
+                logger.error(f"Clipboard history: {len(failed)} writes could not be saved")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _run_with_retry(operation: Callable, db) -> bool:
+        """
+        Run a write, retrying while the database is locked
+
+        Returns:
+            bool: False if it is still locked (keep it for later); True when
+                  done or failed for another reason (retrying can't fix it)
+        """
+        for attempt in range(WRITE_RETRIES):
+            try:
+                operation(db)
+                return True
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) and 'busy' not in str(e):
+                    logger.error(f"Clipboard history write failed: {e}", exc_info=True)
+                    return True
+                logger.warning(f"Clipboard history write locked (attempt {attempt + 1}): {e}")
+                time.sleep(WRITE_RETRY_DELAY * 2 ** attempt)
+            except Exception as e:
+                logger.error(f"Clipboard history write failed: {e}", exc_info=True)
+                return True
+        return False
+
+    @staticmethod
+    def _run(operation: Callable, db) -> None:
+        try:
+            operation(db)
+        except Exception as e:
+            logger.error(f"Clipboard history write failed: {e}", exc_info=True)
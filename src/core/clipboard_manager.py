@@ -3,27 +3,36 @@ Clipboard Manager
 """
 import pyperclip
 from typing import Optional, List
-from datetime import datetime
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.item import Item
-
-
-class ClipboardHistory:
-    """Simple history entry for clipboard operations"""
-    def __init__(self, item: Item, timestamp: datetime):
-        self.item = item
-        self.timestamp = timestamp
+from core.clipboard_history_store import ClipboardHistory, ClipboardHistoryStore
 
 
 class ClipboardManager:
     """Manages clipboard operations"""
 
-    def __init__(self, max_history: int = 20):
-        self.max_history = max_history
-        self.history: List[ClipboardHistory] = []
+    def __init__(self, max_history: int = 20, history_store: Optional[ClipboardHistoryStore] = None):
+        """
+        Args:
+            max_history: Maximum history entries (when no history_store is given)
+            history_store: Shared history ring (e.g. mirrored to the database)
+        """
+        if history_store is None:
+            history_store = ClipboardHistoryStore(capacity=max_history)
+        self.history_store = history_store
+
+    @property
+    def max_history(self) -> int:
+        """Maximum number of history entries"""
+        return self.history_store.capacity
+
+    @property
+    def history(self) -> List[ClipboardHistory]:
+        """History entries, newest first"""
+        return self.history_store.get()
 
     def copy_text(self, content: str) -> bool:
         """Copy text to clipboard"""
@@ -62,28 +71,25 @@ class ClipboardManager:
 
     def add_to_history(self, item: Item) -> None:
         """Add item to clipboard history"""
-        # Create history entry
-        history_entry = ClipboardHistory(item, datetime.now())
-
-        # Add to beginning of list
-        self.history.insert(0, history_entry)
-
-        # Keep only max_history items
-        if len(self.history) > self.max_history:
-            self.history = self.history[:self.max_history]
+        self.history_store.append(item)
 
     def get_history(self, limit: Optional[int] = None) -> List[ClipboardHistory]:
         """Get clipboard history"""
-        if limit is None:
-            return self.history
-        return self.history[:limit]
+        return self.history_store.get(limit)
 
     def clear_history(self) -> None:
         """Clear clipboard history"""
-        self.history.clear()
+        self.history_store.clear()
+
+    def set_max_history(self, max_history: int) -> None:
+        """Change the maximum number of history entries"""
+        self.history_store.set_capacity(max_history)
 
     def get_last_copied(self) -> Optional[Item]:
         """Get the last copied item"""
-        if self.history:
-            return self.history[0].item
-        return None
+        entry = self.history_store.latest()
+        return entry.item if entry else None
+
+    def close(self) -> None:
+        """Flush pending history writes"""
+        self.history_store.close()
@@ -2,17 +2,21 @@
 Config Manager - SQLite Version
 Manages application configuration using SQLite database
 """
-import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 # Add models to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.category import Category
-from models.item import Item, ItemType
+from models.item import Item
 from database.db_manager import DBManager
 from core.encryption_manager import EncryptionManager
+from core.startup_snapshot import StartupSnapshot, SNAPSHOT_FILENAME
+from core.item_store import ItemStore, item_from_row
+from core.config_stream import (
+    LegacyJsonConfigWriter, NdjsonConfigWriter, is_ndjson_path, iter_records, open_text
+)
 
 
 class ConfigManager:
@@ -52,6 +56,15 @@ class ConfigManager:
         # Cache for categories
         self._categories_cache: Optional[List[Category]] = None
 
+        # Shared Item objects (the same instance for every view)
+        self.item_store = ItemStore()
+
+        # Startup snapshot next to the database (not used for in-memory databases)
+        if self.db_path == ":memory:":
+            self.startup_snapshot = None
+        else:
+            self.startup_snapshot = StartupSnapshot(Path(self.db_path).parent / SNAPSHOT_FILENAME)
+
     def load_config(self) -> Dict[str, Any]:
         """
         Load configuration from database (for backward compatibility)
@@ -93,17 +106,55 @@ class ConfigManager:
             return self._categories_cache
 
         # Load from database
-        categories_data = self.db.get_categories(include_inactive=False)
+        return self.load_categories_from_rows(self.read_category_rows(self.db))
+
+    def read_category_rows(self, db: Optional[DBManager] = None) -> Dict[str, Any]:
+        """
+        Read the category and item rows behind get_categories()
+
+        Without db a separate connection is opened, so this is safe on a
+        worker thread: it never touches self.db, the item store or the
+        category cache. Apply the result on the UI thread with
+        load_categories_from_rows().
+
+        Args:
+            db: Connection to read from (default: a new one)
+
+        Returns:
+            Dict: {'watermark': data watermark, 'categories': [rows], 'items': {category_id: [rows]}}
+        """
+        # Una BD en memoria no se puede abrir dos veces
+        own = db is None and self.db_path != ":memory:"
+        if db is None:
+            db = DBManager(self.db_path) if own else self.db
+
+        try:
+            watermark = db.get_data_watermark()
+            categories_data = db.get_categories(include_inactive=False)
+            items = {cat_data['id']: db.get_items_by_category(cat_data['id']) for cat_data in categories_data}
+            return {'watermark': watermark, 'categories': categories_data, 'items': items}
+        finally:
+            if own:
+                db.close()
+
+    def load_categories_from_rows(self, data: Dict[str, Any]) -> List[Category]:
+        """
+        Build (and cache) the categories from read_category_rows() data
+
+        Args:
+            data: Result of read_category_rows()
+
+        Returns:
+            List[Category]: List of Category objects
+        """
         categories = []
 
-        for cat_data in categories_data:
+        for cat_data in data['categories']:
             # Convert database dict to Category object
             category = self._dict_to_category(cat_data)
 
-            # Load items for this category
-            items_data = self.db.get_items_by_category(cat_data['id'])
-            for item_data in items_data:
-                item = self._dict_to_item(item_data)
+            # Items for this category
+            for item in self.item_store.upsert_rows(data['items'].get(cat_data['id'], [])):
                 category.add_item(item)
 
             categories.append(category)
@@ -112,6 +163,48 @@ class ConfigManager:
         self._categories_cache = categories
         return categories
 
+    def load_snapshot_categories(self) -> Optional[List[Category]]:
+        """
+        Load categories from the startup snapshot (labels/ids only, no content)
+
+        Returns:
+            Optional[List[Category]]: Snapshot categories, or None if unavailable
+        """
+        if not self.startup_snapshot:
+            return None
+        return self.startup_snapshot.load()
+
+    def is_snapshot_current(self, watermark: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether the loaded startup snapshot still matches the database
+
+        Args:
+            watermark: Watermark already read (e.g. by read_category_rows); read now if None
+
+        Returns:
+            bool: True if nothing changed since the snapshot was written
+        """
+        if not self.startup_snapshot:
+            return False
+        if watermark is None:
+            watermark = self.db.get_data_watermark()
+        return self.startup_snapshot.is_current(watermark)
+
+    def save_startup_snapshot(self) -> bool:
+        """
+        Write the startup snapshot from the current database state
+
+        Returns:
+            bool: True if successful
+        """
+        if not self.startup_snapshot:
+            return False
+
+        categories = self.db.get_categories(include_inactive=False)
+        items = self.db.get_item_summaries()
+        watermark = self.db.get_data_watermark()
+        return self.startup_snapshot.save(categories, items, watermark)
+
     def get_category(self, category_id) -> Optional[Category]:
         """
         Get a specific category by ID
@@ -146,8 +239,7 @@ class ConfigManager:
 
             # Load items
             items_data = self.db.get_items_by_category(cat_id)
-            for item_data in items_data:
-                item = self._dict_to_item(item_data)
+            for item in self.item_store.upsert_rows(items_data):
                 category.add_item(item)
 
             return category
@@ -155,6 +247,34 @@ class ConfigManager:
         except (ValueError, TypeError):
             return None
 
+    def get_categories_by_ids(self, category_ids: List) -> Dict[str, Category]:
+        """
+        Get several categories with their items using one query per table
+
+        Args:
+            category_ids: Category IDs (strings or ints)
+
+        Returns:
+            Dict[str, Category]: {category_id: Category} for the categories found
+        """
+        ids = []
+        for category_id in category_ids:
+            try:
+                ids.append(int(category_id))
+            except (ValueError, TypeError):
+                continue
+        ids = list(dict.fromkeys(ids))
+
+        categories = {}
+        items_by_category = self.db.get_items_by_categories(ids)
+
+        for cat_data in self.db.get_categories_by_ids(ids):
+            category = self._dict_to_category(cat_data)
+            category.items = self.item_store.upsert_rows(items_by_category[cat_data['id']])
+            categories[category.id] = category
+
+        return categories
+
     def add_category(self, category: Category) -> bool:
         """
         Add a new category
@@ -175,33 +295,20 @@ class ConfigManager:
             import logging
             logger = logging.getLogger(__name__)
 
-            # Add category to database WITH order_index
-            cat_id = self.db.add_category(
-                name=category.name,
-                icon=category.icon,
-                is_predefined=category.is_predefined,
-                order_index=category.order_index  # FIX: Pass order_index
-            )
-            logger.info(f"[ConfigManager] Category added to DB: {category.name} (ID: {cat_id}, order_index: {category.order_index})")
-
-            # Add items
-            for item in category.items:
-                item_id = self.db.add_item(
-                    category_id=cat_id,
-                    label=item.label,
-                    content=item.content,
-                    item_type=item.type.value.upper(),
-                    icon=item.icon,
-                    is_sensitive=item.is_sensitive,
-                    is_favorite=getattr(item, 'is_favorite', False),  # FIX: Add is_favorite
-                    tags=item.tags,
-                    description=item.description,
-                    working_dir=getattr(item, 'working_dir', None),
-                    color=getattr(item, 'color', None),  # FIX: Add color
-                    is_active=getattr(item, 'is_active', True),  # Add is_active (default True)
-                    is_archived=getattr(item, 'is_archived', False)  # Add is_archived (default False)
+            # Category and items in a single transaction (savepoint when nested, e.g. import_config)
+            with self.db.transaction():
+                # Add category to database WITH order_index
+                cat_id = self.db.add_category(
+                    name=category.name,
+                    icon=category.icon,
+                    is_predefined=category.is_predefined,
+                    order_index=category.order_index  # FIX: Pass order_index
                 )
-                logger.info(f"  [ConfigManager] Item added: {item.label} (ID: {item_id})")
+                logger.info(f"[ConfigManager] Category added to DB: {category.name} (ID: {cat_id}, order_index: {category.order_index})")
+
+                # Add items
+                item_ids = self.db.add_items_bulk([self._item_to_dict(item, cat_id) for item in category.items])
+                logger.info(f"  [ConfigManager] {len(item_ids)} items added to category {cat_id}")
 
             # Clear cache
             self._categories_cache = None
@@ -240,38 +347,32 @@ class ConfigManager:
             if cat_id is None:
                 return False
 
-            # Update category metadata
-            self.db.update_category(
-                category_id=cat_id,
-                name=updated_category.name,
-                icon=updated_category.icon,
-                order_index=updated_category.order_index,
-                is_active=updated_category.is_active
-            )
-
-            # Update items (simple approach: delete all and re-add)
-            # Get existing items
-            existing_items = self.db.get_items_by_category(cat_id)
-            for existing_item in existing_items:
-                self.db.delete_item(existing_item['id'])
-
-            # Add new items
-            for item in updated_category.items:
-                self.db.add_item(
-                    category_id=cat_id,
-                    label=item.label,
-                    content=item.content,
-                    item_type=item.type.value.upper(),
-                    icon=item.icon,
-                    is_sensitive=item.is_sensitive,
-                    is_favorite=getattr(item, 'is_favorite', False),  # FIX: Add is_favorite
-                    tags=item.tags,
-                    description=item.description,
-                    working_dir=getattr(item, 'working_dir', None),
-                    color=getattr(item, 'color', None),  # FIX: Add color
-                    is_active=getattr(item, 'is_active', True),  # Add is_active (default True)
-                    is_archived=getattr(item, 'is_archived', False)  # Add is_archived (default False)
-                )
+            stored_category = self.db.get_category(cat_id)
+            if stored_category is None:
+                return False
+
+            with self.db.transaction():
+                # Update category metadata (only the fields that changed)
+                metadata = {
+                    'name': updated_category.name,
+                    'icon': updated_category.icon,
+                    'order_index': updated_category.order_index,
+                    'is_active': updated_category.is_active
+                }
+                changed_metadata = {
+                    field: value for field, value in metadata.items()
+                    if not self._same_value(stored_category.get(field), value)
+                }
+                if changed_metadata:
+                    self.db.update_category(category_id=cat_id, **changed_metadata)
+
+                # Update items (diff against the stored rows by item id)
+                stats = self._reconcile_items(cat_id, updated_category.items)
+
+            # The editor works on copies: refresh the shared Items (and the
+            # store columns) from the rows that were just written
+            if stats['updated'] or stats['inserted']:
+                self.item_store.upsert_rows(self.db.get_items_by_category(cat_id))
 
             # Clear cache
             self._categories_cache = None
@@ -300,6 +401,7 @@ class ConfigManager:
                 return False
 
             self.db.delete_category(cat_id)
+            self.item_store.remove_category(cat_id)
 
             # Clear cache
             self._categories_cache = None
@@ -340,6 +442,23 @@ class ConfigManager:
             print(f"Error setting value: {e}")
             return False
 
+    def set_settings(self, settings: Dict[str, Any]) -> bool:
+        """
+        Set several settings at once (one transaction)
+
+        Args:
+            settings: key -> value
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            self.db.set_settings(settings)
+            return True
+        except Exception as e:
+            print(f"Error setting values: {e}")
+            return False
+
     def get_history(self, limit: int = 20) -> List[Dict]:
         """
         Get clipboard history
@@ -370,67 +489,131 @@ class ConfigManager:
             print(f"Error adding to history: {e}")
             return False
 
-    def export_config(self, export_path: Path) -> bool:
+    def export_config(self, export_path: Path, progress_callback: Optional[Callable[[int, int], None]] = None,
+                      batch_size: int = 500) -> bool:
         """
-        Export configuration to JSON file
+        Export configuration to a JSON or NDJSON file
+
+        Items are streamed from the database in batches, so memory stays
+        constant. Paths ending in .ndjson/.jsonl use the NDJSON format, any
+        other path the legacy JSON document; a .gz/.bz2/.xz suffix compresses
+        the output.
 
         Args:
             export_path: Path to export file
+            progress_callback: Optional callback(exported_items, total_items)
+            batch_size: Items read from the database per batch
 
         Returns:
             bool: True if successful
         """
+        import logging
+        logger = logging.getLogger(__name__)
+
         try:
-            # Get all data from database
             settings = self.db.get_all_settings()
-            categories = self.get_categories()
+            categories = self.db.get_categories()
+            total_items = sum(self.db.get_category_item_counts().get(cat['id'], 0) for cat in categories)
+
+            writer_class = NdjsonConfigWriter if is_ndjson_path(export_path) else LegacyJsonConfigWriter
+            exported_items = 0
 
-            export_data = {
-                "version": "3.0.0",
-                "settings": settings,
-                "categories": [cat.to_dict() for cat in categories]
-            }
+            with open_text(export_path, 'w') as f:
+                writer = writer_class(f)
+                writer.write_header(settings, {'categories': len(categories), 'items': total_items})
 
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+                for cat_data in categories:
+                    category_dict = self._dict_to_category(cat_data).to_dict()
+                    del category_dict['items']
+                    writer.write_category(category_dict)
 
+                    for rows in self.db.iter_items_by_category(cat_data['id'], batch_size):
+                        for row in rows:
+                            writer.write_item(self._dict_to_item(row).to_dict())
+                        exported_items += len(rows)
+                        if progress_callback:
+                            progress_callback(exported_items, total_items)
+
+                writer.close()
+
+            logger.info(f"Config exported to {export_path}: {len(categories)} categories, {exported_items} items")
             return True
 
         except Exception as e:
+            logger.error(f"Error exporting config: {e}", exc_info=True)
             print(f"Error exporting config: {e}")
             return False
 
-    def import_config(self, import_path: Path) -> bool:
+    def import_config(self, import_path: Path, progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+                      batch_size: int = 1000) -> bool:
         """
-        Import configuration from JSON file
+        Import configuration from a JSON or NDJSON file (optionally compressed)
+
+        NDJSON files are read record by record and items are inserted in
+        batches, all in a single transaction. Legacy JSON documents are
+        still accepted (they are loaded whole).
 
         Args:
             import_path: Path to import file
+            progress_callback: Optional callback(imported_items, total_items or None)
+            batch_size: Items inserted per executemany batch
 
         Returns:
             bool: True if successful
         """
-        try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Import settings
-            settings = data.get('settings', {})
-            for key, value in settings.items():
-                self.db.set_setting(key, value)
+        import logging
+        logger = logging.getLogger(__name__)
 
-            # Import categories
-            categories_data = data.get('categories', [])
-            for cat_data in categories_data:
-                category = Category.from_dict(cat_data)
-                if category.validate():
-                    self.add_category(category)
+        try:
+            imported_items = 0
+            total_items = None
+            pending_items = []
+
+            def flush_items():
+                nonlocal imported_items
+                if pending_items:
+                    imported_items += len(self.db.add_items_bulk(pending_items))
+                    pending_items.clear()
+                    if progress_callback:
+                        progress_callback(imported_items, total_items)
+
+            # One transaction for the whole import
+            with self.db.transaction():
+                cat_id = None
+
+                for record_type, data in iter_records(import_path):
+                    if record_type == 'header':
+                        # Import settings
+                        self.db.set_settings(data.get('settings', {}))
+                        total_items = data.get('counts', {}).get('items')
+
+                    elif record_type == 'category':
+                        flush_items()
+                        category = Category.from_dict(data)
+                        cat_id = None
+                        if category.validate():
+                            cat_id = self.db.add_category(
+                                name=category.name,
+                                icon=category.icon,
+                                is_predefined=category.is_predefined,
+                                order_index=category.order_index
+                            )
+
+                    elif cat_id is not None:
+                        pending_items.append(self._item_to_dict(Item.from_dict(data), cat_id))
+                        if len(pending_items) >= batch_size:
+                            flush_items()
+
+                flush_items()
+
+            logger.info(f"Config imported from {import_path}: {imported_items} items")
 
             # Clear cache
             self._categories_cache = None
             return True
 
         except Exception as e:
+            logger.error(f"Error importing config: {e}", exc_info=True)
             print(f"Error importing config: {e}")
             return False
 
@@ -460,6 +643,7 @@ class ConfigManager:
 
             # Clear cache
             self._categories_cache = None
+            self.item_store.clear()
             return True
 
         except Exception as e:
@@ -507,7 +691,7 @@ class ConfigManager:
 
     def _dict_to_item(self, data: Dict) -> Item:
         """
-        Convert database dict to Item object
+        Convert database dict to Item object (not shared through item_store)
 
         Args:
             data: Database row as dict
@@ -515,29 +699,83 @@ class ConfigManager:
         Returns:
             Item: Item object
         """
-        # Map database type to ItemType enum
-        type_str = data.get('type', 'TEXT').upper().lower()  # Convert from DB (TEXT/URL/CODE/PATH) to enum (text/url/code/path)
-        try:
-            item_type = ItemType(type_str)
-        except ValueError:
-            item_type = ItemType.TEXT
-
-        item = Item(
-            item_id=str(data['id']),  # Convert to string for compatibility
-            label=data['label'],
-            content=data['content'],
-            item_type=item_type,
-            icon=data.get('icon'),
-            is_sensitive=bool(data.get('is_sensitive', False)),
-            is_favorite=bool(data.get('is_favorite', False)),
-            tags=data.get('tags', []),
-            description=data.get('description'),
-            working_dir=data.get('working_dir'),
-            color=data.get('color'),
-            is_active=bool(data.get('is_active', True)),  # Add is_active (default True)
-            is_archived=bool(data.get('is_archived', False))  # Add is_archived (default False)
-        )
-        return item
+        return item_from_row(data)
+
+    def _reconcile_items(self, category_id: int, items: List[Item]) -> Dict[str, int]:
+        """
+        Write only the item changes of a category (INSERT/UPDATE/DELETE)
+
+        Items whose id matches a stored row are compared field by field and
+        updated only if something changed; unknown ids are inserted (and get
+        their new database id) and stored rows missing from `items` are deleted.
+        Must be called inside a transaction.
+
+        Args:
+            category_id: Category ID
+            items: Edited items of the category
+
+        Returns:
+            Dict[str, int]: Number of inserted, updated, deleted and unchanged items
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
+        stored_items = {str(row['id']): row for row in self.db.get_items_by_category(category_id)}
+        stats = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+        new_items = []
+        kept_ids = set()
+
+        for item in items:
+            item_data = self._item_to_dict(item, category_id)
+            stored = stored_items.get(str(item.id))
+
+            if stored is None or item.id in kept_ids:
+                new_items.append((item, item_data))
+                continue
+            kept_ids.add(item.id)
+
+            changes = {}
+            for field, value in item_data.items():
+                column = 'type' if field == 'item_type' else field
+                if column != 'category_id' and not self._same_value(stored.get(column), value):
+                    changes[column] = value
+
+            # Content must be rewritten (encrypted or decrypted) when sensitivity changes
+            if 'is_sensitive' in changes:
+                changes['content'] = item_data['content']
+
+            if changes:
+                self.db.update_item(int(stored['id']), **changes)
+                stats['updated'] += 1
+            else:
+                stats['unchanged'] += 1
+
+        for item_id in stored_items.keys() - kept_ids:
+            self.db.delete_item(int(item_id))
+            self.item_store.remove(item_id)
+            stats['deleted'] += 1
+
+        if new_items:
+            new_ids = self.db.add_items_bulk([item_data for _, item_data in new_items])
+            for (item, _), new_id in zip(new_items, new_ids):
+                item.id = str(new_id)
+            stats['inserted'] = len(new_ids)
+
+        logger.info(f"[ConfigManager] Items reconciled for category {category_id}: {stats}")
+        return stats
+
+    @staticmethod
+    def _same_value(stored: Any, value: Any) -> bool:
+        """
+        Compare a stored column value with an edited value
+
+        SQLite returns booleans as 0/1 and empty text may be NULL or "".
+        """
+        if isinstance(value, bool):
+            return bool(stored) == value
+        if isinstance(value, list):
+            return list(stored or []) == value
+        return (stored if stored != "" else None) == (value if value != "" else None)
 
     def _category_to_dict(self, category: Category) -> Dict:
         """
@@ -558,7 +796,7 @@ class ConfigManager:
 
     def _item_to_dict(self, item: Item, category_id: int) -> Dict:
         """
-        Convert Item object to database dict
+        Convert Item object to database dict (DBManager.add_items_bulk format)
 
         Args:
             item: Item object
@@ -571,10 +809,19 @@ class ConfigManager:
             'category_id': category_id,
             'label': item.label,
             'content': item.content,
-            'type': item.type.value.upper(),
+            'item_type': item.type.value.upper(),
             'icon': item.icon,
             'is_sensitive': item.is_sensitive,
-            'tags': item.tags
+            'is_favorite': getattr(item, 'is_favorite', False),
+            'tags': item.tags,
+            'description': item.description,
+            'working_dir': getattr(item, 'working_dir', None),
+            'color': getattr(item, 'color', None),
+            'is_active': getattr(item, 'is_active', True),
+            'is_archived': getattr(item, 'is_archived', False),
+            'is_list': getattr(item, 'is_list', False),
+            'list_group': getattr(item, 'list_group', None),
+            'orden_lista': getattr(item, 'orden_lista', 0)
         }
 
     def __del__(self):
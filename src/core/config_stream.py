@@ -0,0 +1,197 @@
+"""
+Config Stream
+Streaming export/import format for categories and items.
+
+NDJSON layout (one JSON object per line):
+    {"record": "header", "format": "widget_sidebar.ndjson", "version": 1, "settings": {...}, "counts": {...}}
+    {"record": "category", ...Category.to_dict() without items...}
+    {"record": "item", ...Item.to_dict()...}      <- items follow their category
+    ...
+
+Files ending in .gz, .bz2 or .xz are compressed with the stdlib codecs.
+The legacy single-document JSON export ({"version", "settings", "categories"})
+can be written in chunks and is still readable (it is loaded in one go).
+"""
+import bz2
+import gzip
+import json
+import logging
+import lzma
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+STREAM_FORMAT = "widget_sidebar.ndjson"
+STREAM_VERSION = 1
+LEGACY_VERSION = "3.0.0"
+
+# Extensions that select the NDJSON format on export
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+
+# Compression codecs by file extension / magic bytes
+COMPRESSION_SUFFIXES = {'.gz': gzip, '.bz2': bz2, '.xz': lzma}
+COMPRESSION_MAGIC = ((b'\x1f\x8b', gzip), (b'BZh', bz2), (b'\xfd7zXZ\x00', lzma))
+
+
+def open_text(path: Path, mode: str) -> IO[str]:
+    """
+    Open a (possibly compressed) UTF-8 text file
+
+    Args:
+        path: File path
+        mode: 'r' or 'w'. On write the codec is chosen by extension,
+              on read by the file's magic bytes.
+
+    Returns:
+        Text file object
+    """
+    path = Path(path)
+
+    if mode == 'w':
+        codec = COMPRESSION_SUFFIXES.get(path.suffix.lower())
+    else:
+        with open(path, 'rb') as f:
+            head = f.read(6)
+        codec = next((codec for magic, codec in COMPRESSION_MAGIC if head.startswith(magic)), None)
+
+    if codec is None:
+        return open(path, mode, encoding='utf-8', newline='\n' if mode == 'w' else None)
+    return codec.open(path, mode + 't', encoding='utf-8')
+
+
+def is_ndjson_path(path: Path) -> bool:
+    """
+    Check whether an export path selects the NDJSON format
+
+    Args:
+        path: Export path (e.g. config.ndjson, config.ndjson.gz)
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes = suffixes[:-1]
+    return bool(suffixes) and suffixes[-1] in NDJSON_SUFFIXES
+
+
+class NdjsonConfigWriter:
+    """Writes the NDJSON export one record at a time"""
+
+    def __init__(self, f: IO[str]):
+        """
+        Args:
+            f: Text file opened for writing
+        """
+        self.f = f
+
+    def write_header(self, settings: Dict[str, Any], counts: Dict[str, int]):
+        """Write the header record (settings and totals)"""
+        self._write({'record': 'header', 'format': STREAM_FORMAT, 'version': STREAM_VERSION,
+                     'settings': settings, 'counts': counts})
+
+    def write_category(self, category: Dict[str, Any]):
+        """Write a category record (items are written after it)"""
+        self._write({'record': 'category', **category})
+
+    def write_item(self, item: Dict[str, Any]):
+        """Write an item record of the last written category"""
+        self._write({'record': 'item', **item})
+
+    def close(self):
+        """Nothing to finish for NDJSON"""
+
+    def _write(self, record: Dict[str, Any]):
+        self.f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self.f.write('\n')
+
+
+class LegacyJsonConfigWriter:
+    """Writes the legacy single-document JSON export in chunks"""
+
+    def __init__(self, f: IO[str]):
+        """
+        Args:
+            f: Text file opened for writing
+        """
+        self.f = f
+        self._categories_written = 0
+        self._items_in_category = 0
+
+    def write_header(self, settings: Dict[str, Any], counts: Dict[str, int]):
+        """Write version and settings and open the categories array"""
+        self.f.write('{\n  "version": %s,\n  "settings": %s,\n  "categories": [' % (
+            json.dumps(LEGACY_VERSION), json.dumps(settings, ensure_ascii=False)))
+
+    def write_category(self, category: Dict[str, Any]):
+        """Write a category object and open its items array"""
+        self._close_category()
+        body = json.dumps(category, ensure_ascii=False)[:-1]  # Drop the closing brace
+        self.f.write(('\n    ' if self._categories_written == 0 else ',\n    ') + body + ', "items": [')
+        self._categories_written += 1
+        self._items_in_category = 0
+
+    def write_item(self, item: Dict[str, Any]):
+        """Write an item of the open category"""
+        prefix = '\n      ' if self._items_in_category == 0 else ',\n      '
+        self.f.write(prefix + json.dumps(item, ensure_ascii=False))
+        self._items_in_category += 1
+
+    def close(self):
+        """Close the open arrays and the document"""
+        self._close_category()
+        self.f.write('\n  ]\n}\n')
+
+    def _close_category(self):
+        if self._categories_written:
+            self.f.write('\n    ]}' if self._items_in_category else ']}')
+
+
+def iter_records(path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Read an export file record by record
+
+    NDJSON files are read line by line; legacy JSON documents are loaded
+    whole and split into the same records.
+
+    Args:
+        path: Export file (compressed or not)
+
+    Yields:
+        Tuple[str, Dict]: ('header' | 'category' | 'item', data)
+    """
+    with open_text(path, 'r') as f:
+        first_line = f.readline()
+        header = _parse_ndjson_header(first_line)
+
+        if header is not None:
+            yield 'header', header
+            for line_number, line in enumerate(f, start=2):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                record_type = record.pop('record', None)
+                if record_type not in ('category', 'item'):
+                    logger.warning(f"Unknown record type at line {line_number}: {record_type}")
+                    continue
+                yield record_type, record
+            return
+
+        # Legacy format: one JSON document
+        data = json.loads(first_line + f.read())
+
+    yield 'header', {'settings': data.get('settings', {}), 'counts': {}}
+    for category_data in data.get('categories', []):
+        items = category_data.pop('items', [])
+        yield 'category', category_data
+        for item_data in items:
+            yield 'item', item_data
+
+
+def _parse_ndjson_header(line: str):
+    """Return the NDJSON header record, or None if the line is not one"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(record, dict) and record.get('format') == STREAM_FORMAT:
+        return record
+    return None
@@ -4,10 +4,23 @@ Manages business logic for the Structure Dashboard
 """
 
 from typing import Dict, List, Tuple
+import json
 import logging
 
+from core.event_bus import event_bus, CategoryChanged, ITEM_EVENTS, ItemAdded, ItemDeleted
+from database.content_store import CONTENT_REF_PREFIX
+from core.fuzzy_index import FuzzyIndex
+from core.metrics import metrics
+from core.search_session import SearchSession
+
 logger = logging.getLogger(__name__)
 
+# Más cambios que esto en una categoría cargada: se recarga perezosamente
+PATCH_LIMIT = 200
+
+# Ámbitos de búsqueda de search() (todos activos por defecto)
+SEARCH_SCOPES = ('categories', 'items', 'lists', 'tags', 'content')
+
 
 class DashboardManager:
     """Manager for dashboard data loading and processing"""
@@ -22,17 +35,33 @@ class DashboardManager:
         self.db = db_manager
         self._structure_cache = None
         self._statistics_cache = None
+        # Búsqueda incremental: refina los resultados anteriores mientras se escribe
+        self._search_session = SearchSession(self._match_entry)
+        self._search_scope = {}
+        self._fuzzy_index = None
+        self._fuzzy_key = None
+        self._candidates_key = None  # Última búsqueda cuyos candidatos ya se cargaron
+
+        # Parchear la caché con los cambios publicados en vez de recargar todo
+        self._unsubscribe = [
+            event_bus.subscribe_many(ITEM_EVENTS, self._on_items_changed),
+            event_bus.subscribe(CategoryChanged, self._on_category_changed),
+        ]
         logger.info("DashboardManager initialized")
 
-    def get_full_structure(self, force_refresh: bool = False) -> Dict:
+    def get_structure_summary(self, force_refresh: bool = False) -> Dict:
         """
-        Get complete structure of categories and items
+        Get categories without their items (lazy structure)
+
+        Item counts come from a single aggregate query, so the cost does not
+        depend on how many items exist. Items are loaded on demand with
+        load_category_items() / load_all_items().
 
         Args:
             force_refresh: If True, force reload from database (default: False)
 
         Returns:
-            Dict: Complete structure with categories and their items
+            Dict: Structure with categories whose 'items' is None until loaded
                 {
                     'categories': [
                         {
@@ -40,18 +69,9 @@ class DashboardManager:
                             'name': str,
                             'icon': str,
                             'tags': List[str],
-                            'items': [
-                                {
-                                    'id': int,
-                                    'label': str,
-                                    'content': str,
-                                    'type': str,
-                                    'tags': List[str],
-                                    'is_favorite': bool,
-                                    'is_sensitive': bool
-                                },
-                                ...
-                            ]
+                            'is_predefined': bool,
+                            'item_count': int,
+                            'items': None | List[Dict]
                         },
                         ...
                     ]
@@ -62,48 +82,197 @@ class DashboardManager:
             logger.debug("Returning cached structure")
             return self._structure_cache
 
-        logger.info("Loading full structure from database...")
+        logger.info("Loading structure summary from database...")
 
         try:
-            # Get all categories
             categories = self.db.get_categories()
+            item_counts = self.db.get_category_item_counts()
 
             structure = {'categories': []}
 
             for category in categories:
-                # Get items for this category
-                items = self.db.get_items_by_category(category['id'])
-
                 category_data = {
                     'id': category['id'],
                     'name': category['name'],
                     'icon': category.get('icon', '📁'),
                     'tags': self._parse_tags(category.get('tags', '')),
                     'is_predefined': category.get('is_predefined', False),
-                    'items': []
+                    'item_count': item_counts.get(category['id'], 0),
+                    'items': None
                 }
-
-                # Process each item
-                for item in items:
-                    item_data = {
-                        'id': item['id'],
-                        'label': item['label'],
-                        'content': item['content'],
-                        'type': item['type'],
-                        'tags': self._parse_tags(item.get('tags', '')),
-                        'is_favorite': bool(item.get('is_favorite', 0)),
-                        'is_sensitive': bool(item.get('is_sensitive', 0)),
-                        'description': item.get('description', ''),
-                        'is_list': bool(item.get('is_list', 0)),
-                        'list_group': item.get('list_group', None)
-                    }
-                    category_data['items'].append(item_data)
-
                 structure['categories'].append(category_data)
 
             # Cache the structure
             self._structure_cache = structure
 
+            logger.info(f"Loaded structure summary: {len(structure['categories'])} categories, "
+                       f"{sum(c['item_count'] for c in structure['categories'])} total items")
+
+            return structure
+
+        except Exception as e:
+            logger.error(f"Error loading structure summary: {e}", exc_info=True)
+            return {'categories': []}
+
+    def load_category_items(self, category: Dict) -> List[Dict]:
+        """
+        Load the items of a single category into the structure (if not loaded yet)
+
+        Args:
+            category: Category dict from the structure
+
+        Returns:
+            List[Dict]: The category items
+        """
+        if category['items'] is not None:
+            return category['items']
+
+        items = self.db.get_items_by_category(category['id'])
+        category['items'] = [self._build_item_data(item) for item in items]
+        category['item_count'] = len(category['items'])
+        return category['items']
+
+    def load_all_items(self, structure: Dict) -> Dict:
+        """
+        Load items of every category that has not been loaded yet
+
+        Args:
+            structure: Structure dict (modified in place)
+
+        Returns:
+            Dict: The same structure, fully loaded
+        """
+        for category in structure['categories']:
+            if category['items'] is None:
+                self.load_category_items(category)
+        return structure
+
+    def load_search_candidates(self, query: str, scope_filters: Dict, structure: Dict) -> Dict:
+        """
+        Load the items of the categories a search can match, not every category
+
+        Category names and tags are matched on the summary. Items are only
+        loaded for the categories with a row matching the query in SQL (LIKE
+        over label, list group, tags and non-sensitive content, large
+        contents through the content store). Fuzzy searches, non-ASCII
+        queries (LIKE only folds ASCII case) and queries with quotes or
+        backslashes (escaped in the JSON tags) load every category.
+
+        Args:
+            query: Search query string
+            scope_filters: Scope flags as passed to search()
+            structure: Structure dict (modified in place)
+
+        Returns:
+            Dict: The same structure
+        """
+        unloaded = [category for category in structure['categories'] if category['items'] is None]
+        if not query or not unloaded:
+            return structure
+
+        fuzzy = bool(scope_filters.get('fuzzy', False))
+        scope = tuple(bool(scope_filters.get(name, True)) for name in SEARCH_SCOPES)
+        key = (id(structure), query.lower(), scope, fuzzy)
+        if self._candidates_key == key + (tuple(category['id'] for category in unloaded),):
+            return structure  # Ya filtrada (p. ej. en el hilo de UI antes de la búsqueda en el worker)
+
+        if fuzzy or not query.isascii() or '"' in query or '\\' in query:
+            self.load_all_items(structure)
+        else:
+            candidate_ids = self._get_candidate_category_ids(
+                query, dict(zip(SEARCH_SCOPES, scope)), [category['id'] for category in unloaded]
+            )
+            for category in unloaded:
+                if category['id'] in candidate_ids:
+                    self.load_category_items(category)
+            logger.debug(f"Search '{query}': {len(candidate_ids)} of {len(unloaded)} unloaded categories loaded")
+
+        self._candidates_key = key + (
+            tuple(category['id'] for category in structure['categories'] if category['items'] is None),
+        )
+        return structure
+
+    def _get_candidate_category_ids(self, query: str, scope: Dict, category_ids: List[int]) -> set:
+        """
+        Categories with at least one item row matching the query (SQL pre-filter)
+
+        Args:
+            query: ASCII search query
+            scope: {scope name: bool} for SEARCH_SCOPES
+            category_ids: Categories to check
+
+        Returns:
+            set: IDs of the categories worth loading
+        """
+        pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        conditions, params = [], []
+        if scope['items']:
+            conditions.append("label LIKE ? ESCAPE '\\'")
+            params.append(pattern)
+        if scope['lists']:
+            conditions.append("(is_list = 1 AND list_group LIKE ? ESCAPE '\\')")
+            params.append(pattern)
+        if scope['tags']:
+            conditions.append("tags LIKE ? ESCAPE '\\'")
+            params.append(pattern)
+        if scope['content']:
+            conditions.append(f"""(is_sensitive = 0 AND (content LIKE ? ESCAPE '\\' OR (
+                content LIKE '{CONTENT_REF_PREFIX}%' AND content IN (
+                    SELECT '{CONTENT_REF_PREFIX}' || hash FROM content_blobs
+                    WHERE blob_text(data, compressed) LIKE ? ESCAPE '\\'
+                ))))""")
+            params.extend((pattern, pattern))
+        if not conditions or not category_ids:
+            return set()
+
+        placeholders = ','.join('?' * len(category_ids))
+        rows = self.db.execute_query(f"""
+            SELECT DISTINCT category_id FROM items
+            WHERE category_id IN ({placeholders}) AND ({' OR '.join(conditions)})
+        """, tuple(category_ids) + tuple(params))
+        return {row['category_id'] for row in rows}
+
+    def is_fully_loaded(self, structure: Dict) -> bool:
+        """Check whether every category of the structure has its items loaded"""
+        return all(category['items'] is not None for category in structure['categories'])
+
+    def get_full_structure(self, force_refresh: bool = False) -> Dict:
+        """
+        Get complete structure of categories and items
+
+        Args:
+            force_refresh: If True, force reload from database (default: False)
+
+        Returns:
+            Dict: Complete structure with categories and their items
+                {
+                    'categories': [
+                        {
+                            'id': int,
+                            'name': str,
+                            'icon': str,
+                            'tags': List[str],
+                            'item_count': int,
+                            'items': [
+                                {
+                                    'id': int,
+                                    'label': str,
+                                    'content': str,
+                                    'type': str,
+                                    'tags': List[str],
+                                    'is_favorite': bool,
+                                    'is_sensitive': bool
+                                },
+                                ...
+                            ]
+                        },
+                        ...
+                    ]
+                }
+        """
+        try:
+            structure = self.load_all_items(self.get_structure_summary(force_refresh))
+
             logger.info(f"Loaded structure: {len(structure['categories'])} categories, "
                        f"{sum(len(c['items']) for c in structure['categories'])} total items")
 
@@ -113,6 +282,29 @@ class DashboardManager:
             logger.error(f"Error loading full structure: {e}", exc_info=True)
             return {'categories': []}
 
+    def _build_item_data(self, item: Dict) -> Dict:
+        """
+        Convert an item row into the dashboard item dict
+
+        Args:
+            item: Item dict from DBManager
+
+        Returns:
+            Dict: Dashboard item data
+        """
+        return {
+            'id': item['id'],
+            'label': item['label'],
+            'content': item['content'],
+            'type': item['type'],
+            'tags': self._parse_tags(item.get('tags', '')),
+            'is_favorite': bool(item.get('is_favorite', 0)),
+            'is_sensitive': bool(item.get('is_sensitive', 0)),
+            'description': item.get('description', ''),
+            'is_list': bool(item.get('is_list', 0)),
+            'list_group': item.get('list_group', None)
+        }
+
     def calculate_statistics(self, structure: Dict = None) -> Dict:
         """
         Calculate statistics from the structure
@@ -141,16 +333,21 @@ class DashboardManager:
             return self._statistics_cache
 
         if structure is None:
-            structure = self.get_full_structure()
+            structure = self.get_structure_summary()
 
         logger.info("Calculating statistics...")
 
         try:
             categories = structure['categories']
 
+            # Counts come from SQL aggregates: no item rows are materialized
+            category_counts, type_counts, tag_counts = self._get_item_aggregates(
+                [category['id'] for category in categories]
+            )
+
             stats = {
                 'total_categories': len(categories),
-                'active_categories': len([c for c in categories if c['items']]),
+                'active_categories': len([c for c in categories if c['item_count']]),
                 'total_items': 0,
                 'total_favorites': 0,
                 'total_sensitive': 0,
@@ -161,16 +358,14 @@ class DashboardManager:
                 'type_distribution': {}
             }
 
-            # Collect tags and count items
-            all_tags = []
             largest_cat = None
             largest_count = 0
 
-            type_counts = {}
-
             for category in categories:
-                item_count = len(category['items'])
+                item_count, favorites, sensitive = category_counts.get(category['id'], (0, 0, 0))
                 stats['total_items'] += item_count
+                stats['total_favorites'] += favorites
+                stats['total_sensitive'] += sensitive
 
                 # Track largest category
                 if item_count > largest_count:
@@ -180,32 +375,13 @@ class DashboardManager:
                         'item_count': item_count
                     }
 
-                # Collect category tags
-                all_tags.extend(category['tags'])
-
-                for item in category['items']:
-                    # Count favorites and sensitives
-                    if item['is_favorite']:
-                        stats['total_favorites'] += 1
-                    if item['is_sensitive']:
-                        stats['total_sensitive'] += 1
-
-                    # Collect item tags
-                    all_tags.extend(item['tags'])
-
-                    # Count item types
-                    item_type = item['type']
-                    type_counts[item_type] = type_counts.get(item_type, 0) + 1
-
-            # Calculate unique tags
-            unique_tags = set(all_tags)
-            stats['total_unique_tags'] = len(unique_tags)
-
-            # Find most used tag
-            if all_tags:
-                tag_counts = {}
-                for tag in all_tags:
+                # Category tags count like item tags
+                for tag in category['tags']:
                     tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+            # Unique tags and most used tag
+            stats['total_unique_tags'] = len(tag_counts)
+            if tag_counts:
                 stats['most_used_tag'] = max(tag_counts, key=tag_counts.get)
 
             # Average items per category
@@ -232,6 +408,57 @@ class DashboardManager:
             logger.error(f"Error calculating statistics: {e}", exc_info=True)
             return {}
 
+    def _get_item_aggregates(self, category_ids: List[int]) -> Tuple[Dict, Dict, Dict]:
+        """
+        Aggregate the item counters needed for statistics in SQL
+
+        Tags are counted with json_each; only legacy comma-separated tag
+        strings (not valid JSON) are fetched and parsed in Python.
+
+        Args:
+            category_ids: Categories to aggregate
+
+        Returns:
+            Tuple: ({category_id: (items, favorites, sensitive)}, {type: count}, {tag: count})
+        """
+        category_counts, type_counts, tag_counts = {}, {}, {}
+        if not category_ids:
+            return category_counts, type_counts, tag_counts
+
+        placeholders = ','.join('?' * len(category_ids))
+        params = tuple(category_ids)
+
+        for row in self.db.execute_query(f"""
+            SELECT category_id, type, COUNT(*) AS items,
+                   SUM(is_favorite != 0) AS favorites, SUM(is_sensitive != 0) AS sensitive
+            FROM items
+            WHERE category_id IN ({placeholders})
+            GROUP BY category_id, type
+        """, params):
+            items, favorites, sensitive = category_counts.get(row['category_id'], (0, 0, 0))
+            category_counts[row['category_id']] = (
+                items + row['items'], favorites + row['favorites'], sensitive + row['sensitive']
+            )
+            type_counts[row['type']] = type_counts.get(row['type'], 0) + row['items']
+
+        # json_each sobre '[]' para las filas sin JSON válido (json_each fallaría)
+        for row in self.db.execute_query(f"""
+            SELECT tag.value AS tag, COUNT(*) AS uses
+            FROM items, json_each(CASE WHEN json_valid(items.tags) THEN items.tags ELSE '[]' END) AS tag
+            WHERE items.category_id IN ({placeholders})
+            GROUP BY tag.value
+        """, params):
+            tag_counts[row['tag']] = row['uses']
+
+        for row in self.db.execute_query(f"""
+            SELECT tags FROM items
+            WHERE category_id IN ({placeholders}) AND tags != '' AND NOT json_valid(tags)
+        """, params):
+            for tag in self._parse_tags(row['tags']):
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+        return category_counts, type_counts, tag_counts
+
     def _parse_tags(self, tags_str) -> List[str]:
         """
         Parse tags string or list into list
@@ -249,8 +476,13 @@ class DashboardManager:
         if isinstance(tags_str, list):
             return tags_str
 
-        # If string, parse it
+        # If string, parse it (JSON list from raw rows, or legacy CSV)
         if isinstance(tags_str, str):
+            if tags_str.startswith('['):
+                try:
+                    return json.loads(tags_str)
+                except json.JSONDecodeError:
+                    pass
             return [tag.strip() for tag in tags_str.split(',') if tag.strip()]
 
         return []
@@ -267,6 +499,8 @@ class DashboardManager:
         """
         if structure is None:
             structure = self.get_full_structure()
+        else:
+            self.load_all_items(structure)
 
         logger.info("Generating tag cloud...")
 
@@ -297,19 +531,115 @@ class DashboardManager:
         """Invalidate all caches to force data reload"""
         self._structure_cache = None
         self._statistics_cache = None
+        self._search_session.reset()
+        self._fuzzy_index = None
+        self._fuzzy_key = None
+        self._candidates_key = None
         logger.info("Dashboard caches invalidated")
 
+    def _on_items_changed(self, event) -> None:
+        """
+        Patch the cached structure with the items of a change event
+
+        Loaded categories get only the changed rows re-read (or removed);
+        unloaded ones only get their item_count adjusted. Derived caches
+        (statistics, search session, fuzzy index) are dropped since they
+        are cheap to rebuild from the patched structure.
+
+        Args:
+            event: ItemAdded, ItemUpdated or ItemDeleted
+        """
+        self._statistics_cache = None
+        self._search_session.reset()
+        self._fuzzy_index = None
+        self._fuzzy_key = None
+        self._candidates_key = None
+
+        structure = self._structure_cache
+        if not structure:
+            return
+
+        try:
+            by_id = {category['id']: category for category in structure['categories']}
+            changed = set(event.item_ids)
+
+            if isinstance(event, ItemDeleted):
+                rows = {}
+            else:
+                rows = {row['id']: row for row in (self.db.get_item(item_id) for item_id in event.item_ids) if row}
+
+            # Categorías afectadas: las del evento, o las que tengan cargado alguno de los items
+            category_ids = set(event.category_ids) | {row['category_id'] for row in rows.values()}
+            if not category_ids:
+                category_ids = {category['id'] for category in structure['categories']
+                                if category['items'] is not None
+                                and any(item['id'] in changed for item in category['items'])}
+
+            for category_id in category_ids:
+                category = by_id.get(category_id)
+                if category is None:
+                    continue
+                if category['items'] is None or len(changed) > PATCH_LIMIT:
+                    category['items'] = None  # Se recarga al expandirla
+                    continue
+                self._patch_category_items(category, event, rows)
+
+            if isinstance(event, (ItemAdded, ItemDeleted)):
+                self._refresh_item_counts(structure, category_ids)
+
+            logger.debug(f"Dashboard cache patched: {type(event).__name__} ({len(changed)} items)")
+
+        except Exception as e:
+            logger.error(f"Error patching dashboard cache: {e}", exc_info=True)
+            self.invalidate_cache()
+
+    def _patch_category_items(self, category: Dict, event, rows: Dict[int, Dict]) -> None:
+        """Replace, append or remove the changed items of a loaded category"""
+        changed = set(event.item_ids)
+        items = [item for item in category['items']
+                 if not (item['id'] in changed and
+                         (isinstance(event, ItemDeleted) or rows.get(item['id'], {}).get('category_id') != category['id']))]
+
+        positions = {item['id']: index for index, item in enumerate(items)}
+        for item_id in event.item_ids:
+            row = rows.get(item_id)
+            if row is None or row['category_id'] != category['id']:
+                continue
+            if item_id in positions:
+                items[positions[item_id]] = self._build_item_data(row)
+            else:
+                items.append(self._build_item_data(row))
+
+        category['items'] = items
+        category['item_count'] = len(items)
+
+    def _refresh_item_counts(self, structure: Dict, category_ids) -> None:
+        """Re-read the item counts of the categories that aren't loaded"""
+        unloaded = [category for category in structure['categories']
+                    if category['id'] in category_ids and category['items'] is None]
+        if not unloaded:
+            return
+        item_counts = self.db.get_category_item_counts()
+        for category in unloaded:
+            category['item_count'] = item_counts.get(category['id'], 0)
+
+    def _on_category_changed(self, event: CategoryChanged) -> None:
+        """Categories changed: the (cheap) category summary is reloaded on next access"""
+        self.invalidate_cache()
+
     def refresh_data(self) -> Dict:
         """
         Refresh all data from database
 
         Returns:
-            Dict: Refreshed structure
+            Dict: Refreshed structure (lazy, items loaded on demand)
         """
         self.invalidate_cache()
-        return self.get_full_structure(force_refresh=True)
+        return self.get_structure_summary(force_refresh=True)
 
-    def search(self, query: str, scope_filters: Dict, structure: Dict = None) -> List[Tuple[str, int, int]]:
+    @metrics.timed('search.dashboard')
+    def search(self, query: str, scope_filters: Dict, structure: Dict = None,
+               highlights: Dict = None) -> List[Tuple[str, int, int]]:
         """
         Search for query in structure
 
@@ -320,76 +650,204 @@ class DashboardManager:
                     'categories': bool,
                     'items': bool,
                     'tags': bool,
-                    'content': bool
+                    'content': bool,
+                    'fuzzy': bool  # Typo-tolerant, ranked (see _search_fuzzy)
                 }
             structure: Optional structure dict
+            highlights: Optional dict the fuzzy search fills with the matched
+                characters of every match (see _fuzzy_highlights):
+                {(category_index, item_index): ((field text, ((start, end), ...)), ...)}
 
         Returns:
             List[Tuple[str, int, int]]: List of (match_type, category_index, item_index)
-                match_type can be: 'category', 'item', 'tag', 'content'
+                match_type can be: 'category', 'item', 'list', 'tag', 'content'
                 item_index is -1 for category matches
         """
         if not query:
             return []
 
+        # Matches may live in categories whose items were not loaded yet
         if structure is None:
-            structure = self.get_full_structure()
+            structure = self.get_structure_summary()
+        self.load_search_candidates(query, scope_filters, structure)
 
         logger.info(f"Searching for '{query}' with filters: {scope_filters}")
 
-        query_lower = query.lower()
-        matches = []
+        categories = structure['categories']
+        scope = tuple(bool(scope_filters.get(name, True)) for name in SEARCH_SCOPES)
+        self._search_scope = dict(zip(SEARCH_SCOPES, scope))
+
+        if scope_filters.get('fuzzy', False):
+            matches = self._search_fuzzy(query, structure, scope, highlights)
+            logger.info(f"Fuzzy search found {len(matches)} matches")
+            return matches
+
+        # Entradas: (cat_idx, -1, categoría) y (cat_idx, item_idx, item), en orden de árbol.
+        # Las categorías sin cargar no tienen items que puedan coincidir
+        entries = (
+            entry
+            for cat_idx, category in enumerate(categories)
+            for entry in [(cat_idx, -1, category)] + [
+                (cat_idx, item_idx, item) for item_idx, item in enumerate(category['items'] or ())
+            ]
+        )
+        version = (scope, len(categories), sum(len(category['items'] or ()) for category in categories))
+        matches = [
+            match
+            for entry_matches in self._search_session.search(query, entries, source=structure, version=version)
+            for match in entry_matches
+        ]
+
+        logger.info(f"Search found {len(matches)} matches")
+        return matches
+
+    def _search_fuzzy(self, query: str, structure: Dict, scope: Tuple[bool, ...],
+                      highlights: Dict = None) -> List[Tuple[str, int, int]]:
+        """
+        Fuzzy search over category names, item labels, list groups and tags
 
+        Content is not indexed (too long for typo matching). The index is
+        built once per structure and scope, and the matches are returned
+        best first instead of in tree order.
+
+        Args:
+            query: Search query string
+            structure: Structure dict with items loaded
+            scope: Scope flags, in SEARCH_SCOPES order
+            highlights: Optional dict to fill with the matched characters (see search())
+
+        Returns:
+            List[Tuple[str, int, int]]: (match_type, category_index, item_index);
+                match_type is the field holding the first matched character
+        """
         categories = structure['categories']
+        key = (id(structure), scope, len(categories), sum(len(category['items']) for category in categories))
+        if self._fuzzy_index is None or key != self._fuzzy_key:
+            self._fuzzy_index = FuzzyIndex(self._fuzzy_documents(categories, dict(zip(SEARCH_SCOPES, scope))))
+            self._fuzzy_key = key
+
+        matches = []
+        for match in self._fuzzy_index.search(query, limit=None):
+            cat_idx, item_idx, fields = match.key
+            first = match.positions[0]
+            match_type = next(name for name, end, _ in fields if first < end)
+            matches.append((match_type, cat_idx, item_idx))
+            if highlights is not None:
+                highlights[(cat_idx, item_idx)] = self._fuzzy_highlights(match.positions, fields)
+        return matches
+
+    @staticmethod
+    def _fuzzy_highlights(positions: Tuple[int, ...], fields) -> Tuple:
+        """
+        Split the matched offsets of a fuzzy document into runs per field
+
+        Args:
+            positions: FuzzyMatch.positions (offsets in the joined document text)
+            fields: (match_type, end offset, text) of every field of the document
+
+        Returns:
+            Tuple: ((field text, ((start, end), ...)), ...) with offsets relative
+                   to the field text, only for the fields with matched characters
+        """
+        result = []
+        start = 0
+        for _, end, text in fields:
+            runs = []
+            for position in positions:
+                if start <= position < end:
+                    offset = position - start
+                    if runs and runs[-1][1] == offset:
+                        runs[-1][1] = offset + 1  # Carácter contiguo: se alarga el tramo
+                    else:
+                        runs.append([offset, offset + 1])
+            if runs:
+                result.append((text, tuple((run[0], run[1]) for run in runs)))
+            start = end + 1  # Separador
+        return tuple(result)
+
+    @staticmethod
+    def _fuzzy_documents(categories: List[Dict], scope: Dict):
+        """
+        Yield the fuzzy index documents of a structure
 
+        Each key is (cat_idx, item_idx, fields), where fields lists the
+        (match_type, end offset, text) of every field joined into the text.
+        """
         for cat_idx, category in enumerate(categories):
+            parts = []
+            if scope['categories']:
+                parts.append(('category', category['name']))
+            if scope['tags']:
+                parts.extend(('tag', tag) for tag in category['tags'])
+            if parts:
+                yield DashboardManager._fuzzy_document(cat_idx, -1, parts)
+
+            for item_idx, item in enumerate(category['items']):
+                parts = []
+                if scope['items']:
+                    parts.append(('item', item['label']))
+                if scope['lists'] and item.get('is_list') and item.get('list_group'):
+                    parts.append(('list', item['list_group']))
+                if scope['tags']:
+                    parts.extend(('tag', tag) for tag in item['tags'])
+                if parts:
+                    yield DashboardManager._fuzzy_document(cat_idx, item_idx, parts)
+
+    @staticmethod
+    def _fuzzy_document(cat_idx: int, item_idx: int, parts: List[Tuple[str, str]]):
+        """Join (match_type, text) parts into one fuzzy index document"""
+        fields, texts, end = [], [], 0
+        for match_type, text in parts:
+            text = text or ''
+            end += len(text)
+            fields.append((match_type, end, text))
+            texts.append(text)
+            end += 1  # Separador
+        return (cat_idx, item_idx, tuple(fields)), ' '.join(texts)
+
+    def _match_entry(self, entry: Tuple[int, int, Dict], query_lower: str) -> List[Tuple[str, int, int]]:
+        """
+        Match one category or item of the structure (see search())
+
+        Args:
+            entry: (cat_idx, item_idx, data); item_idx is -1 for the category itself
+            query_lower: Lowercase query
+
+        Returns:
+            List[Tuple[str, int, int]]: Matches of the entry (empty if none)
+        """
+        cat_idx, item_idx, data = entry
+        scope = self._search_scope
+        matches = []
+
+        if item_idx == -1:
             # Search in category name
-            if scope_filters.get('categories', True):
-                if query_lower in category['name'].lower():
-                    matches.append(('category', cat_idx, -1))
-                    logger.debug(f"Category match: {category['name']}")
+            if scope['categories'] and query_lower in data['name'].lower():
+                matches.append(('category', cat_idx, -1))
 
-            # Search in category tags
-            if scope_filters.get('tags', True):
-                for tag in category['tags']:
-                    if query_lower in tag.lower():
-                        matches.append(('tag', cat_idx, -1))
-                        logger.debug(f"Category tag match: {tag} in {category['name']}")
-                        break  # Only count once per category
+            # Search in category tags (only count once per category)
+            if scope['tags'] and any(query_lower in tag.lower() for tag in data['tags']):
+                matches.append(('tag', cat_idx, -1))
+            return matches
 
-            # Search in items
-            for item_idx, item in enumerate(category['items']):
-                # Search in item label
-                if scope_filters.get('items', True):
-                    if query_lower in item['label'].lower():
-                        matches.append(('item', cat_idx, item_idx))
-                        logger.debug(f"Item match: {item['label']}")
-                        continue  # Skip other checks for this item
-
-                # Search in list_group (if is_list)
-                if scope_filters.get('lists', True):
-                    if item.get('is_list') and item.get('list_group'):
-                        if query_lower in item['list_group'].lower():
-                            matches.append(('list', cat_idx, item_idx))
-                            logger.debug(f"List match: {item['list_group']} - {item['label']}")
-                            continue
+        # Search in item label
+        if scope['items'] and query_lower in data['label'].lower():
+            return [('item', cat_idx, item_idx)]  # Skip other checks for this item
 
-                # Search in item tags
-                if scope_filters.get('tags', True):
-                    for tag in item['tags']:
-                        if query_lower in tag.lower():
-                            matches.append(('tag', cat_idx, item_idx))
-                            logger.debug(f"Item tag match: {tag} in {item['label']}")
-                            break
-
-                # Search in item content (if not sensitive)
-                if scope_filters.get('content', True):
-                    if not item['is_sensitive'] and item['content']:
-                        if query_lower in item['content'].lower():
-                            matches.append(('content', cat_idx, item_idx))
-                            logger.debug(f"Content match in {item['label']}")
+        # Search in list_group (if is_list)
+        if scope['lists'] and data.get('is_list') and data.get('list_group'):
+            if query_lower in data['list_group'].lower():
+                return [('list', cat_idx, item_idx)]
+
+        # Search in item tags
+        if scope['tags'] and any(query_lower in tag.lower() for tag in data['tags']):
+            matches.append(('tag', cat_idx, item_idx))
+
+        # Search in item content (if not sensitive)
+        if scope['content'] and not data['is_sensitive'] and data['content']:
+            if query_lower in data['content'].lower():
+                matches.append(('content', cat_idx, item_idx))
 
-        logger.info(f"Search found {len(matches)} matches")
         return matches
 
     def filter_and_sort_structure(
@@ -412,7 +870,11 @@ class DashboardManager:
             Dict: Filtered and sorted structure
         """
         if structure is None:
-            structure = self.get_full_structure()
+            structure = self.get_structure_summary()
+
+        # Type/state filters need the items; sorting only needs the counts
+        if type_filters or state_filters:
+            self.load_all_items(structure)
 
         logger.info(f"Filtering structure - Types: {type_filters}, States: {state_filters}, Sort: {sort_by}")
 
@@ -451,6 +913,7 @@ class DashboardManager:
                     filtered_items.append(item)
 
                 category['items'] = filtered_items
+                category['item_count'] = len(filtered_items)
 
         # Sort categories
         if sort_by == 'name_asc':
@@ -458,9 +921,9 @@ class DashboardManager:
         elif sort_by == 'name_desc':
             filtered_structure['categories'].sort(key=lambda c: c['name'].lower(), reverse=True)
         elif sort_by == 'items_desc':
-            filtered_structure['categories'].sort(key=lambda c: len(c['items']), reverse=True)
+            filtered_structure['categories'].sort(key=lambda c: c['item_count'], reverse=True)
         elif sort_by == 'items_asc':
-            filtered_structure['categories'].sort(key=lambda c: len(c['items']))
+            filtered_structure['categories'].sort(key=lambda c: c['item_count'])
 
         logger.info(f"Filtering complete")
         return filtered_structure
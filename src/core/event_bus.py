@@ -0,0 +1,178 @@
+"""
+Event Bus
+In-process bus of typed change events. Write paths (DBManager,
+UsageTracker, FavoritesManager) publish what changed, and views and
+caches subscribe and patch only that, instead of reloading everything
+after each edit.
+
+Events are delivered synchronously, on the publishing thread, in
+subscription order. DBManager defers the events of a transaction until it
+commits (and drops them on rollback), so subscribers never see changes
+that were not persisted. Bound methods are held through weak references,
+so a subscribed view can be garbage collected without unsubscribing.
+"""
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+# ========== EVENTS ==========
+
+@dataclass(frozen=True)
+class ItemAdded:
+    """Items were inserted"""
+    item_ids: Tuple[int, ...]
+    category_ids: FrozenSet[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class ItemUpdated:
+    """Item fields changed (category_ids empty = not known by the publisher)"""
+    item_ids: Tuple[int, ...]
+    category_ids: FrozenSet[int] = frozenset()
+    fields: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class ItemDeleted:
+    """Items were deleted"""
+    item_ids: Tuple[int, ...]
+    category_ids: FrozenSet[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class CategoryChanged:
+    """A category was added, updated or deleted, or the categories were reordered"""
+    category_id: Optional[int]  # None for 'reordered'
+    action: str  # 'added', 'updated', 'deleted', 'reordered'
+
+
+@dataclass(frozen=True)
+class UsageRecorded:
+    """An item was used (use_count, last_used and frecency changed)"""
+    item_id: int
+    frecency_delta: float = 0.0
+
+
+@dataclass(frozen=True)
+class SettingChanged:
+    """A setting was saved"""
+    key: str
+    value: Any = field(default=None, compare=False)
+
+
+ITEM_EVENTS = (ItemAdded, ItemUpdated, ItemDeleted)
+
+
+# ========== BUS ==========
+
+class EventBus:
+    """Typed publish/subscribe bus"""
+
+    def __init__(self):
+        self._subscribers: Dict[Type, List[Callable[[], Optional[Callable]]]] = {}
+        self._lock = threading.Lock()
+        self.published = 0  # Events published (diagnostics)
+
+    def subscribe(self, event_type: Type, callback: Callable[[Any], None]) -> Callable[[], None]:
+        """
+        Subscribe a callback to an event type
+
+        Args:
+            event_type: Event class (e.g. ItemUpdated)
+            callback: Called with the event; bound methods are weakly referenced
+
+        Returns:
+            Callable: Call it to unsubscribe
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda callback=callback: callback  # Funciones: referencia fuerte
+
+        with self._lock:
+            self._subscribers.setdefault(event_type, []).append(ref)
+
+        def unsubscribe():
+            with self._lock:
+                refs = self._subscribers.get(event_type, [])
+                if ref in refs:
+                    refs.remove(ref)
+
+        return unsubscribe
+
+    def subscribe_many(self, event_types: Iterable[Type], callback: Callable[[Any], None]) -> Callable[[], None]:
+        """
+        Subscribe one callback to several event types
+
+        Returns:
+            Callable: Call it to unsubscribe from all of them
+        """
+        unsubscribers = [self.subscribe(event_type, callback) for event_type in event_types]
+
+        def unsubscribe():
+            for unsubscribe_one in unsubscribers:
+                unsubscribe_one()
+
+        return unsubscribe
+
+    def publish(self, event: Any) -> None:
+        """
+        Deliver an event to its subscribers
+
+        A failing subscriber is logged and doesn't stop the others.
+
+        Args:
+            event: Event instance
+        """
+        with self._lock:
+            refs = list(self._subscribers.get(type(event), ()))
+        self.published += 1
+
+        dead = []
+        for ref in refs:
+            callback = ref()
+            if callback is None:
+                dead.append(ref)
+                continue
+            try:
+                callback(event)
+            except RuntimeError as e:
+                if 'has been deleted' not in str(e):
+                    logger.error(f"Error in {type(event).__name__} subscriber: {e}", exc_info=True)
+                    continue
+                # Vista Qt ya destruida (el objeto C++ fue eliminado)
+                logger.debug(f"Dropping subscriber of {type(event).__name__}: {e}")
+                dead.append(ref)
+            except Exception as e:
+                logger.error(f"Error in {type(event).__name__} subscriber: {e}", exc_info=True)
+
+        if dead:
+            with self._lock:
+                refs = self._subscribers.get(type(event), [])
+                for ref in dead:
+                    if ref in refs:
+                        refs.remove(ref)
+
+    def publish_all(self, events: Iterable[Any]) -> None:
+        """Deliver several events in order"""
+        for event in events:
+            self.publish(event)
+
+    def subscriber_count(self, event_type: Type) -> int:
+        """Number of live subscribers of an event type"""
+        with self._lock:
+            return sum(1 for ref in self._subscribers.get(event_type, ()) if ref() is not None)
+
+    def clear(self) -> None:
+        """Remove every subscriber (tests)"""
+        with self._lock:
+            self._subscribers.clear()
+
+
+# Bus de la aplicación: compartido por todas las instancias de DBManager y las vistas
+event_bus = EventBus()
@@ -5,10 +5,15 @@ Fecha: 2025-01-23
 """
 
 import sqlite3
+import sys
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.db_manager import item_list_columns
+from core.event_bus import event_bus, ItemUpdated
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +56,7 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            event_bus.publish(ItemUpdated((item_id,), fields=frozenset({'is_favorite', 'favorite_order'})))
 
             logger.info(f"Item {item_id} marked as favorite with order {order}")
             return True
@@ -75,6 +81,7 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            event_bus.publish(ItemUpdated((item_id,), fields=frozenset({'is_favorite', 'favorite_order'})))
 
             logger.info(f"Item {item_id} unmarked as favorite")
             return True
@@ -121,16 +128,27 @@ class FavoritesManager:
 
     # ==================== Listado ====================
 
-    def get_all_favorites(self, limit: Optional[int] = None) -> List[Dict]:
-        """Obtener todos los favoritos ordenados"""
+    def get_all_favorites(self, limit: Optional[int] = None, order_by: str = "manual") -> List[Dict]:
+        """Obtener todos los favoritos ordenados
+
+        Args:
+            limit: Número máximo de favoritos
+            order_by: 'manual' (favorite_order) o 'frecency' (frecuentes y recientes
+                primero, vía idx_items_favorite_frecency; sin renumerar)
+        """
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            query = """
-                SELECT * FROM items
+            if order_by == "frecency":
+                order_clause = "frecency DESC, id DESC"
+            else:
+                order_clause = "favorite_order ASC, use_count DESC"
+
+            query = f"""
+                SELECT {item_list_columns(conn)} FROM items
                 WHERE is_favorite = 1
-                ORDER BY favorite_order ASC, use_count DESC
+                ORDER BY {order_clause}
             """
 
             if limit:
@@ -154,8 +172,8 @@ class FavoritesManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM items
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)} FROM items
                 WHERE is_favorite = 1 AND category_id = ?
                 ORDER BY favorite_order ASC, use_count DESC
             """, (category_id,))
@@ -233,6 +251,7 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            event_bus.publish(ItemUpdated(tuple(item_ids), fields=frozenset({'favorite_order'})))
 
             logger.info(f"Reordered {len(item_ids)} favorites")
             return True
@@ -244,7 +263,7 @@ class FavoritesManager:
     def auto_order_favorites(self, by: str = "use_count") -> bool:
         """Auto-ordenar favoritos por criterio"""
         try:
-            valid_criteria = ["use_count", "last_used", "label"]
+            valid_criteria = ["use_count", "last_used", "label", "frecency"]
             if by not in valid_criteria:
                 logger.error(f"Invalid ordering criteria: {by}")
                 return False
@@ -370,8 +389,9 @@ class FavoritesManager:
             cursor = conn.cursor()
 
             # Contar antes de limpiar
-            cursor.execute("SELECT COUNT(*) as count FROM items WHERE is_favorite = 1")
-            count = cursor.fetchone()['count']
+            cursor.execute("SELECT id FROM items WHERE is_favorite = 1")
+            item_ids = tuple(row['id'] for row in cursor.fetchall())
+            count = len(item_ids)
 
             # Limpiar
             cursor.execute("""
@@ -384,6 +404,8 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            if item_ids:
+                event_bus.publish(ItemUpdated(item_ids, fields=frozenset({'is_favorite', 'favorite_order'})))
 
             logger.info(f"Cleared {count} favorites")
             return count
@@ -0,0 +1,365 @@
+"""
+Fuzzy Index
+Typo-tolerant search over short texts (labels and tags) with a precomputed
+candidate index, so a fuzzy query never computes an edit distance against
+every document:
+
+- Subsequence matching scored like fzf ("dkr cmp" -> "docker compose"):
+  candidates are the documents containing every character of the token,
+  found by AND-ing per-character document bitsets.
+- Typos ("dcoker" -> "docker"): a BK-tree over the distinct indexed words
+  returns the words within a small Damerau (OSA) distance of the token, and
+  their document bitsets give the candidates.
+
+Only the candidates are scored. Results are ranked and carry the matched
+character positions for highlighting.
+"""
+import heapq
+import logging
+import re
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Puntuación tipo fzf
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = 8  # Carácter al inicio de una palabra
+BONUS_CAMEL = 7  # Mayúscula tras minúscula (camelCase)
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+# Penalización por error de tecleo (distancia de edición) en coincidencias por palabra
+SCORE_TYPO = -12
+
+BOUNDARY_CHARS = frozenset(" _-./\\:,;()[]{}'\"#@")
+
+_WORD_RE = re.compile(r"[^\W_]+")  # Letras y dígitos (el guion bajo separa palabras)
+
+
+class FuzzyMatch(NamedTuple):
+    """One ranked fuzzy search result"""
+    key: Any  # Key of the matched document
+    score: float
+    positions: Tuple[int, ...]  # Matched character offsets in the document text
+
+
+def max_typos(token: str) -> int:
+    """Edit distance tolerated for a query token (none for very short tokens)"""
+    if len(token) < 3:
+        return 0
+    return 1 if len(token) <= 5 else 2
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions)
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Stop early and return limit + 1 once the distance must exceed it
+
+    Returns:
+        int: Distance
+    """
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if limit is not None and row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree of words under edit_distance"""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root = None  # [word, {distance: child}]
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """Insert a word (duplicates are ignored)"""
+        if self._root is None:
+            self._root = [word, {}]
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find the words within max_distance of a word
+
+        Only subtrees whose edge distance can still satisfy the triangle
+        inequality are visited.
+
+        Returns:
+            List[Tuple[str, int]]: (word, distance) pairs
+        """
+        if self._root is None:
+            return []
+
+        found = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = edit_distance(word, node_word)
+            if distance <= max_distance:
+                found.append((node_word, distance))
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return found
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _bitset(indices: List[int], size: int) -> int:
+    """Build a document bitset (Python int) from document indices"""
+    data = bytearray((size + 7) // 8)
+    for index in indices:
+        data[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(data, 'little')
+
+
+def _bit_indices(bits: int) -> List[int]:
+    """Document indices set in a bitset, ascending"""
+    binary = bin(bits)[:1:-1]  # LSB first, sin '0b'
+    indices = []
+    index = binary.find('1')
+    while index >= 0:
+        indices.append(index)
+        index = binary.find('1', index + 1)
+    return indices
+
+
+def _char_bonus(text: str, position: int) -> int:
+    """fzf-style bonus of matching the character at a position"""
+    if position == 0 or text[position - 1] in BOUNDARY_CHARS:
+        return BONUS_BOUNDARY
+    if text[position].isupper() and text[position - 1].islower():
+        return BONUS_CAMEL
+    return 0
+
+
+def score_positions(text: str, positions: List[int]) -> int:
+    """Score a set of matched positions (consecutive runs and word starts score higher)"""
+    score = 0
+    previous = None
+    for n, position in enumerate(positions):
+        bonus = _char_bonus(text, position)
+        if n == 0:
+            bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+        score += SCORE_MATCH + bonus
+        if previous is not None:
+            gap = position - previous - 1
+            if gap == 0:
+                score += BONUS_CONSECUTIVE
+            else:
+                score += SCORE_GAP_START + SCORE_GAP_EXTENSION * (gap - 1)
+        previous = position
+    return score
+
+
+def subsequence_match(token: str, text: str, lower: str) -> Optional[Tuple[int, List[int]]]:
+    """
+    Match a token as a subsequence of a text (fzf v1: shortest window, then score)
+
+    Args:
+        token: Lowercase query token
+        text: Original document text (for case/boundary bonuses)
+        lower: Lowercase document text
+
+    Returns:
+        (score, positions) or None if the token isn't a subsequence
+    """
+    # Contiguous occurrence: prefer one that starts a word
+    start = lower.find(token)
+    if start >= 0:
+        best = None
+        while start >= 0:
+            positions = list(range(start, start + len(token)))
+            score = score_positions(text, positions)
+            if best is None or score > best[0]:
+                best = (score, positions)
+            if _char_bonus(text, start):
+                break
+            start = lower.find(token, start + 1)
+        return best
+
+    # Forward: first window end
+    position = -1
+    for char in token:
+        position = lower.find(char, position + 1)
+        if position < 0:
+            return None
+    end = position
+
+    # Backward: tightest window start
+    for char in reversed(token):
+        position = lower.rfind(char, 0, position + 1 if position == end else position)
+    start = position
+
+    positions = []
+    position = start - 1
+    for char in token:
+        position = lower.find(char, position + 1, end + 1)
+        positions.append(position)
+    return score_positions(text, positions), positions
+
+
+class FuzzyIndex:
+    """Precomputed fuzzy search index over (key, text) documents"""
+
+    def __init__(self, documents: Iterable[Tuple[Any, str]]):
+        """
+        Build the index
+
+        Args:
+            documents: (key, text) pairs; keys are returned in FuzzyMatch.key
+        """
+        self.keys: List[Any] = []
+        self.texts: List[str] = []
+        self.lower: List[str] = []
+
+        char_docs: Dict[str, List[int]] = {}
+        word_docs: Dict[str, List[int]] = {}
+        for index, (key, text) in enumerate(documents):
+            text = text or ''
+            lower = text.lower()
+            self.keys.append(key)
+            self.texts.append(text)
+            self.lower.append(lower)
+            for char in set(lower):
+                char_docs.setdefault(char, []).append(index)
+            for word in set(_WORD_RE.findall(lower)):
+                word_docs.setdefault(word, []).append(index)
+
+        size = len(self.keys)
+        self._all = (1 << size) - 1
+        self._char_bits = {char: _bitset(indices, size) for char, indices in char_docs.items()}
+        self._word_bits = {word: _bitset(indices, size) for word, indices in word_docs.items()}
+        self._word_docs = {word: frozenset(indices) for word, indices in word_docs.items()}
+        # Solo palabras con letras de longitud suficiente admiten errores de tecleo
+        self._words = BKTree(word for word in word_docs if len(word) >= 3 and not word.isdigit())
+
+        logger.debug(f"FuzzyIndex built: {size} documents, {len(self._char_bits)} chars, {len(self._words)} words")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def search(self, query: str, limit: Optional[int] = 50) -> List[FuzzyMatch]:
+        """
+        Fuzzy search
+
+        Every whitespace-separated token must match the document, either as
+        a subsequence or as a word within its typo budget (see max_typos).
+
+        Args:
+            query: Search query
+            limit: Maximum results (None = all)
+
+        Returns:
+            List[FuzzyMatch]: Best matches first (ties keep document order)
+        """
+        tokens = query.lower().split()
+        if not tokens or not self.keys:
+            return []
+
+        candidates = self._all
+        typo_words = []
+        # Filtro de subsecuencia en C ("abc" -> "a.*?b.*?c") antes de puntuar en Python
+        patterns = [re.compile('.*?'.join(map(re.escape, token)), re.DOTALL) for token in tokens]
+        for token in tokens:
+            token_bits = self._all
+            for char in set(token):
+                token_bits &= self._char_bits.get(char, 0)
+
+            # Palabras cercanas (BK-tree): candidatos adicionales por error de tecleo
+            words = self._words.search(token, max_typos(token)) if max_typos(token) else []
+            for word, _ in words:
+                token_bits |= self._word_bits[word]
+            typo_words.append(words)
+
+            candidates &= token_bits
+            if not candidates:
+                return []
+
+        scored = []
+        for index in _bit_indices(candidates):
+            result = self._score_document(index, tokens, patterns, typo_words)
+            if result is not None:
+                scored.append((result[0], -index, result[1]))
+
+        best = heapq.nlargest(limit, scored) if limit is not None else sorted(scored, reverse=True)
+        return [FuzzyMatch(self.keys[-neg_index], score, positions) for score, neg_index, positions in best]
+
+    def _score_document(self, index: int, tokens: List[str], patterns: List[re.Pattern],
+                        typo_words: List[List[Tuple[str, int]]]) -> Optional[Tuple[int, Tuple[int, ...]]]:
+        """Score one candidate document; None if some token doesn't match"""
+        text = self.texts[index]
+        lower = self.lower[index]
+        total = 0
+        matched = set()
+
+        for token, pattern, words in zip(tokens, patterns, typo_words):
+            best = subsequence_match(token, text, lower) if pattern.search(lower) else None
+
+            for word, distance in words:
+                if index not in self._word_docs[word]:
+                    continue
+                start = self._find_word(lower, word)
+                if start < 0:
+                    continue
+                positions = list(range(start, start + len(word)))
+                score = score_positions(text, positions) * len(token) // max(len(word), 1) \
+                    + SCORE_TYPO * distance
+                if best is None or score > best[0]:
+                    best = (score, positions)
+
+            if best is None:
+                return None
+            total += best[0]
+            matched.update(best[1])
+
+        return total, tuple(sorted(matched))
+
+    @staticmethod
+    def _find_word(lower: str, word: str) -> int:
+        """Offset of a whole word in a lowercase text, -1 if absent"""
+        start = lower.find(word)
+        while start >= 0:
+            end = start + len(word)
+            if (start == 0 or not lower[start - 1].isalnum()) and (end == len(lower) or not lower[end].isalnum()):
+                return start
+            start = lower.find(word, start + 1)
+        return -1
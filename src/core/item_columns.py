@@ -0,0 +1,263 @@
+"""
+Item Columns
+Vectorized filter masks and top-k ranking over the ItemStore columns.
+Uses NumPy when it is installed (masks are boolean arrays and top-N uses
+argpartition); otherwise the same operations run as Python loops over the
+array columns, with identical results.
+"""
+import heapq
+import operator
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from core.item_store import (
+    FLAG_FAVORITE, FLAG_LIST, FLAG_SENSITIVE, FLAG_TAGGED, TYPE_CODES, ItemStore
+)
+from models.item import ItemType
+
+HAS_NUMPY = np is not None
+
+# Filtros de AdvancedFilterEngine que se resuelven sobre las columnas
+VECTOR_FILTERS = ('type', 'is_favorite', 'is_sensitive', 'has_tags', 'is_list',
+                  'use_count', 'last_used', 'created_at')
+
+# Criterios de orden numéricos: (columna, descendente)
+VECTOR_SORTS = {
+    'frecency': ('frecency', True),
+    'use_count_desc': ('use_counts', True),
+    'use_count_asc': ('use_counts', False),
+    'recent': ('last_used', True),
+    'oldest': ('created_at', False),
+}
+
+COMPARISONS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le, '=': operator.eq}
+
+
+class ColumnSnapshot:
+    """Copy of the ItemStore columns (NumPy arrays when available) at one store version"""
+
+    _NUMPY_TYPES = {'q': 'int64', 'B': 'uint8', 'd': 'float64'}
+
+    def __init__(self, store: ItemStore):
+        self.version = store.version
+        self.size = len(store)
+        for name in ('ids', 'category_ids', 'type_codes', 'flags', 'use_counts', 'last_used', 'created_at',
+                     'frecency'):
+            column = getattr(store, name)
+            if HAS_NUMPY:
+                column = np.frombuffer(column, dtype=self._NUMPY_TYPES[column.typecode]).copy()
+            else:
+                column = column[:]
+            setattr(self, name, column)
+
+
+def snapshot(store: ItemStore, previous: Optional[ColumnSnapshot] = None) -> ColumnSnapshot:
+    """
+    Get a column snapshot of the store, reusing `previous` if the store didn't change
+
+    Args:
+        store: Item store
+        previous: Last snapshot taken of this store
+
+    Returns:
+        ColumnSnapshot: Up-to-date snapshot
+    """
+    if previous is not None and previous.version == store.version:
+        return previous
+    return ColumnSnapshot(store)
+
+
+def date_filter_bounds(date_filter: Dict[str, Any], now: Optional[datetime] = None):
+    """
+    Convert a last_used/created_at filter to an epoch range
+
+    Args:
+        date_filter: {"preset": ...} or {"custom_from": datetime, "custom_to": datetime}
+        now: Reference time (default: now)
+
+    Returns:
+        (from_ts, to_ts) tuple, 'never' for the never-used preset, or None if the filter doesn't apply
+    """
+    now = now or datetime.now()
+
+    if 'preset' in date_filter:
+        preset = date_filter['preset']
+        if preset == 'never':
+            return 'never'
+
+        starts = {
+            'today': now.replace(hour=0, minute=0, second=0, microsecond=0),
+            'this_week': now - timedelta(days=now.weekday()),
+            'this_month': now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+            'last_7_days': now - timedelta(days=7),
+            'last_30_days': now - timedelta(days=30),
+            'last_90_days': now - timedelta(days=90),
+        }
+        if preset not in starts:
+            return None
+        return starts[preset].timestamp(), float('inf')
+
+    if 'custom_from' in date_filter and 'custom_to' in date_filter:
+        return date_filter['custom_from'].timestamp(), date_filter['custom_to'].timestamp()
+
+    return None
+
+
+def build_mask(columns: ColumnSnapshot, filters: Dict[str, Any], now: Optional[datetime] = None):
+    """
+    Evaluate the column filters of an AdvancedFilterEngine filter dict
+
+    Args:
+        columns: Column snapshot
+        filters: Filter dict (keys outside VECTOR_FILTERS are ignored)
+        now: Reference time for date presets
+
+    Returns:
+        Boolean mask over the snapshot rows (NumPy array, or list without NumPy)
+    """
+    mask = _full(columns.size)
+
+    types = filters.get('type')
+    if types:
+        codes = {TYPE_CODES[ItemType.parse(value)] for value in types}
+        mask = _and(mask, _isin(columns.type_codes, codes))
+
+    for key, bit in (('is_favorite', FLAG_FAVORITE), ('is_sensitive', FLAG_SENSITIVE),
+                     ('has_tags', FLAG_TAGGED), ('is_list', FLAG_LIST)):
+        if filters.get(key) is not None:
+            mask = _and(mask, _flag(columns.flags, bit, bool(filters[key])))
+
+    count_filter = filters.get('use_count')
+    if count_filter:
+        compare = COMPARISONS.get(count_filter.get('operator', '>'))
+        if compare is None:
+            return _full(columns.size, False)
+        mask = _and(mask, _compare(columns.use_counts, compare, count_filter.get('value', 0)))
+
+    for key, column in (('last_used', columns.last_used), ('created_at', columns.created_at)):
+        if not filters.get(key):
+            continue
+        bounds = date_filter_bounds(filters[key], now)
+        if bounds is None:
+            continue
+        if bounds == 'never':
+            mask = _and(mask, _compare(columns.use_counts, operator.eq, 0))
+            continue
+        mask = _and(mask, _compare(column, operator.ge, bounds[0]))
+        if bounds[1] != float('inf'):
+            mask = _and(mask, _compare(column, operator.le, bounds[1]))
+
+    return mask
+
+
+def select_positions(mask, rows) -> List[int]:
+    """
+    Positions of `rows` whose store row passes the mask
+
+    Args:
+        mask: Mask from build_mask
+        rows: Store row of each candidate item
+
+    Returns:
+        List[int]: Positions into `rows`, in order
+    """
+    if HAS_NUMPY:
+        return np.flatnonzero(mask[rows]).tolist()
+    return [position for position, row in enumerate(rows) if mask[row]]
+
+
+def order_positions(column, rows, positions: List[int], descending: bool,
+                    limit: Optional[int] = None) -> List[int]:
+    """
+    Stable-sort candidate positions by a column (ties keep their order)
+
+    Args:
+        column: Snapshot column (indexed by store row)
+        rows: Store row of each candidate item
+        positions: Positions into `rows` to sort
+        descending: Sort direction
+        limit: Keep only the first `limit` positions (top-N)
+
+    Returns:
+        List[int]: Sorted positions
+    """
+    if not positions:
+        return []
+
+    if HAS_NUMPY:
+        positions = np.asarray(positions)
+        values = column[rows[positions]]
+        scores = -values if descending else values
+        order = top_k(-scores, limit) if limit is not None else np.argsort(scores, kind='stable')
+        return positions[order].tolist()
+
+    ordered = sorted(positions, key=lambda position: column[rows[position]], reverse=descending)
+    return ordered[:limit] if limit is not None else ordered
+
+
+def top_k(scores: Sequence, k: Optional[int]) -> List[int]:
+    """
+    Indices of the k highest scores, highest first (ties: lowest index first)
+
+    With NumPy this is O(n): argpartition finds the k-th score and only the
+    k selected indices are sorted.
+
+    Args:
+        scores: Scores (NumPy array or sequence)
+        k: Number of indices (None = all)
+
+    Returns:
+        Indices into `scores`
+    """
+    size = len(scores)
+    if k is None or k >= size:
+        k = size
+    if k <= 0:
+        return []
+
+    if HAS_NUMPY:
+        scores = np.asarray(scores)
+        if k < size:
+            kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            above = np.flatnonzero(scores > kth)
+            ties = np.flatnonzero(scores == kth)[:k - len(above)]
+            selected = np.concatenate((above, ties))
+        else:
+            selected = np.arange(size)
+        return selected[np.lexsort((selected, -scores[selected]))]
+
+    return heapq.nsmallest(k, range(size), key=lambda index: (-scores[index], index))
+
+
+# ========== PRIMITIVAS (NumPy / Python) ==========
+
+def _full(size: int, value: bool = True):
+    return np.full(size, value, dtype=bool) if HAS_NUMPY else [value] * size
+
+
+def _and(mask, other):
+    return mask & other if HAS_NUMPY else [a and b for a, b in zip(mask, other)]
+
+
+def _compare(column, compare, value):
+    return compare(column, value) if HAS_NUMPY else [compare(v, value) for v in column]
+
+
+def _flag(flags, bit: int, expected: bool):
+    if HAS_NUMPY:
+        return ((flags & bit) != 0) == expected
+    return [bool(value & bit) == expected for value in flags]
+
+
+def _isin(column, values: set):
+    if HAS_NUMPY:
+        # Tabla de búsqueda: los códigos de tipo caben en un byte
+        lookup = np.zeros(256, dtype=bool)
+        lookup[list(values)] = True
+        return lookup[column]
+    return [value in values for value in column]
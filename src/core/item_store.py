@@ -0,0 +1,289 @@
+"""
+Item Store
+Shared, compact in-memory store of items. Every view gets the same Item
+object for a given item id (identity map), and the hot scalar fields live in
+typed columns (array module) so filters can scan them without touching the
+Item objects. Category names, icons and tags are interned, so thousands of
+items share one string per distinct value.
+"""
+import logging
+import sys
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from models.item import Item, ItemType
+
+logger = logging.getLogger(__name__)
+
+# Código compacto de cada tipo (columna type_codes)
+TYPE_CODES = {ItemType.TEXT: 0, ItemType.URL: 1, ItemType.CODE: 2, ItemType.PATH: 3}
+
+# Bits de la columna flags
+FLAG_SENSITIVE = 1
+FLAG_FAVORITE = 2
+FLAG_ACTIVE = 4
+FLAG_ARCHIVED = 8
+FLAG_LIST = 16
+FLAG_TAGGED = 32
+
+_intern = sys.intern
+
+
+def _intern_optional(value):
+    """Intern a string value, leaving None/non-strings untouched"""
+    return _intern(value) if value.__class__ is str else value
+
+
+def parse_timestamp(value) -> float:
+    """
+    Convert a SQLite timestamp to epoch seconds
+
+    Args:
+        value: 'YYYY-MM-DD HH:MM:SS' string, datetime or None
+
+    Returns:
+        float: Epoch seconds, 0.0 if missing or invalid
+    """
+    if not value:
+        return 0.0
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def item_from_row(data: Dict) -> Item:
+    """
+    Build an Item from a database row (not registered in any store)
+
+    Args:
+        data: Item row as dict (content already decrypted)
+
+    Returns:
+        Item: New Item
+    """
+    item = Item(
+        item_id=str(data['id']),  # Convert to string for compatibility
+        label=data['label'],
+        content=data.get('content') or '',
+        item_type=ItemType.parse(data.get('type')),
+        icon=_intern_optional(data.get('icon')),
+        is_sensitive=bool(data.get('is_sensitive', False)),
+        is_favorite=bool(data.get('is_favorite', False)),
+        tags=[_intern(tag) for tag in data.get('tags') or [] if isinstance(tag, str)],
+        description=data.get('description'),
+        working_dir=data.get('working_dir'),
+        color=_intern_optional(data.get('color')),
+        is_active=bool(data.get('is_active', True)),
+        is_archived=bool(data.get('is_archived', False)),
+        is_list=bool(data.get('is_list', False)),
+        list_group=_intern_optional(data.get('list_group')),
+        orden_lista=data.get('orden_lista') or 0
+    )
+    item.frecency = float(data.get('frecency') or 0.0)
+    if 'category_name' in data:
+        item.category_name = _intern_optional(data['category_name'])
+        item.category_icon = _intern_optional(data.get('category_icon'))
+        item.category_color = _intern_optional(data.get('category_color'))
+    return item
+
+
+class ItemStore:
+    """Identity map of Item objects with struct-of-arrays columns for filtering"""
+
+    def __init__(self):
+        self._items: List[Item] = []  # Row -> Item
+        self._rows: Dict[str, int] = {}  # Item id -> row
+        self.version = 0  # Bumped on every change (invalidates column snapshots)
+
+        # Columnas alineadas con _items
+        self.ids = array('q')  # Numeric database id (-1 if not saved yet)
+        self.category_ids = array('q')
+        self.type_codes = array('B')
+        self.flags = array('B')
+        self.use_counts = array('q')
+        self.last_used = array('d')  # Epoch seconds, 0.0 = never used
+        self.created_at = array('d')
+        self.frecency = array('d')  # Valor almacenado de items.frecency
+
+    # ========== PUBLIC API ==========
+
+    def upsert_row(self, data: Dict) -> Item:
+        """
+        Get the shared Item for a database row, creating or refreshing it
+
+        An existing Item is updated in place, so every view holding it sees
+        the new values.
+
+        Args:
+            data: Item row as dict (content already decrypted)
+
+        Returns:
+            Item: Shared Item for data['id']
+        """
+        item_id = str(data['id'])
+        row = self._rows.get(item_id)
+        fresh = item_from_row(data)
+
+        if row is None:
+            item = fresh
+            self._rows[item_id] = len(self._items)
+            self._items.append(item)
+            self._append_columns()
+            row = self._rows[item_id]
+        else:
+            # Solo las columnas presentes en la fila (una proyección no borra content)
+            item = self._items[row]
+            for name in Item.__slots__:
+                if name in data and name not in ('id', 'created_at', 'last_used'):
+                    setattr(item, name, getattr(fresh, name))
+
+        self._write_row(row, item, data)
+        self.version += 1
+        return item
+
+    def upsert_rows(self, rows: Iterable[Dict]) -> List[Item]:
+        """Get the shared Items for several database rows"""
+        return [self.upsert_row(data) for data in rows]
+
+    def get(self, item_id) -> Optional[Item]:
+        """Get the shared Item for an id, or None if it isn't loaded"""
+        row = self._rows.get(str(item_id))
+        return self._items[row] if row is not None else None
+
+    def refresh(self, item: Item) -> None:
+        """
+        Re-read the flag/type/frecency columns of an Item that was modified in place
+
+        Args:
+            item: Shared Item (ignored if it isn't in the store)
+        """
+        row = self._rows.get(str(item.id))
+        if row is not None and self._items[row] is item:
+            self.type_codes[row] = TYPE_CODES.get(item.type, 0)
+            self.flags[row] = self._item_flags(item)
+            self.frecency[row] = item.frecency
+            self.version += 1
+
+    def update_usage(self, item_id, use_count: int, last_used=None, frecency: Optional[float] = None) -> None:
+        """
+        Update the usage columns of an item
+
+        Args:
+            item_id: Item ID
+            use_count: New use count
+            last_used: Last use timestamp (string, datetime or None)
+            frecency: New stored frecency (None = unchanged)
+        """
+        row = self._rows.get(str(item_id))
+        if row is not None:
+            self.use_counts[row] = int(use_count or 0)
+            self.last_used[row] = parse_timestamp(last_used)
+            if frecency is not None:
+                self._items[row].frecency = self.frecency[row] = float(frecency)
+            self.version += 1
+
+    def remove(self, item_id) -> bool:
+        """
+        Remove an item (the last row is moved into its place)
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            bool: True if the item was in the store
+        """
+        row = self._rows.pop(str(item_id), None)
+        if row is None:
+            return False
+
+        last = len(self._items) - 1
+        if row != last:
+            moved = self._items[last]
+            self._items[row] = moved
+            self._rows[str(moved.id)] = row
+            for column in self._columns():
+                column[row] = column[last]
+
+        self._items.pop()
+        for column in self._columns():
+            column.pop()
+        self.version += 1
+        return True
+
+    def remove_category(self, category_id: int) -> int:
+        """
+        Remove every item of a category
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            int: Number of items removed
+        """
+        category_id = int(category_id)
+        item_ids = [self._items[row].id for row, cat_id in enumerate(self.category_ids) if cat_id == category_id]
+        for item_id in item_ids:
+            self.remove(item_id)
+        return len(item_ids)
+
+    def clear(self) -> None:
+        """Remove every item"""
+        self._items.clear()
+        self._rows.clear()
+        for column in self._columns():
+            del column[:]
+        self.version += 1
+
+    def items(self) -> List[Item]:
+        """Get every item, in row order"""
+        return list(self._items)
+
+    def item_at(self, row: int) -> Item:
+        """Get the Item of a column row"""
+        return self._items[row]
+
+    def row_of(self, item_id) -> Optional[int]:
+        """Get the column row of an item, or None if it isn't loaded"""
+        return self._rows.get(str(item_id))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id) -> bool:
+        return str(item_id) in self._rows
+
+    # ========== PRIVATE ==========
+
+    def _columns(self):
+        return (self.ids, self.category_ids, self.type_codes, self.flags,
+                self.use_counts, self.last_used, self.created_at, self.frecency)
+
+    def _append_columns(self) -> None:
+        for column in self._columns():
+            column.append(0)
+
+    def _write_row(self, row: int, item: Item, data: Dict) -> None:
+        """Fill the columns of a row from its Item and database row"""
+        self.ids[row] = int(data['id']) if str(data['id']).isdigit() else -1
+        self.category_ids[row] = int(data.get('category_id') or 0)
+        self.type_codes[row] = TYPE_CODES.get(item.type, 0)
+        self.flags[row] = self._item_flags(item)
+        self.use_counts[row] = int(data.get('use_count') or 0)
+        self.last_used[row] = parse_timestamp(data.get('last_used'))
+        self.created_at[row] = parse_timestamp(data.get('created_at'))
+        self.frecency[row] = item.frecency
+
+    @staticmethod
+    def _item_flags(item: Item) -> int:
+        return ((FLAG_SENSITIVE if item.is_sensitive else 0)
+                | (FLAG_FAVORITE if item.is_favorite else 0)
+                | (FLAG_ACTIVE if item.is_active else 0)
+                | (FLAG_ARCHIVED if item.is_archived else 0)
+                | (FLAG_LIST if item.is_list else 0)
+                | (FLAG_TAGGED if item.tags else 0))
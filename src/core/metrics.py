@@ -0,0 +1,286 @@
+"""
+Metrics
+Lightweight in-process instrumentation: counters, histograms and timers
+(context manager or decorator) collected in one registry, plus an optional
+cProfile capture. Hot paths (DBManager queries and decryption, searches,
+filters, panel rendering, command execution) record here; the Stats
+Dashboard shows the registry and it can be dumped to JSON to compare runs.
+
+A timer costs two perf_counter() calls and a locked update, and nothing
+when the registry is disabled.
+"""
+import cProfile
+import functools
+import io
+import json
+import logging
+import math
+import pstats
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Muestras recientes por histograma usadas para los percentiles
+HISTOGRAM_SAMPLES = 1024
+
+
+class Counter:
+    """Monotonic event count"""
+
+    __slots__ = ('name', 'value', '_lock')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'count': self.value}
+
+
+class Histogram:
+    """
+    Distribution of observed values
+
+    Count, total, min and max cover every observation; percentiles are
+    computed over the last HISTOGRAM_SAMPLES values.
+    """
+
+    __slots__ = ('name', 'unit', 'count', 'total', 'min', 'max', '_samples', '_lock')
+
+    def __init__(self, name: str, unit: str = 'ms', samples: int = HISTOGRAM_SAMPLES):
+        self.name = name
+        self.unit = unit
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._samples = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+            self._samples.append(value)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Value below which `fraction` of the recent samples fall (nearest rank)"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = max(0, math.ceil(fraction * len(samples)) - 1)
+        return samples[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'unit': self.unit,
+            'total': round(self.total, 3),
+            'mean': round(self.total / self.count, 3) if self.count else None,
+            'min': round(self.min, 3) if self.min is not None else None,
+            'max': round(self.max, 3) if self.max is not None else None,
+            'p50': _round(self.percentile(0.50)),
+            'p95': _round(self.percentile(0.95)),
+            'p99': _round(self.percentile(0.99)),
+        }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+class _Timer:
+    """Context manager recording the elapsed milliseconds into a histogram"""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe((time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class _NullTimer:
+    """Timer used while the registry is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Named counters and histograms, created on first use"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+
+    # ========== METRICS ==========
+
+    def counter(self, name: str) -> Counter:
+        """Get (or create) a counter"""
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, Counter(name))
+        return counter
+
+    def histogram(self, name: str, unit: str = 'ms') -> Histogram:
+        """Get (or create) a histogram"""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram(name, unit))
+        return histogram
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        """Increment a counter (no-op while disabled)"""
+        if self.enabled:
+            self.counter(name).inc(amount)
+
+    def observe(self, name: str, value: float, unit: str = 'ms') -> None:
+        """Record a value in a histogram (no-op while disabled)"""
+        if self.enabled:
+            self.histogram(name, unit).observe(value)
+
+    def timer(self, name: str):
+        """
+        Time a block in milliseconds
+
+        Usage:
+            with metrics.timer('db.query'):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name))
+
+    def timed(self, name: str) -> Callable:
+        """Decorator timing every call of a function"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Timer(self.histogram(name)):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current values of every metric
+
+        Returns:
+            Dict: {'generated_at', 'counters': {name: {...}}, 'histograms': {name: {...}}}
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'counters': {name: counters[name].snapshot() for name in sorted(counters)},
+            'histograms': {name: histograms[name].snapshot() for name in sorted(histograms)},
+        }
+
+    def dump_json(self, path: Union[str, Path]) -> Path:
+        """
+        Write the snapshot to a JSON file (for regression tracking)
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path: The written file
+        """
+        path = Path(path)
+        path.write_text(json.dumps(self.snapshot(), indent=2, ensure_ascii=False), encoding='utf-8')
+        logger.info(f"Metrics written to {path}")
+        return path
+
+    def reset(self) -> None:
+        """Forget every metric"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # ========== PROFILING ==========
+
+    @property
+    def profiling(self) -> bool:
+        """True while a cProfile capture is running"""
+        return self._profiler is not None
+
+    def start_profiling(self) -> bool:
+        """
+        Start a cProfile capture of the calling thread
+
+        Returns:
+            bool: False if a capture was already running
+        """
+        if self._profiler is not None:
+            return False
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        logger.info("Profiling started")
+        return True
+
+    def stop_profiling(self, path: Optional[Union[str, Path]] = None, limit: int = 30) -> str:
+        """
+        Stop the capture and summarize it
+
+        Args:
+            path: If given, also write the raw stats (.prof, for snakeviz/pstats)
+            limit: Functions listed in the summary
+
+        Returns:
+            str: Top functions by cumulative time ('' if no capture was running)
+        """
+        profiler, self._profiler = self._profiler, None
+        if profiler is None:
+            return ''
+        profiler.disable()
+
+        if path:
+            profiler.dump_stats(str(path))
+            logger.info(f"Profile written to {path}")
+
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+        return output.getvalue()
+
+
+# Registro de la aplicación (compartido por todos los componentes)
+metrics = MetricsRegistry()
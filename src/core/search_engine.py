@@ -4,21 +4,49 @@ Provides filtering and searching functionality for items across categories
 """
 
 from typing import List, Optional
+from functools import lru_cache
 import re
 from models.item import Item
 from models.category import Category
+from core.search_session import SearchSession
+from core.fuzzy_index import FuzzyIndex, FuzzyMatch
+from core.metrics import metrics
+
+
+@lru_cache(maxsize=64)
+def compile_query_pattern(query: str) -> re.Pattern:
+    """
+    Compile a literal, case-insensitive pattern for a search query
+
+    Memoized, so every cell and every call highlighting the same query
+    shares one compiled pattern.
+
+    Args:
+        query: Search query (already stripped)
+
+    Returns:
+        re.Pattern: Pattern matching the query anywhere in a text
+    """
+    return re.compile(re.escape(query), re.IGNORECASE)
 
 
 class SearchEngine:
     """
     Search engine for filtering items across categories
-    Performs case-insensitive search on item labels and content
+    Performs case-insensitive search on item labels and content.
+    Results are ranked by frecency (frequent and recent items first).
     """
 
     def __init__(self):
         """Initialize search engine"""
-        pass
-
+        # Sesiones incrementales: refinan el resultado anterior mientras se escribe
+        self._session = SearchSession(self._match_item)
+        self._category_session = SearchSession(self._match_item)
+        # Índice difuso sobre labels y tags, reconstruido solo si cambian las categorías
+        self._fuzzy_index: Optional[FuzzyIndex] = None
+        self._fuzzy_version = None
+
+    @metrics.timed('search.global')
     def search(self, query: str, categories: List[Category]) -> List[Item]:
         """
         Search for items matching the query across all categories
@@ -28,44 +56,32 @@ class SearchEngine:
             categories: List of categories to search through
 
         Returns:
-            List of items that match the query
+            List of items that match the query, by frecency
         """
         if not query or not query.strip():
             # Return all items if query is empty
             return self._get_all_items(categories)
 
-        query = query.strip().lower()
-        matching_items = []
+        # Cualquier categoría reemplazada, añadida o con otra cantidad de items reinicia la sesión
+        version = tuple((id(category.items), len(category.items), category.is_active) for category in categories)
+        matching_items = self._session.search(
+            query.strip(),
+            (item for category in categories if category.is_active for item in category.items),
+            source=categories,
+            version=version
+        )
 
-        for category in categories:
-            if not category.is_active:
-                continue
+        return self.rank_by_frecency(matching_items)
 
-            for item in category.items:
-                # Search in label, content, and tags
-                label_match = query in item.label.lower()
-                content_match = query in item.content.lower()
-
-                # Search in tags
-                tags_match = False
-                if item.tags:
-                    for tag in item.tags:
-                        if query in tag.lower():
-                            tags_match = True
-                            break
-
-                if label_match or content_match or tags_match:
-                    matching_items.append(item)
-
-        return matching_items
-
-    def search_in_category(self, query: str, category: Category) -> List[Item]:
+    @metrics.timed('search.category')
+    def search_in_category(self, query: str, category: Category, rank: bool = True) -> List[Item]:
         """
         Search for items matching the query within a specific category
 
         Args:
             query: Search query string (case-insensitive)
             category: Category to search in
+            rank: Sort the results by frecency (False keeps the category order)
 
         Returns:
             List of items that match the query in the category
@@ -73,26 +89,72 @@ class SearchEngine:
         if not query or not query.strip():
             return category.items
 
-        query = query.strip().lower()
-        matching_items = []
+        matching_items = self._category_session.search(
+            query.strip(), category.items, source=category.items, version=len(category.items)
+        )
 
-        for item in category.items:
-            # Search in label, content, and tags
-            label_match = query in item.label.lower()
-            content_match = query in item.content.lower()
+        return self.rank_by_frecency(matching_items) if rank else matching_items
 
-            # Search in tags
-            tags_match = False
-            if item.tags:
-                for tag in item.tags:
-                    if query in tag.lower():
-                        tags_match = True
-                        break
+    @metrics.timed('search.fuzzy')
+    def search_fuzzy(self, query: str, categories: List[Category], limit: Optional[int] = 50) -> List[FuzzyMatch]:
+        """
+        Typo-tolerant search over item labels and tags ("dcoker" finds "docker")
 
-            if label_match or content_match or tags_match:
-                matching_items.append(item)
+        Args:
+            query: Search query string (case-insensitive)
+            categories: List of categories to search through
+            limit: Maximum results (None = all)
 
-        return matching_items
+        Returns:
+            List[FuzzyMatch]: Best matches first; match.key is the Item and
+                match.positions are offsets in "label tag1 tag2...", so
+                positions below len(item.label) highlight the label
+        """
+        if not query or not query.strip():
+            return []
+
+        version = tuple((id(category.items), len(category.items), category.is_active) for category in categories)
+        if self._fuzzy_index is None or version != self._fuzzy_version:
+            self._fuzzy_index = FuzzyIndex(
+                (item, ' '.join([item.label] + list(item.tags or [])))
+                for category in categories if category.is_active for item in category.items
+            )
+            self._fuzzy_version = version
+
+        return self._fuzzy_index.search(query, limit=limit)
+
+    def invalidate(self) -> None:
+        """Forget memoized results (call after editing items in place)"""
+        self._session.reset()
+        self._category_session.reset()
+        self._fuzzy_index = None
+
+    @staticmethod
+    def _match_item(item: Item, query: str) -> Optional[Item]:
+        """
+        Match an item's label, content and tags against a lowercase query
+
+        Returns:
+            The item if it matches, None otherwise
+        """
+        if query in item.label.lower() or query in item.content.lower():
+            return item
+        if item.tags and any(query in tag.lower() for tag in item.tags):
+            return item
+        return None
+
+    @staticmethod
+    def rank_by_frecency(items: List[Item]) -> List[Item]:
+        """
+        Sort items by frecency, highest first (ties keep their order)
+
+        Args:
+            items: Items to rank
+
+        Returns:
+            New sorted list
+        """
+        return sorted(items, key=lambda item: item.frecency, reverse=True)
 
     def highlight_matches(self, text: str, query: str) -> str:
         """
@@ -108,16 +170,9 @@ class SearchEngine:
         if not query or not query.strip():
             return text
 
-        query = query.strip()
-
-        # Escape special regex characters
-        escaped_query = re.escape(query)
-
         # Case-insensitive replacement with <mark> tags
-        pattern = re.compile(f'({escaped_query})', re.IGNORECASE)
-        highlighted = pattern.sub(r'<mark>\1</mark>', text)
-
-        return highlighted
+        pattern = compile_query_pattern(query.strip())
+        return pattern.sub(r'<mark>\g<0></mark>', text)
 
     def _get_all_items(self, categories: List[Category]) -> List[Item]:
         """
@@ -0,0 +1,94 @@
+"""
+Search Session
+Incremental search over a fixed corpus. Results are memoized per query in a
+small LRU, and a query that contains a previous query (typing "doc" ->
+"dock" -> "docke") only re-checks the previous matches instead of the whole
+corpus, since a substring match of the longer query implies a match of the
+shorter one. Deleting characters hits the cache; only a non-refining change
+rescans the corpus.
+"""
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Consultas memorizadas por sesión
+DEFAULT_CACHE_SIZE = 16
+
+
+class SearchSession:
+    """Memoized, prefix-refining substring search over one corpus"""
+
+    def __init__(self, matcher: Callable[[Any, str], Any], cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize search session
+
+        Args:
+            matcher: matcher(entry, query_lower) -> match result, or a falsy value
+                if the entry doesn't match. Must be a substring test, so that
+                every entry matching a query also matches its substrings.
+            cache_size: Number of queries kept in the LRU
+        """
+        self.matcher = matcher
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[List[Any], List[Any]]]" = OrderedDict()  # query -> (entries, results)
+        self._source = None
+        self._version: Optional[Hashable] = None
+        self.last_scanned = 0  # Entries evaluated by the last search (0 = cache hit)
+
+    def search(self, query: str, corpus: Iterable, source: Any = None,
+               version: Optional[Hashable] = None) -> List[Any]:
+        """
+        Search the corpus
+
+        Args:
+            query: Search query (case-insensitive)
+            corpus: Entries to search; only iterated on a full scan, so a
+                generator avoids building the corpus on refinements
+            source: Object the corpus comes from; a different object resets the cache
+            version: Change token of the source (e.g. its length); a new value
+                resets the cache
+
+        Returns:
+            List of match results, in corpus order
+        """
+        if source is not self._source or version != self._version:
+            self.reset()
+            self._source = source
+            self._version = version
+
+        key = query.lower()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.last_scanned = 0
+            return list(cached[1])
+
+        # Refinar la consulta memorizada más larga contenida en la nueva
+        base = max((previous for previous in self._cache if previous in key), key=len, default=None)
+        entries = self._cache[base][0] if base is not None else corpus
+
+        matcher = self.matcher
+        matched, results, scanned = [], [], 0
+        for entry in entries:
+            scanned += 1
+            result = matcher(entry, key)
+            if result:
+                matched.append(entry)
+                results.append(result)
+
+        self.last_scanned = scanned
+        self._cache[key] = (matched, results)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        logger.debug(f"Search '{key}': {len(results)} matches, {scanned} entries scanned"
+                     f"{f' (refined from {base!r})' if base is not None else ''}")
+        return list(results)
+
+    def reset(self) -> None:
+        """Forget every memoized query (call after editing entries in place)"""
+        self._cache.clear()
+        self._source = None
+        self._version = None
@@ -0,0 +1,137 @@
+"""
+Search Worker
+Runs searches on a QThreadPool so slow queries never block the UI thread.
+Every submitted search gets a generation number; submitting a new search
+(or cancelling) supersedes the previous ones, whose work is dropped as soon
+as the worker notices. Results are streamed back in chunks through queued
+signals, so the UI thread only ever applies them.
+"""
+import logging
+import threading
+from typing import Callable, Iterable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+# Resultados por señal chunk_ready
+CHUNK_SIZE = 200
+
+# Pasos del productor entre comprobaciones de cancelación
+CANCEL_CHECK_INTERVAL = 256
+
+
+class _SearchTask(QRunnable):
+    """Pool task running one search generation"""
+
+    def __init__(self, executor: 'SearchExecutor', generation: int, producer: Callable[[], Iterable]):
+        super().__init__()
+        self.executor = executor
+        self.generation = generation
+        self.producer = producer
+
+    def run(self):
+        self.executor._run(self.generation, self.producer)
+
+
+class SearchExecutor(QObject):
+    """Background search executor with generation-based cancellation"""
+
+    # Signals (emitted from the worker thread, delivered on the receiver's thread)
+    chunk_ready = pyqtSignal(int, object)  # generation, list of results
+    search_finished = pyqtSignal(int, int)  # generation, total results
+    search_failed = pyqtSignal(int, str)  # generation, error message
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, parent=None):
+        """
+        Initialize search executor
+
+        Args:
+            chunk_size: Results per chunk_ready signal
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.chunk_size = chunk_size
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        # Un solo hilo: las búsquedas se ejecutan en orden y nunca en paralelo
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    @property
+    def generation(self) -> int:
+        """Generation of the latest submitted search"""
+        return self._generation
+
+    def submit(self, producer: Callable[[], Iterable]) -> int:
+        """
+        Start a search, superseding any running or queued one
+
+        Args:
+            producer: Called on the worker thread; returns an iterable of
+                results. Falsy values are skipped, so a producer that scans
+                many entries can yield None for non-matches and still be
+                cancelled promptly.
+
+        Returns:
+            int: Generation of the new search
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self._pool.start(_SearchTask(self, generation, producer))
+        return generation
+
+    def cancel(self) -> None:
+        """Supersede the current search without starting a new one"""
+        with self._lock:
+            self._generation += 1
+
+    def is_current(self, generation: int) -> bool:
+        """Check whether a generation is still the latest one"""
+        return generation == self._generation
+
+    def wait(self, msecs: int = -1) -> bool:
+        """
+        Wait until every queued search has run (tests and shutdown)
+
+        Args:
+            msecs: Timeout in milliseconds (-1 = no timeout)
+
+        Returns:
+            bool: True if the pool is idle
+        """
+        return self._pool.waitForDone(msecs)
+
+    def _run(self, generation: int, producer: Callable[[], Iterable]) -> None:
+        """Worker thread: iterate the producer and stream the results"""
+        if not self.is_current(generation):
+            return  # Superada antes de empezar
+
+        try:
+            chunk, total = [], 0
+            for step, result in enumerate(producer(), start=1):
+                if step % CANCEL_CHECK_INTERVAL == 0 and not self.is_current(generation):
+                    logger.debug(f"Search generation {generation} cancelled after {step} steps")
+                    return
+                if not result:
+                    continue
+
+                chunk.append(result)
+                total += 1
+                if len(chunk) >= self.chunk_size:
+                    if not self.is_current(generation):
+                        return
+                    self.chunk_ready.emit(generation, chunk)
+                    chunk = []
+
+            if not self.is_current(generation):
+                return
+            if chunk:
+                self.chunk_ready.emit(generation, chunk)
+            self.search_finished.emit(generation, total)
+
+        except Exception as e:
+            logger.error(f"Search generation {generation} failed: {e}", exc_info=True)
+            self.search_failed.emit(generation, str(e))
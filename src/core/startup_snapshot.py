@@ -0,0 +1,172 @@
+"""
+Startup Snapshot
+Compact on-disk copy of what the sidebar needs to paint (categories,
+ordering, icons, colors, item ids and labels). It never contains item
+content, descriptions or any other secret data.
+"""
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from models.category import Category
+from models.item import Item, ItemType
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "startup_snapshot.json"
+SNAPSHOT_VERSION = 1
+
+# Category columns stored in the snapshot
+CATEGORY_FIELDS = ('id', 'name', 'icon', 'order_index', 'is_active', 'is_predefined',
+                   'color', 'badge', 'is_pinned', 'pinned_order')
+
+# Item columns stored in the snapshot (no content)
+ITEM_FIELDS = ('id', 'label', 'type', 'icon', 'color', 'is_sensitive', 'is_favorite',
+               'is_list', 'list_group', 'orden_lista')
+
+
+class StartupSnapshot:
+    """Reads and writes the startup snapshot file"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Snapshot file path
+        """
+        self.path = Path(path)
+        self.watermark: Optional[Dict[str, Any]] = None  # Watermark of the loaded snapshot
+
+    def save(self, categories: List[Dict], items: List[Dict], watermark: Dict[str, Any]) -> bool:
+        """
+        Write the snapshot atomically
+
+        Args:
+            categories: Category rows (as returned by DBManager.get_categories)
+            items: Item rows without content (DBManager.get_item_summaries)
+            watermark: DBManager.get_data_watermark() taken with the same data
+
+        Returns:
+            bool: True if written
+        """
+        try:
+            items_by_category: Dict[int, List[list]] = {}
+            for item in items:
+                items_by_category.setdefault(item['category_id'], []).append(
+                    [item.get(field) for field in ITEM_FIELDS]
+                )
+
+            data = {
+                'version': SNAPSHOT_VERSION,
+                'created_at': datetime.now().isoformat(),
+                'watermark': watermark,
+                'category_fields': CATEGORY_FIELDS,
+                'item_fields': ITEM_FIELDS,
+                'categories': [
+                    {
+                        'fields': [category.get(field) for field in CATEGORY_FIELDS],
+                        'items': items_by_category.get(category['id'], [])
+                    }
+                    for category in categories
+                ]
+            }
+
+            # Write to a temp file and replace, so a crash never leaves a partial snapshot
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+
+            logger.info(f"Startup snapshot saved: {len(categories)} categories, {len(items)} items")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving startup snapshot: {e}", exc_info=True)
+            return False
+
+    def load(self) -> Optional[List[Category]]:
+        """
+        Read the snapshot in one go and build lightweight Category objects
+
+        Items are created with empty content; they are only meant for painting
+        until the real data is reconciled from the database.
+
+        Returns:
+            Optional[List[Category]]: Categories, or None if missing/invalid
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            data = json.loads(self.path.read_bytes())
+
+            if data.get('version') != SNAPSHOT_VERSION:
+                logger.info("Startup snapshot version mismatch - ignoring")
+                return None
+
+            category_fields = data['category_fields']
+            item_fields = data['item_fields']
+            categories = []
+
+            for entry in data['categories']:
+                category_data = dict(zip(category_fields, entry['fields']))
+                category = Category(
+                    category_id=str(category_data['id']),
+                    name=category_data['name'],
+                    icon=category_data.get('icon') or '',
+                    order_index=category_data.get('order_index') or 0,
+                    is_active=bool(category_data.get('is_active', True)),
+                    is_predefined=bool(category_data.get('is_predefined', False)),
+                    color=category_data.get('color'),
+                    badge=category_data.get('badge')
+                )
+                category.is_pinned = bool(category_data.get('is_pinned', False))
+                category.pinned_order = category_data.get('pinned_order') or 0
+
+                # Append directly: items are unique, Category.add_item would be O(n) per item
+                for values in entry['items']:
+                    item_data = dict(zip(item_fields, values))
+                    category.items.append(self._build_item(item_data))
+                category.item_count = len(category.items)
+
+                categories.append(category)
+
+            self.watermark = data.get('watermark')
+            logger.info(f"Startup snapshot loaded: {len(categories)} categories")
+            return categories
+
+        except Exception as e:
+            logger.warning(f"Invalid startup snapshot ({e}) - ignoring")
+            return None
+
+    def is_current(self, watermark: Dict[str, Any]) -> bool:
+        """
+        Check whether the loaded snapshot matches the database
+
+        Args:
+            watermark: Current DBManager.get_data_watermark()
+
+        Returns:
+            bool: True if the database did not change since the snapshot
+        """
+        return self.watermark is not None and self.watermark == watermark
+
+    @staticmethod
+    def _build_item(data: Dict) -> Item:
+        """Build a content-less Item from snapshot fields"""
+        return Item(
+            item_id=str(data['id']),
+            label=data['label'],
+            content='',
+            item_type=ItemType.parse(data.get('type')),
+            icon=data.get('icon'),
+            is_sensitive=bool(data.get('is_sensitive', False)),
+            is_favorite=bool(data.get('is_favorite', False)),
+            color=data.get('color'),
+            is_list=bool(data.get('is_list', False)),
+            list_group=data.get('list_group'),
+            orden_lista=data.get('orden_lista') or 0
+        )
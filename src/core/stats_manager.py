@@ -5,12 +5,21 @@ Fecha: 2025-01-23
 """
 
 import sqlite3
+import sys
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.db_manager import item_list_columns
+from database.frecency import current_frecency
+from core.item_columns import HAS_NUMPY, np, top_k
 
 logger = logging.getLogger(__name__)
 
+# Días hacia atrás de cada período de los rankings (None = histórico)
+PERIOD_DAYS = {'today': 1, 'week': 7, 'month': 30, 'all': None}
+
 
 class StatsManager:
     """Gestor de estadísticas y análisis de items"""
@@ -53,10 +62,14 @@ class StatsManager:
                 }
                 days = period_map.get(period, None)
 
+            if days and HAS_NUMPY:
+                conn.close()
+                return self._rank_most_used(limit, [days])[days]
+
             if days:
                 # Uso reciente
-                cursor.execute("""
-                    SELECT i.*, COUNT(h.id) as recent_uses
+                cursor.execute(f"""
+                    SELECT {item_list_columns(conn, 'i')}, COUNT(h.id) as recent_uses
                     FROM items i
                     LEFT JOIN item_usage_history h ON i.id = h.item_id
                         AND h.used_at >= datetime('now', '-' || ? || ' days')
@@ -66,8 +79,8 @@ class StatsManager:
                 """, (days, limit))
             else:
                 # Global
-                cursor.execute("""
-                    SELECT * FROM items
+                cursor.execute(f"""
+                    SELECT {item_list_columns(conn)} FROM items
                     WHERE use_count > 0
                     ORDER BY use_count DESC, last_used DESC
                     LIMIT ?
@@ -89,8 +102,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT i.*,
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn, 'i')},
                        COUNT(h.id) as recent_uses,
                        CASE
                            WHEN i.use_count > 0
@@ -123,8 +136,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM items
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)} FROM items
                 WHERE category_id = ? AND use_count > 0
                 ORDER BY use_count DESC, last_used DESC
                 LIMIT ?
@@ -140,6 +153,132 @@ class StatsManager:
             logger.error(f"Error getting top items by category: {e}")
             return []
 
+    def get_top_frecency_items(self, limit: int = 10) -> List[Dict]:
+        """Items frecuentes y recientes (usos con decaimiento exponencial)
+
+        Recorre idx_items_frecency en orden, sin ordenar toda la tabla.
+
+        Args:
+            limit: Número máximo de items
+
+        Returns:
+            List[Dict]: Items con 'frecency_score' (usos ponderados por antigüedad)
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)} FROM items
+                WHERE frecency > 0
+                ORDER BY frecency DESC
+                LIMIT ?
+            """, (limit,))
+
+            results = cursor.fetchall()
+            conn.close()
+
+            items = [dict(row) for row in results]
+            for item in items:
+                item['frecency_score'] = round(current_frecency(item['frecency']), 2)
+            return items
+
+        except Exception as e:
+            logger.error(f"Error getting top frecency items: {e}")
+            return []
+
+    def get_most_used_by_period(self, limit: int = 10,
+                                periods: Iterable[str] = ('all', 'month', 'week', 'today')) -> Dict[str, List[Dict]]:
+        """Items más usados de varios períodos con una sola lectura del historial
+
+        Args:
+            limit: Número máximo de items por período
+            periods: Períodos ('today', 'week', 'month', 'all')
+
+        Returns:
+            Dict[str, List[Dict]]: {período: items} en el formato de get_most_used_items
+        """
+        periods = list(periods)
+        if not HAS_NUMPY:
+            return {period: self.get_most_used_items(limit=limit, period=period) for period in periods}
+
+        ranked = self._rank_most_used(limit, [PERIOD_DAYS.get(period) for period in periods])
+        return {period: ranked[PERIOD_DAYS.get(period)] for period in periods}
+
+    def _rank_most_used(self, limit: int, days_list: List[Optional[int]]) -> Dict[Optional[int], List[Dict]]:
+        """Ranking vectorizado (NumPy) de items más usados para varias ventanas de días
+
+        Args:
+            limit: Número máximo de items por ventana
+            days_list: Ventanas en días (None = uso histórico)
+
+        Returns:
+            Dict[Optional[int], List[Dict]]: {días: items}
+        """
+        try:
+            conn = self._get_connection()
+            windows = [days for days in days_list if days]
+            usage = self._load_usage_columns(conn, max(windows) if windows else 0)
+
+            ranked = {}
+            for days in dict.fromkeys(days_list):
+                if days:
+                    # Mismo orden que el SQL: usos recientes DESC, use_count DESC
+                    recent = usage.recent_uses(days)
+                    scores = recent * (int(usage.use_counts.max(initial=0)) + 1) + usage.use_counts
+                    indices = top_k(scores, limit)
+                    ranked[days] = [(usage.ids[i], {'recent_uses': int(recent[i])}) for i in indices]
+                else:
+                    # Solo items usados: use_count DESC, last_used DESC
+                    used = np.flatnonzero(usage.use_counts > 0)
+                    scores = usage.use_counts[used] * (1 << 32) + usage.last_used[used]
+                    ranked[days] = [(usage.ids[used[i]], {}) for i in top_k(scores, limit)]
+
+            rows = self._fetch_items(conn, {int(item_id) for entries in ranked.values() for item_id, _ in entries})
+            conn.close()
+
+            return {
+                days: [{**rows[int(item_id)], **extra} for item_id, extra in entries if int(item_id) in rows]
+                for days, entries in ranked.items()
+            }
+
+        except Exception as e:
+            logger.error(f"Error ranking most used items: {e}")
+            return {days: [] for days in days_list}
+
+    def _load_usage_columns(self, conn: sqlite3.Connection, days: int) -> '_UsageColumns':
+        """Leer en columnas NumPy los contadores de items y el historial de los últimos `days` días"""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+
+        now = cursor.execute("SELECT CAST(strftime('%s', 'now') AS INTEGER)").fetchone()[0]
+        items = cursor.execute("""
+            SELECT id, use_count, is_favorite, COALESCE(CAST(strftime('%s', last_used) AS INTEGER), 0)
+            FROM items
+            ORDER BY id
+        """).fetchall()
+        columns = np.array(items, dtype=np.int64).reshape(-1, 4)
+
+        history = np.empty((0, 2), dtype=np.int64)
+        if days:
+            rows = cursor.execute("""
+                SELECT item_id, CAST(strftime('%s', used_at) AS INTEGER)
+                FROM item_usage_history
+                WHERE used_at >= datetime(?, 'unixepoch')
+            """, (now - days * 86400,)).fetchall()
+            history = np.array(rows, dtype=np.int64).reshape(-1, 2)
+
+        return _UsageColumns(now, columns, history)
+
+    def _fetch_items(self, conn: sqlite3.Connection, item_ids: set) -> Dict[int, Dict]:
+        """Obtener las filas (columnas de listado) de un conjunto de items por id"""
+        if not item_ids:
+            return {}
+        placeholders = ",".join("?" * len(item_ids))
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {item_list_columns(conn)} FROM items WHERE id IN ({placeholders})", tuple(item_ids))
+        return {row['id']: dict(row) for row in cursor.fetchall()}
+
     # ==================== Items Olvidados ====================
 
     def get_never_used_items(self) -> List[Dict]:
@@ -148,8 +287,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT *,
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)},
                        julianday('now') - julianday(created_at) as days_old
                 FROM items
                 WHERE use_count = 0 OR last_used IS NULL
@@ -172,8 +311,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT *,
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)},
                        julianday('now') - julianday(last_used) as days_since_last_use
                 FROM items
                 WHERE use_count >= ?
@@ -197,8 +336,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM items
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)} FROM items
                 WHERE use_count > 0
                 ORDER BY use_count ASC, created_at DESC
                 LIMIT ?
@@ -220,10 +359,25 @@ class StatsManager:
         """Sugerir items que deberían ser favoritos"""
         try:
             conn = self._get_connection()
+
+            if HAS_NUMPY:
+                usage = self._load_usage_columns(conn, 30)
+                recent = usage.recent_uses(30)
+                candidates = np.flatnonzero((usage.is_favorite == 0) & (usage.use_counts > 10) & (recent > 5))
+                scores = recent[candidates] * (int(usage.use_counts.max(initial=0)) + 1) + usage.use_counts[candidates]
+                selected = [candidates[i] for i in top_k(scores, limit)]
+
+                rows = self._fetch_items(conn, {int(usage.ids[i]) for i in selected})
+                conn.close()
+                return [
+                    {**rows[int(usage.ids[i])], 'uses_last_30_days': int(recent[i])}
+                    for i in selected if int(usage.ids[i]) in rows
+                ]
+
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT i.*, COUNT(h.id) as uses_last_30_days
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn, 'i')}, COUNT(h.id) as uses_last_30_days
                 FROM items i
                 LEFT JOIN item_usage_history h ON i.id = h.item_id
                     AND h.used_at >= datetime('now', '-30 days')
@@ -251,8 +405,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT *,
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)},
                        julianday('now') - julianday(created_at) as days_old
                 FROM items
                 WHERE use_count = 0
@@ -276,8 +430,8 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM items
+            cursor.execute(f"""
+                SELECT {item_list_columns(conn)} FROM items
                 WHERE (shortcut IS NULL OR shortcut = '')
                   AND (is_favorite = 1 OR use_count > 20)
                 ORDER BY use_count DESC, is_favorite DESC
@@ -591,3 +745,26 @@ class StatsManager:
         except Exception as e:
             logger.error(f"Error getting health report: {e}")
             return {}
+
+
+class _UsageColumns:
+    """Columnas NumPy de uso de items (ordenadas por id) y su historial reciente"""
+
+    def __init__(self, now: int, items, history):
+        self.now = now
+        self.ids = items[:, 0]
+        self.use_counts = items[:, 1]
+        self.is_favorite = items[:, 2]
+        self.last_used = items[:, 3]
+
+        # Posición de cada uso en las columnas (se descartan usos de items borrados)
+        positions = np.searchsorted(self.ids, history[:, 0])
+        valid = positions < len(self.ids)
+        valid[valid] = self.ids[positions[valid]] == history[valid, 0]
+        self._positions = positions[valid]
+        self._used_at = history[valid, 1]
+
+    def recent_uses(self, days: int):
+        """Número de usos de cada item en los últimos `days` días (np.bincount)"""
+        in_window = self._used_at >= self.now - days * 86400
+        return np.bincount(self._positions[in_window], minlength=len(self.ids)).astype(np.int64)
@@ -5,12 +5,17 @@ Fecha: 2025-01-23
 """
 
 import sqlite3
+import sys
 import logging
 import time
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.frecency import frecency_weight
+from core.event_bus import event_bus, UsageRecorded
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,20 +39,32 @@ class UsageTracker:
     # ==================== Registro de Uso ====================
 
     def track_usage(self, item_id: int, execution_time_ms: int = 0,
-                    success: bool = True, error_message: Optional[str] = None) -> bool:
-        """Registrar uso de un item"""
+                    success: bool = True, error_message: Optional[str] = None,
+                    item=None) -> bool:
+        """Registrar uso de un item
+
+        Args:
+            item_id: ID del item
+            execution_time_ms: Duración de la ejecución
+            success: Si la ejecución tuvo éxito
+            error_message: Error de la ejecución
+            item: Item en memoria cuyo last_used/frecency se actualiza (opcional)
+        """
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            # 1. Incrementar use_count y actualizar last_used en items
+            # 1. Incrementar use_count, last_used y frecency en items
+            # (la frecencia suma el peso del uso actual: O(1), sin re-decaer los demás)
+            weight = frecency_weight()
             cursor.execute("""
                 UPDATE items
                 SET use_count = use_count + 1,
                     last_used = datetime('now'),
+                    frecency = frecency + ?,
                     updated_at = datetime('now')
                 WHERE id = ?
-            """, (item_id,))
+            """, (weight, item_id))
 
             # 2. Insertar registro en item_usage_history
             cursor.execute("""
@@ -59,6 +76,11 @@ class UsageTracker:
             conn.commit()
             conn.close()
 
+            if item is not None:
+                item.frecency += weight
+                item.update_last_used()
+            event_bus.publish(UsageRecorded(item_id, weight))
+
             logger.info(f"Tracked usage for item {item_id}: success={success}, time={execution_time_ms}ms")
             return True
 
@@ -71,12 +93,13 @@ class UsageTracker:
         return int(time.time() * 1000)
 
     def track_execution_end(self, item_id: int, start_time: int,
-                           success: bool = True, error: Optional[str] = None) -> bool:
+                           success: bool = True, error: Optional[str] = None,
+                           item=None) -> bool:
         """Finalizar tracking de ejecución"""
         end_time = int(time.time() * 1000)
         execution_time = end_time - start_time
 
-        return self.track_usage(item_id, execution_time, success, error)
+        return self.track_usage(item_id, execution_time, success, error, item=item)
 
     # ==================== Consultas Básicas ====================
 
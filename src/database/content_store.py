@@ -0,0 +1,71 @@
+"""
+Content Store helpers
+Large texts (item content, clipboard history) are stored once in the
+content_blobs table, keyed by their SHA-256, and the owning column holds a
+short reference instead of the text. Blobs are reference counted by
+DBManager and zlib-compressed above a size threshold.
+"""
+import hashlib
+import zlib
+from typing import Optional, Tuple
+
+# Texts shorter than this stay inline in their column
+BLOB_MIN_SIZE = 1024
+
+# Blobs larger than this (in bytes) are zlib-compressed when it saves space
+COMPRESS_MIN_SIZE = 4096
+COMPRESS_LEVEL = 6
+
+# Value stored in the owning column: CONTENT_REF_PREFIX + sha256 hex digest
+CONTENT_REF_PREFIX = "@@blob:sha256:"
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of a text (UTF-8)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def needs_blob(text: Optional[str]) -> bool:
+    """
+    Check whether a text must be stored in the content store
+
+    Texts that start with the reference prefix are always stored as blobs,
+    so a literal value can never be mistaken for a reference.
+    """
+    if not text or not isinstance(text, str):
+        return False
+    return len(text) >= BLOB_MIN_SIZE or text.startswith(CONTENT_REF_PREFIX)
+
+
+def make_ref(digest: str) -> str:
+    """Build the column value that references a blob"""
+    return CONTENT_REF_PREFIX + digest
+
+
+def parse_ref(value) -> Optional[str]:
+    """Return the blob hash referenced by a column value, or None for inline text"""
+    if isinstance(value, str) and value.startswith(CONTENT_REF_PREFIX):
+        return value[len(CONTENT_REF_PREFIX):]
+    return None
+
+
+def encode_blob(text: str) -> Tuple[bytes, bool, int]:
+    """
+    Encode a text for the content_blobs table
+
+    Returns:
+        Tuple[bytes, bool, int]: (data, compressed, uncompressed size in bytes)
+    """
+    raw = text.encode('utf-8')
+    if len(raw) >= COMPRESS_MIN_SIZE:
+        packed = zlib.compress(raw, COMPRESS_LEVEL)
+        if len(packed) < len(raw):
+            return packed, True, len(raw)
+    return raw, False, len(raw)
+
+
+def decode_blob(data: bytes, compressed: bool) -> str:
+    """Decode a content_blobs row back to text"""
+    if compressed:
+        data = zlib.decompress(data)
+    return bytes(data).decode('utf-8')
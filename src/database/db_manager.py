@@ -3,19 +3,76 @@ Database Manager for Widget Sidebar
 Manages SQLite database operations for settings, categories, items, and clipboard history
 """
 
+import copy
 import sqlite3
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from contextlib import contextmanager
 
+from database.content_store import (
+    CONTENT_REF_PREFIX, content_hash, decode_blob, encode_blob, make_ref, needs_blob, parse_ref
+)
+from database.frecency import initial_frecency
+from core.metrics import metrics
+from core.event_bus import (
+    event_bus, CategoryChanged, ItemAdded, ItemDeleted, ItemUpdated, SettingChanged
+)
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Los settings se leen de memoria; PRAGMA data_version (cambios de otras conexiones
+# o procesos) se comprueba como mucho una vez por este intervalo
+SETTINGS_RECHECK_SECONDS = 1.0
+
+# Columnas de texto pesadas de items: los listados no las leen (se cargan bajo demanda)
+HEAVY_ITEM_COLUMNS = ('content', 'description', 'working_dir')
+
+# Columnas para listados (sidebar, paneles, filtros); cubiertas por idx_items_category_summary
+ITEM_SUMMARY_COLUMNS = ('id', 'category_id', 'label', 'type', 'icon', 'color', 'tags',
+                        'is_sensitive', 'is_favorite', 'is_active', 'is_archived',
+                        'is_list', 'list_group', 'orden_lista', 'created_at')
+
+
+# Claves de orden para la paginación keyset (columnas NOT NULL e indexadas; id desempata)
+ITEM_SORT_KEYS = {'created_at': 'i.created_at', 'label': 'i.label', 'frecency': 'i.frecency'}
+
+# Filtros de iter_items/get_items_page -> columna
+ITEM_FILTER_COLUMNS = {
+    'category_id': 'i.category_id',
+    'type': 'i.type',
+    'is_favorite': 'i.is_favorite',
+    'is_sensitive': 'i.is_sensitive',
+    'is_active': 'i.is_active',
+    'is_archived': 'i.is_archived',
+    'list_group': 'i.list_group',
+}
+
+
+def item_list_columns(conn: sqlite3.Connection, alias: str = '') -> str:
+    """
+    Build a SELECT list with every items column except the heavy text columns
+
+    For readers with their own connection (StatsManager, FavoritesManager)
+    that need all the light columns, including ones added by migrations.
+
+    Args:
+        conn: Open connection
+        alias: Table alias to prefix (e.g. 'i')
+
+    Returns:
+        str: Comma-separated column list
+    """
+    prefix = f"{alias}." if alias else ''
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(items)")]
+    return ", ".join(prefix + column for column in columns if column not in HEAVY_ITEM_COLUMNS)
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
@@ -29,6 +86,12 @@ class DBManager:
         """
         self.db_path = Path(db_path)
         self.connection = None
+        self._transaction_depth = 0  # > 0 while inside transaction(); execute_update won't commit
+        self._pending_events = []  # Change events waiting for the outermost commit
+        self._settings_cache = None  # key -> parsed value, loaded on first read (committed values only)
+        self._pending_settings = []  # (key, parsed value) written in the open transaction
+        self._settings_data_version = None  # PRAGMA data_version when the cache was loaded
+        self._settings_checked_at = 0.0  # time.monotonic() of the last data_version check
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -42,6 +105,89 @@ class DBManager:
         else:
             logger.info("Database already exists")
 
+        self._ensure_extension_tables()
+
+    def _ensure_extension_tables(self):
+        """
+        Create tables added after the original schema (idempotent)
+
+        Runs for new and existing databases, so no migration script is needed.
+        """
+        conn = self.connect()
+        self._ensure_frecency_column(conn)
+        conn.executescript("""
+            -- Historial de portapapeles como anillo de tamaño fijo (slot = seq % capacidad)
+            CREATE TABLE IF NOT EXISTS clipboard_history_ring (
+                slot INTEGER PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                item_id INTEGER,
+                content TEXT NOT NULL,
+                copied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- item_id sin FK: el escritor en segundo plano nunca debe fallar
+            );
+
+            -- Índice cubriente para listados de items por categoría (sin leer content)
+            CREATE INDEX IF NOT EXISTS idx_items_category_summary ON items(
+                category_id, created_at, label, type, icon, color, tags, is_sensitive, is_favorite,
+                is_active, is_archived, is_list, list_group, orden_lista
+            );
+
+            -- Paginación keyset de items: (clave de orden, id)
+            CREATE INDEX IF NOT EXISTS idx_items_created_at ON items(created_at);
+            CREATE INDEX IF NOT EXISTS idx_items_label ON items(label);
+
+            -- Ranking por frecencia (búsqueda, favoritos, populares)
+            CREATE INDEX IF NOT EXISTS idx_items_frecency ON items(frecency);
+            CREATE INDEX IF NOT EXISTS idx_items_favorite_frecency ON items(is_favorite, frecency);
+
+            -- Contenido grande deduplicado por hash (items e historial guardan una referencia)
+            CREATE TABLE IF NOT EXISTS content_blobs (
+                hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                compressed INTEGER NOT NULL DEFAULT 0,
+                size INTEGER NOT NULL,
+                refcount INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+
+        # Migrar el historial antiguo una sola vez
+        ring_empty = conn.execute("SELECT 1 FROM clipboard_history_ring LIMIT 1").fetchone() is None
+        if ring_empty:
+            setting = conn.execute("SELECT value FROM settings WHERE key = 'max_history'").fetchone()
+            capacity = max(int(json.loads(setting[0])) if setting else 20, 1)
+            legacy_rows = conn.execute(
+                "SELECT item_id, content, copied_at FROM ("
+                "SELECT id, item_id, content, copied_at FROM clipboard_history ORDER BY copied_at DESC, id DESC LIMIT ?"
+                ") ORDER BY copied_at, id",
+                (capacity,)
+            ).fetchall()
+            if legacy_rows:
+                conn.executemany(
+                    "INSERT INTO clipboard_history_ring (slot, seq, item_id, content, copied_at) VALUES (?, ?, ?, ?, ?)",
+                    [(seq % capacity, seq, row[0], row[1], row[2]) for seq, row in enumerate(legacy_rows, start=1)]
+                )
+                conn.execute("DELETE FROM clipboard_history")
+                logger.info(f"Migrated {len(legacy_rows)} clipboard history entries to the history ring")
+        conn.commit()
+
+    def _ensure_frecency_column(self, conn: sqlite3.Connection):
+        """
+        Add the items.frecency column, backfilled from use_count/last_used
+
+        See database.frecency for how the score is stored.
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(items)")]
+        if 'frecency' in columns:
+            return
+
+        conn.execute("ALTER TABLE items ADD COLUMN frecency REAL NOT NULL DEFAULT 0")
+        rows = conn.execute("SELECT id, use_count, last_used FROM items WHERE use_count > 0").fetchall()
+        conn.executemany(
+            "UPDATE items SET frecency = ? WHERE id = ?",
+            [(initial_frecency(row[1], row[2]), row[0]) for row in rows]
+        )
+        conn.commit()
+        logger.info(f"Added frecency column ({len(rows)} used items backfilled)")
+
     def connect(self) -> sqlite3.Connection:
         """
         Establish connection to the database
@@ -57,6 +203,10 @@ class DBManager:
             self.connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
+            # Text of a content_blobs row (used to search compressed blobs)
+            self.connection.create_function(
+                "blob_text", 2, lambda data, compressed: decode_blob(data, compressed), deterministic=True
+            )
         return self.connection
 
     def close(self):
@@ -71,18 +221,82 @@ class DBManager:
         """
         Context manager for database transactions
 
+        Transactions can be nested: inner blocks use a SAVEPOINT, so they
+        can fail and roll back on their own while the outermost block
+        commits (or rolls back) everything. execute_update() does not
+        commit while a transaction is open.
+
         Usage:
             with db.transaction() as conn:
                 conn.execute(...)
         """
         conn = self.connect()
+
+        if self._transaction_depth > 0:
+            # Nested transaction: savepoint inside the outer one
+            savepoint = f"sp_{self._transaction_depth}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+            self._transaction_depth += 1
+            events_mark = len(self._pending_events)
+            settings_mark = len(self._pending_settings)
+            try:
+                yield conn
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            except Exception as e:
+                conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+                del self._pending_events[events_mark:]  # Cambios deshechos: sin eventos
+                del self._pending_settings[settings_mark:]
+                logger.error(f"Nested transaction failed: {e}")
+                raise
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        # Explicit BEGIN so savepoints never open (and commit) their own transaction.
+        # IMMEDIATE takes the write lock up front: another connection (history writer)
+        # waits on the busy timeout instead of failing to upgrade a read lock ("database is locked")
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
         try:
             yield conn
             conn.commit()
         except Exception as e:
             conn.rollback()
+            self._pending_events.clear()
+            self._pending_settings.clear()
             logger.error(f"Transaction failed: {e}")
             raise
+        finally:
+            self._transaction_depth -= 1
+
+        # Write-through de settings y eventos solo una vez confirmados
+        settings, self._pending_settings = self._pending_settings, []
+        if self._settings_cache is not None:
+            self._settings_cache.update(settings)
+        events, self._pending_events = self._pending_events, []
+        event_bus.publish_all(events)
+
+    def _publish(self, event) -> None:
+        """
+        Publish a change event on the application bus
+
+        Inside a transaction the event waits for the outermost commit (and is
+        dropped if the transaction rolls back).
+
+        Args:
+            event: Event from core.event_bus
+        """
+        if self._transaction_depth > 0:
+            self._pending_events.append(event)
+        else:
+            event_bus.publish(event)
+
+    def _item_ids_where(self, where: str, params: tuple) -> Tuple[int, ...]:
+        """IDs of the items matching a WHERE clause (for change events)"""
+        rows = self.execute_query(f"SELECT id FROM items WHERE {where}", params)
+        return tuple(row['id'] for row in rows)
 
     def _create_database(self):
         """Create database schema with all tables and indices"""
@@ -219,21 +433,69 @@ class DBManager:
             List[Dict]: Query results
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with metrics.timer('db.query'):
+                conn = self.connect()
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                return [dict(row) for row in rows]
         except sqlite3.Error as e:
             logger.error(f"Query execution failed: {e}")
             logger.error(f"Query: {query}")
             logger.error(f"Params: {params}")
             raise
 
+    def iter_query(self, query: str, params: tuple = (), batch_size: int = 500) -> Iterator[List[Dict]]:
+        """
+        Execute SELECT query and yield the results in batches (cursor.fetchmany)
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            batch_size: Rows per batch
+
+        Yields:
+            List[Dict]: Next batch of rows
+        """
+        try:
+            cursor = self.connect().cursor()
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            logger.error(f"Query: {query}")
+            raise
+
+    def iter_items_by_category(self, category_id: int, batch_size: int = 500) -> Iterator[List[Dict]]:
+        """
+        Stream the items of a category in batches
+
+        Args:
+            category_id: Category ID
+            batch_size: Items per batch
+
+        Yields:
+            List[Dict]: Item dictionaries (content decrypted if sensitive)
+        """
+        query = """
+            SELECT * FROM items
+            WHERE category_id = ?
+            ORDER BY created_at, id
+        """
+        for rows in self.iter_query(query, (category_id,), batch_size):
+            yield self._process_item_rows(rows)
+
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """
         Execute INSERT/UPDATE/DELETE query
 
+        Commits immediately, unless called inside transaction() (the outer
+        transaction commits).
+
         Args:
             query: SQL query string
             params: Query parameters tuple
@@ -242,11 +504,13 @@ class DBManager:
             int: Last row ID for INSERT, or number of affected rows
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
+            with metrics.timer('db.update'):
+                conn = self.connect()
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                if self._transaction_depth == 0:
+                    conn.commit()
+                return cursor.lastrowid
         except sqlite3.Error as e:
             logger.error(f"Update execution failed: {e}")
             logger.error(f"Query: {query}")
@@ -272,6 +536,50 @@ class DBManager:
 
     # ========== SETTINGS ==========
 
+    def _settings(self) -> Dict[str, Any]:
+        """
+        In-memory settings map, reloaded only if another connection changed the database
+
+        Writes through this instance update the map when their transaction
+        commits (see set_settings), so only commits of other connections or
+        processes need a reload. Those are detected with PRAGMA data_version,
+        which is checked at most once every SETTINGS_RECHECK_SECONDS.
+
+        The map only holds committed values: inside a transaction, settings
+        written in it are overlaid, and a reload isn't cached because it can
+        include them.
+
+        Returns:
+            Dict[str, Any]: key -> parsed value (don't modify)
+        """
+        now = time.monotonic()
+        if self._settings_cache is None or now - self._settings_checked_at >= SETTINGS_RECHECK_SECONDS:
+            data_version = self.connect().execute("PRAGMA data_version").fetchone()[0]
+            if self._settings_cache is None or data_version != self._settings_data_version:
+                settings = self._load_settings()
+                if self._transaction_depth > 0:
+                    return settings  # Ya incluye lo escrito en la transacción abierta
+                self._settings_cache = settings
+                self._settings_data_version = data_version
+                logger.debug(f"Settings loaded: {len(self._settings_cache)} keys")
+            self._settings_checked_at = now
+
+        if self._pending_settings:
+            return {**self._settings_cache, **dict(self._pending_settings)}
+        return self._settings_cache
+
+    def _load_settings(self) -> Dict[str, Any]:
+        """Read and parse every row of the settings table"""
+        query = "SELECT key, value FROM settings"
+        results = self.execute_query(query)
+        settings = {}
+        for row in results:
+            try:
+                settings[row['key']] = json.loads(row['value'])
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse setting '{row['key']}': {e}")
+        return settings
+
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
         Get configuration setting by key
@@ -283,15 +591,10 @@ class DBManager:
         Returns:
             Any: Setting value (parsed from JSON)
         """
-        query = "SELECT value FROM settings WHERE key = ?"
-        result = self.execute_query(query, (key,))
-        if result:
-            try:
-                return json.loads(result[0]['value'])
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse setting '{key}': {e}")
-                return default
-        return default
+        value = self._settings().get(key, default)
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)  # La caché no debe modificarse desde fuera
+        return value
 
     def set_setting(self, key: str, value: Any) -> None:
         """
@@ -301,7 +604,19 @@ class DBManager:
             key: Setting key
             value: Setting value (will be JSON encoded)
         """
-        value_json = json.dumps(value)
+        self.set_settings({key: value})
+
+    def set_settings(self, settings: Dict[str, Any]) -> None:
+        """
+        Save or update several settings in one transaction
+
+        Args:
+            settings: key -> value (values will be JSON encoded)
+        """
+        if not settings:
+            return
+
+        rows = [(key, json.dumps(value)) for key, value in settings.items()]
         query = """
             INSERT INTO settings (key, value, updated_at)
             VALUES (?, ?, CURRENT_TIMESTAMP)
@@ -309,8 +624,13 @@ class DBManager:
                 value = excluded.value,
                 updated_at = CURRENT_TIMESTAMP
         """
-        self.execute_update(query, (key, value_json))
-        logger.debug(f"Setting saved: {key} = {value}")
+        with self.transaction() as conn:
+            conn.executemany(query, rows)
+            # Write-through al confirmar (como los eventos): el valor queda como se leería de la BD
+            self._pending_settings.extend((key, json.loads(value_json)) for key, value_json in rows)
+            for key, value in settings.items():
+                self._publish(SettingChanged(key, value))
+        logger.debug(f"Settings saved: {settings}")
 
     def get_all_settings(self) -> Dict[str, Any]:
         """
@@ -319,15 +639,7 @@ class DBManager:
         Returns:
             Dict[str, Any]: Dictionary of all settings
         """
-        query = "SELECT key, value FROM settings"
-        results = self.execute_query(query)
-        settings = {}
-        for row in results:
-            try:
-                settings[row['key']] = json.loads(row['value'])
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse setting '{row['key']}': {e}")
-        return settings
+        return copy.deepcopy(self._settings())
 
     # ========== CATEGORIES ==========
 
@@ -362,6 +674,23 @@ class DBManager:
         result = self.execute_query(query, (category_id,))
         return result[0] if result else None
 
+    def get_categories_by_ids(self, category_ids: List[int]) -> List[Dict]:
+        """
+        Get several categories by ID with a single query
+
+        Args:
+            category_ids: Category IDs
+
+        Returns:
+            List[Dict]: Found categories ordered by order_index
+        """
+        if not category_ids:
+            return []
+
+        placeholders = ",".join("?" * len(category_ids))
+        query = f"SELECT * FROM categories WHERE id IN ({placeholders}) ORDER BY order_index"
+        return self.execute_query(query, tuple(category_ids))
+
     def add_category(self, name: str, icon: str = None,
                      is_predefined: bool = False, order_index: int = None) -> int:
         """
@@ -388,6 +717,7 @@ class DBManager:
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
         """
         category_id = self.execute_update(query, (name, icon, order_index, is_predefined))
+        self._publish(CategoryChanged(category_id, 'added'))
         logger.info(f"Category added: {name} (ID: {category_id}, order_index: {order_index})")
         return category_id
 
@@ -425,6 +755,7 @@ class DBManager:
             params.append(category_id)
             query = f"UPDATE categories SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            self._publish(CategoryChanged(category_id, 'updated'))
             logger.info(f"Category updated: ID {category_id}")
 
     def delete_category(self, category_id: int) -> None:
@@ -434,8 +765,14 @@ class DBManager:
         Args:
             category_id: Category ID to delete
         """
-        query = "DELETE FROM categories WHERE id = ?"
-        self.execute_update(query, (category_id,))
+        with self.transaction():
+            self._release_item_contents("category_id = ?", (category_id,))
+            item_ids = self._item_ids_where("category_id = ?", (category_id,))
+            query = "DELETE FROM categories WHERE id = ?"
+            self.execute_update(query, (category_id,))
+            if item_ids:
+                self._publish(ItemDeleted(item_ids, frozenset({category_id})))
+            self._publish(CategoryChanged(category_id, 'deleted'))
         logger.info(f"Category deleted: ID {category_id}")
 
     def reorder_categories(self, category_ids: List[int]) -> None:
@@ -448,35 +785,94 @@ class DBManager:
         updates = [(i, cat_id) for i, cat_id in enumerate(category_ids)]
         query = "UPDATE categories SET order_index = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
         self.execute_many(query, updates)
+        self._publish(CategoryChanged(None, 'reordered'))
         logger.info(f"Categories reordered: {len(category_ids)} items")
 
     # ========== ITEMS ==========
 
-    def get_items_by_category(self, category_id: int) -> List[Dict]:
+    def get_items_by_category(self, category_id: int, columns: Optional[List[str]] = None) -> List[Dict]:
         """
         Get all items for a specific category
 
         Args:
             category_id: Category ID
+            columns: Columns to read (e.g. ITEM_SUMMARY_COLUMNS); None reads every column
 
         Returns:
             List[Dict]: List of item dictionaries (content decrypted if sensitive)
         """
-        query = """
-            SELECT * FROM items
+        query = f"""
+            SELECT {self._item_select(columns)} FROM items
             WHERE category_id = ?
-            ORDER BY created_at
+            ORDER BY created_at, id
         """
         results = self.execute_query(query, (category_id,))
+        return self._process_item_rows(results)
+
+    def get_items_by_categories(self, category_ids: List[int],
+                                columns: Optional[List[str]] = None) -> Dict[int, List[Dict]]:
+        """
+        Get items of several categories with a single query
+
+        Args:
+            category_ids: Category IDs
+            columns: Columns to read (category_id is always included); None reads every column
+
+        Returns:
+            Dict[int, List[Dict]]: {category_id: items} (content decrypted if sensitive),
+                                   every requested category is present
+        """
+        items_by_category = {category_id: [] for category_id in category_ids}
+        if not category_ids:
+            return items_by_category
+
+        if columns is not None and 'category_id' not in columns:
+            columns = ['category_id', *columns]
+
+        placeholders = ",".join("?" * len(category_ids))
+        query = f"""
+            SELECT {self._item_select(columns)} FROM items
+            WHERE category_id IN ({placeholders})
+            ORDER BY created_at, id
+        """
+        results = self._process_item_rows(self.execute_query(query, tuple(category_ids)))
+
+        for item in results:
+            items_by_category[item['category_id']].append(item)
+
+        return items_by_category
+
+    def _process_item_rows(self, results: List[Dict]) -> List[Dict]:
+        """
+        Parse tags and decrypt sensitive content of item rows (in place)
+
+        Args:
+            results: Item rows from execute_query
+
+        Returns:
+            List[Dict]: The same rows
+        """
+        has_content = bool(results) and 'content' in results[0]
+        has_tags = bool(results) and 'tags' in results[0]
+        if not (has_content or has_tags):
+            return results
 
         # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        encryption_manager = None
+        if has_content:
+            from core.encryption_manager import EncryptionManager
+            encryption_manager = EncryptionManager()
+
+            # Large contents live in the content store
+            self._resolve_content_refs(results)
 
         # Parse tags and decrypt sensitive content
+        log_rows = logger.isEnabledFor(logging.DEBUG)
         for item in results:
             # Parse tags from JSON or CSV format
-            if item['tags']:
+            if not has_tags:
+                pass
+            elif item['tags']:
                 try:
                     # Try to parse as JSON first
                     item['tags'] = json.loads(item['tags'])
@@ -489,17 +885,72 @@ class DBManager:
             else:
                 item['tags'] = []
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
+            # Decrypt sensitive content (sensitive content is never stored as a blob)
+            if has_content and item.get('is_sensitive') and item.get('content'):
                 try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
+                    with metrics.timer('db.decrypt'):
+                        item['content'] = encryption_manager.decrypt(item['content'])
+                    if log_rows:
+                        logger.debug(f"Content decrypted for item ID: {item['id']}")
                 except Exception as e:
                     logger.error(f"Failed to decrypt item {item['id']}: {e}")
                     item['content'] = "[DECRYPTION ERROR]"
 
         return results
 
+    def get_category_item_counts(self) -> Dict[int, int]:
+        """
+        Get number of items per category with a single aggregate query
+
+        Returns:
+            Dict[int, int]: {category_id: item_count} (categories without items are omitted)
+        """
+        query = """
+            SELECT category_id, COUNT(*) as item_count
+            FROM items
+            GROUP BY category_id
+        """
+        results = self.execute_query(query)
+        return {row['category_id']: row['item_count'] for row in results}
+
+    def get_item_summaries(self) -> List[Dict]:
+        """
+        Get display fields of all items, without content (no decryption)
+
+        Returns:
+            List[Dict]: Items with id, category_id, label, type, icon and flags,
+                        ordered like get_items_by_category
+        """
+        query = """
+            SELECT id, category_id, label, type, icon, color, is_sensitive,
+                   is_favorite, is_list, list_group, orden_lista
+            FROM items
+            ORDER BY created_at, id
+        """
+        return self.execute_query(query)
+
+    def get_data_watermark(self) -> Dict[str, Any]:
+        """
+        Get a fingerprint of the categories and items tables
+
+        Counts catch deletions, max ids catch inserts and max updated_at
+        catches edits. Unlike PRAGMA data_version, the value is stable across
+        connections and processes, so it can be stored between launches.
+
+        Returns:
+            Dict[str, Any]: Watermark values
+        """
+        query = """
+            SELECT
+                (SELECT COUNT(*) FROM categories) as category_count,
+                (SELECT MAX(id) FROM categories) as category_max_id,
+                (SELECT MAX(updated_at) FROM categories) as category_updated_at,
+                (SELECT COUNT(*) FROM items) as item_count,
+                (SELECT MAX(id) FROM items) as item_max_id,
+                (SELECT MAX(updated_at) FROM items) as item_updated_at
+        """
+        return self.execute_query(query)[0]
+
     def get_item(self, item_id: int) -> Optional[Dict]:
         """
         Get item by ID
@@ -513,34 +964,44 @@ class DBManager:
         query = "SELECT * FROM items WHERE id = ?"
         result = self.execute_query(query, (item_id,))
         if result:
-            item = result[0]
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+            return self._process_item_rows(result)[0]
+        return None
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                from core.encryption_manager import EncryptionManager
-                encryption_manager = EncryptionManager()
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item_id}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item_id}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+    def get_item_content(self, item_id: int) -> Optional[str]:
+        """
+        Load the content of one item on demand (for copy/reveal from list views)
 
-            return item
-        return None
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Optional[str]: Content (decrypted if sensitive), or None if the item doesn't exist
+        """
+        result = self.execute_query("SELECT id, content, is_sensitive FROM items WHERE id = ?", (item_id,))
+        if not result:
+            return None
+        return self._process_item_rows(result)[0]['content']
+
+    def _item_select(self, columns: Optional[List[str]], alias: str = '') -> str:
+        """
+        Build the SELECT list for item readers
+
+        Args:
+            columns: Item columns to read, or None for every column
+            alias: Table alias to prefix (e.g. 'i')
+
+        Returns:
+            str: SELECT list
+        """
+        prefix = f"{alias}." if alias else ''
+        if columns is None:
+            return prefix + '*'
+
+        valid_columns = {row['name'] for row in self.execute_query("PRAGMA table_info(items)")}
+        unknown = [column for column in columns if column not in valid_columns]
+        if unknown:
+            raise ValueError(f"Unknown item columns: {unknown}")
+        return ", ".join(prefix + column for column in columns)
 
     def add_item(self, category_id: int, label: str, content: str,
                  item_type: str = 'TEXT', icon: str = None,
@@ -587,14 +1048,88 @@ class DBManager:
             (category_id, label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """
-        item_id = self.execute_update(
-            query,
-            (category_id, label, content, item_type, icon, is_sensitive, is_favorite, tags_json, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista)
-        )
+        with self.transaction():
+            if not is_sensitive:
+                content = self._store_contents([content])[0]
+            item_id = self.execute_update(
+                query,
+                (category_id, label, content, item_type, icon, is_sensitive, is_favorite, tags_json, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista)
+            )
+            self._publish(ItemAdded((item_id,), frozenset({category_id})))
         list_info = f", List: {list_group}[{orden_lista}]" if is_list else ""
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info})")
         return item_id
 
+    def add_items_bulk(self, items_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add many items with a single executemany in one transaction
+
+        Sensitive contents are encrypted with one EncryptionManager and
+        identical tag lists are serialized once.
+
+        Args:
+            items_data: One dict per item with the add_item() keyword arguments
+                        (category_id, label and content are required)
+
+        Returns:
+            List[int]: New item IDs, in the same order as items_data
+        """
+        if not items_data:
+            return []
+
+        encryption_manager = None
+        tags_cache = {}
+        rows = []
+
+        for data in items_data:
+            content = data['content']
+            is_sensitive = data.get('is_sensitive', False)
+
+            # Encrypt content if sensitive
+            if is_sensitive and content:
+                if encryption_manager is None:
+                    from core.encryption_manager import EncryptionManager
+                    encryption_manager = EncryptionManager()
+                content = encryption_manager.encrypt(content)
+
+            tags = tuple(data.get('tags') or ())
+            tags_json = tags_cache.get(tags)
+            if tags_json is None:
+                tags_json = tags_cache[tags] = json.dumps(list(tags))
+
+            rows.append((
+                data['category_id'], data['label'], content, data.get('item_type', 'TEXT'),
+                data.get('icon'), is_sensitive, data.get('is_favorite', False), tags_json,
+                data.get('description'), data.get('working_dir'), data.get('color'),
+                data.get('is_active', True), data.get('is_archived', False),
+                data.get('is_list', False), data.get('list_group'), data.get('orden_lista', 0)
+            ))
+
+        query = """
+            INSERT INTO items
+            (category_id, label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """
+
+        with self.transaction() as conn:
+            # Large non-sensitive contents go to the content store (column 2 = content, 5 = is_sensitive)
+            blob_rows = [index for index, row in enumerate(rows) if not row[5] and needs_blob(row[2])]
+            if blob_rows:
+                refs = self._store_contents([rows[index][2] for index in blob_rows])
+                for index, ref in zip(blob_rows, refs):
+                    rows[index] = rows[index][:2] + (ref,) + rows[index][3:]
+
+            conn.executemany(query, rows)
+            # The write lock is held until commit, so AUTOINCREMENT ids are consecutive
+            last_id = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'items'"
+            ).fetchone()[0]
+            item_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+            self._publish(ItemAdded(tuple(item_ids), frozenset(row[0] for row in rows)))
+
+        logger.info(f"Bulk added {len(item_ids)} items")
+        return item_ids
+
     def update_item(self, item_id: int, **kwargs) -> None:
         """
         Update item fields
@@ -617,29 +1152,43 @@ class DBManager:
         is_currently_sensitive = current_item.get('is_sensitive', False)
         will_be_sensitive = kwargs.get('is_sensitive', is_currently_sensitive)
 
-        for field, value in kwargs.items():
-            if field in allowed_fields:
-                # Handle tags serialization
-                if field == 'tags':
-                    value = json.dumps(value)
-                # Handle content encryption for sensitive items
-                elif field == 'content' and will_be_sensitive and value:
-                    from core.encryption_manager import EncryptionManager
-                    encryption_manager = EncryptionManager()
-                    # Only encrypt if not already encrypted
-                    if not encryption_manager.is_encrypted(value):
-                        value = encryption_manager.encrypt(value)
-                        logger.info(f"Content encrypted for item ID: {item_id}")
-
-                updates.append(f"{field} = ?")
-                params.append(value)
-
-        if updates:
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            params.append(item_id)
-            query = f"UPDATE items SET {', '.join(updates)} WHERE id = ?"
-            self.execute_update(query, tuple(params))
-            logger.info(f"Item updated: ID {item_id}")
+        old_content = []
+        with self.transaction():
+            for field, value in kwargs.items():
+                if field in allowed_fields:
+                    # Handle tags serialization
+                    if field == 'tags':
+                        value = json.dumps(value)
+                    elif field == 'content':
+                        # The previous blob (if any) is released once the new content is stored
+                        old_content = self.execute_query("SELECT content FROM items WHERE id = ?", (item_id,))
+
+                        # Handle content encryption for sensitive items
+                        if will_be_sensitive and value:
+                            from core.encryption_manager import EncryptionManager
+                            encryption_manager = EncryptionManager()
+                            # Only encrypt if not already encrypted
+                            if not encryption_manager.is_encrypted(value):
+                                value = encryption_manager.encrypt(value)
+                                logger.info(f"Content encrypted for item ID: {item_id}")
+                        else:
+                            value = self._store_contents([value])[0]
+
+                    updates.append(f"{field} = ?")
+                    params.append(value)
+
+            if updates:
+                updates.append("updated_at = CURRENT_TIMESTAMP")
+                params.append(item_id)
+                query = f"UPDATE items SET {', '.join(updates)} WHERE id = ?"
+                self.execute_update(query, tuple(params))
+                # Released after storing: unchanged blob content keeps its row (not deleted and recompressed)
+                self._release_contents([row['content'] for row in old_content])
+                self._publish(ItemUpdated(
+                    (item_id,), frozenset({current_item['category_id']}),
+                    frozenset(field for field in kwargs if field in allowed_fields)
+                ))
+                logger.info(f"Item updated: ID {item_id}")
 
     def delete_item(self, item_id: int) -> None:
         """
@@ -648,8 +1197,13 @@ class DBManager:
         Args:
             item_id: Item ID to delete
         """
-        query = "DELETE FROM items WHERE id = ?"
-        self.execute_update(query, (item_id,))
+        with self.transaction():
+            self._release_item_contents("id = ?", (item_id,))
+            category = self.execute_query("SELECT category_id FROM items WHERE id = ?", (item_id,))
+            query = "DELETE FROM items WHERE id = ?"
+            self.execute_update(query, (item_id,))
+            if category:
+                self._publish(ItemDeleted((item_id,), frozenset({category[0]['category_id']})))
         logger.info(f"Item deleted: ID {item_id}")
 
     def update_last_used(self, item_id: int) -> None:
@@ -663,19 +1217,20 @@ class DBManager:
         self.execute_update(query, (item_id,))
         logger.debug(f"Last used updated: ID {item_id}")
 
-    def get_all_items(self, include_inactive: bool = False) -> List[Dict]:
+    def get_all_items(self, include_inactive: bool = False, columns: Optional[List[str]] = None) -> List[Dict]:
         """
         Get ALL items from ALL categories with category info
 
         Args:
             include_inactive: Include items from inactive categories
+            columns: Item columns to read (e.g. ITEM_SUMMARY_COLUMNS); None reads every column
 
         Returns:
             List[Dict]: List of all items with category_name, category_icon, category_color
         """
-        query = """
+        query = f"""
             SELECT
-                i.*,
+                {self._item_select(columns, 'i')},
                 c.name as category_name,
                 c.icon as category_icon,
                 c.color as category_color,
@@ -686,37 +1241,125 @@ class DBManager:
             ORDER BY i.created_at DESC
         """
         results = self.execute_query(query, (include_inactive,))
+        return self._process_item_rows(results)
 
-        # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+    def iter_items(self, filters: Optional[Dict] = None, batch_size: int = 500,
+                   columns: Optional[List[str]] = None, order_by: str = 'created_at',
+                   descending: bool = True, after: Optional[tuple] = None) -> Iterator[List[Dict]]:
+        """
+        Stream items of all categories (with category info) in batches
 
-        # Parse tags and decrypt sensitive content
-        for item in results:
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+        Args:
+            filters: Optional filters (see _item_filter_clause)
+            batch_size: Items per batch (cursor.fetchmany)
+            columns: Item columns to read; None reads every column
+            order_by: Sort key (one of ITEM_SORT_KEYS); id breaks ties
+            descending: Sort direction
+            after: Keyset cursor from get_items_page to continue from
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+        Yields:
+            List[Dict]: Item dictionaries with category_name, category_icon, category_color
+        """
+        query, params = self._items_page_query(filters, after, columns, order_by, descending)
+        for rows in self.iter_query(query, params, batch_size):
+            yield self._process_item_rows(rows)
 
-        return results
+    def get_items_page(self, filters: Optional[Dict] = None, after: Optional[tuple] = None,
+                       limit: int = 100, columns: Optional[List[str]] = None,
+                       order_by: str = 'created_at', descending: bool = True) -> Tuple[List[Dict], Optional[tuple]]:
+        """
+        Get one page of items using keyset pagination
+
+        The page starts right after the (sort key, id) cursor of the previous
+        page, so every page costs the same regardless of how deep it is.
+
+        Args:
+            filters: Optional filters (see _item_filter_clause)
+            after: Cursor returned by the previous page (None = first page)
+            limit: Page size
+            columns: Item columns to read; None reads every column
+            order_by: Sort key (one of ITEM_SORT_KEYS); id breaks ties
+            descending: Sort direction
+
+        Returns:
+            Tuple[List[Dict], Optional[tuple]]: (items, cursor of the next page or None if this is the last)
+        """
+        query, params = self._items_page_query(filters, after, columns, order_by, descending)
+        rows = self.execute_query(f"{query} LIMIT ?", params + (limit + 1,))
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]['sort_key'], rows[-1]['id'])
+        return self._process_item_rows(rows), next_cursor
+
+    def _items_page_query(self, filters: Optional[Dict], after: Optional[tuple],
+                          columns: Optional[List[str]], order_by: str, descending: bool) -> Tuple[str, tuple]:
+        """Build the SELECT used by iter_items/get_items_page"""
+        if order_by not in ITEM_SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {order_by}")
+        sort_column = ITEM_SORT_KEYS[order_by]
+
+        if columns is not None and 'id' not in columns:
+            columns = ['id', *columns]
+
+        where, params = self._item_filter_clause(filters)
+        if after is not None:
+            where.append(f"({sort_column}, i.id) {'<' if descending else '>'} (?, ?)")
+            params.extend(after)
+
+        direction = 'DESC' if descending else 'ASC'
+        query = f"""
+            SELECT
+                {self._item_select(columns, 'i')},
+                {sort_column} as sort_key,
+                c.name as category_name,
+                c.icon as category_icon,
+                c.color as category_color,
+                c.id as category_id
+            FROM items i
+            JOIN categories c ON i.category_id = c.id
+            WHERE {' AND '.join(where) or '1 = 1'}
+            ORDER BY {sort_column} {direction}, i.id {direction}
+        """
+        return query, tuple(params)
+
+    @staticmethod
+    def _item_filter_clause(filters: Optional[Dict]) -> Tuple[List[str], list]:
+        """
+        Translate item filters into WHERE conditions
+
+        Args:
+            filters: Dict with any of ITEM_FILTER_COLUMNS (value or list of values)
+                and include_inactive (items of inactive categories, default False)
+
+        Returns:
+            Tuple[List[str], list]: (conditions, params)
+        """
+        filters = dict(filters or {})
+        where, params = [], []
+
+        if not filters.pop('include_inactive', False):
+            where.append("c.is_active = 1")
+
+        for key, value in filters.items():
+            if key not in ITEM_FILTER_COLUMNS:
+                raise ValueError(f"Unknown item filter: {key}")
+            column = ITEM_FILTER_COLUMNS[key]
+            if isinstance(value, (list, tuple, set)):
+                values = list(value)
+                if not values:
+                    where.append("0 = 1")
+                    continue
+                where.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+            elif value is None:
+                where.append(f"{column} IS NULL")
+            else:
+                where.append(f"{column} = ?")
+                params.append(int(value) if isinstance(value, bool) else value)
+
+        return where, params
 
     def search_items(self, search_query: str, limit: int = 50) -> List[Dict]:
         """
@@ -729,19 +1372,23 @@ class DBManager:
         Returns:
             List[Dict]: List of matching items with category name
         """
-        query = """
+        query = f"""
             SELECT i.*, c.name as category_name
             FROM items i
             JOIN categories c ON i.category_id = c.id
             WHERE i.label LIKE ? OR i.content LIKE ? OR i.tags LIKE ?
-            ORDER BY i.last_used DESC
+               OR (i.content LIKE '{CONTENT_REF_PREFIX}%' AND i.content IN (
+                   SELECT '{CONTENT_REF_PREFIX}' || hash FROM content_blobs WHERE blob_text(data, compressed) LIKE ?
+               ))
+            ORDER BY i.frecency DESC, i.last_used DESC
             LIMIT ?
         """
         search_pattern = f"%{search_query}%"
         results = self.execute_query(
             query,
-            (search_pattern, search_pattern, search_pattern, limit)
+            (search_pattern, search_pattern, search_pattern, search_pattern, limit)
         )
+        self._resolve_content_refs(results)
 
         # Parse tags
         for item in results:
@@ -785,32 +1432,28 @@ class DBManager:
         if not self.is_list_name_unique(category_id, list_name):
             raise ValueError(f"El nombre de lista '{list_name}' ya existe en esta categoría")
 
-        item_ids = []
-
         try:
-            with self.transaction() as conn:
-                for orden, item_data in enumerate(items_data, start=1):
-                    # Agregar item con campos de lista
-                    item_id = self.add_item(
-                        category_id=category_id,
-                        label=item_data.get('label', f'Paso {orden}'),
-                        content=item_data.get('content', ''),
-                        item_type=item_data.get('type', 'TEXT'),
-                        icon=item_data.get('icon'),
-                        is_sensitive=item_data.get('is_sensitive', False),
-                        tags=item_data.get('tags'),
-                        description=item_data.get('description'),
-                        working_dir=item_data.get('working_dir'),
-                        color=item_data.get('color'),
-                        # Campos de lista
-                        is_list=True,
-                        list_group=list_name,
-                        orden_lista=orden
-                    )
-                    item_ids.append(item_id)
-
-                logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
-
+            item_ids = self.add_items_bulk([
+                {
+                    'category_id': category_id,
+                    'label': item_data.get('label', f'Paso {orden}'),
+                    'content': item_data.get('content', ''),
+                    'item_type': item_data.get('type', 'TEXT'),
+                    'icon': item_data.get('icon'),
+                    'is_sensitive': item_data.get('is_sensitive', False),
+                    'tags': item_data.get('tags'),
+                    'description': item_data.get('description'),
+                    'working_dir': item_data.get('working_dir'),
+                    'color': item_data.get('color'),
+                    # Campos de lista
+                    'is_list': True,
+                    'list_group': list_name,
+                    'orden_lista': orden
+                }
+                for orden, item_data in enumerate(items_data, start=1)
+            ])
+
+            logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
             return item_ids
 
         except Exception as e:
@@ -873,33 +1516,7 @@ class DBManager:
             AND is_active = 1
             ORDER BY orden_lista ASC
         """
-        results = self.execute_query(query, (category_id, list_group))
-
-        # Desencriptar y parsear tags (mismo proceso que en get_items_by_category)
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
-
-        for item in results:
-            # Parse tags
-            if item['tags']:
-                try:
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
-
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+        results = self._process_item_rows(self.execute_query(query, (category_id, list_group)))
 
         logger.debug(f"Obtenidos {len(results)} items de lista '{list_group}'")
         return results
@@ -939,7 +1556,7 @@ class DBManager:
                 if new_orden < old_orden:
                     cursor.execute("""
                         UPDATE items
-                        SET orden_lista = orden_lista + 1
+                        SET orden_lista = orden_lista + 1, updated_at = CURRENT_TIMESTAMP
                         WHERE category_id = ?
                         AND list_group = ?
                         AND orden_lista >= ?
@@ -951,7 +1568,7 @@ class DBManager:
                 else:
                     cursor.execute("""
                         UPDATE items
-                        SET orden_lista = orden_lista - 1
+                        SET orden_lista = orden_lista - 1, updated_at = CURRENT_TIMESTAMP
                         WHERE category_id = ?
                         AND list_group = ?
                         AND orden_lista > ?
@@ -961,10 +1578,19 @@ class DBManager:
                 # Actualizar el item movido
                 cursor.execute("""
                     UPDATE items
-                    SET orden_lista = ?
+                    SET orden_lista = ?, updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
                 """, (new_orden, item_id))
 
+                low, high = min(old_orden, new_orden), max(old_orden, new_orden)
+                self._publish(ItemUpdated(
+                    self._item_ids_where(
+                        "category_id = ? AND list_group = ? AND orden_lista BETWEEN ? AND ?",
+                        (category_id, list_group, low, high)
+                    ),
+                    frozenset({category_id}), frozenset({'orden_lista'})
+                ))
+
                 logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
                 return True
 
@@ -991,9 +1617,17 @@ class DBManager:
                 AND is_list = 1
             """
             with self.transaction() as conn:
+                self._release_item_contents(
+                    "category_id = ? AND list_group = ? AND is_list = 1", (category_id, list_group)
+                )
+                item_ids = self._item_ids_where(
+                    "category_id = ? AND list_group = ? AND is_list = 1", (category_id, list_group)
+                )
                 cursor = conn.cursor()
                 cursor.execute(query, (category_id, list_group))
                 deleted_count = cursor.rowcount
+                if item_ids:
+                    self._publish(ItemDeleted(item_ids, frozenset({category_id})))
 
                 logger.info(f"Lista '{list_group}' eliminada ({deleted_count} items) de categoría {category_id}")
                 return True
@@ -1031,11 +1665,17 @@ class DBManager:
                     cursor = conn.cursor()
                     cursor.execute("""
                         UPDATE items
-                        SET list_group = ?
+                        SET list_group = ?, updated_at = CURRENT_TIMESTAMP
                         WHERE category_id = ?
                         AND list_group = ?
                         AND is_list = 1
                     """, (new_list_group, category_id, old_list_group))
+                    self._publish(ItemUpdated(
+                        self._item_ids_where(
+                            "category_id = ? AND list_group = ? AND is_list = 1", (category_id, new_list_group)
+                        ),
+                        frozenset({category_id}), frozenset({'list_group'})
+                    ))
 
                     logger.info(f"Lista renombrada: '{old_list_group}' → '{new_list_group}'")
 
@@ -1094,31 +1734,230 @@ class DBManager:
         logger.debug(f"Nombre de lista '{list_name}' en categoría {category_id}: {'único' if is_unique else 'ya existe'}")
         return is_unique
 
+    # ========== CONTENT STORE ==========
+
+    def _store_contents(self, contents: List[Optional[str]]) -> List[Optional[str]]:
+        """
+        Store large contents in content_blobs and return the column values
+
+        Contents below the size threshold are returned unchanged. Each stored
+        content adds one reference to its blob (identical texts share a blob).
+        Must be called inside transaction().
+
+        Args:
+            contents: Texts to store
+
+        Returns:
+            List[Optional[str]]: Values for the owning column (text or reference)
+        """
+        conn = self.connect()
+        values = list(contents)
+        new_refs: Dict[str, int] = {}
+        texts: Dict[str, str] = {}
+
+        for index, text in enumerate(contents):
+            if needs_blob(text):
+                digest = content_hash(text)
+                new_refs[digest] = new_refs.get(digest, 0) + 1
+                texts.setdefault(digest, text)
+                values[index] = make_ref(digest)
+
+        for digest, count in new_refs.items():
+            cursor = conn.execute(
+                "UPDATE content_blobs SET refcount = refcount + ? WHERE hash = ?", (count, digest)
+            )
+            if cursor.rowcount == 0:
+                data, compressed, size = encode_blob(texts[digest])
+                conn.execute(
+                    "INSERT INTO content_blobs (hash, data, compressed, size, refcount) VALUES (?, ?, ?, ?, ?)",
+                    (digest, data, compressed, size, count)
+                )
+
+        return values
+
+    def _release_contents(self, values: List[Optional[str]]) -> None:
+        """
+        Drop one reference per content reference and delete unreferenced blobs
+
+        Inline texts are ignored. Must be called inside transaction().
+
+        Args:
+            values: Column values that are being deleted or overwritten
+        """
+        released: Dict[str, int] = {}
+        for value in values:
+            digest = parse_ref(value)
+            if digest:
+                released[digest] = released.get(digest, 0) + 1
+        if not released:
+            return
+
+        conn = self.connect()
+        conn.executemany(
+            "UPDATE content_blobs SET refcount = refcount - ? WHERE hash = ?",
+            [(count, digest) for digest, count in released.items()]
+        )
+        conn.execute("DELETE FROM content_blobs WHERE refcount <= 0")
+
+    def _release_item_contents(self, where: str, params: tuple) -> None:
+        """Release the content references of the items matching a WHERE clause"""
+        rows = self.execute_query(
+            f"SELECT content FROM items WHERE ({where}) AND content LIKE '{CONTENT_REF_PREFIX}%'", params
+        )
+        self._release_contents([row['content'] for row in rows])
+
+    def _resolve_content_refs(self, rows: List[Dict], column: str = 'content') -> List[Dict]:
+        """
+        Replace content references with their text (in place, one query per 500 blobs)
+
+        Args:
+            rows: Rows that may hold content references
+            column: Column to resolve
+
+        Returns:
+            List[Dict]: The same rows
+        """
+        digests = {parse_ref(row.get(column)) for row in rows} - {None}
+        if not digests:
+            return rows
+
+        texts = {}
+        digest_list = list(digests)
+        for start in range(0, len(digest_list), 500):
+            chunk = digest_list[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for blob in self.execute_query(
+                f"SELECT hash, data, compressed FROM content_blobs WHERE hash IN ({placeholders})", tuple(chunk)
+            ):
+                texts[blob['hash']] = decode_blob(blob['data'], blob['compressed'])
+
+        for row in rows:
+            digest = parse_ref(row.get(column))
+            if digest:
+                if digest not in texts:
+                    logger.error(f"Missing content blob {digest[:12]}")
+                row[column] = texts.get(digest, "")
+        return rows
+
+    def collect_content_garbage(self) -> int:
+        """
+        Recount blob references and delete unreferenced blobs
+
+        Repairs reference counts after rows were deleted outside DBManager
+        (e.g. with raw SQL).
+
+        Returns:
+            int: Number of blobs deleted
+        """
+        counts: Dict[str, int] = {}
+        for table in ('items', 'clipboard_history_ring'):
+            query = f"SELECT content FROM {table} WHERE content LIKE '{CONTENT_REF_PREFIX}%'"
+            for rows in self.iter_query(query):
+                for row in rows:
+                    digest = parse_ref(row['content'])
+                    counts[digest] = counts.get(digest, 0) + 1
+
+        with self.transaction() as conn:
+            stored = conn.execute("SELECT hash, refcount FROM content_blobs").fetchall()
+            conn.executemany(
+                "UPDATE content_blobs SET refcount = ? WHERE hash = ?",
+                [(counts.get(row['hash'], 0), row['hash']) for row in stored
+                 if counts.get(row['hash'], 0) != row['refcount']]
+            )
+            deleted = conn.execute("DELETE FROM content_blobs WHERE refcount <= 0").rowcount
+
+        if deleted:
+            logger.info(f"Content store: {deleted} unreferenced blobs deleted")
+        return deleted
+
+    def get_content_store_stats(self) -> Dict[str, int]:
+        """
+        Get content store usage
+
+        Returns:
+            Dict[str, int]: blobs, references, stored_bytes, original_bytes
+                            (original_bytes counts every reference)
+        """
+        result = self.execute_query("""
+            SELECT COUNT(*) AS blobs,
+                   COALESCE(SUM(refcount), 0) AS refs,
+                   COALESCE(SUM(LENGTH(data)), 0) AS stored_bytes,
+                   COALESCE(SUM(size * refcount), 0) AS original_bytes
+            FROM content_blobs
+        """)[0]
+        return {
+            'blobs': result['blobs'],
+            'references': result['refs'],
+            'stored_bytes': result['stored_bytes'],
+            'original_bytes': result['original_bytes']
+        }
+
     # ========== CLIPBOARD HISTORY ==========
 
     def add_to_history(self, item_id: Optional[int], content: str) -> int:
         """
         Add entry to clipboard history
 
+        Convenience wrapper around write_history_slot() that reads the
+        current sequence and max_history. ClipboardHistoryStore keeps both in
+        memory and calls write_history_slot() directly.
+
         Args:
             item_id: Associated item ID (optional)
             content: Copied content
 
         Returns:
-            int: History entry ID
+            int: History entry sequence number
         """
-        query = """
-            INSERT INTO clipboard_history (item_id, content)
-            VALUES (?, ?)
+        seq = self.get_history_last_seq() + 1
+        capacity = self.get_setting('max_history', 20)
+        self.write_history_slot(seq, capacity, item_id, content)
+        return seq
+
+    def write_history_slot(self, seq: int, capacity: int, item_id: Optional[int],
+                           content: str, copied_at: Optional[str] = None) -> None:
         """
-        history_id = self.execute_update(query, (item_id, content))
-        logger.debug(f"History entry added: ID {history_id}")
+        Write a history entry into its ring slot (UPSERT, O(1))
 
-        # Auto-trim history to max_history setting
-        max_history = self.get_setting('max_history', 20)
-        self.trim_history(keep_latest=max_history)
+        The slot is seq % capacity, so the entry overwrites the one copied
+        `capacity` entries earlier and the table never needs trimming.
 
-        return history_id
+        Args:
+            seq: Entry sequence number (increasing)
+            capacity: Ring capacity (max_history)
+            item_id: Associated item ID (optional)
+            content: Copied content
+            copied_at: Timestamp (defaults to now)
+        """
+        query = """
+            INSERT INTO clipboard_history_ring (slot, seq, item_id, content, copied_at)
+            VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+            ON CONFLICT(slot) DO UPDATE SET
+                seq = excluded.seq,
+                item_id = excluded.item_id,
+                content = excluded.content,
+                copied_at = excluded.copied_at
+        """
+        with self.transaction() as conn:
+            # Large contents are stored once in the content store; the overwritten entry releases its blob
+            overwritten = conn.execute(
+                "SELECT content FROM clipboard_history_ring WHERE slot = ?", (seq % capacity,)
+            ).fetchone()
+            content = self._store_contents([content])[0]
+            self.execute_update(query, (seq % capacity, seq, item_id, content, copied_at))
+            if overwritten:
+                self._release_contents([overwritten['content']])
+        logger.debug(f"History entry written: seq {seq} (slot {seq % capacity})")
+
+    def get_history_last_seq(self) -> int:
+        """
+        Get the sequence number of the newest history entry
+
+        Returns:
+            int: Last sequence number (0 if the history is empty)
+        """
+        result = self.execute_query("SELECT COALESCE(MAX(seq), 0) AS seq FROM clipboard_history_ring")
+        return result[0]['seq']
 
     def get_history(self, limit: int = 20) -> List[Dict]:
         """
@@ -1128,39 +1967,51 @@ class DBManager:
             limit: Maximum entries to retrieve
 
         Returns:
-            List[Dict]: List of history entries
+            List[Dict]: List of history entries, newest first ('id' is the sequence number)
         """
         query = """
-            SELECT h.*, i.label, i.type
-            FROM clipboard_history h
+            SELECT h.seq AS id, h.seq, h.slot, h.item_id, h.content, h.copied_at, i.label, i.type
+            FROM clipboard_history_ring h
             LEFT JOIN items i ON h.item_id = i.id
-            ORDER BY h.copied_at DESC
+            ORDER BY h.seq DESC
             LIMIT ?
         """
-        return self.execute_query(query, (limit,))
+        return self._resolve_content_refs(self.execute_query(query, (limit,)))
 
     def clear_history(self) -> None:
         """Clear all clipboard history"""
-        query = "DELETE FROM clipboard_history"
-        self.execute_update(query)
+        with self.transaction() as conn:
+            refs = conn.execute(
+                f"SELECT content FROM clipboard_history_ring WHERE content LIKE '{CONTENT_REF_PREFIX}%'"
+            ).fetchall()
+            self._release_contents([row['content'] for row in refs])
+            query = "DELETE FROM clipboard_history_ring"
+            self.execute_update(query)
         logger.info("Clipboard history cleared")
 
     def trim_history(self, keep_latest: int = 20) -> None:
         """
-        Keep only the latest N history entries
+        Keep only the latest N history entries and re-slot them for a new capacity
+
+        Only needed when max_history changes; normal writes never trim.
 
         Args:
-            keep_latest: Number of entries to keep
-        """
-        query = """
-            DELETE FROM clipboard_history
-            WHERE id NOT IN (
-                SELECT id FROM clipboard_history
-                ORDER BY copied_at DESC
-                LIMIT ?
+            keep_latest: Number of entries to keep (new ring capacity)
+        """
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT seq, item_id, content, copied_at FROM clipboard_history_ring ORDER BY seq DESC LIMIT ?",
+                (keep_latest,)
+            ).fetchall()
+            dropped = conn.execute(
+                "SELECT content FROM clipboard_history_ring WHERE seq < ?", (rows[-1]['seq'] if rows else 0,)
+            ).fetchall() if len(rows) == keep_latest else []
+            self._release_contents([row['content'] for row in dropped])
+            conn.execute("DELETE FROM clipboard_history_ring")
+            conn.executemany(
+                "INSERT INTO clipboard_history_ring (slot, seq, item_id, content, copied_at) VALUES (?, ?, ?, ?, ?)",
+                [(row['seq'] % keep_latest, row['seq'], row['item_id'], row['content'], row['copied_at']) for row in rows]
             )
-        """
-        self.execute_update(query, (keep_latest,))
         logger.debug(f"History trimmed to {keep_latest} entries")
 
     # ========== PINNED PANELS ==========
@@ -0,0 +1,87 @@
+"""
+Frecency helpers
+The frecency of an item is its use count with every use decayed
+exponentially by age (one half-life = the use counts half). Instead of
+decaying every score as time passes, each use adds a weight that grows with
+the time of the use, 2 ** ((t - FRECENCY_EPOCH) / half-life). All scores share
+the same implicit decay factor, so the stored values rank exactly like the
+decayed ones, a new use is a single `frecency = frecency + weight` update and
+the column can be indexed.
+"""
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+# Vida media de un uso
+FRECENCY_HALF_LIFE_DAYS = 14
+FRECENCY_HALF_LIFE = FRECENCY_HALF_LIFE_DAYS * 86400.0
+
+# Origen fijo de los pesos (2025-01-01 UTC). Un double llega a 2**1023
+# después de ~39 años (1023 vidas medias) desde esta fecha.
+FRECENCY_EPOCH = 1735689600.0
+
+
+def _epoch_seconds(value) -> Optional[float]:
+    """Convert a timestamp (epoch seconds, datetime or SQLite string) to epoch seconds"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    # datetime('now') de SQLite guarda UTC sin zona
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def frecency_weight(used_at=None) -> float:
+    """
+    Stored weight of one use
+
+    Args:
+        used_at: Time of the use (epoch seconds, datetime or SQLite string; default: now)
+
+    Returns:
+        float: Amount to add to the frecency column
+    """
+    timestamp = _epoch_seconds(used_at)
+    if timestamp is None:
+        timestamp = time.time()
+    return 2.0 ** ((timestamp - FRECENCY_EPOCH) / FRECENCY_HALF_LIFE)
+
+
+def initial_frecency(use_count: int, last_used=None) -> float:
+    """
+    Approximate stored frecency of an item from its counters (backfill)
+
+    Every use is assumed to have happened at last_used.
+
+    Args:
+        use_count: Number of uses
+        last_used: Last use timestamp (None = never used)
+
+    Returns:
+        float: Stored frecency (0.0 for unused items)
+    """
+    if not use_count or _epoch_seconds(last_used) is None:
+        return 0.0
+    return use_count * frecency_weight(last_used)
+
+
+def current_frecency(stored: float, now=None) -> float:
+    """
+    Decayed use count of a stored frecency at a given time (for display)
+
+    Args:
+        stored: Value of the frecency column
+        now: Reference time (default: now)
+
+    Returns:
+        float: Uses weighted by age (a use made `now` counts 1.0)
+    """
+    return (stored or 0.0) / frecency_weight(now)
@@ -13,10 +13,39 @@ class ItemType(Enum):
     CODE = "code"
     PATH = "path"
 
+    @classmethod
+    def parse(cls, value) -> 'ItemType':
+        """
+        Convert a stored type (TEXT/url/ItemType...) to ItemType without raising
+
+        Args:
+            value: ItemType, or its value in any case
+
+        Returns:
+            ItemType: Matching type, TEXT if unknown
+        """
+        if isinstance(value, cls):
+            return value
+        return _ITEM_TYPES_BY_VALUE.get(str(value or '').lower(), cls.TEXT)
+
+
+# Lookup por valor (evita recorrer el Enum en cada conversión)
+_ITEM_TYPES_BY_VALUE = {item_type.value: item_type for item_type in ItemType}
+
 
 class Item:
     """Model representing a clipboard item"""
 
+    # Sin __dict__ por instancia: la app mantiene decenas de miles de items en memoria
+    __slots__ = (
+        'id', 'label', 'content', 'type', 'icon', 'is_sensitive', 'is_favorite', 'tags',
+        'description', 'working_dir', 'color', 'is_active', 'is_archived',
+        'is_list', 'list_group', 'orden_lista', 'created_at', 'last_used',
+        'frecency',  # Columna items.frecency (ver database.frecency)
+        # Información de categoría para vistas globales (búsqueda global)
+        'category_name', 'category_icon', 'category_color',
+    )
+
     def __init__(
         self,
         item_id: str,
@@ -40,7 +69,7 @@ class Item:
         self.id = item_id
         self.label = label
         self.content = content
-        self.type = item_type if isinstance(item_type, ItemType) else ItemType(item_type)
+        self.type = item_type if item_type.__class__ is ItemType else ItemType(item_type)
         self.icon = icon
         self.is_sensitive = is_sensitive
         self.is_favorite = is_favorite
@@ -54,8 +83,11 @@ class Item:
         self.is_list = is_list  # Indica si este item es parte de una lista
         self.list_group = list_group  # Nombre/identificador del grupo de lista
         self.orden_lista = orden_lista  # Posición del item dentro de la lista
-        self.created_at = datetime.now()
-        self.last_used = datetime.now()
+        self.created_at = self.last_used = datetime.now()
+        self.frecency = 0.0
+        self.category_name = None
+        self.category_icon = None
+        self.category_color = None
 
     def update_last_used(self) -> None:
         """Update the last used timestamp"""
@@ -99,8 +131,7 @@ class Item:
         # Generate ID from label if not provided
         item_id = data.get("id", data.get("label", "").lower().replace(" ", "_"))
 
-        item_type_str = data.get("type", "text")
-        item_type = ItemType(item_type_str) if item_type_str in [t.value for t in ItemType] else ItemType.TEXT
+        item_type = ItemType.parse(data.get("type", "text"))
 
         return cls(
             item_id=item_id,
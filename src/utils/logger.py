@@ -1,3 +1,102 @@
 """
 Logger utility
+Queue-based logging: loggers only put records on a queue and a
+QueueListener thread formats and writes them (rotating file + console), so
+logging never blocks the UI thread on disk I/O. The root level can be
+changed at runtime (settings 'log_level'); per-item debug logging in hot
+loops is guarded with logger.isEnabledFor(logging.DEBUG).
 """
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Optional, Union
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+DEFAULT_LOG_LEVEL = 'INFO'
+
+# Rotación del fichero de log
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(log_file: Union[str, Path], level: Union[str, int] = DEFAULT_LOG_LEVEL,
+                  console: bool = True, max_bytes: int = LOG_MAX_BYTES,
+                  backup_count: int = LOG_BACKUP_COUNT) -> QueueListener:
+    """
+    Route every log record through a queue to a background writer thread
+
+    Replaces the handlers of the root logger with a single QueueHandler.
+    Calling it again restarts the pipeline with the new options.
+
+    Args:
+        log_file: Log file path (rotated at max_bytes)
+        level: Root logger level (name or number)
+        console: Also write to stdout
+        max_bytes: Size at which the log file is rotated
+        backup_count: Rotated files to keep
+
+    Returns:
+        QueueListener: The running listener (stopped at exit)
+    """
+    global _listener
+    stop_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+    handlers = [file_handler]
+    if console and sys.stdout:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(QueueHandler(log_queue))
+    set_log_level(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def set_log_level(level: Union[str, int]) -> int:
+    """
+    Change the root logger level at runtime
+
+    Args:
+        level: Level name ('DEBUG', 'INFO', ...) or number; unknown names fall back to INFO
+
+    Returns:
+        int: The level applied
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+    logging.getLogger().setLevel(level)
+    return level
+
+
+def stop_logging() -> None:
+    """Flush the queued records and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,125 @@
+"""
+Startup profiler
+Records import times (like `python -X importtime`) and startup milestones,
+and writes a plain-text report when the sidebar has painted.
+"""
+
+import builtins
+import sys
+import time
+from datetime import datetime
+from importlib.util import resolve_name
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class StartupProfiler:
+    """Import-time and milestone profiler for the application startup path"""
+
+    def __init__(self, start_time: Optional[float] = None):
+        """
+        Args:
+            start_time: perf_counter() value taken at process start (defaults to now)
+        """
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.imports: List[Tuple[int, str, float, float]] = []  # (depth, module, self_us, cumulative_us)
+        self.milestones: List[Tuple[str, float]] = []  # (name, ms since start)
+        self._original_import = None
+        self._stack: List[float] = []  # Accumulated child time per active import
+
+    def install(self):
+        """Start timing imports by wrapping builtins.__import__"""
+        if self._original_import is not None:
+            return
+
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Time the import only when it actually loads a new module"""
+        try:
+            package = globals.get('__package__') if (level and globals) else None
+            fullname = resolve_name('.' * level + name, package) if level else name
+        except (ImportError, ValueError):
+            fullname = name
+
+        if fullname in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        depth = len(self._stack)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = (time.perf_counter() - start) * 1_000_000
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += cumulative
+            self.imports.append((depth, fullname, cumulative - children, cumulative))
+
+    def mark(self, name: str):
+        """
+        Record a startup milestone
+
+        Args:
+            name: Milestone name (e.g. "window shown")
+        """
+        self.milestones.append((name, (time.perf_counter() - self.start_time) * 1000))
+
+    def format_report(self, top: int = 30) -> str:
+        """
+        Build the report text
+
+        Args:
+            top: Number of slowest imports listed in the summary
+
+        Returns:
+            Report with milestones, slowest imports and the full import tree
+        """
+        lines = [
+            f"Widget Sidebar startup profile - {datetime.now()}",
+            "",
+            "Milestones [ms since process start]:",
+        ]
+        for name, elapsed_ms in self.milestones:
+            lines.append(f"  {elapsed_ms:10.1f}  {name}")
+
+        # Only top-level imports add up to the total (children are included in them)
+        total_us = sum(cumulative for depth, _, _, cumulative in self.imports if depth == 0)
+        lines += [
+            "",
+            f"Total import time: {total_us / 1000:.1f} ms ({len(self.imports)} modules)",
+            "",
+            f"Slowest {top} imports (cumulative):",
+        ]
+        slowest = sorted(self.imports, key=lambda entry: entry[3], reverse=True)[:top]
+        for _, module, self_us, cumulative_us in slowest:
+            lines.append(f"  {cumulative_us / 1000:10.1f} ms  (self {self_us / 1000:8.1f} ms)  {module}")
+
+        # Same layout as `python -X importtime` (children are listed before their parent)
+        lines += ["", "import time: self [us] | cumulative | imported package"]
+        for depth, module, self_us, cumulative_us in self.imports:
+            lines.append(f"import time: {self_us:9.0f} | {cumulative_us:10.0f} | {'  ' * depth}{module}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: Path) -> Path:
+        """
+        Write the report to a file
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path of the written report
+        """
+        path = Path(path)
+        path.write_text(self.format_report(), encoding='utf-8')
+        return path
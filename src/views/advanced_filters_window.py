@@ -124,6 +124,14 @@ class AdvancedFiltersWindow(QWidget):
         """Actualizar tags disponibles desde los items"""
         self.filter_panel.update_available_tags(items)
 
+    def set_available_tags(self, tags):
+        """Reemplazar los tags disponibles (conserva los marcados)"""
+        self.filter_panel.set_available_tags(tags)
+
+    def add_available_tags(self, items):
+        """Añadir los tags de items recién cargados"""
+        self.filter_panel.add_available_tags(items)
+
     def on_filters_changed(self, filters):
         """Reenviar señal de filtros cambiados"""
         self.filters_changed.emit(filters)
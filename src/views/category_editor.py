@@ -267,8 +267,13 @@ class CategoryEditor(QWidget):
             # Clear cache to force fresh reload from database
             self.controller.config_manager._categories_cache = None
 
-            # Load ALL categories with ALL items directly from database
-            self.categories = self.controller.config_manager.get_categories()
+            # Load ALL categories with ALL items directly from database.
+            # Edit copies: the loaded Items are shared with the sidebar, panels
+            # and search, and must only change when the settings are saved
+            self.categories = [
+                self._editable_copy(category)
+                for category in self.controller.config_manager.get_categories()
+            ]
             logger.info(f"[LOAD_CATEGORIES] ✅ Loaded {len(self.categories)} categories from database")
             for cat in self.categories:
                 logger.debug(f"  - {cat.name}: {len(cat.items)} items")
@@ -278,6 +283,18 @@ class CategoryEditor(QWidget):
 
         self.refresh_categories_list()
 
+    @staticmethod
+    def _editable_copy(category: Category) -> Category:
+        """Return a detached copy of a category and its items"""
+        data = category.to_dict()
+        items = data.pop('items')
+        copy = Category.from_dict(data)
+        copy.items = [
+            Item.from_dict(dict(item_data, tags=list(item_data.get('tags') or [])))
+            for item_data in items
+        ]
+        return copy
+
     def refresh_categories_list(self):
         """Refresh the categories list widget"""
         self.categories_list.clear()
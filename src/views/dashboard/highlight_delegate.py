@@ -3,27 +3,50 @@ Highlight Delegate for TreeWidget
 Custom item delegate that highlights search matches in text
 """
 
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
 from PyQt6.QtCore import Qt, QRect
 from PyQt6.QtGui import QPalette, QTextDocument, QAbstractTextDocumentLayout, QPainter
 import logging
 
+from core.search_engine import compile_query_pattern
+
 logger = logging.getLogger(__name__)
 
+# Documentos maquetados en caché (celdas visibles al hacer scroll)
+DOCUMENT_CACHE_SIZE = 512
+
+# Tramos (start, end) a resaltar en el texto de una celda (coincidencias difusas);
+# sin ellos se resaltan las apariciones literales de la búsqueda
+HIGHLIGHT_SPANS_ROLE = Qt.ItemDataRole.UserRole + 1
+
 
 class HighlightDelegate(QStyledItemDelegate):
     """Custom delegate that highlights search query in item text"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, cache_size: int = DOCUMENT_CACHE_SIZE):
         super().__init__(parent)
         self.search_query = ""
         self.highlight_color = "#ffeb3b"  # Yellow highlight
+        self._pattern = None  # Compiled once per query, shared by every cell
+
+        # LRU: (text, query, text color, font) -> laid-out QTextDocument
+        self.cache_size = cache_size
+        self._documents: "OrderedDict[tuple, QTextDocument]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def set_search_query(self, query: str):
         """Set the search query to highlight"""
         self.search_query = query.lower() if query else ""
+        self._pattern = compile_query_pattern(self.search_query) if self.search_query else None
         logger.debug(f"Highlight delegate search query set to: '{self.search_query}'")
 
+    def clear_cache(self):
+        """Drop every cached document (e.g. after a font or palette change)"""
+        self._documents.clear()
+
     def paint(self, painter, option, index):
         """Custom paint method to highlight text"""
         if not self.search_query:
@@ -37,9 +60,9 @@ class HighlightDelegate(QStyledItemDelegate):
             super().paint(painter, option, index)
             return
 
-        # Check if text contains search query
-        text_lower = text.lower()
-        if self.search_query not in text_lower:
+        # Check if text contains search query (or fuzzy matched characters)
+        spans = index.data(HIGHLIGHT_SPANS_ROLE)
+        if not spans and self.search_query not in text.lower():
             # No match, use default painting
             super().paint(painter, option, index)
             return
@@ -48,28 +71,21 @@ class HighlightDelegate(QStyledItemDelegate):
         painter.save()
 
         # Draw background
-        if option.state & QStyle.StateFlag.State_Selected:
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        if selected:
             painter.fillRect(option.rect, option.palette.highlight())
         elif index.row() % 2 == 1:
             painter.fillRect(option.rect, option.palette.alternateBase())
         else:
             painter.fillRect(option.rect, option.palette.base())
 
-        # Create HTML with highlighted text
-        html_text = self._create_highlighted_html(text, self.search_query)
-
-        # Create text document for rich text rendering
-        doc = QTextDocument()
-        doc.setDefaultFont(option.font)
-        doc.setHtml(html_text)
-
         # Set text color based on selection state
-        if option.state & QStyle.StateFlag.State_Selected:
+        if selected:
             text_color = option.palette.color(QPalette.ColorRole.HighlightedText)
         else:
             text_color = option.palette.color(QPalette.ColorRole.Text)
 
-        doc.setDefaultStyleSheet(f"body {{ color: {text_color.name()}; }}")
+        doc = self._get_document(text, text_color.name(), option.font, spans)
 
         # Calculate text position with padding
         text_rect = QRect(option.rect)
@@ -90,47 +106,82 @@ class HighlightDelegate(QStyledItemDelegate):
         # Restore painter state
         painter.restore()
 
-    def _create_highlighted_html(self, text: str, query: str) -> str:
+    def _get_document(self, text: str, color: str, font, spans=None) -> QTextDocument:
+        """
+        Get the laid-out rich text document of a cell, from the LRU if possible
+
+        The document isn't wrapped (the cell clips it), so its layout doesn't
+        depend on the row or the cell width: identical texts share one entry
+        and resizing a column doesn't invalidate anything.
+
+        Args:
+            text: Cell text
+            color: Text color name
+            font: Cell font
+            spans: (start, end) ranges to highlight instead of the query matches
+
+        Returns:
+            QTextDocument ready to draw
+        """
+        key = (text, self.search_query, color, font.key(), spans)
+        doc = self._documents.get(key)
+        if doc is not None:
+            self._documents.move_to_end(key)
+            self.cache_hits += 1
+            return doc
+
+        self.cache_misses += 1
+        doc = QTextDocument()
+        doc.setDefaultFont(font)
+        doc.setDefaultStyleSheet(f"body {{ color: {color}; }}")
+        doc.setHtml(f"<body>{self._create_highlighted_html(text, self.search_query, spans)}</body>")
+        doc.documentLayout().documentSize()  # Maquetar ahora, no en el primer draw
+
+        self._documents[key] = doc
+        if len(self._documents) > self.cache_size:
+            self._documents.popitem(last=False)
+        return doc
+
+    def _create_highlighted_html(self, text: str, query: str, spans=None) -> str:
         """
         Create HTML with highlighted query matches
 
         Args:
             text: Original text
             query: Search query to highlight
+            spans: (start, end) ranges to highlight instead (fuzzy matches)
 
         Returns:
             HTML string with highlighted matches
         """
-        if not query:
-            return text
+        if not spans:
+            if not query:
+                return text
+            pattern = self._pattern if query == self.search_query and self._pattern else compile_query_pattern(query)
+            spans = [match.span() for match in pattern.finditer(text)]
 
-        # Escape HTML special characters in text
-        text_escaped = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
-        # Find all matches (case-insensitive)
+        # Matches are found in the raw text, then every segment is escaped
         result = []
-        text_lower = text_escaped.lower()
-        query_lower = query.lower()
-
         last_pos = 0
-        pos = text_lower.find(query_lower)
-
-        while pos != -1:
-            # Add text before match
-            result.append(text_escaped[last_pos:pos])
-
-            # Add highlighted match
-            match_text = text_escaped[pos:pos + len(query)]
-            result.append(f'<span style="background-color: {self.highlight_color}; color: #000000; font-weight: bold;">{match_text}</span>')
-
-            last_pos = pos + len(query)
-            pos = text_lower.find(query_lower, last_pos)
+        for start, end in spans:
+            start = max(start, last_pos)  # Tramos solapados
+            if end <= start:
+                continue
+            result.append(self._escape(text[last_pos:start]))
+            result.append(f'<span style="background-color: {self.highlight_color}; color: #000000; '
+                          f'font-weight: bold;">{self._escape(text[start:end])}</span>')
+            last_pos = end
 
         # Add remaining text
-        result.append(text_escaped[last_pos:])
+        result.append(self._escape(text[last_pos:]))
 
         return ''.join(result)
 
+    @staticmethod
+    def _escape(text: str) -> str:
+        """Escape HTML special characters"""
+        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
     def sizeHint(self, option, index):
         """Return the size hint for the item"""
         # Use default size hint
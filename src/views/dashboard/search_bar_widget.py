@@ -165,12 +165,13 @@ class SearchBarWidget(QWidget):
             ('items', 'Items'),
             ('lists', 'Listas'),
             ('tags', 'Tags'),
-            ('content', 'Contenido')
+            ('content', 'Contenido'),
+            ('fuzzy', 'Aproximada')  # Tolera errores de tecleo ("dcoker" -> "docker")
         ]
 
         for scope_id, scope_label in scopes:
             checkbox = QCheckBox(scope_label)
-            checkbox.setChecked(True)  # All checked by default
+            checkbox.setChecked(scope_id != 'fuzzy')  # All scopes checked by default, fuzzy mode off
             checkbox.setStyleSheet("""
                 QCheckBox {
                     color: #cccccc;
@@ -12,11 +12,17 @@ from PyQt6.QtGui import QFont, QIcon, QBrush, QColor, QShortcut, QKeySequence
 import logging
 
 from core.dashboard_manager import DashboardManager
+from core.search_worker import SearchExecutor
 from views.dashboard.search_bar_widget import SearchBarWidget
-from views.dashboard.highlight_delegate import HighlightDelegate
+from views.dashboard.highlight_delegate import HighlightDelegate, HIGHLIGHT_SPANS_ROLE
 
 logger = logging.getLogger(__name__)
 
+# Shared brushes for search highlighting (reused by every node instead of
+# allocating a new QBrush per cell on each keystroke)
+DEFAULT_BACKGROUND = QBrush(QColor('#252525'))
+HIGHLIGHT_BACKGROUND = QBrush(QColor('#3d5a80'))
+
 
 class StructureDashboard(QDialog):
     """Dashboard window for viewing global structure"""
@@ -36,7 +42,25 @@ class StructureDashboard(QDialog):
         self.db = db_manager
         self.dashboard_manager = DashboardManager(db_manager)
         self.structure = None
+        self.displayed_structure = None  # Structure currently shown (filtered/sorted)
         self.current_matches = []  # Store current search matches
+
+        # Search runs on a background worker; only the latest generation is applied
+        self.search_executor = SearchExecutor(parent=self)
+        self.search_executor.chunk_ready.connect(self.on_search_chunk)
+        self.search_executor.search_finished.connect(self.on_search_finished)
+        self._pending_matches = []  # Matches streamed so far by the current search
+        self._pending_highlights = {}  # Fuzzy matched characters, filled by the current search
+
+        # Search state currently applied to the tree, so each query change
+        # only touches the nodes whose match state actually changed
+        self._hidden_categories = set()  # cat_idx of hidden categories
+        self._visible_items = {}  # {cat_idx: set(item_idx)}; missing = all visible
+        self._highlighted_nodes = set()  # (cat_idx, item_idx) with highlight brush
+        self._span_nodes = set()  # (cat_idx, item_idx) with fuzzy highlight spans
+
+        # Categories whose child rows have been created (lazy population)
+        self._materialized_categories = set()
         self.highlight_delegate = None  # Will be set in init_ui
         self.is_custom_maximized = False  # Track custom maximize state
 
@@ -331,6 +355,9 @@ class StructureDashboard(QDialog):
         # Double click to copy content
         tree.itemDoubleClicked.connect(self.on_item_double_clicked)
 
+        # Create child rows on first expansion
+        tree.itemExpanded.connect(self.on_item_expanded)
+
         # Enable context menu
         tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         tree.customContextMenuRequested.connect(self.show_context_menu)
@@ -392,8 +419,8 @@ class StructureDashboard(QDialog):
         logger.info("Loading dashboard data...")
 
         try:
-            # Get structure
-            self.structure = self.dashboard_manager.get_full_structure()
+            # Get structure (categories only, items are loaded on expansion)
+            self.structure = self.dashboard_manager.get_structure_summary()
 
             # Clear tree
             self.tree_widget.clear()
@@ -414,6 +441,9 @@ class StructureDashboard(QDialog):
         """
         Populate tree widget with structure data
 
+        Only category rows are created here; item rows are created the first
+        time a category is expanded (see materialize_category).
+
         Args:
             structure: Structure dict from DashboardManager
         """
@@ -421,12 +451,22 @@ class StructureDashboard(QDialog):
 
         logger.info(f"Populating tree with {len(categories)} categories...")
 
+        self.displayed_structure = structure
+        self._materialized_categories = set()
+
+        # A running search refers to the rows of the previous tree
+        self.search_executor.cancel()
+
+        # Fresh nodes carry no search state
+        self._reset_search_state()
+
         for category in categories:
             # Create category item (Level 1)
             category_item = QTreeWidgetItem(self.tree_widget)
+            item_count = category['item_count']
 
             # Column 0: Name with icon and item count
-            category_name = f"{category['icon']} {category['name']} ({len(category['items'])} items)"
+            category_name = f"{category['icon']} {category['name']} ({item_count} items)"
             category_item.setText(0, category_name)
             category_item.setFont(0, self.get_bold_font())
 
@@ -441,7 +481,7 @@ class StructureDashboard(QDialog):
             # Build tooltip for category
             category_tooltip_parts = []
             category_tooltip_parts.append(f"<b>{category['name']}</b>")
-            category_tooltip_parts.append(f"<b>Items:</b> {len(category['items'])}")
+            category_tooltip_parts.append(f"<b>Items:</b> {item_count}")
 
             if category['tags']:
                 tags_str = ", ".join([f"#{tag}" for tag in category['tags']])
@@ -463,98 +503,145 @@ class StructureDashboard(QDialog):
                 'id': category['id']
             })
 
-            # Add items under this category (Level 2)
-            for item in category['items']:
-                item_widget = QTreeWidgetItem(category_item)
-
-                # Column 0: Item name with indicators
-                indicators = ""
-                if item.get('is_list'):
-                    indicators += "📝 "
-                if item['is_favorite']:
-                    indicators += "⭐ "
-                if item['is_sensitive']:
-                    indicators += "🔒 "
-
-                item_name = f"{indicators}{item['label']}"
-                item_widget.setText(0, item_name)
-
-                # Column 1: Item type
-                type_icons = {
-                    'CODE': '💻',
-                    'URL': '🔗',
-                    'PATH': '📂',
-                    'TEXT': '📝'
-                }
-                type_icon = type_icons.get(item['type'], '📄')
-                item_widget.setText(1, f"{type_icon} {item['type']}")
-
-                # Column 2: Tags + list_group + preview
-                info_parts = []
-
-                # List group (if is_list)
-                if item.get('is_list') and item.get('list_group'):
-                    info_parts.append(f"📝 Lista: {item['list_group']}")
-
-                # Tags
-                if item['tags']:
-                    tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
-                    info_parts.append(tags_str)
-
-                # Content preview (first 50 chars)
-                if not item['is_sensitive'] and item['content']:
-                    preview = item['content'][:50]
-                    if len(item['content']) > 50:
-                        preview += "..."
-                    info_parts.append(f"Preview: {preview}")
-
-                item_widget.setText(2, " | ".join(info_parts))
-
-                # Build tooltip with detailed information
-                tooltip_parts = []
-                tooltip_parts.append(f"<b>{item['label']}</b>")
-                tooltip_parts.append(f"<b>Tipo:</b> {item['type']}")
-
-                if item['description']:
-                    tooltip_parts.append(f"<b>Descripción:</b> {item['description']}")
-
-                if item.get('is_list') and item.get('list_group'):
-                    tooltip_parts.append(f"📝 <b>Pertenece a la lista:</b> {item['list_group']}")
-
-                if item['tags']:
-                    tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
-                    tooltip_parts.append(f"<b>Tags:</b> {tags_str}")
-
-                if item['is_favorite']:
-                    tooltip_parts.append("⭐ <b>Favorito</b>")
-
-                if item['is_sensitive']:
-                    tooltip_parts.append("🔒 <b>Contenido sensible (encriptado)</b>")
-                else:
-                    # Show content preview for non-sensitive items
-                    if item['content']:
-                        content_preview = item['content'][:100]
-                        if len(item['content']) > 100:
-                            content_preview += "..."
-                        tooltip_parts.append(f"<b>Contenido:</b><br><code>{content_preview}</code>")
-
-                tooltip_parts.append("<br><i>Doble click para copiar | Click derecho para más opciones</i>")
-
-                tooltip_html = "<br>".join(tooltip_parts)
-                item_widget.setToolTip(0, tooltip_html)
-                item_widget.setToolTip(1, tooltip_html)
-                item_widget.setToolTip(2, tooltip_html)
-
-                # Store item data
-                item_widget.setData(0, Qt.ItemDataRole.UserRole, {
-                    'type': 'item',
-                    'id': item['id'],
-                    'content': item['content'],
-                    'item_type': item['type']
-                })
+            # Show the expand arrow before any child row exists
+            if item_count:
+                category_item.setChildIndicatorPolicy(
+                    QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+                )
 
         logger.info("Tree populated successfully")
 
+    def on_item_expanded(self, tree_item: QTreeWidgetItem):
+        """Create child rows of a category the first time it is expanded"""
+        cat_idx = self.tree_widget.indexOfTopLevelItem(tree_item)
+        if cat_idx != -1:
+            self.materialize_category(cat_idx)
+
+    def materialize_category(self, cat_idx: int):
+        """
+        Create the item rows of a category (loading its items if needed)
+
+        Args:
+            cat_idx: Category index in the displayed structure
+        """
+        if cat_idx in self._materialized_categories or not self.displayed_structure:
+            return
+
+        category = self.displayed_structure['categories'][cat_idx]
+        category_item = self.tree_widget.topLevelItem(cat_idx)
+        items = self.dashboard_manager.load_category_items(category)
+
+        self._materialized_categories.add(cat_idx)
+
+        for item in items:
+            self._create_item_node(category_item, item)
+
+        category_item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+        )
+        logger.debug(f"Materialized {len(items)} items for category '{category['name']}'")
+
+    def _create_item_node(self, category_item: QTreeWidgetItem, item: dict) -> QTreeWidgetItem:
+        """
+        Create the tree row for an item (Level 2)
+
+        Args:
+            category_item: Parent category node
+            item: Item dict from the structure
+
+        Returns:
+            QTreeWidgetItem: The created node
+        """
+        item_widget = QTreeWidgetItem(category_item)
+
+        # Column 0: Item name with indicators
+        indicators = ""
+        if item.get('is_list'):
+            indicators += "📝 "
+        if item['is_favorite']:
+            indicators += "⭐ "
+        if item['is_sensitive']:
+            indicators += "🔒 "
+
+        item_name = f"{indicators}{item['label']}"
+        item_widget.setText(0, item_name)
+
+        # Column 1: Item type
+        type_icons = {
+            'CODE': '💻',
+            'URL': '🔗',
+            'PATH': '📂',
+            'TEXT': '📝'
+        }
+        type_icon = type_icons.get(item['type'], '📄')
+        item_widget.setText(1, f"{type_icon} {item['type']}")
+
+        # Column 2: Tags + list_group + preview
+        info_parts = []
+
+        # List group (if is_list)
+        if item.get('is_list') and item.get('list_group'):
+            info_parts.append(f"📝 Lista: {item['list_group']}")
+
+        # Tags
+        if item['tags']:
+            tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
+            info_parts.append(tags_str)
+
+        # Content preview (first 50 chars)
+        if not item['is_sensitive'] and item['content']:
+            preview = item['content'][:50]
+            if len(item['content']) > 50:
+                preview += "..."
+            info_parts.append(f"Preview: {preview}")
+
+        item_widget.setText(2, " | ".join(info_parts))
+
+        # Build tooltip with detailed information
+        tooltip_parts = []
+        tooltip_parts.append(f"<b>{item['label']}</b>")
+        tooltip_parts.append(f"<b>Tipo:</b> {item['type']}")
+
+        if item['description']:
+            tooltip_parts.append(f"<b>Descripción:</b> {item['description']}")
+
+        if item.get('is_list') and item.get('list_group'):
+            tooltip_parts.append(f"📝 <b>Pertenece a la lista:</b> {item['list_group']}")
+
+        if item['tags']:
+            tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
+            tooltip_parts.append(f"<b>Tags:</b> {tags_str}")
+
+        if item['is_favorite']:
+            tooltip_parts.append("⭐ <b>Favorito</b>")
+
+        if item['is_sensitive']:
+            tooltip_parts.append("🔒 <b>Contenido sensible (encriptado)</b>")
+        else:
+            # Show content preview for non-sensitive items
+            if item['content']:
+                content_preview = item['content'][:100]
+                if len(item['content']) > 100:
+                    content_preview += "..."
+                tooltip_parts.append(f"<b>Contenido:</b><br><code>{content_preview}</code>")
+
+        tooltip_parts.append("<br><i>Doble click para copiar | Click derecho para más opciones</i>")
+
+        tooltip_html = "<br>".join(tooltip_parts)
+        item_widget.setToolTip(0, tooltip_html)
+        item_widget.setToolTip(1, tooltip_html)
+        item_widget.setToolTip(2, tooltip_html)
+
+        # Store item data
+        item_widget.setData(0, Qt.ItemDataRole.UserRole, {
+            'type': 'item',
+            'id': item['id'],
+            'content': item['content'],
+            'item_type': item['type']
+        })
+
+        return item_widget
+
     def update_statistics(self):
         """Update statistics label"""
         if not self.structure:
@@ -655,11 +742,10 @@ class StructureDashboard(QDialog):
         if self.highlight_delegate:
             self.highlight_delegate.set_search_query(query)
 
-        # Clear previous highlighting
-        self.clear_highlighting()
-
         if not query:
             # If empty query, show all items
+            self.search_executor.cancel()
+            self.clear_highlighting()
             self.show_all_items()
             self.search_bar.set_results_count(0)
             self.current_matches = []
@@ -667,12 +753,38 @@ class StructureDashboard(QDialog):
             self.tree_widget.viewport().update()
             return
 
-        # Perform search
-        matches = self.dashboard_manager.search(query, scope_filters, self.structure)
+        # Search the structure shown in the tree so indices match its rows. Only the
+        # categories that can match are loaded, here (database access stays on the
+        # UI thread); the scan runs on the worker
+        structure = self.displayed_structure
+        self.dashboard_manager.load_search_candidates(query, scope_filters, structure)
+        self._pending_matches = []
+        highlights = self._pending_highlights = {}  # Uno por búsqueda: solo lo escribe su worker
+        self.search_executor.submit(
+            lambda: self.dashboard_manager.search(query, scope_filters, structure, highlights)
+        )
+
+    def on_search_chunk(self, generation: int, chunk: list):
+        """Collect streamed matches of the current search (UI thread)"""
+        if not self.search_executor.is_current(generation):
+            return
+        self._pending_matches.extend(chunk)
+        self.search_bar.set_results_count(len(self._pending_matches))
+
+    def on_search_finished(self, generation: int, total: int):
+        """Apply the matches of the current search to the tree (UI thread)"""
+        if not self.search_executor.is_current(generation):
+            return
+
+        matches = self._pending_matches
+        self._pending_matches = []
         self.current_matches = matches
 
-        # Filter tree to show only matches
+        # Filter tree to show only matches, then move the highlight (previous
+        # highlighting is kept until the new matches are ready; both are diffs)
         self.filter_tree_by_matches(matches)
+        self.highlight_matches(matches)
+        self.apply_match_spans(self._pending_highlights)
 
         # Update results counter
         self.search_bar.set_results_count(len(matches))
@@ -686,66 +798,130 @@ class StructureDashboard(QDialog):
 
         logger.info(f"Search found {len(matches)} matches")
 
-    def clear_highlighting(self):
-        """Clear all highlighting in tree"""
+    def _reset_search_state(self):
+        """Forget the search state applied to the current tree nodes"""
+        self._hidden_categories = set()
+        self._visible_items = {}
+        self._highlighted_nodes = set()
+        self._span_nodes = set()
+
+    def _get_node(self, cat_idx: int, item_idx: int):
+        """
+        Get tree node for a (category_index, item_index) pair
+
+        Args:
+            cat_idx: Category index (top-level row)
+            item_idx: Item index inside the category, -1 for the category itself
+
+        Returns:
+            QTreeWidgetItem or None if indices are out of range
+        """
         root = self.tree_widget.invisibleRootItem()
+        if cat_idx >= root.childCount():
+            return None
 
-        for cat_idx in range(root.childCount()):
-            category_item = root.child(cat_idx)
+        category_item = root.child(cat_idx)
+        if item_idx == -1:
+            return category_item
+        if item_idx < category_item.childCount():
+            return category_item.child(item_idx)
+        return None
 
-            # Reset category background
-            for col in range(3):
-                category_item.setBackground(col, QBrush(QColor('#252525')))
+    def _set_node_background(self, node: QTreeWidgetItem, brush: QBrush):
+        """Apply a shared brush to all columns of a node"""
+        for col in range(3):
+            node.setBackground(col, brush)
 
-            # Reset items background
-            for item_idx in range(category_item.childCount()):
-                item_widget = category_item.child(item_idx)
-                for col in range(3):
-                    item_widget.setBackground(col, QBrush(QColor('#252525')))
+    def clear_highlighting(self):
+        """Clear highlighting from the nodes that are currently highlighted"""
+        for cat_idx, item_idx in self._highlighted_nodes:
+            node = self._get_node(cat_idx, item_idx)
+            if node is not None:
+                self._set_node_background(node, DEFAULT_BACKGROUND)
+
+        self._highlighted_nodes = set()
+        self.apply_match_spans({})
+
+    def apply_match_spans(self, highlights: dict):
+        """
+        Give the highlight delegate the characters matched by a fuzzy search
+
+        Args:
+            highlights: {(cat_idx, item_idx): ((field text, ((start, end), ...)), ...)}
+                        as filled by DashboardManager.search
+        """
+        for node_key in self._span_nodes - highlights.keys():
+            node = self._get_node(*node_key)
+            if node is not None:
+                for col in (0, 2):
+                    node.setData(col, HIGHLIGHT_SPANS_ROLE, None)
+
+        for node_key, fields in highlights.items():
+            node = self._get_node(*node_key)
+            if node is None:
+                continue
+            for col in (0, 2):
+                # Los campos aparecen dentro del texto de la celda (icono, #tag, contador...)
+                text = node.text(col)
+                spans = []
+                for field_text, runs in fields:
+                    offset = text.find(field_text) if field_text else -1
+                    if offset >= 0:
+                        spans.extend((offset + start, offset + end) for start, end in runs)
+                node.setData(col, HIGHLIGHT_SPANS_ROLE, tuple(sorted(spans)) or None)
+
+        self._span_nodes = set(highlights)
 
     def highlight_matches(self, matches: list):
         """
         Highlight matching items in tree
 
+        Only nodes whose highlight state changes are touched.
+
         Args:
             matches: List of (match_type, category_index, item_index) tuples
         """
-        root = self.tree_widget.invisibleRootItem()
-        highlight_color = QColor('#3d5a80')  # Dark blue for highlights
-
+        new_highlighted = set()
         for match_type, cat_idx, item_idx in matches:
-            if cat_idx >= root.childCount():
-                continue
-
-            category_item = root.child(cat_idx)
-
-            if item_idx == -1:
-                # Highlight category
-                for col in range(3):
-                    category_item.setBackground(col, QBrush(highlight_color))
-                # Expand category to show items
+            if item_idx != -1:
+                self.materialize_category(cat_idx)
+            if self._get_node(cat_idx, item_idx) is not None:
+                new_highlighted.add((cat_idx, item_idx))
+
+        # Remove highlight from nodes that no longer match
+        for cat_idx, item_idx in self._highlighted_nodes - new_highlighted:
+            node = self._get_node(cat_idx, item_idx)
+            if node is not None:
+                self._set_node_background(node, DEFAULT_BACKGROUND)
+
+        # Highlight newly matching nodes
+        for cat_idx, item_idx in new_highlighted - self._highlighted_nodes:
+            self._set_node_background(self._get_node(cat_idx, item_idx), HIGHLIGHT_BACKGROUND)
+            # Expand category to show highlighted node
+            category_item = self._get_node(cat_idx, -1)
+            if not category_item.isExpanded():
                 category_item.setExpanded(True)
-            else:
-                # Highlight item
-                if item_idx < category_item.childCount():
-                    item_widget = category_item.child(item_idx)
-                    for col in range(3):
-                        item_widget.setBackground(col, QBrush(highlight_color))
-                    # Expand category to show highlighted item
-                    category_item.setExpanded(True)
+
+        self._highlighted_nodes = new_highlighted
 
     def show_all_items(self):
-        """Show all items in tree"""
+        """Show all items in tree (only nodes currently hidden are touched)"""
         root = self.tree_widget.invisibleRootItem()
 
-        for cat_idx in range(root.childCount()):
-            category_item = root.child(cat_idx)
-            category_item.setHidden(False)
+        for cat_idx in self._hidden_categories:
+            if cat_idx < root.childCount():
+                root.child(cat_idx).setHidden(False)
 
-            # Show all items in category
+        for cat_idx, visible in self._visible_items.items():
+            if cat_idx >= root.childCount():
+                continue
+            category_item = root.child(cat_idx)
             for item_idx in range(category_item.childCount()):
-                item_widget = category_item.child(item_idx)
-                item_widget.setHidden(False)
+                if item_idx not in visible:
+                    category_item.child(item_idx).setHidden(False)
+
+        self._hidden_categories = set()
+        self._visible_items = {}
 
     def navigate_to_result(self, result_index: int):
         """
@@ -766,6 +942,7 @@ class StructureDashboard(QDialog):
             return
 
         category_item = root.child(cat_idx)
+        self.materialize_category(cat_idx)
 
         # Clear previous selection
         self.tree_widget.clearSelection()
@@ -791,52 +968,82 @@ class StructureDashboard(QDialog):
         """
         Filter tree to show only matching items
 
+        The previous visibility state is diffed against the new one, so only
+        nodes whose match state changed are shown or hidden.
+
         Args:
             matches: List of (match_type, category_index, item_index) tuples
         """
         root = self.tree_widget.invisibleRootItem()
 
-        # Create set of matching category and item indices for quick lookup
-        matching_categories = set()
+        # Create sets of matching category and item indices for quick lookup
+        matched_categories = set()  # Categories matched by name/tag
         matching_items = {}  # {cat_idx: set(item_indices)}
 
         for match_type, cat_idx, item_idx in matches:
-            matching_categories.add(cat_idx)
-            if item_idx != -1:
-                if cat_idx not in matching_items:
-                    matching_items[cat_idx] = set()
-                matching_items[cat_idx].add(item_idx)
+            if item_idx == -1:
+                matched_categories.add(cat_idx)
+            else:
+                matching_items.setdefault(cat_idx, set()).add(item_idx)
+
+        categories_with_matches = matched_categories | matching_items.keys()
+        new_hidden_categories = set()
 
-        # Hide/show categories and items based on matches
         for cat_idx in range(root.childCount()):
             category_item = root.child(cat_idx)
 
-            # Check if this category has any matches
-            if cat_idx in matching_categories:
-                # Category has matches - show it
+            if cat_idx not in categories_with_matches:
+                # No matches in this category - hide it (children keep their state)
+                new_hidden_categories.add(cat_idx)
+                if cat_idx not in self._hidden_categories:
+                    category_item.setHidden(True)
+                continue
+
+            # Category has matches - make sure its item rows exist, then show it
+            self.materialize_category(cat_idx)
+            if cat_idx in self._hidden_categories:
                 category_item.setHidden(False)
+            if not category_item.isExpanded():
                 category_item.setExpanded(True)
 
-                # If category itself matched, show all its items
-                category_matched = any(
-                    m[1] == cat_idx and m[2] == -1
-                    for m in matches
-                )
+            # If category itself matched, show all its items (None = all visible)
+            new_visible = None if cat_idx in matched_categories else matching_items[cat_idx]
+            self._apply_item_visibility(category_item, cat_idx, new_visible)
 
-                if category_matched:
-                    # Show all items in this category
-                    for item_idx in range(category_item.childCount()):
-                        item_widget = category_item.child(item_idx)
-                        item_widget.setHidden(False)
-                else:
-                    # Only show matching items
-                    cat_matching_items = matching_items.get(cat_idx, set())
-                    for item_idx in range(category_item.childCount()):
-                        item_widget = category_item.child(item_idx)
-                        item_widget.setHidden(item_idx not in cat_matching_items)
-            else:
-                # No matches in this category - hide it
-                category_item.setHidden(True)
+        self._hidden_categories = new_hidden_categories
+
+    def _apply_item_visibility(self, category_item: QTreeWidgetItem, cat_idx: int, new_visible):
+        """
+        Update visibility of a category's children against their previous state
+
+        Args:
+            category_item: Category node
+            cat_idx: Category index
+            new_visible: Set of visible item indices, or None to show all items
+        """
+        old_visible = self._visible_items.get(cat_idx)
+
+        if old_visible is None and new_visible is None:
+            return
+
+        if old_visible is not None and new_visible is not None:
+            # Refinement: only toggle the symmetric difference
+            for item_idx in old_visible - new_visible:
+                category_item.child(item_idx).setHidden(True)
+            for item_idx in new_visible - old_visible:
+                category_item.child(item_idx).setHidden(False)
+        else:
+            # Switching between "all visible" and a subset
+            for item_idx in range(category_item.childCount()):
+                was_visible = old_visible is None or item_idx in old_visible
+                is_visible = new_visible is None or item_idx in new_visible
+                if was_visible != is_visible:
+                    category_item.child(item_idx).setHidden(not is_visible)
+
+        if new_visible is None:
+            self._visible_items.pop(cat_idx, None)
+        else:
+            self._visible_items[cat_idx] = new_visible
 
     def show_context_menu(self, position):
         """Show context menu on right-click"""
@@ -1040,5 +1247,6 @@ class StructureDashboard(QDialog):
 
     def closeEvent(self, event):
         """Handle window close"""
+        self.search_executor.cancel()
         logger.info("Structure Dashboard closed")
         event.accept()
@@ -48,6 +48,11 @@ class PopularItemsDialog(QDialog):
         # Tabs para diferentes períodos
         self.tabs = QTabWidget()
 
+        # Tab: Frecuentes y recientes (frecencia)
+        self.frecency_list = QListWidget()
+        self.frecency_list.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.tabs.addTab(self.frecency_list, "🔥 Frecuentes y Recientes")
+
         # Tab: Todos los tiempos
         self.all_time_list = QListWidget()
         self.all_time_list.itemDoubleClicked.connect(self.on_item_double_clicked)
@@ -153,21 +158,23 @@ class PopularItemsDialog(QDialog):
     def load_popular_items(self):
         """Cargar items populares en cada tab"""
         try:
+            # Todos los períodos con una sola lectura del historial
+            ranked = self.stats_manager.get_most_used_by_period(limit=20)
+
+            # Frecency
+            self.populate_list(self.frecency_list, self.stats_manager.get_top_frecency_items(limit=20))
+
             # All time
-            all_time = self.stats_manager.get_most_used_items(limit=20)
-            self.populate_list(self.all_time_list, all_time, show_percentage=True)
+            self.populate_list(self.all_time_list, ranked['all'], show_percentage=True)
 
             # This month (30 days)
-            month_items = self.stats_manager.get_most_used_items(limit=20, period='month')
-            self.populate_list(self.month_list, month_items)
+            self.populate_list(self.month_list, ranked['month'])
 
             # This week
-            week_items = self.stats_manager.get_most_used_items(limit=20, period='week')
-            self.populate_list(self.week_list, week_items)
+            self.populate_list(self.week_list, ranked['week'])
 
             # Today
-            today_items = self.stats_manager.get_most_used_items(limit=20, period='today')
-            self.populate_list(self.today_list, today_items)
+            self.populate_list(self.today_list, ranked['today'])
 
             logger.info("Popular items loaded successfully")
 
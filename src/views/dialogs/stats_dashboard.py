@@ -22,6 +22,7 @@ import matplotlib.pyplot as plt
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.stats_manager import StatsManager
 from core.favorites_manager import FavoritesManager
+from core.metrics import metrics
 import logging
 
 logger = logging.getLogger(__name__)
@@ -78,6 +79,10 @@ class StatsDashboard(QDialog):
         self.health_tab = self.create_health_tab()
         self.tabs.addTab(self.health_tab, "🏥 Salud del Widget")
 
+        # Tab 6: Métricas internas (tiempos de consultas, búsquedas, render...)
+        self.metrics_tab = self.create_metrics_tab()
+        self.tabs.addTab(self.metrics_tab, "🔬 Métricas")
+
         layout.addWidget(self.tabs)
 
         # Botones
@@ -322,6 +327,60 @@ class StatsDashboard(QDialog):
 
         return widget
 
+    def create_metrics_tab(self) -> QWidget:
+        """Crear tab de métricas internas y perfilado"""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+
+        # Contadores y tiempos registrados
+        metrics_group = QGroupBox("⏱️ Tiempos de Operaciones")
+        metrics_layout = QVBoxLayout(metrics_group)
+
+        self.metrics_table = QTableWidget()
+        self.metrics_table.setColumnCount(7)
+        self.metrics_table.setHorizontalHeaderLabels([
+            "Métrica", "Tipo", "Cuenta", "Media ms", "p95 ms", "Máx ms", "Total ms"
+        ])
+        self.metrics_table.horizontalHeader().setStretchLastSection(True)
+        metrics_layout.addWidget(self.metrics_table)
+
+        layout.addWidget(metrics_group)
+
+        # Perfilado con cProfile
+        profile_group = QGroupBox("🔬 Perfilado")
+        profile_layout = QVBoxLayout(profile_group)
+
+        self.profile_text = QTextEdit()
+        self.profile_text.setReadOnly(True)
+        self.profile_text.setFont(QFont("Consolas", 9))
+        self.profile_text.setPlaceholderText(
+            "Inicia el perfilado, usa la aplicación y detenlo para ver las funciones más costosas"
+        )
+        profile_layout.addWidget(self.profile_text)
+
+        layout.addWidget(profile_group)
+
+        # Botones de acción
+        actions_layout = QHBoxLayout()
+
+        export_metrics_btn = QPushButton("💾 Exportar JSON")
+        export_metrics_btn.clicked.connect(self.export_metrics)
+        actions_layout.addWidget(export_metrics_btn)
+
+        reset_metrics_btn = QPushButton("🧹 Reiniciar")
+        reset_metrics_btn.clicked.connect(self.reset_metrics)
+        actions_layout.addWidget(reset_metrics_btn)
+
+        self.profile_btn = QPushButton()
+        self.profile_btn.clicked.connect(self.toggle_profiling)
+        actions_layout.addWidget(self.profile_btn)
+        self.update_profile_button()
+
+        actions_layout.addStretch()
+        layout.addLayout(actions_layout)
+
+        return widget
+
     def create_metric_card(self, title: str, value: str, icon: str) -> QFrame:
         """Crear card de métrica"""
         card = QFrame()
@@ -378,6 +437,7 @@ class StatsDashboard(QDialog):
             self.load_categories_data()
             self.load_performance_data()
             self.load_health_data()
+            self.load_metrics_data()
             logger.info("Dashboard data loaded successfully")
         except Exception as e:
             logger.error(f"Error loading dashboard data: {e}")
@@ -711,6 +771,97 @@ class StatsDashboard(QDialog):
 
         self.health_text.setHtml(html)
 
+    def load_metrics_data(self):
+        """Cargar métricas internas del registro"""
+        try:
+            snapshot = metrics.snapshot()
+            self.populate_metrics_table(snapshot)
+        except Exception as e:
+            logger.error(f"Error loading metrics data: {e}")
+
+    def populate_metrics_table(self, snapshot: dict):
+        """Poblar tabla de métricas (histogramas primero, luego contadores)"""
+        self.metrics_table.setRowCount(0)
+
+        def fmt(value):
+            return f"{value:.2f}" if value is not None else "-"
+
+        rows = [
+            (name, "Tiempo", data['count'], fmt(data['mean']), fmt(data['p95']),
+             fmt(data['max']), fmt(data['total']))
+            for name, data in snapshot.get('histograms', {}).items()
+        ]
+        rows += [
+            (name, "Contador", data['count'], "-", "-", "-", "-")
+            for name, data in snapshot.get('counters', {}).items()
+        ]
+
+        for row, values in enumerate(rows):
+            self.metrics_table.insertRow(row)
+            for column, value in enumerate(values):
+                self.metrics_table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    def export_metrics(self):
+        """Exportar métricas a JSON"""
+        try:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self,
+                "Exportar Métricas",
+                f"metricas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                "JSON Files (*.json);;All Files (*)"
+            )
+
+            if not file_path:
+                return
+
+            metrics.dump_json(file_path)
+            QMessageBox.information(
+                self,
+                "Éxito",
+                f"Métricas exportadas correctamente:\n{file_path}"
+            )
+
+        except Exception as e:
+            logger.error(f"Error exporting metrics: {e}", exc_info=True)
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Error al exportar métricas:\n{str(e)}"
+            )
+
+    def reset_metrics(self):
+        """Reiniciar todas las métricas"""
+        metrics.reset()
+        self.load_metrics_data()
+
+    def toggle_profiling(self):
+        """Iniciar o detener el perfilado con cProfile"""
+        if not metrics.profiling:
+            metrics.start_profiling()
+            self.profile_text.clear()
+        else:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self,
+                "Guardar Perfil (opcional)",
+                f"perfil_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof",
+                "Profile Files (*.prof);;All Files (*)"
+            )
+            try:
+                self.profile_text.setPlainText(metrics.stop_profiling(file_path or None))
+            except Exception as e:
+                logger.error(f"Error stopping profiler: {e}", exc_info=True)
+                QMessageBox.critical(self, "Error", f"Error al guardar perfil:\n{str(e)}")
+            self.load_metrics_data()
+
+        self.update_profile_button()
+
+    def update_profile_button(self):
+        """Actualizar texto del botón de perfilado"""
+        if metrics.profiling:
+            self.profile_btn.setText("⏹️ Detener perfilado")
+        else:
+            self.profile_btn.setText("▶️ Iniciar perfilado")
+
     def show_cleanup_dialog(self):
         """Mostrar diálogo de limpieza"""
         from views.dialogs.forgotten_items_dialog import ForgottenItemsDialog
@@ -19,10 +19,15 @@ from views.dialogs.list_creator_dialog import ListCreatorDialog
 from views.dialogs.list_editor_dialog import ListEditorDialog
 from core.search_engine import SearchEngine
 from core.advanced_filter_engine import AdvancedFilterEngine
+from core.event_bus import event_bus, ITEM_EVENTS, ItemDeleted
+from core.metrics import metrics
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Item buttons created per event-loop turn by display_items_and_lists_incrementally
+ITEM_BUTTON_CHUNK_SIZE = 25
+
 
 class FloatingPanel(QWidget):
     """Floating window for displaying category items"""
@@ -39,22 +44,31 @@ class FloatingPanel(QWidget):
     # Signal emitted when customization is requested
     customization_requested = pyqtSignal()
 
+    # Signal emitted when an incremental display completes or is superseded
+    incremental_display_finished = pyqtSignal()
+
     def __init__(self, config_manager=None, list_controller=None, panel_id=None, custom_name=None, custom_color=None, parent=None):
         super().__init__(parent)
         self.current_category = None
         self.config_manager = config_manager
         self.list_controller = list_controller  # Controlador de listas
         self.search_engine = SearchEngine()
-        self.filter_engine = AdvancedFilterEngine()  # Motor de filtrado avanzado
+        self.filter_engine = AdvancedFilterEngine(  # Motor de filtrado avanzado
+            item_store=config_manager.item_store if config_manager else None
+        )
         self.all_items = []  # Store all items before filtering
         self.all_lists = []  # Store all lists before filtering
         self.current_filters = {}  # Filtros activos actuales
         self.current_state_filter = "normal"  # Filtro de estado actual: normal, archived, inactive, all
+        self._search_base = []  # all_items con filtros avanzados y de estado aplicados
+        self._search_base_key = None  # (all_items, len, current_filters, estado) de _search_base
         self.is_pinned = False  # Estado de anclaje del panel
         self.is_minimized = False  # Estado de minimizado (solo para paneles anclados)
         self.normal_height = None  # Altura normal antes de minimizar
         self.normal_width = None  # Ancho normal antes de minimizar
         self.normal_position = None  # Posición normal antes de minimizar
+        self._display_generation = 0  # Bumped on every display; cancels pending incremental chunks
+        self._incremental_pending = False  # An incremental display is still adding buttons
 
         # Panel persistence attributes
         self.panel_id = panel_id  # ID del panel en la base de datos (None si no está guardado)
@@ -79,6 +93,14 @@ class FloatingPanel(QWidget):
         self.update_timer.timeout.connect(self._save_panel_state_to_db)
         self.update_delay_ms = 1000  # 1 second delay after move/resize
 
+        # Cambios de items publicados por la base de datos: se parchean solo esos items
+        self._changed_item_ids = set()
+        self._item_patch_timer = QTimer(self)
+        self._item_patch_timer.setSingleShot(True)
+        self._item_patch_timer.setInterval(0)  # Agrupa los eventos de una misma operación
+        self._item_patch_timer.timeout.connect(self._apply_item_changes)
+        self._unsubscribe = event_bus.subscribe_many(ITEM_EVENTS, self._on_items_changed)
+
         self.init_ui()
 
     def init_ui(self):
@@ -431,8 +453,13 @@ class FloatingPanel(QWidget):
         self.scroll_area.setWidget(self.items_container)
         main_layout.addWidget(self.scroll_area)
 
-    def load_category(self, category: Category):
-        """Load and display items and lists from a category"""
+    def load_category(self, category: Category, incremental: bool = False):
+        """Load and display items and lists from a category
+
+        Args:
+            category: Category to display
+            incremental: Create item buttons over several event-loop turns
+        """
         logger.info(f"Loading category: {category.name} with {len(category.items)} items")
 
         self.current_category = category
@@ -457,15 +484,18 @@ class FloatingPanel(QWidget):
         self.filters_window.update_available_tags(self.all_items)
         logger.debug(f"Updated available tags from {len(self.all_items)} items")
 
-        # Clear search bar
-        self.search_bar.clear_search()
+        # Clear search bar (without emitting: items are displayed below)
+        self.search_bar.clear_search(emit=False)
 
         # Clear existing items
         self.clear_items()
         logger.debug("Previous items and lists cleared")
 
         # Display items and lists
-        self.display_items_and_lists(self.all_items, self.all_lists)
+        if incremental:
+            self.display_items_and_lists_incrementally(self.all_items, self.all_lists)
+        else:
+            self.display_items_and_lists(self.all_items, self.all_lists)
 
         # Enable "Nueva Lista" button if we have a list controller
         if self.list_controller and hasattr(category, 'id'):
@@ -478,22 +508,29 @@ class FloatingPanel(QWidget):
         self.raise_()
         self.activateWindow()
 
+    @metrics.timed('panel.render')
     def display_items(self, items):
         """Display a list of items (mantiene compatibilidad hacia atrás)"""
         logger.info(f"Displaying {len(items)} items")
 
+        # Cancel any pending incremental display
+        self._start_display()
+
         # Clear existing items
         self.clear_items()
 
         # Add items
+        log_items = logger.isEnabledFor(logging.DEBUG)
         for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
+            if log_items:
+                logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
             item_button = ItemButton(item)
             item_button.item_clicked.connect(self.on_item_clicked)
             self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
 
         logger.info(f"Successfully added {len(items)} item buttons to layout")
 
+    @metrics.timed('panel.render')
     def display_items_and_lists(self, items, lists):
         """Display items and lists in separate sections
 
@@ -503,84 +540,155 @@ class FloatingPanel(QWidget):
         """
         logger.info(f"Displaying {len(items)} items and {len(lists)} lists")
 
+        # Cancel any pending incremental display
+        self._start_display()
+
         # Clear existing content
         self.clear_items()
 
         # === SECCIÓN DE ITEMS ===
         if items:
-            # Section header
-            items_header = QLabel(f"━━━ Items ({len(items)}) ━━━")
-            items_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            items_header.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10pt;
-                    font-weight: bold;
-                    padding: 8px;
-                    background-color: transparent;
-                }
-            """)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, items_header)
+            self._add_items_header(len(items))
 
             # Add items
+            log_items = logger.isEnabledFor(logging.DEBUG)
             for idx, item in enumerate(items):
-                logger.debug(f"Creating item button {idx+1}/{len(items)}: {item.label}")
-                item_button = ItemButton(item)
-                item_button.item_clicked.connect(self.on_item_clicked)
-                self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
+                if log_items:
+                    logger.debug(f"Creating item button {idx+1}/{len(items)}: {item.label}")
+                self._add_item_button(item)
 
         # === SECCIÓN DE LISTAS ===
         if lists:
-            # Spacer entre secciones
-            if items:
-                spacer_label = QLabel("")
-                spacer_label.setFixedHeight(10)
-                spacer_label.setStyleSheet("background-color: transparent;")
-                self.items_layout.insertWidget(self.items_layout.count() - 1, spacer_label)
-
-            # Section header
-            lists_header = QLabel(f"━━━ Listas ({len(lists)}) ━━━")
-            lists_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lists_header.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10pt;
-                    font-weight: bold;
-                    padding: 8px;
-                    background-color: transparent;
-                }
-            """)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, lists_header)
+            self._add_lists_section(lists, has_items=bool(items))
 
-            # Add lists
-            for idx, list_data in enumerate(lists):
+        logger.info(f"Successfully displayed {len(items)} items and {len(lists)} lists")
+
+    def display_items_and_lists_incrementally(self, items, lists, chunk_size: int = ITEM_BUTTON_CHUNK_SIZE):
+        """Same result as display_items_and_lists, but item buttons are created
+        in chunks over successive event-loop turns so input is not blocked.
+        Any later display call cancels the pending chunks.
+
+        Args:
+            items: List of Item objects (solo items normales, no items de listas)
+            lists: List of list metadata dicts from ListController.get_lists()
+            chunk_size: Item buttons created per turn
+        """
+        logger.info(f"Displaying {len(items)} items and {len(lists)} lists incrementally")
+
+        generation = self._start_display()
+        self._incremental_pending = True
+
+        self.clear_items()
+
+        if items:
+            self._add_items_header(len(items))
+
+        def add_chunk(start: int):
+            if generation != self._display_generation:
+                return  # Superseded by a newer display (search, filters, close)
+
+            with metrics.timer('panel.render_chunk'):
+                for item in items[start:start + chunk_size]:
+                    self._add_item_button(item)
+
+            if start + chunk_size < len(items):
+                QTimer.singleShot(0, lambda: add_chunk(start + chunk_size))
+            else:
+                if lists:
+                    self._add_lists_section(lists, has_items=bool(items))
+                logger.info(f"Successfully displayed {len(items)} items and {len(lists)} lists")
+                self._incremental_pending = False
+                self.incremental_display_finished.emit()
+
+        add_chunk(0)
+
+    def _start_display(self) -> int:
+        """Start a new display pass, superseding any pending incremental one
+
+        Returns:
+            int: Generation of the new display pass
+        """
+        self._display_generation += 1
+
+        if self._incremental_pending:
+            self._incremental_pending = False
+            self.incremental_display_finished.emit()
+
+        return self._display_generation
+
+    def _add_items_header(self, count: int):
+        """Add the items section header"""
+        items_header = QLabel(f"━━━ Items ({count}) ━━━")
+        items_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        items_header.setStyleSheet("""
+            QLabel {
+                color: #888888;
+                font-size: 10pt;
+                font-weight: bold;
+                padding: 8px;
+                background-color: transparent;
+            }
+        """)
+        self.items_layout.insertWidget(self.items_layout.count() - 1, items_header)
+
+    def _add_item_button(self, item: Item):
+        """Add an item button before the stretch"""
+        item_button = ItemButton(item)
+        item_button.item_clicked.connect(self.on_item_clicked)
+        self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
+
+    def _add_lists_section(self, lists, has_items: bool):
+        """Add the lists section (header and one ListWidget per list)"""
+        # Spacer entre secciones
+        if has_items:
+            spacer_label = QLabel("")
+            spacer_label.setFixedHeight(10)
+            spacer_label.setStyleSheet("background-color: transparent;")
+            self.items_layout.insertWidget(self.items_layout.count() - 1, spacer_label)
+
+        # Section header
+        lists_header = QLabel(f"━━━ Listas ({len(lists)}) ━━━")
+        lists_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lists_header.setStyleSheet("""
+            QLabel {
+                color: #888888;
+                font-size: 10pt;
+                font-weight: bold;
+                padding: 8px;
+                background-color: transparent;
+            }
+        """)
+        self.items_layout.insertWidget(self.items_layout.count() - 1, lists_header)
+
+        # Add lists
+        log_lists = logger.isEnabledFor(logging.DEBUG)
+        for idx, list_data in enumerate(lists):
+            if log_lists:
                 logger.debug(f"Creating list widget {idx+1}/{len(lists)}: {list_data.get('list_group')}")
 
-                # Obtener items de la lista
-                list_items = []
-                if self.list_controller and hasattr(self.current_category, 'id'):
-                    list_items = self.list_controller.get_list_items(
-                        self.current_category.id,
-                        list_data.get('list_group')
-                    )
-
-                # Crear ListWidget
-                list_widget = ListWidget(
-                    list_data=list_data,
-                    category_id=int(self.current_category.id) if hasattr(self.current_category, 'id') and self.current_category.id else None,
-                    list_items=list_items
+            # Obtener items de la lista
+            list_items = []
+            if self.list_controller and hasattr(self.current_category, 'id'):
+                list_items = self.list_controller.get_list_items(
+                    self.current_category.id,
+                    list_data.get('list_group')
                 )
 
-                # Conectar señales
-                list_widget.list_executed.connect(self.on_list_executed)
-                list_widget.list_edited.connect(self.on_list_edit_requested)
-                list_widget.list_deleted.connect(self.on_list_delete_requested)
-                list_widget.copy_all_requested.connect(self.on_list_copy_all_requested)
-                list_widget.item_copied.connect(self.on_list_item_copied)
+            # Crear ListWidget
+            list_widget = ListWidget(
+                list_data=list_data,
+                category_id=int(self.current_category.id) if hasattr(self.current_category, 'id') and self.current_category.id else None,
+                list_items=list_items
+            )
 
-                self.items_layout.insertWidget(self.items_layout.count() - 1, list_widget)
+            # Conectar señales
+            list_widget.list_executed.connect(self.on_list_executed)
+            list_widget.list_edited.connect(self.on_list_edit_requested)
+            list_widget.list_deleted.connect(self.on_list_delete_requested)
+            list_widget.copy_all_requested.connect(self.on_list_copy_all_requested)
+            list_widget.item_copied.connect(self.on_list_item_copied)
 
-        logger.info(f"Successfully displayed {len(items)} items and {len(lists)} lists")
+            self.items_layout.insertWidget(self.items_layout.count() - 1, list_widget)
 
     def clear_items(self):
         """Clear all item buttons"""
@@ -678,12 +786,7 @@ class FloatingPanel(QWidget):
             if success:
                 logger.info(f"List '{list_group}' deleted successfully")
 
-                # Recargar categoría para reflejar cambios
-                if self.current_category:
-                    # Necesitamos actualizar la categoría desde la base de datos
-                    # Por ahora solo recargamos la vista
-                    self.all_lists = self.list_controller.get_lists(category_id)
-                    self.display_items_and_lists(self.all_items, self.all_lists)
+                # La vista se actualiza con el evento ItemDeleted de la lista
             else:
                 logger.warning(f"Failed to delete list '{list_group}': {message}")
 
@@ -763,20 +866,13 @@ class FloatingPanel(QWidget):
         """Handle list creation from ListCreatorDialog"""
         logger.info(f"List '{list_name}' created successfully in category {category_id} with {len(item_ids)} items")
 
-        # Recargar la categoría para mostrar la nueva lista
-        if self.current_category and hasattr(self.current_category, 'id'):
-            if int(self.current_category.id) == category_id:
-                # Recargar items y listas desde la base de datos
-                self.reload_current_category()
+        # La nueva lista llega por el bus de eventos (ItemAdded) y se parchea sola
 
     def on_list_updated_from_dialog(self, list_name: str, category_id: int):
         """Handle list update from ListEditorDialog"""
         logger.info(f"List '{list_name}' updated successfully in category {category_id}")
 
-        # Recargar la categoría para mostrar cambios
-        if self.current_category and hasattr(self.current_category, 'id'):
-            if int(self.current_category.id) == category_id:
-                self.reload_current_category()
+        # Los cambios llegan por el bus de eventos y se parchean solos
 
     def reload_current_category(self):
         """Reload current category from database"""
@@ -793,9 +889,8 @@ class FloatingPanel(QWidget):
                 if hasattr(self.config_manager, 'db'):
                     all_items_from_db = self.config_manager.db.get_items_by_category(category_id)
 
-                    # Actualizar items en la categoría
-                    from models.item import Item
-                    self.current_category.items = [Item.from_dict(item_dict) for item_dict in all_items_from_db]
+                    # Actualizar items en la categoría (los Item compartidos del store)
+                    self.current_category.items = self.config_manager.item_store.upsert_rows(all_items_from_db)
 
                     # Separar items normales
                     self.all_items = [item for item in self.current_category.items if not item.is_list_item()]
@@ -812,16 +907,97 @@ class FloatingPanel(QWidget):
         except Exception as e:
             logger.error(f"Error reloading category: {e}", exc_info=True)
 
+    def _current_category_id(self):
+        """Database ID of the displayed category (None for virtual categories)"""
+        try:
+            return int(self.current_category.id)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def _on_items_changed(self, event):
+        """
+        Queue the items of a change event that belong to the displayed category
+
+        Events without categories (e.g. favorites) are matched by item ID.
+        The changes are applied together on the next event-loop turn.
+
+        Args:
+            event: ItemAdded, ItemUpdated or ItemDeleted
+        """
+        category_id = self._current_category_id()
+        if category_id is None or not self.config_manager:
+            return
+
+        if event.category_ids:
+            if category_id not in event.category_ids:
+                return
+            item_ids = event.item_ids
+        else:
+            shown = {str(item.id) for item in self.current_category.items}
+            item_ids = [item_id for item_id in event.item_ids if str(item_id) in shown]
+            if not item_ids:
+                return
+
+        if isinstance(event, ItemDeleted):
+            self._changed_item_ids.update((item_id, True) for item_id in item_ids)
+        else:
+            self._changed_item_ids.update((item_id, False) for item_id in item_ids)
+        self._item_patch_timer.start()
+
+    def _apply_item_changes(self):
+        """Re-read only the queued items and re-display the category"""
+        changes, self._changed_item_ids = self._changed_item_ids, set()
+        category_id = self._current_category_id()
+        if not changes or category_id is None:
+            return
+
+        try:
+            deleted = {str(item_id) for item_id, is_delete in changes if is_delete}
+            rows = {}
+            for item_id in {item_id for item_id, _ in changes}:
+                row = None if str(item_id) in deleted else self.config_manager.db.get_item(item_id)
+                if row is not None and row['category_id'] == category_id:
+                    # Item compartido del store (actualizado en su sitio, id como str)
+                    rows[str(item_id)] = self.config_manager.item_store.upsert_row(row)
+
+            changed = deleted | {str(item_id) for item_id, _ in changes}
+            lists_affected = any(item.is_list_item() for item in rows.values())
+
+            items = []
+            for item in self.current_category.items:
+                key = str(item.id)
+                if key not in changed:
+                    items.append(item)
+                    continue
+                lists_affected = lists_affected or item.is_list_item()
+                if key in rows:
+                    items.append(rows.pop(key))
+            items.extend(rows.values())  # Nuevos items (orden de creación)
+
+            self.current_category.items = items
+            self.all_items = [item for item in items if not item.is_list_item()]
+            if lists_affected and self.list_controller:
+                self.all_lists = self.list_controller.get_lists(category_id)
+            self.filters_window.update_available_tags(self.all_items)
+
+            # Re-aplicar filtros y búsqueda actuales sobre los items parcheados
+            self.search_engine.invalidate()
+            self.on_search_changed(self.search_bar.get_query())
+
+            logger.info(f"Panel patched: {len(changed)} changed items "
+                        f"({'with' if lists_affected else 'without'} list reload)")
+
+        except Exception as e:
+            logger.error(f"Error applying item changes: {e}", exc_info=True)
+            self.reload_current_category()
+
     def on_search_changed(self, query: str):
         """Handle search query change with filtering"""
         if not self.current_category:
             return
 
-        # Aplicar filtros avanzados primero a items
-        filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
-
-        # Aplicar filtro de estado (is_active, is_archived)
-        filtered_items = self.filter_items_by_state(filtered_items)
+        # Filtros avanzados y de estado (se recalculan solo si cambian los items o filtros)
+        filtered_items = self._search_base_items()
 
         # Filtrar listas (por ahora solo por nombre)
         filtered_lists = self.all_lists.copy()
@@ -836,8 +1012,11 @@ class FloatingPanel(QWidget):
                 icon=""
             )
             # Asignar items después de crear la categoría
+            # (misma lista entre teclas: la sesión de búsqueda refina el resultado anterior)
             temp_category.items = filtered_items
-            filtered_items = self.search_engine.search_in_category(query, temp_category)
+            filtered_items = self.search_engine.search_in_category(
+                query, temp_category, rank=not self.current_filters.get('sort_by')
+            )
 
             # Buscar en nombres de listas
             query_lower = query.lower()
@@ -891,6 +1070,25 @@ class FloatingPanel(QWidget):
             self.update_timer.start(self.update_delay_ms)
             logger.debug("State filter change triggered auto-save")
 
+    def _search_base_items(self):
+        """
+        Get all_items with the advanced and state filters applied
+
+        The result is reused while typing, so every keystroke searches the
+        same list.
+
+        Returns:
+            Lista de items filtrados
+        """
+        cached = self._search_base_key
+        if (cached is None or cached[0] is not self.all_items or cached[2] is not self.current_filters
+                or cached[1] != len(self.all_items) or cached[3] != self.current_state_filter):
+            filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
+            self._search_base = self.filter_items_by_state(filtered_items)
+            self._search_base_key = (self.all_items, len(self.all_items), self.current_filters,
+                                     self.current_state_filter)
+        return self._search_base
+
     def filter_items_by_state(self, items):
         """Filtrar items por estado (activo/archivado)
 
@@ -1265,6 +1463,10 @@ class FloatingPanel(QWidget):
 
     def closeEvent(self, event):
         """Handle window close event"""
+        # Stop any pending incremental display
+        self._start_display()
+        self._item_patch_timer.stop()
+
         # Cerrar también la ventana de filtros si está abierta
         if self.filters_window.isVisible():
             self.filters_window.close()
@@ -6,7 +6,7 @@ Widget for general application settings
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
     QSpinBox, QPushButton, QGroupBox, QFormLayout, QFileDialog,
-    QMessageBox
+    QMessageBox, QComboBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
@@ -16,6 +16,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from views.dialogs.password_verify_dialog import PasswordVerifyDialog
+from utils.logger import DEFAULT_LOG_LEVEL, LOG_LEVELS
 
 
 class GeneralSettings(QWidget):
@@ -107,6 +108,23 @@ class GeneralSettings(QWidget):
         clipboard_group.setLayout(clipboard_layout)
         main_layout.addWidget(clipboard_group)
 
+        # Diagnostics group
+        diagnostics_group = QGroupBox("Diagnóstico")
+        diagnostics_group.setStyleSheet(behavior_group.styleSheet())
+        diagnostics_layout = QFormLayout()
+        diagnostics_layout.setSpacing(10)
+
+        # Log level (se aplica al guardar, sin reiniciar)
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(LOG_LEVELS)
+        self.log_level_combo.setCurrentText(DEFAULT_LOG_LEVEL)
+        self.log_level_combo.setToolTip("DEBUG registra cada item procesado (más lento)")
+        self.log_level_combo.currentTextChanged.connect(self.settings_changed)
+        diagnostics_layout.addRow("Nivel de log:", self.log_level_combo)
+
+        diagnostics_group.setLayout(diagnostics_layout)
+        main_layout.addWidget(diagnostics_group)
+
         # Import/Export group
         io_group = QGroupBox("Importar/Exportar")
         io_group.setStyleSheet(behavior_group.styleSheet())
@@ -189,6 +207,14 @@ class GeneralSettings(QWidget):
             QSpinBox:focus {
                 border: 1px solid #007acc;
             }
+            QComboBox {
+                background-color: #2d2d2d;
+                color: #cccccc;
+                border: 1px solid #3d3d3d;
+                border-radius: 4px;
+                padding: 5px;
+                min-width: 100px;
+            }
             QPushButton {
                 background-color: #2d2d2d;
                 color: #cccccc;
@@ -223,6 +249,10 @@ class GeneralSettings(QWidget):
         max_history = self.config_manager.get_setting("max_history", 20)
         self.max_history_spin.setValue(max_history)
 
+        # Load log level
+        log_level = self.config_manager.get_setting("log_level", DEFAULT_LOG_LEVEL)
+        self.log_level_combo.setCurrentText(log_level if log_level in LOG_LEVELS else DEFAULT_LOG_LEVEL)
+
     def export_config(self):
         """Export configuration to JSON file"""
         if not self.config_manager:
@@ -249,7 +279,7 @@ class GeneralSettings(QWidget):
             self,
             "Exportar Configuración",
             str(Path.home() / "widget_sidebar_config.json"),
-            "JSON Files (*.json)"
+            "JSON Files (*.json);;NDJSON comprimido (*.ndjson.gz);;NDJSON (*.ndjson)"
         )
 
         if not file_path:
@@ -292,7 +322,7 @@ class GeneralSettings(QWidget):
             self,
             "Importar Configuración",
             str(Path.home()),
-            "JSON Files (*.json)"
+            "Config Files (*.json *.ndjson *.jsonl *.gz *.bz2 *.xz);;All Files (*)"
         )
 
         if not file_path:
@@ -334,5 +364,6 @@ class GeneralSettings(QWidget):
             "minimize_to_tray": self.minimize_tray_check.isChecked(),
             "always_on_top": self.always_on_top_check.isChecked(),
             "start_with_windows": self.start_windows_check.isChecked(),
-            "max_history": self.max_history_spin.value()
+            "max_history": self.max_history_spin.value(),
+            "log_level": self.log_level_combo.currentText()
         }
@@ -9,16 +9,47 @@ import logging
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.item import Item, ItemType
+from models.item import Item
 from views.widgets.item_widget import ItemButton
 from views.widgets.search_bar import SearchBar
 from views.advanced_filters_window import AdvancedFiltersWindow
 from core.search_engine import SearchEngine
 from core.advanced_filter_engine import AdvancedFilterEngine
+from core.item_store import ItemStore, item_from_row
+from core.search_worker import SearchExecutor
+from core.metrics import metrics
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Items leídos de la BD por página y botones creados por tanda al hacer scroll
+PAGE_SIZE = 100
+
+# Distancia (px) al final del scroll a partir de la cual se carga la siguiente tanda
+SCROLL_LOAD_MARGIN = 200
+
+
+def item_matches(item: Item, query_lower: str) -> bool:
+    """
+    Check whether an item matches a global search query
+
+    Searches the label, content (if not sensitive), tags and description.
+
+    Args:
+        item: Item to check
+        query_lower: Lowercase query
+
+    Returns:
+        bool: True if the item matches
+    """
+    if query_lower in item.label.lower():
+        return True
+    if not item.is_sensitive and query_lower in item.content.lower():
+        return True
+    if any(query_lower in tag.lower() for tag in item.tags):
+        return True
+    return bool(item.description and query_lower in item.description.lower())
+
 
 class GlobalSearchPanel(QWidget):
     """Floating window for global search across all items"""
@@ -29,15 +60,35 @@ class GlobalSearchPanel(QWidget):
     # Signal emitted when window is closed
     window_closed = pyqtSignal()
 
+    # Tags of every item, emitted by the search worker when it reloads its snapshot
+    all_tags_loaded = pyqtSignal(object)
+
     def __init__(self, db_manager=None, config_manager=None, parent=None):
         super().__init__(parent)
         self.db_manager = db_manager
         self.config_manager = config_manager
         self.search_engine = SearchEngine()
-        self.filter_engine = AdvancedFilterEngine()  # Motor de filtrado avanzado
-        self.all_items = []  # Store all items before filtering
+        self.all_items = []  # Items loaded so far (keyset pages, newest first)
         self.current_filters = {}  # Filtros activos actuales
 
+        # Paginación: cursor de la siguiente página y items mostrados por tandas
+        self._next_cursor = None
+        self._all_loaded = True
+        self._shown_items = []
+        self._shown_count = 0
+
+        # Búsqueda en segundo plano: solo se aplican los resultados de la última generación
+        self.search_executor = SearchExecutor(parent=self)
+        self.search_executor.chunk_ready.connect(self.on_search_chunk)
+        self.search_executor.search_finished.connect(self.on_search_finished)
+        self._search_results = None  # Resultados acumulados de la búsqueda actual
+
+        # Estado del worker (solo se toca en su hilo): conexión de lectura propia y
+        # copia de todos los items, independiente de los Item que muestra la UI
+        self._reader = None
+        self._snapshot = None  # (data_version, rows por id, ItemStore privado)
+        self.all_tags_loaded.connect(self.on_all_tags_loaded)
+
         # Get panel width from config
         if config_manager:
             self.panel_width = config_manager.get_setting('panel_width', 500)
@@ -217,6 +268,7 @@ class GlobalSearchPanel(QWidget):
 
         # Scroll area for items
         scroll_area = QScrollArea()
+        self.scroll_area = scroll_area
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -251,57 +303,26 @@ class GlobalSearchPanel(QWidget):
         scroll_area.setWidget(self.items_container)
         main_layout.addWidget(scroll_area)
 
+        # Cargar más items al acercarse al final
+        scroll_area.verticalScrollBar().valueChanged.connect(self.on_scroll)
+
     def load_all_items(self):
-        """Load and display ALL items from ALL categories"""
+        """Show the global search window with the first page of items (the rest streams on scroll)"""
         if not self.db_manager:
             logger.error("No database manager available")
             return
 
-        logger.info("Loading all items for global search")
+        logger.info("Loading items for global search")
 
-        # Get all items from database
-        items_data = self.db_manager.get_all_items(include_inactive=False)
-
-        # Convert dict items to Item objects
         self.all_items = []
-        for item_dict in items_data:
-            try:
-                # Convert type string to ItemType enum (handle both uppercase and lowercase)
-                type_str = item_dict['type'].lower() if item_dict['type'] else 'text'
-                item_type = ItemType(type_str)
-
-                item = Item(
-                    item_id=str(item_dict['id']),
-                    label=item_dict['label'],
-                    content=item_dict['content'],
-                    item_type=item_type,
-                    icon=item_dict.get('icon'),
-                    is_sensitive=bool(item_dict.get('is_sensitive', False)),
-                    is_favorite=bool(item_dict.get('is_favorite', False)),
-                    tags=item_dict.get('tags', []),
-                    description=item_dict.get('description')
-                )
-
-                # Store category info for display
-                item.category_name = item_dict.get('category_name', '')
-                item.category_icon = item_dict.get('category_icon', '')
-                item.category_color = item_dict.get('category_color', '')
-
-                self.all_items.append(item)
-            except Exception as e:
-                logger.error(f"Error converting item {item_dict.get('id')}: {e}")
-                continue
-
-        logger.info(f"Loaded {len(self.all_items)} items from database")
-
-        # Update available tags in filters window
-        self.filters_window.update_available_tags(self.all_items)
-        logger.debug(f"Updated available tags from {len(self.all_items)} items")
+        self._next_cursor = None
+        self._all_loaded = False
+        self.load_next_page()
 
         # Clear search bar
         self.search_bar.clear_search()
 
-        # Display all items initially
+        # Display loaded items; more are fetched as the user scrolls
         self.display_items(self.all_items)
 
         # Show the window
@@ -309,21 +330,78 @@ class GlobalSearchPanel(QWidget):
         self.raise_()
         self.activateWindow()
 
+    def load_next_page(self) -> list:
+        """
+        Load the next keyset page of items from the database
+
+        Returns:
+            list: Newly loaded Item objects (also appended to all_items)
+        """
+        if self._all_loaded:
+            return []
+
+        items_data, self._next_cursor = self.db_manager.get_items_page(
+            after=self._next_cursor, limit=PAGE_SIZE, order_by='frecency'
+        )
+        self._all_loaded = self._next_cursor is None
+        new_items = self._add_loaded_items(items_data)
+        if self._all_loaded:
+            self._reconcile_tags()
+        return new_items
+
+    def _add_loaded_items(self, items_data) -> list:
+        """Convert item rows to Item objects and append them to all_items"""
+        new_items = self._shared_items(items_data)
+        self.all_items.extend(new_items)
+        logger.info(f"Loaded {len(new_items)} items from database ({len(self.all_items)} total)")
+
+        # Solo los tags de la página nueva: los checkboxes existentes (y marcados) se conservan
+        if new_items:
+            self.filters_window.add_available_tags(new_items)
+        return new_items
+
+    def _shared_items(self, items_data) -> list:
+        """Item objects for item rows, shared with the sidebar/config cache when available"""
+        if self.config_manager is not None:
+            return self.config_manager.item_store.upsert_rows(items_data)
+        return [item_from_row(item_dict) for item_dict in items_data]
+
+    def _reconcile_tags(self):
+        """Once everything is loaded, drop tags of earlier loads that no longer exist (checked state is kept)"""
+        self.filters_window.update_available_tags(self.all_items)
+
     def display_items(self, items):
-        """Display a list of items"""
+        """Display a list of items (buttons are created in pages as the user scrolls)"""
         logger.info(f"Displaying {len(items)} items")
 
         # Clear existing items
         self.clear_items()
 
-        # Add items
-        for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
+        self._shown_items = items
+        self._shown_count = 0
+        self.show_more_items()
+
+    @metrics.timed('panel.render_chunk')
+    def show_more_items(self):
+        """Add the next page of item buttons"""
+        # Showing the unfiltered list: fetch the next page from the database when needed
+        if self._shown_count >= len(self._shown_items) and self._shown_items is self.all_items:
+            self.load_next_page()
+
+        page = self._shown_items[self._shown_count:self._shown_count + PAGE_SIZE]
+        for item in page:
             item_button = ItemButton(item, show_category=True)  # show_category=True for global search
             item_button.item_clicked.connect(self.on_item_clicked)
             self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
 
-        logger.info(f"Successfully added {len(items)} item buttons to layout")
+        self._shown_count += len(page)
+        logger.debug(f"Showing {self._shown_count}/{len(self._shown_items)} item buttons")
+
+    def on_scroll(self, value: int):
+        """Load the next page when the scroll gets close to the end"""
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if value >= scroll_bar.maximum() - SCROLL_LOAD_MARGIN:
+            self.show_more_items()
 
     def clear_items(self):
         """Clear all item buttons"""
@@ -338,40 +416,103 @@ class GlobalSearchPanel(QWidget):
         self.item_clicked.emit(item)
 
     def on_search_changed(self, query: str):
-        """Handle search query change with filtering"""
-        # Aplicar filtros avanzados primero
-        filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
-
-        # Luego aplicar búsqueda si hay query
-        if query and query.strip():
-            # Search in labels, content, and tags
-            search_results = []
-            query_lower = query.lower()
-
-            for item in filtered_items:
-                # Search in label
-                if query_lower in item.label.lower():
-                    search_results.append(item)
-                    continue
-
-                # Search in content (if not sensitive)
-                if not item.is_sensitive and query_lower in item.content.lower():
-                    search_results.append(item)
-                    continue
+        """Handle search query change with filtering (loading, filtering and search run on the search worker)"""
+        has_query = bool(query and query.strip())
+        if not has_query and not self.current_filters:
+            self.search_executor.cancel()
+            self.display_items(self.all_items)
+            return
 
-                # Search in tags
-                if any(query_lower in tag.lower() for tag in item.tags):
-                    search_results.append(item)
-                    continue
+        # Sin orden explícito: frecuentes y recientes primero
+        filters = dict(self.current_filters)
+        rank = has_query and not filters.get('sort_by')
+        query_lower = query.strip().lower() if has_query else ''
+
+        def produce():
+            rows_by_id, store = self._load_snapshot()
+            # Filtros avanzados vectorizados sobre las columnas del store privado
+            candidates = AdvancedFilterEngine(item_store=store).apply_filters(store.items(), filters)
+            if rank:
+                candidates = self.search_engine.rank_by_frecency(candidates)
+            # None por cada no coincidencia: el worker puede cancelar en medio del recorrido
+            return (rows_by_id[item.id] if not query_lower or item_matches(item, query_lower) else None
+                    for item in candidates)
+
+        self._search_results = None
+        self.search_executor.submit(produce)
+
+    def _load_snapshot(self):
+        """
+        Worker thread: rows of every item and a private ItemStore built from them
+
+        The snapshot is read through the worker's own connection and reused
+        until PRAGMA data_version reports a commit from another connection.
+        The worker never touches the Item objects shown by the UI.
+
+        Returns:
+            Tuple: (rows by item id, ItemStore)
+        """
+        if self._reader is None:
+            from database.db_manager import DBManager
+            # Una BD en memoria no se puede abrir dos veces: se comparte la conexión
+            shared = str(self.db_manager.db_path) == ":memory:"
+            self._reader = self.db_manager if shared else DBManager(str(self.db_manager.db_path))
+
+        # En la conexión compartida los cambios propios no cambian data_version: se relee siempre
+        data_version = None
+        if self._reader is not self.db_manager:
+            data_version = self._reader.connect().execute("PRAGMA data_version").fetchone()[0]
+        if self._snapshot is not None and data_version is not None and self._snapshot[0] == data_version:
+            return self._snapshot[1], self._snapshot[2]
+
+        rows_by_id = {}
+        for items_data in self._reader.iter_items(batch_size=PAGE_SIZE * 5, order_by='frecency'):
+            for item_dict in items_data:
+                rows_by_id[str(item_dict['id'])] = item_dict
+        store = ItemStore()
+        store.upsert_rows(rows_by_id.values())
+        self._snapshot = (data_version, rows_by_id, store)
+
+        tags = set()
+        for item in store.items():
+            tags.update(item.tags)
+        self.all_tags_loaded.emit(tags)
+
+        logger.info(f"Search snapshot loaded: {len(rows_by_id)} items")
+        return rows_by_id, store
+
+    def on_all_tags_loaded(self, tags):
+        """Show the tags of every item, from the search worker's snapshot (UI thread)"""
+        self.filters_window.set_available_tags(tags)
+
+    def on_search_chunk(self, generation: int, chunk: list):
+        """Apply a chunk of search results (UI thread)"""
+        if not self.search_executor.is_current(generation):
+            return  # Resultado de una búsqueda superada
+
+        # Filas del worker -> Item compartidos (se crean solo en el hilo de UI)
+        chunk = self._shared_items(chunk)
+
+        if self._search_results is None:
+            # Primer chunk: reemplazar la lista mostrada
+            self._search_results = list(chunk)
+            self.display_items(self._search_results)
+            return
 
-                # Search in description
-                if item.description and query_lower in item.description.lower():
-                    search_results.append(item)
-                    continue
+        # Siguientes chunks: se añaden a la lista mostrada y se crean botones si falta la primera tanda
+        self._search_results.extend(chunk)
+        if self._shown_count < PAGE_SIZE:
+            self.show_more_items()
 
-            filtered_items = search_results
+    def on_search_finished(self, generation: int, total: int):
+        """Handle the end of a search (UI thread)"""
+        if not self.search_executor.is_current(generation):
+            return
 
-        self.display_items(filtered_items)
+        if self._search_results is None:
+            self._search_results = []
+            self.display_items(self._search_results)
+        logger.info(f"Search generation {generation} finished: {total} results")
 
     def on_filters_changed(self, filters: dict):
         """Handle cuando cambian los filtros avanzados"""
@@ -487,5 +628,13 @@ class GlobalSearchPanel(QWidget):
         if self.filters_window.isVisible():
             self.filters_window.close()
 
+        # Descartar la búsqueda en curso y cerrar la conexión del worker
+        self.search_executor.cancel()
+        self.search_executor.wait()
+        if self._reader is not None and self._reader is not self.db_manager:
+            self._reader.close()
+        self._reader = None
+        self._snapshot = None
+
         self.window_closed.emit()
         event.accept()
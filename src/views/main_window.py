@@ -1,33 +1,26 @@
 """
 Main Window View
 """
-from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QMessageBox
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QMessageBox
+from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal
 from PyQt6.QtGui import QScreen, QShortcut, QKeySequence
 import sys
 import logging
+import threading
 import traceback
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from views.sidebar import Sidebar
-from views.floating_panel import FloatingPanel
-from views.global_search_panel import GlobalSearchPanel
-from views.favorites_floating_panel import FavoritesFloatingPanel
-from views.stats_floating_panel import StatsFloatingPanel
-from views.settings_window import SettingsWindow
-from views.pinned_panels_window import PinnedPanelsWindow
-from views.dialogs.popular_items_dialog import PopularItemsDialog
-from views.dialogs.forgotten_items_dialog import ForgottenItemsDialog
-from views.dialogs.suggestions_dialog import FavoriteSuggestionsDialog
-from views.dialogs.stats_dashboard import StatsDashboard
-from views.dialogs.panel_config_dialog import PanelConfigDialog
-from views.category_filter_window import CategoryFilterWindow
 from models.item import Item
 from core.hotkey_manager import HotkeyManager
 from core.tray_manager import TrayManager
-from core.session_manager import SessionManager
-from core.notification_manager import NotificationManager
+from core.event_bus import event_bus, CategoryChanged, SettingChanged
+from utils.logger import set_log_level
+
+# Secondary windows, dialogs (StatsDashboard pulls in matplotlib) and the
+# notification/pinned-panel stacks are imported on first use so that the
+# sidebar can paint as soon as possible.
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -39,6 +32,7 @@ class MainWindow(QMainWindow):
     # Signals
     category_selected = pyqtSignal(str)  # category_id
     item_selected = pyqtSignal(object)  # Item
+    startup_data_loaded = pyqtSignal(object)  # Rows read off the UI thread for the snapshot reconcile
 
     def __init__(self, controller=None):
         super().__init__()
@@ -47,6 +41,8 @@ class MainWindow(QMainWindow):
         self.sidebar = None
         self.floating_panel = None  # Panel flotante activo (no anclado) - compatibility
         self.pinned_panels = []  # Lista de paneles anclados
+        self._pending_panel_shells = []  # (category, panel_data) restored panels not created yet
+        self._pending_panel_fills = []  # (panel, category, panel_data) restored panels waiting for items
         self.pinned_panels_window = None  # Ventana de gestión de paneles anclados
         self.global_search_panel = None  # Ventana flotante para búsqueda global
         self.favorites_panel = None  # Ventana flotante para favoritos
@@ -56,8 +52,9 @@ class MainWindow(QMainWindow):
         self.current_category_id = None  # Para el toggle
         self.hotkey_manager = None
         self.tray_manager = None
-        self.notification_manager = NotificationManager()
+        self.notification_manager = None  # Created after first paint
         self.is_visible = True
+        self._deferred_startup_done = False
 
         # Panel shortcuts management
         self.panel_shortcuts = {}  # Dict[panel_id, QShortcut] - Track keyboard shortcuts for panels
@@ -72,11 +69,57 @@ class MainWindow(QMainWindow):
         self.position_window()
         self.setup_hotkeys()
         self.setup_tray()
+
+        # Cambios publicados por la base de datos: solo se recarga lo afectado
+        self._category_reload_timer = QTimer(self)
+        self._category_reload_timer.setSingleShot(True)
+        self._category_reload_timer.setInterval(50)
+        self._category_reload_timer.timeout.connect(self._reload_categories)
+        self.startup_data_loaded.connect(self._on_startup_data_loaded, Qt.ConnectionType.QueuedConnection)
+        self._unsubscribe = [
+            event_bus.subscribe(CategoryChanged, self._on_category_changed),
+            event_bus.subscribe(SettingChanged, self._on_setting_changed),
+        ]
+
+        # Notifications, pinned panels and filter engine are initialized
+        # after the first paint (see showEvent / run_deferred_startup)
+
+    def showEvent(self, event):
+        """Schedule deferred startup work once the window is first shown"""
+        super().showEvent(event)
+
+        if not self._deferred_startup_done:
+            self._deferred_startup_done = True
+            # Zero-timeout runs after the pending paint events are processed
+            QTimer.singleShot(0, self.run_deferred_startup)
+
+    def run_deferred_startup(self):
+        """Initialize subsystems that are not needed for the first paint"""
+        logger.info("Running deferred startup tasks...")
+
+        # Replace categories painted from the startup snapshot with database data,
+        # read on a worker thread (decrypting every item would block the UI)
+        if self.controller:
+            threading.Thread(
+                target=lambda: self.startup_data_loaded.emit(self.controller.read_startup_data()),
+                name="startup-snapshot-reconcile", daemon=True
+            ).start()
+
         self.check_notifications_delayed()
 
         # AUTO-RESTORE: Restore pinned panels from database on startup
         self.restore_pinned_panels_on_startup()
 
+        # Category filter engine, so the first filter is instant
+        if self.controller:
+            self.controller.init_category_filter_engine()
+
+        logger.info("Deferred startup tasks completed")
+
+    def _on_startup_data_loaded(self, data):
+        """Apply the rows read by the startup worker (UI thread; None = nothing read)"""
+        self.controller.reconcile_startup_snapshot(data)
+
     def init_ui(self):
         """Initialize the user interface"""
         # Window properties
@@ -222,6 +265,7 @@ class MainWindow(QMainWindow):
 
                     # Create floating panel if it doesn't exist or current one is pinned
                     if not self.floating_panel:
+                        from views.floating_panel import FloatingPanel
                         self.floating_panel = FloatingPanel(
                             config_manager=self.config_manager,
                             list_controller=self.controller.list_controller if self.controller else None
@@ -369,6 +413,7 @@ class MainWindow(QMainWindow):
             # Create global search panel if it doesn't exist
             if not self.global_search_panel:
                 # Get db_manager from controller's config_manager
+                from views.global_search_panel import GlobalSearchPanel
                 db_manager = self.config_manager.db if self.config_manager else None
                 self.global_search_panel = GlobalSearchPanel(
                     db_manager=db_manager,
@@ -414,6 +459,7 @@ class MainWindow(QMainWindow):
 
             # Crear panel si no existe
             if not self.favorites_panel:
+                from views.favorites_floating_panel import FavoritesFloatingPanel
                 self.favorites_panel = FavoritesFloatingPanel()
                 self.favorites_panel.favorite_executed.connect(self.on_favorite_executed)
                 self.favorites_panel.window_closed.connect(self.on_favorites_panel_closed)
@@ -470,6 +516,7 @@ class MainWindow(QMainWindow):
 
             # Crear panel si no existe
             if not self.stats_panel:
+                from views.stats_floating_panel import StatsFloatingPanel
                 self.stats_panel = StatsFloatingPanel()
                 self.stats_panel.window_closed.connect(self.on_stats_panel_closed)
                 logger.debug("Stats panel created")
@@ -549,6 +596,7 @@ class MainWindow(QMainWindow):
 
             # Crear ventana si no existe
             if not self.category_filter_window:
+                from views.category_filter_window import CategoryFilterWindow
                 self.category_filter_window = CategoryFilterWindow(self)
                 self.category_filter_window.filters_changed.connect(self.on_category_filters_changed)
                 self.category_filter_window.filters_cleared.connect(self.on_category_filters_cleared)
@@ -751,6 +799,7 @@ class MainWindow(QMainWindow):
     def open_settings(self):
         """Open settings window"""
         print("Opening settings window...")
+        from views.settings_window import SettingsWindow
         settings_window = SettingsWindow(controller=self.controller, parent=self)
         settings_window.settings_changed.connect(self.on_settings_changed)
 
@@ -763,19 +812,29 @@ class MainWindow(QMainWindow):
 
     def on_settings_changed(self):
         """Handle settings changes"""
-        print("Settings changed - reloading...")
+        # Categories and opacity are already updated through the event bus;
+        # a category reload still pending is done now, before the dialog closes
+        if self._category_reload_timer.isActive():
+            self._category_reload_timer.stop()
+            self._reload_categories()
 
-        # Reload categories in sidebar
-        if self.controller:
-            categories = self.controller.get_categories()
-            self.sidebar.load_categories(categories)
+        print("Settings applied")
 
-        # Apply appearance settings (opacity, etc.)
-        if self.config_manager:
-            opacity = self.config_manager.get_setting("opacity", 0.95)
-            self.setWindowOpacity(opacity)
+    def _on_category_changed(self, event: CategoryChanged):
+        """A category was added, edited, deleted or reordered: reload the sidebar (debounced)"""
+        self._category_reload_timer.start()
 
-        print("Settings applied")
+    def _reload_categories(self):
+        """Reload the sidebar categories from the database"""
+        if self.controller:
+            self.controller.refresh_categories()
+
+    def _on_setting_changed(self, event: SettingChanged):
+        """Apply appearance and logging settings as soon as they are saved"""
+        if event.key == "opacity" and event.value is not None:
+            self.setWindowOpacity(float(event.value))
+        elif event.key == "log_level" and event.value:
+            set_log_level(event.value)
 
     def logout_session(self):
         """Logout current session"""
@@ -792,6 +851,7 @@ class MainWindow(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             # Invalidate session
+            from core.session_manager import SessionManager
             session_manager = SessionManager()
             session_manager.invalidate_session()
             logger.info("Session invalidated")
@@ -822,17 +882,19 @@ class MainWindow(QMainWindow):
         self.close()
 
         # Exit application
-        from PyQt6.QtWidgets import QApplication
         QApplication.quit()
 
     def check_notifications_delayed(self):
         """Verificar notificaciones 10 segundos después de abrir"""
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(10000, self.check_notifications)  # 10 segundos
 
     def check_notifications(self):
         """Verificar y mostrar notificaciones pendientes"""
         try:
+            if self.notification_manager is None:
+                from core.notification_manager import NotificationManager
+                self.notification_manager = NotificationManager()
+
             notifications = self.notification_manager.get_pending_notifications()
 
             if not notifications:
@@ -912,6 +974,7 @@ class MainWindow(QMainWindow):
     def show_popular_items(self):
         """Mostrar diálogo de items populares"""
         try:
+            from views.dialogs.popular_items_dialog import PopularItemsDialog
             dialog = PopularItemsDialog(self)
             dialog.item_selected.connect(self.on_popular_item_selected)
             dialog.exec()
@@ -922,6 +985,7 @@ class MainWindow(QMainWindow):
     def show_forgotten_items(self):
         """Mostrar diálogo de items olvidados"""
         try:
+            from views.dialogs.forgotten_items_dialog import ForgottenItemsDialog
             dialog = ForgottenItemsDialog(self)
             if dialog.exec():
                 # Recargar categorías si se eliminaron items
@@ -935,6 +999,7 @@ class MainWindow(QMainWindow):
     def show_stats_dashboard(self):
         """Mostrar dashboard completo de estadísticas"""
         try:
+            from views.dialogs.stats_dashboard import StatsDashboard
             dialog = StatsDashboard(self)
             dialog.exec()
         except Exception as e:
@@ -944,6 +1009,7 @@ class MainWindow(QMainWindow):
     def show_favorite_suggestions(self):
         """Mostrar diálogo de sugerencias de favoritos"""
         try:
+            from views.dialogs.suggestions_dialog import FavoriteSuggestionsDialog
             dialog = FavoriteSuggestionsDialog(self)
             if dialog.exec():
                 # Refrescar panel de favoritos si existe
@@ -976,6 +1042,7 @@ class MainWindow(QMainWindow):
                 current_shortcut = panel_data.get('keyboard_shortcut', '')
 
         # Open config dialog
+        from views.dialogs.panel_config_dialog import PanelConfigDialog
         dialog = PanelConfigDialog(
             current_name=current_name,
             current_color=current_color,
@@ -1137,6 +1204,7 @@ class MainWindow(QMainWindow):
 
         # Create window if doesn't exist
         if not self.pinned_panels_window:
+            from views.pinned_panels_window import PinnedPanelsWindow
             self.pinned_panels_window = PinnedPanelsWindow(
                 panels_manager=self.controller.pinned_panels_manager,
                 parent=self
@@ -1154,7 +1222,14 @@ class MainWindow(QMainWindow):
         logger.info("Pinned panels window opened")
 
     def restore_pinned_panels_on_startup(self):
-        """AUTO-RESTORE: Restore active pinned panels from database on application startup"""
+        """AUTO-RESTORE: Restore active pinned panels from database on application startup
+
+        All categories are fetched with one bulk query. Panels are then
+        created as empty shells with their saved geometry, one per event-loop
+        turn, and filled afterwards one panel at a time with incrementally
+        created item buttons (visible panels first), so input is never
+        blocked for long.
+        """
         if not self.controller:
             logger.warning("No controller available - skipping panel restoration")
             return
@@ -1169,85 +1244,156 @@ class MainWindow(QMainWindow):
 
             logger.info(f"Restoring {len(active_panels)} active panels from database...")
 
-            # Restore each panel
+            # Get all needed categories at once
+            categories = self.controller.get_categories_by_ids(
+                [panel_data['category_id'] for panel_data in active_panels]
+            )
+
             for panel_data in active_panels:
-                try:
-                    panel_id = panel_data['id']
-                    category_id = panel_data['category_id']
-
-                    # Get category
-                    category = self.controller.get_category(str(category_id))
-                    if not category:
-                        logger.warning(f"Category {category_id} not found for panel {panel_id} - skipping")
-                        continue
-
-                    # Create new floating panel with saved configuration
-                    restored_panel = FloatingPanel(
-                        config_manager=self.config_manager,
-                        list_controller=self.controller.list_controller if self.controller else None,
-                        panel_id=panel_id,
-                        custom_name=panel_data.get('custom_name'),
-                        custom_color=panel_data.get('custom_color')
-                    )
+                category = categories.get(str(panel_data['category_id']))
+                if not category:
+                    logger.warning(f"Category {panel_data['category_id']} not found for panel {panel_data['id']} - skipping")
+                    continue
+                self._pending_panel_shells.append((category, panel_data))
 
-                    # Connect signals
-                    restored_panel.item_clicked.connect(self.on_item_clicked)
-                    restored_panel.window_closed.connect(self.on_floating_panel_closed)
-                    restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
-                    restored_panel.customization_requested.connect(self.on_panel_customization_requested)
+            # Visible panels first, minimized/off-screen ones last
+            self._pending_panel_shells.sort(key=lambda entry: not self._is_panel_data_on_screen(entry[1]))
 
-                    # Load category
-                    restored_panel.load_category(category)
+            QTimer.singleShot(0, self._create_next_panel_shell)
 
-                    # Restore position and size
-                    restored_panel.move(panel_data['x_position'], panel_data['y_position'])
-                    restored_panel.resize(panel_data['width'], panel_data['height'])
+        except Exception as e:
+            logger.error(f"Error during panel restoration on startup: {e}", exc_info=True)
 
-                    # Apply custom styling
-                    restored_panel.apply_custom_styling()
+    def _create_restored_panel_shell(self, panel_data: dict, category):
+        """
+        Create a pinned panel with its saved geometry and styling, without items
 
-                    # Set as pinned
-                    restored_panel.is_pinned = True
-                    restored_panel.pin_button.setText("📍")
-                    restored_panel.minimize_button.setVisible(True)
-                    restored_panel.config_button.setVisible(True)
+        Args:
+            panel_data: Panel row from the database
+            category: Category that will be loaded into the panel
 
-                    # Restore minimized state if needed
-                    if panel_data.get('is_minimized'):
-                        restored_panel.toggle_minimize()
+        Returns:
+            FloatingPanel: The shown (empty) panel
+        """
+        from views.floating_panel import FloatingPanel
 
-                    # Restore filter configuration if available
-                    if panel_data.get('filter_config'):
-                        filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
-                            panel_data['filter_config']
-                        )
-                        if filter_config:
-                            restored_panel.apply_filter_config(filter_config)
-                            logger.debug(f"Applied saved filters to panel {panel_id}")
+        panel_id = panel_data['id']
+
+        # Create new floating panel with saved configuration
+        restored_panel = FloatingPanel(
+            config_manager=self.config_manager,
+            list_controller=self.controller.list_controller if self.controller else None,
+            panel_id=panel_id,
+            custom_name=panel_data.get('custom_name'),
+            custom_color=panel_data.get('custom_color')
+        )
+
+        # Connect signals
+        restored_panel.item_clicked.connect(self.on_item_clicked)
+        restored_panel.window_closed.connect(self.on_floating_panel_closed)
+        restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
+        restored_panel.customization_requested.connect(self.on_panel_customization_requested)
 
-                    # Add to pinned panels list
-                    self.pinned_panels.append(restored_panel)
+        # Header shows the category until its items are loaded
+        restored_panel.header_label.setText(category.name)
 
-                    # Update last_opened in database
-                    self.controller.pinned_panels_manager.mark_panel_opened(panel_id)
+        # Restore position and size
+        restored_panel.move(panel_data['x_position'], panel_data['y_position'])
+        restored_panel.resize(panel_data['width'], panel_data['height'])
 
-                    # Register keyboard shortcut if one is assigned
-                    if panel_data.get('keyboard_shortcut'):
-                        self.register_panel_shortcut(restored_panel, panel_data['keyboard_shortcut'])
+        # Apply custom styling
+        restored_panel.apply_custom_styling()
 
-                    # Show panel
-                    restored_panel.show()
+        # Set as pinned
+        restored_panel.is_pinned = True
+        restored_panel.pin_button.setText("📍")
+        restored_panel.minimize_button.setVisible(True)
+        restored_panel.config_button.setVisible(True)
 
-                    logger.info(f"Panel {panel_id} (Category: {category.name}) restored successfully")
+        # Restore minimized state if needed
+        if panel_data.get('is_minimized'):
+            restored_panel.toggle_minimize()
 
-                except Exception as e:
-                    logger.error(f"Error restoring panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
-                    continue
+        # Add to pinned panels list
+        self.pinned_panels.append(restored_panel)
 
-            logger.info(f"Panel restoration complete: {len(self.pinned_panels)}/{len(active_panels)} panels restored")
+        # Update last_opened in database
+        self.controller.pinned_panels_manager.mark_panel_opened(panel_id)
 
-        except Exception as e:
-            logger.error(f"Error during panel restoration on startup: {e}", exc_info=True)
+        # Register keyboard shortcut if one is assigned
+        if panel_data.get('keyboard_shortcut'):
+            self.register_panel_shortcut(restored_panel, panel_data['keyboard_shortcut'])
+
+        # Show panel
+        restored_panel.show()
+
+        return restored_panel
+
+    def _is_panel_data_on_screen(self, panel_data: dict) -> bool:
+        """Check if a saved panel is expanded and its center lies on a screen"""
+        if panel_data.get('is_minimized'):
+            return False
+        center = QPoint(
+            panel_data['x_position'] + panel_data['width'] // 2,
+            panel_data['y_position'] + panel_data['height'] // 2
+        )
+        return QApplication.screenAt(center) is not None
+
+    def _create_next_panel_shell(self):
+        """Create the next restored panel shell, one per event-loop turn"""
+        if self._pending_panel_shells:
+            category, panel_data = self._pending_panel_shells.pop(0)
+            try:
+                restored_panel = self._create_restored_panel_shell(panel_data, category)
+                self._pending_panel_fills.append((restored_panel, category, panel_data))
+            except Exception as e:
+                logger.error(f"Error restoring panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
+
+        if self._pending_panel_shells:
+            QTimer.singleShot(0, self._create_next_panel_shell)
+        else:
+            logger.info(f"Created {len(self._pending_panel_fills)} panel shells - filling contents")
+            QTimer.singleShot(0, self._fill_next_restored_panel)
+
+    def _fill_next_restored_panel(self):
+        """Load items of the next restored panel
+
+        Item buttons are created incrementally; the next panel starts when
+        this one finishes (see _on_restored_panel_filled).
+        """
+        while self._pending_panel_fills:
+            restored_panel, category, panel_data = self._pending_panel_fills.pop(0)
+
+            # Skip panels closed or unpinned before their turn
+            if restored_panel not in self.pinned_panels:
+                continue
+
+            try:
+                restored_panel.incremental_display_finished.connect(self._on_restored_panel_filled)
+                restored_panel.load_category(category, incremental=True)
+
+                # Restore filter configuration if available
+                if panel_data.get('filter_config'):
+                    filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
+                        panel_data['filter_config']
+                    )
+                    if filter_config:
+                        restored_panel.apply_filter_config(filter_config)
+                        logger.debug(f"Applied saved filters to panel {panel_data['id']}")
+
+                logger.info(f"Panel {panel_data['id']} (Category: {category.name}) restored successfully")
+                return
+
+            except Exception as e:
+                logger.error(f"Error filling restored panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
+
+        logger.info(f"Panel restoration complete: {len(self.pinned_panels)} pinned panels")
+
+    def _on_restored_panel_filled(self):
+        """A restored panel finished (or cancelled) its incremental load"""
+        restored_panel = self.sender()
+        restored_panel.incremental_display_finished.disconnect(self._on_restored_panel_filled)
+        QTimer.singleShot(0, self._fill_next_restored_panel)
 
     def on_restore_panel_requested(self, panel_id: int):
         """Handle request to restore/open a saved panel"""
@@ -1280,6 +1426,7 @@ class MainWindow(QMainWindow):
             return
 
         # Create new floating panel with saved configuration
+        from views.floating_panel import FloatingPanel
         restored_panel = FloatingPanel(
             config_manager=self.config_manager,
             list_controller=self.controller.list_controller if self.controller else None,
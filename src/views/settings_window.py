@@ -277,20 +277,23 @@ class SettingsWindow(QDialog):
 
             # Update config
             logger.info("Updating config settings...")
-            self.config_manager.set_setting("theme", appearance_settings["theme"])
-            self.config_manager.set_setting("opacity", appearance_settings["opacity"])
-            self.config_manager.set_setting("sidebar_width", appearance_settings["sidebar_width"])
-            self.config_manager.set_setting("panel_width", appearance_settings["panel_width"])
-            self.config_manager.set_setting("animation_speed", appearance_settings["animation_speed"])
-            logger.debug("Appearance settings saved")
-
-            self.config_manager.set_setting("hotkey", hotkey_settings["hotkey"])
-            logger.debug("Hotkey settings saved")
-
-            self.config_manager.set_setting("minimize_to_tray", general_settings["minimize_to_tray"])
-            self.config_manager.set_setting("always_on_top", general_settings["always_on_top"])
-            self.config_manager.set_setting("start_with_windows", general_settings["start_with_windows"])
-            self.config_manager.set_setting("max_history", general_settings["max_history"])
+            self.config_manager.set_settings({
+                "theme": appearance_settings["theme"],
+                "opacity": appearance_settings["opacity"],
+                "sidebar_width": appearance_settings["sidebar_width"],
+                "panel_width": appearance_settings["panel_width"],
+                "animation_speed": appearance_settings["animation_speed"],
+                "hotkey": hotkey_settings["hotkey"],
+                "minimize_to_tray": general_settings["minimize_to_tray"],
+                "always_on_top": general_settings["always_on_top"],
+                "start_with_windows": general_settings["start_with_windows"],
+                "max_history": general_settings["max_history"],
+                "log_level": general_settings["log_level"],
+            })
+            logger.debug("Appearance, hotkey and general settings saved")
+
+            if self.controller:
+                self.controller.clipboard_manager.set_max_history(general_settings["max_history"])
             logger.debug("General settings saved")
 
             # Save categories
@@ -299,9 +302,8 @@ class SettingsWindow(QDialog):
             logger.info(f"Got {len(categories)} categories from editor")
 
             if self.controller:
-                # Update controller's categories
-                logger.debug("Updating controller categories...")
-                self.controller.categories = categories
+                # The editor holds copies; the controller keeps the shared
+                # items, refreshed by update_category and the event bus reload
 
                 # Get existing categories from database to avoid duplicates
                 existing_categories = self.config_manager.get_categories()
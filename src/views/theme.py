@@ -0,0 +1,347 @@
+"""
+Theme
+Application-wide stylesheet for the widgets created in bulk (ItemButton,
+ListWidget, ListStepPreview). The stylesheet is compiled once per theme and
+set on the QApplication, so creating a widget doesn't parse any stylesheet.
+Widgets pick their rules through type selectors and dynamic properties
+(e.g. ItemButton[state="copied"]), and switch visual states with
+set_state(), which only re-polishes the widget instead of installing a new
+stylesheet string.
+"""
+import logging
+from functools import lru_cache
+from string import Template
+from typing import Optional
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THEME = 'dark'
+
+# Propiedad dinámica usada para los estados visuales (copied, running, success, error)
+STATE_PROPERTY = 'state'
+
+# QApplication property holding the name of the applied theme
+_APPLIED_PROPERTY = 'widgetSidebarTheme'
+
+THEMES = {
+    'dark': {
+        'colors': {
+            'surface': '#2d2d2d',
+            'surface_hover': '#3d3d3d',
+            'separator': '#1e1e1e',
+            'text': '#cccccc',
+            'text_strong': '#ffffff',
+            'accent': '#007acc',
+            'accent_dark': '#005a9e',
+            'warning': '#cc7a00',
+            'warning_dark': '#9e5e00',
+            'sensitive': '#3d2020',
+            'sensitive_hover': '#4d2525',
+            'sensitive_border': '#cc0000',
+            'badge': '#3d3d3d',
+            'badge_text': '#f093fb',
+            'list_surface': '#2b2b2b',
+            'step_surface': '#252525',
+            'list_border': '#3a3a3a',
+            'list_button_border': '#4a4a4a',
+            'list_button_hover': '#4a4a4a',
+            'list_button_hover_border': '#5a5a5a',
+            'list_button_pressed': '#2a2a2a',
+            'list_text': '#e0e0e0',
+            'list_muted': '#aaaaaa',
+            'list_meta': '#888888',
+            'step_number': '#4a9eff',
+            'code_surface': '#1a1a1a',
+            'danger_surface': '#3a2a2a',
+            'danger_border': '#5a3a3a',
+            'danger_hover_border': '#7a4a4a',
+            'danger_text': '#ff6666',
+        },
+        # ItemButton action buttons: action -> (normal, hover, pressed)
+        'actions': {
+            'execute': ('#cc7a00', '#ff9900', '#9e5e00'),
+            'url': ('#007acc', '#005a9e', '#004578'),
+            'explorer': ('#2d7d2d', '#236123', '#1a4a1a'),
+            'file': ('#cc7a00', '#9e5e00', '#784500'),
+            'reveal': ('#cc0000', '#9e0000', '#780000'),
+        },
+        # Estados temporales de los botones de acción: state -> (fondo, texto)
+        'button_states': {
+            'running': ('#ffff00', '#000000'),
+            'success': ('#00ff00', '#000000'),
+            'error': ('#ff0000', '#ffffff'),
+        },
+    },
+}
+
+_BASE_TEMPLATE = Template("""
+ItemButton {
+    background-color: $surface;
+    border: none;
+    border-bottom: 1px solid $separator;
+}
+ItemButton:hover {
+    background-color: $surface_hover;
+}
+ItemButton[sensitive="true"] {
+    background-color: $sensitive;
+    border-left: 3px solid $sensitive_border;
+}
+ItemButton[sensitive="true"]:hover {
+    background-color: $sensitive_hover;
+}
+ItemButton[state="copied"], ItemButton[state="copied"]:hover {
+    background-color: $accent;
+    border-bottom: 1px solid $accent_dark;
+}
+ItemButton[state="copied"][sensitive="true"], ItemButton[state="copied"][sensitive="true"]:hover {
+    background-color: $warning;
+    border-left: none;
+    border-bottom: 1px solid $warning_dark;
+}
+ItemButton QLabel {
+    color: $text;
+    background-color: transparent;
+    border: none;
+}
+ItemButton[state="copied"] QLabel {
+    color: $text_strong;
+    font-weight: bold;
+}
+ItemButton QLabel[role="category"] {
+    background-color: $badge;
+    color: $badge_text;
+    border-radius: 3px;
+    padding: 2px 8px;
+    font-size: 8pt;
+    font-weight: bold;
+}
+ItemButton QLabel[role="badge"] {
+    background-color: transparent;
+    color: $text;
+    font-size: 14pt;
+    padding: 0px;
+}
+ItemButton QLabel[role="tag"] {
+    background-color: $accent;
+    color: $text_strong;
+    border-radius: 3px;
+    padding: 2px 8px;
+    font-size: 8pt;
+}
+ItemButton QPushButton[action="favorite"] {
+    background-color: transparent;
+    border: none;
+    font-size: 16pt;
+}
+ItemButton QPushButton[action="favorite"]:hover {
+    background-color: #3e3e42;
+    border-radius: 3px;
+}
+
+ListWidget {
+    background-color: $list_surface;
+    border: 1px solid $list_border;
+    border-radius: 6px;
+}
+ListWidget QPushButton {
+    background-color: $list_border;
+    border: 1px solid $list_button_border;
+    border-radius: 4px;
+    padding: 6px 10px;
+    color: $list_text;
+    font-size: 10px;
+}
+ListWidget QPushButton:hover {
+    background-color: $list_button_hover;
+    border: 1px solid $list_button_hover_border;
+}
+ListWidget QPushButton:pressed {
+    background-color: $list_button_pressed;
+}
+ListWidget QPushButton#deleteButton {
+    background-color: $danger_surface;
+    border: 1px solid $danger_border;
+    color: $danger_text;
+}
+ListWidget QPushButton#deleteButton:hover {
+    background-color: $danger_border;
+    border: 1px solid $danger_hover_border;
+}
+ListWidget QPushButton#listToggleButton {
+    background-color: transparent;
+    border: none;
+    color: $list_muted;
+    font-size: 12px;
+    padding: 0px;
+}
+ListWidget QPushButton#listToggleButton:hover {
+    color: $list_text;
+}
+ListWidget QScrollArea {
+    border: none;
+    background-color: transparent;
+}
+ListWidget QLabel[role="listTitle"] {
+    color: $list_text;
+}
+ListWidget QLabel[role="listMeta"] {
+    color: $list_meta;
+    font-size: 10px;
+}
+ListWidget QFrame[role="separator"] {
+    background-color: $list_border;
+}
+
+ListStepPreview {
+    background-color: $step_surface;
+    border: 1px solid $list_border;
+    border-radius: 4px;
+}
+ListStepPreview QPushButton {
+    background-color: $list_border;
+    border: 1px solid $list_button_border;
+    border-radius: 3px;
+    color: $list_text;
+    font-size: 10px;
+}
+ListStepPreview QPushButton:hover {
+    background-color: $list_button_hover;
+    border: 1px solid $list_button_hover_border;
+}
+ListStepPreview QPushButton:pressed {
+    background-color: $list_button_pressed;
+}
+ListStepPreview QLabel[role="stepNumber"] {
+    color: $step_number;
+}
+ListStepPreview QLabel[role="stepLabel"] {
+    color: $list_text;
+    font-weight: bold;
+}
+ListStepPreview QLabel[role="stepType"] {
+    background-color: $list_border;
+    color: $list_muted;
+    border-radius: 3px;
+    padding: 2px 6px;
+    font-size: 9px;
+    font-weight: bold;
+}
+ListStepPreview QLabel[role="stepContent"] {
+    color: $list_muted;
+    font-size: 9px;
+    font-family: 'Consolas', 'Courier New', monospace;
+    padding: 4px;
+    background-color: $code_surface;
+    border-radius: 3px;
+}
+""")
+
+
+def _action_rules(actions: dict, button_states: dict) -> str:
+    """Rules of the ItemButton action buttons and their temporary states"""
+    rules = []
+    for action, (normal, hover, pressed) in actions.items():
+        selector = f'ItemButton QPushButton[action="{action}"]'
+        rules.append(f"""
+{selector} {{
+    background-color: {normal};
+    color: #ffffff;
+    border: none;
+    border-radius: 4px;
+    font-size: 16pt;
+}}
+{selector}:hover {{
+    background-color: {hover};
+}}
+{selector}:pressed {{
+    background-color: {pressed};
+}}""")
+        # Los estados van después y con más especificidad: ganan al hover/pressed
+        for state, (background, color) in button_states.items():
+            state_selector = f'{selector}[{STATE_PROPERTY}="{state}"]'
+            rules.append(f"""
+{state_selector}, {state_selector}:hover, {state_selector}:pressed {{
+    background-color: {background};
+    color: {color};
+}}""")
+    return ''.join(rules)
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet(theme: str = DEFAULT_THEME) -> str:
+    """
+    Compile the application stylesheet of a theme (memoized)
+
+    Args:
+        theme: Theme name (key of THEMES)
+
+    Returns:
+        str: Stylesheet text
+
+    Raises:
+        KeyError: If the theme doesn't exist
+    """
+    definition = THEMES[theme]
+    return _BASE_TEMPLATE.substitute(definition['colors']) + \
+        _action_rules(definition['actions'], definition['button_states'])
+
+
+def apply_theme(app: Optional[QApplication] = None, theme: str = DEFAULT_THEME) -> bool:
+    """
+    Install the compiled theme on the application (no-op if already installed)
+
+    Widgets call this on creation, so the theme is available even when the
+    application didn't install it explicitly (e.g. dialogs opened in tests).
+
+    Args:
+        app: Application (default: QApplication.instance())
+        theme: Theme name
+
+    Returns:
+        bool: True if the stylesheet was installed by this call
+    """
+    app = app or QApplication.instance()
+    if app is None or app.property(_APPLIED_PROPERTY) == theme:
+        return False
+
+    app.setStyleSheet(compile_stylesheet(theme))
+    app.setProperty(_APPLIED_PROPERTY, theme)
+    logger.info(f"Theme '{theme}' applied")
+    return True
+
+
+def repolish(widget: QWidget, children: bool = False) -> None:
+    """
+    Re-apply the stylesheet rules of a widget after a dynamic property change
+
+    Args:
+        widget: Widget whose properties changed
+        children: Also re-polish its descendant widgets (needed when rules
+            like 'Parent[state="x"] QLabel' style the children)
+    """
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    if children:
+        for child in widget.findChildren(QWidget):
+            style.unpolish(child)
+            style.polish(child)
+    widget.update()
+
+
+def set_state(widget: QWidget, state: str = '', children: bool = False) -> None:
+    """
+    Switch the visual state of a themed widget
+
+    Args:
+        widget: Widget
+        state: State name ('' = normal)
+        children: Re-polish descendants too (see repolish())
+    """
+    if widget.property(STATE_PROPERTY) == state:
+        return
+    widget.setProperty(STATE_PROPERTY, state)
+    repolish(widget, children)
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QDate, QTimer
 from PyQt6.QtGui import QFont, QCursor
 import sys
+import bisect
 import json
 import hashlib
 import logging
@@ -518,6 +519,7 @@ class AdvancedFilterPanel(QWidget):
         self.sort_by_combo = QComboBox()
         self.sort_by_combo.addItems([
             "-",
+            "Frecuentes y recientes",
             "Más usados",
             "Menos usados",
             "Usados recientemente",
@@ -1041,46 +1043,74 @@ class AdvancedFilterPanel(QWidget):
         """
         Actualizar la lista de tags disponibles desde los items actuales
 
+        Los checkboxes de los tags que siguen existiendo se conservan, con su
+        estado marcado; solo se quitan los que ya no aparecen y se añaden los nuevos.
+
         Args:
             items: Lista de items de la categoría actual
         """
-        # Obtener todos los tags únicos de los items
-        all_tags = set()
-        for item in items:
-            if hasattr(item, 'tags') and item.tags:
-                all_tags.update(item.tags)
+        self.set_available_tags(self._collect_tags(items))
 
-        # Convertir a lista ordenada
-        self.available_tags = sorted(list(all_tags))
+    def set_available_tags(self, tags):
+        """
+        Reemplazar los tags disponibles por un conjunto de tags ya calculado
 
-        # Limpiar checkboxes anteriores
-        while self.tags_container_layout.count() > 1:  # Mantener el stretch al final
-            item = self.tags_container_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        Igual que update_available_tags (los checkboxes existentes conservan
+        su estado), para cuando los tags vienen de fuera de la lista de items.
 
-        self.tag_checkboxes.clear()
+        Args:
+            tags: Todos los tags disponibles
+        """
+        all_tags = set(tags)
 
-        # Si no hay tags, mostrar mensaje informativo
-        if not self.available_tags:
-            self.tags_info_label.setVisible(True)
-            self.tags_scroll_area.setVisible(False)
-            return
+        # Quitar los tags que ya no existen
+        for tag in set(self.tag_checkboxes) - all_tags:
+            checkbox = self.tag_checkboxes.pop(tag)
+            self.tags_container_layout.removeWidget(checkbox)
+            checkbox.deleteLater()
+
+        self._add_tag_checkboxes(all_tags)
+
+    def add_available_tags(self, items):
+        """
+        Añadir los tags de items recién cargados (carga por páginas)
 
-        # Ocultar mensaje informativo y mostrar scroll area
-        self.tags_info_label.setVisible(False)
-        self.tags_scroll_area.setVisible(True)
+        Solo crea checkboxes para los tags nuevos: los existentes y su estado
+        marcado no se tocan, así el coste depende de la página y no del total.
 
-        # Crear checkbox para cada tag
-        for tag in self.available_tags:
+        Args:
+            items: Items recién cargados
+        """
+        self._add_tag_checkboxes(self._collect_tags(items))
+
+    @staticmethod
+    def _collect_tags(items) -> set:
+        """Tags únicos de una lista de items"""
+        tags = set()
+        for item in items:
+            if getattr(item, 'tags', None):
+                tags.update(item.tags)
+        return tags
+
+    def _add_tag_checkboxes(self, tags: set):
+        """Crear checkboxes para los tags que aún no tienen, en orden alfabético"""
+        present = sorted(self.tag_checkboxes)
+        for tag in sorted(tags - self.tag_checkboxes.keys()):
             checkbox = QCheckBox(f"🏷️ {tag}")
             checkbox.setStyleSheet(self.get_checkbox_style())
             checkbox.stateChanged.connect(self.on_filter_changed)
             self.tag_checkboxes[tag] = checkbox
-            self.tags_container_layout.insertWidget(
-                self.tags_container_layout.count() - 1,
-                checkbox
-            )
+
+            # El layout sigue el orden de present (el stretch queda al final)
+            index = bisect.bisect_left(present, tag)
+            present.insert(index, tag)
+            self.tags_container_layout.insertWidget(index, checkbox)
+
+        self.available_tags = present
+
+        # Sin tags: mostrar mensaje informativo en lugar de la lista
+        self.tags_info_label.setVisible(not present)
+        self.tags_scroll_area.setVisible(bool(present))
 
     def get_checkbox_style(self):
         """Obtener estilo común para checkboxes"""
@@ -1327,6 +1357,7 @@ class AdvancedFilterPanel(QWidget):
         if sort_text != "-":
             # Mapear texto a sort_by del engine
             sort_map = {
+                "Frecuentes y recientes": "frecency",
                 "Más usados": "use_count_desc",
                 "Menos usados": "use_count_asc",
                 "Usados recientemente": "recent",
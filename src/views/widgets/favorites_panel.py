@@ -32,6 +32,7 @@ class FavoritesPanel(QWidget):
         super().__init__(parent)
         self.favorites_manager = FavoritesManager()
         self.usage_tracker = UsageTracker()
+        self.sort_mode = "manual"  # 'manual' (drag & drop) o 'frecency' (automático)
         self.init_ui()
         self.load_favorites()
 
@@ -165,7 +166,7 @@ class FavoritesPanel(QWidget):
             self.favorites_list.clear()
 
             # Obtener favoritos
-            favorites = self.favorites_manager.get_all_favorites()
+            favorites = self.favorites_manager.get_all_favorites(order_by=self.sort_mode)
 
             # Actualizar contador en título
             self.title_label.setText(f"⭐ FAVORITOS ({len(favorites)})")
@@ -244,8 +245,9 @@ class FavoritesPanel(QWidget):
                 if item_id:
                     item_ids.append(item_id)
 
-            # Actualizar orden en BD
+            # Actualizar orden en BD (arrastrar vuelve al orden manual)
             if item_ids:
+                self.sort_mode = "manual"
                 self.favorites_manager.reorder_favorites(item_ids)
                 logger.info(f"Favorites reordered: {item_ids}")
                 self.favorites_reordered.emit()
@@ -285,6 +287,11 @@ class FavoritesPanel(QWidget):
         # Auto-ordenar
         sort_menu = menu.addMenu("🔢 Auto-ordenar")
 
+        sort_by_frecency = sort_menu.addAction("Frecuentes y Recientes (automático)")
+        sort_by_frecency.setCheckable(True)
+        sort_by_frecency.setChecked(self.sort_mode == "frecency")
+        sort_by_frecency.triggered.connect(self.toggle_frecency_sort)
+
         sort_by_use = sort_menu.addAction("Por Uso (más usado primero)")
         sort_by_use.triggered.connect(lambda: self.auto_sort_favorites("use_count"))
 
@@ -303,11 +310,18 @@ class FavoritesPanel(QWidget):
         # Mostrar menú
         menu.exec(QCursor.pos())
 
+    def toggle_frecency_sort(self, enabled: bool):
+        """Activar/desactivar el orden automático por frecencia"""
+        self.sort_mode = "frecency" if enabled else "manual"
+        self.load_favorites()
+        logger.info(f"Favorites sort mode: {self.sort_mode}")
+
     def auto_sort_favorites(self, by: str):
         """Auto-ordenar favoritos"""
         try:
             success = self.favorites_manager.auto_order_favorites(by=by)
             if success:
+                self.sort_mode = "manual"
                 self.load_favorites()
                 logger.info(f"Favorites auto-sorted by {by}")
         except Exception as e:
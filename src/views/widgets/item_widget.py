@@ -15,7 +15,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from models.item import Item, ItemType
 from core.usage_tracker import UsageTracker
 from core.favorites_manager import FavoritesManager
+from core.metrics import metrics
 from views.command_output_dialog import CommandOutputDialog
+from views.theme import apply_theme, set_state
 import time
 import logging
 
@@ -126,30 +128,14 @@ class ItemButton(QFrame):
         # Category badge (for global search)
         if self.show_category and hasattr(self.item, 'category_name') and self.item.category_name:
             category_badge = QLabel(f"📁 {self.item.category_name}")
-            category_badge.setStyleSheet("""
-                QLabel {
-                    background-color: #3d3d3d;
-                    color: #f093fb;
-                    border-radius: 3px;
-                    padding: 2px 8px;
-                    font-size: 8pt;
-                    font-weight: bold;
-                }
-            """)
+            category_badge.setProperty("role", "category")
             label_row.addWidget(category_badge)
 
         # Badge (Popular / Nuevo)
         badge = self.get_badge()
         if badge:
             badge_label = QLabel(badge)
-            badge_label.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                    color: #cccccc;
-                    font-size: 14pt;
-                    padding: 0px;
-                }
-            """)
+            badge_label.setProperty("role", "badge")
             label_row.addWidget(badge_label)
 
         label_row.addStretch()
@@ -163,15 +149,7 @@ class ItemButton(QFrame):
 
             for tag in self.item.tags:
                 tag_label = QLabel(tag)
-                tag_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #007acc;
-                        color: #ffffff;
-                        border-radius: 3px;
-                        padding: 2px 8px;
-                        font-size: 8pt;
-                    }
-                """)
+                tag_label.setProperty("role", "tag")
                 tags_layout.addWidget(tag_label)
 
             tags_layout.addStretch()
@@ -203,17 +181,7 @@ class ItemButton(QFrame):
         self.favorite_btn = QPushButton()
         self.favorite_btn.setFixedSize(30, 30)
         self.favorite_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.favorite_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                font-size: 16pt;
-            }
-            QPushButton:hover {
-                background-color: #3e3e42;
-                border-radius: 3px;
-            }
-        """)
+        self.favorite_btn.setProperty("action", "favorite")
         self.favorite_btn.clicked.connect(self.toggle_favorite)
         self.update_favorite_button()
         main_layout.addWidget(self.favorite_btn)
@@ -222,21 +190,7 @@ class ItemButton(QFrame):
         if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
             self.reveal_button = QPushButton("👁")
             self.reveal_button.setFixedSize(35, 35)
-            self.reveal_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #cc0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-                QPushButton:hover {
-                    background-color: #9e0000;
-                }
-                QPushButton:pressed {
-                    background-color: #780000;
-                }
-            """)
+            self.reveal_button.setProperty("action", "reveal")
             self.reveal_button.setCursor(Qt.CursorShape.PointingHandCursor)
             self.reveal_button.setToolTip("Revelar/Ocultar contenido sensible")
             self.reveal_button.clicked.connect(self.toggle_reveal)
@@ -247,21 +201,7 @@ class ItemButton(QFrame):
             # Execute command button (only for CODE items)
             self.execute_button = QPushButton("⚡")
             self.execute_button.setFixedSize(35, 35)
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #cc7a00;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-                QPushButton:hover {
-                    background-color: #ff9900;
-                }
-                QPushButton:pressed {
-                    background-color: #9e5e00;
-                }
-            """)
+            self.execute_button.setProperty("action", "execute")
             self.execute_button.setCursor(Qt.CursorShape.PointingHandCursor)
             self.execute_button.setToolTip("Ejecutar comando")
             self.execute_button.clicked.connect(self.execute_command)
@@ -271,21 +211,7 @@ class ItemButton(QFrame):
             # Open URL button (only for URL items)
             self.open_url_button = QPushButton("🌐")
             self.open_url_button.setFixedSize(35, 35)
-            self.open_url_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #007acc;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-                QPushButton:hover {
-                    background-color: #005a9e;
-                }
-                QPushButton:pressed {
-                    background-color: #004578;
-                }
-            """)
+            self.open_url_button.setProperty("action", "url")
             self.open_url_button.setCursor(Qt.CursorShape.PointingHandCursor)
             self.open_url_button.setToolTip("Abrir en navegador")
             self.open_url_button.clicked.connect(self.open_in_browser)
@@ -299,21 +225,7 @@ class ItemButton(QFrame):
             # Open in explorer button
             self.open_explorer_button = QPushButton("📁")
             self.open_explorer_button.setFixedSize(35, 35)
-            self.open_explorer_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2d7d2d;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-                QPushButton:hover {
-                    background-color: #236123;
-                }
-                QPushButton:pressed {
-                    background-color: #1a4a1a;
-                }
-            """)
+            self.open_explorer_button.setProperty("action", "explorer")
             self.open_explorer_button.setCursor(Qt.CursorShape.PointingHandCursor)
             self.open_explorer_button.setToolTip("Abrir en explorador")
             self.open_explorer_button.clicked.connect(self.open_in_explorer)
@@ -324,21 +236,7 @@ class ItemButton(QFrame):
             if path.exists() and path.is_file():
                 self.open_file_button = QPushButton("📝")
                 self.open_file_button.setFixedSize(35, 35)
-                self.open_file_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #cc7a00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                    QPushButton:hover {
-                        background-color: #9e5e00;
-                    }
-                    QPushButton:pressed {
-                        background-color: #784500;
-                    }
-                """)
+                self.open_file_button.setProperty("action", "file")
                 self.open_file_button.setCursor(Qt.CursorShape.PointingHandCursor)
                 self.open_file_button.setToolTip("Abrir archivo")
                 self.open_file_button.clicked.connect(self.open_file)
@@ -346,40 +244,9 @@ class ItemButton(QFrame):
 
             main_layout.addLayout(path_buttons_layout)
 
-        # Set initial style (different for sensitive items)
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #3d2020;
-                    border: none;
-                    border-left: 3px solid #cc0000;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #4d2525;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: none;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #3d3d3d;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
+        # Estilo: reglas ItemButton del tema de la aplicación (sensible = borde rojo)
+        apply_theme()
+        self.setProperty("sensitive", bool(getattr(self.item, 'is_sensitive', False)))
 
     def mousePressEvent(self, event):
         """Handle mouse press event"""
@@ -401,7 +268,7 @@ class ItemButton(QFrame):
 
         # Track completion for clipboard copy
         if self.item.type not in [ItemType.URL, ItemType.PATH]:
-            self.usage_tracker.track_execution_end(self.item.id, start_time, True, None)
+            self.usage_tracker.track_execution_end(self.item.id, start_time, True, None, item=self.item)
 
         # If sensitive item, start clipboard auto-clear timer
         if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
@@ -429,17 +296,7 @@ class ItemButton(QFrame):
                 success = True
 
                 # Update button style briefly to show it was clicked
-                original_style = self.open_url_button.styleSheet()
-                self.open_url_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_url_button.setStyleSheet(original_style))
+                self.flash_button(self.open_url_button, "success", 300)
 
             except Exception as e:
                 logger.error(f"Error opening URL {self.item.label}: {e}")
@@ -447,7 +304,7 @@ class ItemButton(QFrame):
 
             finally:
                 # Track execution end
-                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg, item=self.item)
 
     def open_in_explorer(self):
         """Open file/folder in system file explorer"""
@@ -493,17 +350,7 @@ class ItemButton(QFrame):
                 success = True
 
                 # Visual feedback
-                original_style = self.open_explorer_button.styleSheet()
-                self.open_explorer_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_explorer_button.setStyleSheet(original_style))
+                self.flash_button(self.open_explorer_button, "success", 300)
 
             except Exception as e:
                 logger.error(f"Error opening explorer for {self.item.label}: {e}")
@@ -511,7 +358,7 @@ class ItemButton(QFrame):
 
             finally:
                 # Track execution end
-                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg, item=self.item)
 
     def open_file(self):
         """Open file with default application"""
@@ -536,17 +383,7 @@ class ItemButton(QFrame):
                     subprocess.run(['xdg-open', str(path.absolute())])
 
                 # Visual feedback
-                original_style = self.open_file_button.styleSheet()
-                self.open_file_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_file_button.setStyleSheet(original_style))
+                self.flash_button(self.open_file_button, "success", 300)
 
             except Exception as e:
                 print(f"Error opening file: {e}")
@@ -555,36 +392,8 @@ class ItemButton(QFrame):
         """Show visual feedback that item was copied"""
         self.is_copied = True
 
-        # Different style for sensitive items (orange/warning color)
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #cc7a00;
-                    border: none;
-                    border-bottom: 1px solid #9e5e00;
-                }
-                QLabel {
-                    color: #ffffff;
-                    background-color: transparent;
-                    border: none;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            # Normal items: blue feedback
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #007acc;
-                    border: none;
-                    border-bottom: 1px solid #005a9e;
-                }
-                QLabel {
-                    color: #ffffff;
-                    background-color: transparent;
-                    border: none;
-                    font-weight: bold;
-                }
-            """)
+        # Azul para items normales, naranja para sensibles (ver tema)
+        set_state(self, "copied", children=True)
 
         # Reset after 500ms
         QTimer.singleShot(500, self.reset_style)
@@ -592,40 +401,19 @@ class ItemButton(QFrame):
     def reset_style(self):
         """Reset button style to normal"""
         self.is_copied = False
-        # Apply special style for sensitive items
-        if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #3d2020;
-                    border: none;
-                    border-left: 3px solid #cc0000;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #4d2525;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border: none;
-                    border-bottom: 1px solid #1e1e1e;
-                }
-                QFrame:hover {
-                    background-color: #3d3d3d;
-                }
-                QLabel {
-                    color: #cccccc;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
+        set_state(self, "", children=True)
+
+    def flash_button(self, button: QPushButton, state: str, msecs: int):
+        """
+        Show a temporary state on an action button (see the theme's button_states)
+
+        Args:
+            button: Action button
+            state: 'success', 'error' or 'running'
+            msecs: Time until the button returns to its normal state
+        """
+        set_state(button, state)
+        QTimer.singleShot(msecs, lambda: set_state(button, ""))
 
     def get_display_label(self):
         """Get display label (ofuscado si es sensible y no revelado)"""
@@ -807,16 +595,7 @@ class ItemButton(QFrame):
             command = self.item.content.strip()
 
             # Visual feedback - cambiar botón a amarillo mientras ejecuta
-            original_style = self.execute_button.styleSheet()
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffff00;
-                    color: #000000;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-            """)
+            set_state(self.execute_button, "running")
             self.execute_button.setText("⏳")
 
             # Ejecutar comando usando subprocess
@@ -834,27 +613,29 @@ class ItemButton(QFrame):
                 else:
                     logger.warning(f"Working directory does not exist: {self.item.working_dir}")
 
-            if system == 'Windows':
-                # En Windows, usar cmd.exe para ejecutar el comando
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,  # Timeout de 30 segundos
-                    cwd=cwd  # Directorio de trabajo
-                )
-            else:
-                # En Unix-like systems, usar bash
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    executable='/bin/bash',
-                    cwd=cwd  # Directorio de trabajo
-                )
+            # Solo se mide el proceso, no el tiempo que el diálogo queda abierto
+            with metrics.timer('command.execute'):
+                if system == 'Windows':
+                    # En Windows, usar cmd.exe para ejecutar el comando
+                    result = subprocess.run(
+                        command,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=30,  # Timeout de 30 segundos
+                        cwd=cwd  # Directorio de trabajo
+                    )
+                else:
+                    # En Unix-like systems, usar bash
+                    result = subprocess.run(
+                        command,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=30,
+                        executable='/bin/bash',
+                        cwd=cwd  # Directorio de trabajo
+                    )
 
             # Obtener output y error
             stdout = result.stdout if result.stdout else ""
@@ -863,35 +644,16 @@ class ItemButton(QFrame):
 
             # Considerar éxito si return code es 0
             success = (return_code == 0)
+            if not success:
+                metrics.inc('command.failed')
 
             # Restaurar botón
             self.execute_button.setText("⚡")
-            if success:
-                # Verde si éxito
-                self.execute_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #000000;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-            else:
-                # Rojo si error
-                self.execute_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #ff0000;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
+            if not success:
                 error_msg = stderr if stderr else "Error desconocido"
 
-            # Restaurar estilo original después de 1 segundo
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
+            # Verde si éxito, rojo si error; estado normal después de 1 segundo
+            self.flash_button(self.execute_button, "success" if success else "error", 1000)
 
             # Mostrar dialog con el resultado
             dialog = CommandOutputDialog(
@@ -905,20 +667,12 @@ class ItemButton(QFrame):
 
         except subprocess.TimeoutExpired:
             logger.error(f"Command timeout: {self.item.label}")
+            metrics.inc('command.timeout')
             error_msg = "Comando excedió el tiempo de espera (30 segundos)"
 
             # Restaurar botón con estilo de error
             self.execute_button.setText("⚡")
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-            """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
+            self.flash_button(self.execute_button, "error", 1000)
 
             # Mostrar dialog de error
             dialog = CommandOutputDialog(
@@ -936,16 +690,7 @@ class ItemButton(QFrame):
 
             # Restaurar botón con estilo de error
             self.execute_button.setText("⚡")
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-            """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
+            self.flash_button(self.execute_button, "error", 1000)
 
             # Mostrar dialog de error
             dialog = CommandOutputDialog(
@@ -959,4 +704,4 @@ class ItemButton(QFrame):
 
         finally:
             # Track execution end
-            self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+            self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg, item=self.item)
@@ -13,6 +13,8 @@ from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QFont, QCursor
 from datetime import datetime
 
+from views.theme import apply_theme
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,7 +62,7 @@ class ListStepPreview(QFrame):
         number_font.setBold(True)
         number_font.setPointSize(10)
         number_label.setFont(number_font)
-        number_label.setStyleSheet("color: #4a9eff;")
+        number_label.setProperty("role", "stepNumber")
         number_label.setFixedWidth(25)
         header_layout.addWidget(number_label)
 
@@ -69,22 +71,13 @@ class ListStepPreview(QFrame):
         label_font = QFont()
         label_font.setPointSize(10)
         label_text.setFont(label_font)
-        label_text.setStyleSheet("color: #e0e0e0; font-weight: bold;")
+        label_text.setProperty("role", "stepLabel")
         label_text.setWordWrap(True)
         header_layout.addWidget(label_text, stretch=1)
 
         # Tipo badge
         type_badge = QLabel(self.item_type)
-        type_badge.setStyleSheet("""
-            QLabel {
-                background-color: #3a3a3a;
-                color: #aaaaaa;
-                border-radius: 3px;
-                padding: 2px 6px;
-                font-size: 9px;
-                font-weight: bold;
-            }
-        """)
+        type_badge.setProperty("role", "stepType")
         type_badge.setFixedHeight(18)
         header_layout.addWidget(type_badge)
 
@@ -98,16 +91,7 @@ class ListStepPreview(QFrame):
                 preview_text += "..."
 
             content_label = QLabel(preview_text)
-            content_label.setStyleSheet("""
-                QLabel {
-                    color: #aaaaaa;
-                    font-size: 9px;
-                    font-family: 'Consolas', 'Courier New', monospace;
-                    padding: 4px;
-                    background-color: #1a1a1a;
-                    border-radius: 3px;
-                }
-            """)
+            content_label.setProperty("role", "stepContent")
             content_label.setWordWrap(True)
             content_label.setMaximumHeight(50)
             layout.addWidget(content_label)
@@ -121,28 +105,8 @@ class ListStepPreview(QFrame):
         layout.addWidget(copy_btn, alignment=Qt.AlignmentFlag.AlignRight)
 
     def apply_styles(self):
-        """Aplica estilos al frame"""
-        self.setStyleSheet("""
-            ListStepPreview {
-                background-color: #252525;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-            }
-            QPushButton {
-                background-color: #3a3a3a;
-                border: 1px solid #4a4a4a;
-                border-radius: 3px;
-                color: #e0e0e0;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                border: 1px solid #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-        """)
+        """Aplica estilos al frame (reglas ListStepPreview del tema de la aplicación)"""
+        apply_theme()
 
     def on_copy_clicked(self):
         """Handler cuando se hace click en copiar"""
@@ -188,7 +152,8 @@ class ListWidget(QFrame):
         self.setup_ui()
         self.apply_styles()
 
-        logger.debug(f"[LIST_WIDGET] Created for '{self.list_group}' ({self.item_count} steps)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[LIST_WIDGET] Created for '{self.list_group}' ({self.item_count} steps)")
 
     def setup_ui(self):
         """Configura la interfaz del widget"""
@@ -222,11 +187,12 @@ class ListWidget(QFrame):
         name_font.setBold(True)
         name_font.setPointSize(11)
         name_label.setFont(name_font)
-        name_label.setStyleSheet("color: #e0e0e0;")
+        name_label.setProperty("role", "listTitle")
         first_line.addWidget(name_label, stretch=1)
 
         # Toggle button
         self.toggle_btn = QPushButton("▼")
+        self.toggle_btn.setObjectName("listToggleButton")
         self.toggle_btn.setFixedSize(24, 24)
         self.toggle_btn.clicked.connect(self.toggle_expanded)
         first_line.addWidget(self.toggle_btn)
@@ -235,7 +201,7 @@ class ListWidget(QFrame):
 
         # Segunda línea: metadata
         metadata_label = QLabel(f"{self.item_count} pasos")
-        metadata_label.setStyleSheet("color: #888888; font-size: 10px;")
+        metadata_label.setProperty("role", "listMeta")
         header_layout.addWidget(metadata_label)
 
         self.main_layout.addWidget(self.header_widget)
@@ -274,7 +240,7 @@ class ListWidget(QFrame):
         # Separador
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("background-color: #3a3a3a;")
+        separator.setProperty("role", "separator")
         separator.setFixedHeight(1)
         content_layout.addWidget(separator)
 
@@ -314,56 +280,8 @@ class ListWidget(QFrame):
         self.main_layout.addWidget(self.content_widget)
 
     def apply_styles(self):
-        """Aplica estilos al widget"""
-        self.setStyleSheet("""
-            ListWidget {
-                background-color: #2b2b2b;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-            }
-            QPushButton {
-                background-color: #3a3a3a;
-                border: 1px solid #4a4a4a;
-                border-radius: 4px;
-                padding: 6px 10px;
-                color: #e0e0e0;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                border: 1px solid #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-            QPushButton#deleteButton {
-                background-color: #3a2a2a;
-                border: 1px solid #5a3a3a;
-                color: #ff6666;
-            }
-            QPushButton#deleteButton:hover {
-                background-color: #5a3a3a;
-                border: 1px solid #7a4a4a;
-            }
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-
-        # Estilo especial para el toggle button
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                color: #aaaaaa;
-                font-size: 12px;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                color: #e0e0e0;
-            }
-        """)
+        """Aplica estilos al widget (reglas ListWidget del tema de la aplicación)"""
+        apply_theme()
 
     def toggle_expanded(self):
         """Alterna entre estado expandido y colapsado"""
@@ -60,7 +60,7 @@ class SearchBar(QWidget):
     def _connect_signals(self):
         """Connect internal signals"""
         self.search_input.textChanged.connect(self._on_text_changed)
-        self.clear_button.clicked.connect(self.clear_search)
+        self.clear_button.clicked.connect(lambda: self.clear_search())
 
     def _apply_styles(self):
         """Apply dark theme styles"""
@@ -133,12 +133,21 @@ class SearchBar(QWidget):
         """Emit search_changed signal after debounce delay"""
         self.search_changed.emit(self.current_query)
 
-    def clear_search(self):
-        """Clear search input and emit empty query"""
+    def clear_search(self, emit: bool = True):
+        """
+        Clear search input and emit empty query
+
+        Args:
+            emit: Emit search_changed (False when the caller refreshes the results itself)
+        """
+        self.debounce_timer.stop()
+        self.search_input.blockSignals(True)
         self.search_input.clear()
+        self.search_input.blockSignals(False)
         self.current_query = ""
         self.clear_button.hide()
-        self.search_changed.emit("")
+        if emit:
+            self.search_changed.emit("")
 
     def get_query(self) -> str:
         """
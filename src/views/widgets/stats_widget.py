@@ -12,6 +12,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.stats_manager import StatsManager
+from core.event_bus import event_bus, ITEM_EVENTS, UsageRecorded
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,10 +27,12 @@ class StatsWidget(QWidget):
         self.init_ui()
         self.load_stats()
 
-        # Auto-refresh cada 30 segundos
-        self.timer = QTimer()
+        # Refrescar solo cuando algo cambia (varios eventos seguidos = un refresco)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(500)
         self.timer.timeout.connect(self.refresh)
-        self.timer.start(30000)
+        self._unsubscribe = event_bus.subscribe_many((UsageRecorded,) + ITEM_EVENTS, self._on_data_changed)
 
     def init_ui(self):
         """Inicializar UI"""
@@ -169,21 +172,19 @@ class StatsWidget(QWidget):
     def load_stats(self):
         """Cargar estadísticas"""
         try:
-            # Items usados hoy
-            today_items = self.stats_manager.get_most_used_items(period='today')
-            today_count = len(today_items)
+            # Items usados hoy / esta semana (una sola lectura del historial)
+            ranked = self.stats_manager.get_most_used_by_period(periods=('today', 'week'))
+            today_count = len(ranked['today'])
             self._update_stat_value(self.today_label, str(today_count))
 
             # Items usados esta semana
-            week_items = self.stats_manager.get_most_used_items(period='week')
-            week_count = len(week_items)
+            week_count = len(ranked['week'])
             self._update_stat_value(self.week_label, str(week_count))
 
             # Total favoritos
             from core.favorites_manager import FavoritesManager
             favorites_manager = FavoritesManager()
-            favorites = favorites_manager.get_all_favorites()
-            favorites_count = len(favorites)
+            favorites_count = favorites_manager.get_favorites_count()
             self._update_stat_value(self.favorites_label, str(favorites_count))
 
             # Items populares (>50 usos)
@@ -197,6 +198,11 @@ class StatsWidget(QWidget):
         except Exception as e:
             logger.error(f"Error loading stats: {e}")
 
+    def _on_data_changed(self, event):
+        """Usage or items changed: schedule a refresh"""
+        if not self.timer.isActive():
+            self.timer.start()
+
     def refresh(self):
         """Refrescar estadísticas"""
         logger.debug("Refreshing stats widget")
@@ -206,4 +212,5 @@ class StatsWidget(QWidget):
         """Cleanup al cerrar"""
         if self.timer:
             self.timer.stop()
+        self._unsubscribe()
         super().closeEvent(event)
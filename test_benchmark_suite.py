@@ -0,0 +1,134 @@
+"""
+Test the benchmark suite (seeded data generator, runner, JSON comparison)
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_data import build_database
+from run_benchmarks import compare, run_benchmarks
+
+
+class in_tempdir:
+    """Run inside a temporary directory (sensitive items write the key to .env)"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def dump(db_path: str) -> tuple:
+    """Deterministic content of a benchmark database (encrypted contents excluded)"""
+    conn = sqlite3.connect(db_path)
+    try:
+        items = conn.execute("""
+            SELECT category_id, label, type, tags, is_sensitive, is_favorite, is_list, list_group,
+                   orden_lista, use_count
+            FROM items ORDER BY id
+        """).fetchall()
+        history = conn.execute(
+            "SELECT item_id, execution_time_ms, success, error_message FROM item_usage_history ORDER BY id"
+        ).fetchall()
+        return items, history
+    finally:
+        conn.close()
+
+
+def test_generator_is_reproducible():
+    """The same seed builds the same data; another seed doesn't"""
+    with in_tempdir() as tmp:
+        first = build_database(str(tmp / "a.db"), 300, 2_000, seed=7)
+        build_database(str(tmp / "b.db"), 300, 2_000, seed=7)
+        build_database(str(tmp / "c.db"), 300, 2_000, seed=8)
+
+        assert dump(str(tmp / "a.db")) == dump(str(tmp / "b.db"))
+        assert dump(str(tmp / "a.db")) != dump(str(tmp / "c.db"))
+
+        assert first['items'] == 300 and first['history_rows'] == 2_000
+        assert first['sensitive_items'] > 0 and first['list_items'] > 0 and first['tagged_items'] > 0
+
+        # Los contadores de los items cuadran con el historial
+        conn = sqlite3.connect(str(tmp / "a.db"))
+        mismatched = conn.execute("""
+            SELECT COUNT(*) FROM items i
+            WHERE i.use_count != (SELECT COUNT(*) FROM item_usage_history h WHERE h.item_id = i.id)
+        """).fetchone()[0]
+        conn.close()
+        assert mismatched == 0
+
+        try:
+            build_database(str(tmp / "a.db"), 10)
+            raise AssertionError("Existing database was overwritten")
+        except FileExistsError:
+            pass
+
+    print("[OK] Generator is reproducible")
+
+
+def test_runner_report():
+    """A small run covers every benchmark and reports timings per size"""
+    with in_tempdir():
+        report = run_benchmarks([200], rounds=1, seed=3, history_per_item=5)
+
+    benchmarks = report['sizes']['200']['benchmarks']
+    for name in ('config.get_categories', 'search_engine.search', 'dashboard.search',
+                 'advanced_filter.apply_filters', 'category_filter.apply_filters',
+                 'stats.get_health_report', 'stats.get_most_used_by_period', 'usage_tracker.track_usage'):
+        assert name in benchmarks, name
+    assert sum(name.startswith('stats.') for name in benchmarks) >= 17
+
+    # Queries that fail (and return their empty fallback) are reported without timings
+    failed = report['sizes']['200']['failed']
+    assert 'stats.suggest_shortcuts' in failed and 'stats.suggest_shortcuts' not in benchmarks
+    assert 'shortcut' in failed['stats.suggest_shortcuts']
+    assert all(timing['min_ms'] <= timing['median_ms'] <= timing['max_ms'] for timing in benchmarks.values())
+    assert benchmarks['usage_tracker.track_usage']['ops_per_s'] > 0
+    assert report['sizes']['200']['dataset']['history_rows'] == 1_000
+    assert report['sizes']['200']['metrics']['db.query']['count'] > 0
+    assert report['seed'] == 3
+
+    print("[OK] Runner report")
+
+
+def test_compare_flags_regressions():
+    """--compare reports relative changes and flags slowdowns over the threshold"""
+    def report(search_ms, stats_ms):
+        return {'sizes': {'1000': {'benchmarks': {
+            'search_engine.search': {'median_ms': search_ms},
+            'stats.get_health_report': {'median_ms': stats_ms},
+        }}}}
+
+    rows = {row[1]: row for row in compare(report(10.0, 50.0), report(12.0, 40.0))}
+    assert rows['search_engine.search'][5] is True
+    assert abs(rows['search_engine.search'][4] - 0.2) < 1e-9
+    assert rows['stats.get_health_report'][5] is False
+    assert compare(report(10.0, 50.0), {'sizes': {'5000': {'benchmarks': {}}}}) == []
+
+    print("[OK] Compare flags regressions")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Benchmark Suite")
+    print("=" * 60)
+
+    test_generator_is_reproducible()
+    test_runner_report()
+    test_compare_flags_regressions()
+
+    print("\nAll benchmark suite tests passed")
+
+
+if __name__ == '__main__':
+    main()
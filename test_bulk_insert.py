@@ -0,0 +1,146 @@
+"""
+Test bulk item inserts and nested transactions (savepoints)
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.config_manager import ConfigManager
+from database.db_manager import DBManager
+from models.category import Category
+from models.item import Item, ItemType
+
+
+def count_items(db: DBManager, category_id: int) -> int:
+    """Count items of a category"""
+    return db.execute_query(
+        "SELECT COUNT(*) AS n FROM items WHERE category_id = ?", (category_id,)
+    )[0]['n']
+
+
+def test_add_items_bulk_returns_ids():
+    """IDs are returned in order and match the inserted rows"""
+    db = DBManager(":memory:")
+    cat_id = db.add_category("Bulk", "📦")
+    db.add_item(cat_id, "Before", "x")
+
+    item_ids = db.add_items_bulk([
+        {'category_id': cat_id, 'label': f"Item {i}", 'content': f"content {i}", 'tags': ['a', 'b']}
+        for i in range(50)
+    ])
+
+    assert len(item_ids) == 50
+    rows = db.execute_query(
+        "SELECT id, label, tags FROM items WHERE id IN ({})".format(','.join('?' * len(item_ids))),
+        tuple(item_ids)
+    )
+    labels = {row['id']: row['label'] for row in rows}
+    assert [labels[item_id] for item_id in item_ids] == [f"Item {i}" for i in range(50)]
+    assert all(json.loads(row['tags']) == ['a', 'b'] for row in rows)
+    assert db.add_items_bulk([]) == []
+    db.close()
+
+    print("[OK] add_items_bulk returns ordered IDs")
+
+
+def test_nested_transaction_rollback():
+    """A failing inner block rolls back only its savepoint"""
+    db = DBManager(":memory:")
+    cat_id = db.add_category("Nested", "🪆")
+
+    with db.transaction():
+        db.add_item(cat_id, "Outer", "kept")
+        try:
+            with db.transaction():
+                db.add_item(cat_id, "Inner", "discarded")
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        db.add_item(cat_id, "Outer 2", "kept")
+
+    labels = [item['label'] for item in db.get_items_by_category(cat_id)]
+    assert labels == ["Outer", "Outer 2"], labels
+
+    # Outer failure discards everything, including execute_update writes
+    try:
+        with db.transaction():
+            db.add_item(cat_id, "Lost", "x")
+            db.add_items_bulk([{'category_id': cat_id, 'label': "Lost bulk", 'content': "y"}])
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert count_items(db, cat_id) == 2
+    db.close()
+
+    print("[OK] Nested transaction rollback")
+
+
+def test_execute_update_no_commit_inside_transaction():
+    """execute_update writes are not visible to other connections until the outer commit"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "tx_test.db")
+        db = DBManager(db_path)
+        reader = DBManager(db_path)
+        cat_id = db.add_category("Tx", "🔒")
+
+        with db.transaction():
+            db.add_item(cat_id, "Pending", "x")
+            assert count_items(reader, cat_id) == 0
+        assert count_items(reader, cat_id) == 1
+
+        reader.close()
+        db.close()
+
+    print("[OK] execute_update defers commit inside transaction")
+
+
+def test_import_20k_items():
+    """import_config with 20k items runs in a single transaction"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        config = ConfigManager(db_path=str(tmp_dir / "import_test.db"), base_dir=tmp_dir)
+
+        categories = []
+        for c in range(20):
+            category = Category(f"bulk_{c}", f"Import {c}", "📥")
+            category.items = [
+                Item(f"{c}_{i}", f"Item {c}-{i}", f"content {i}", ItemType.TEXT, tags=['import'])
+                for i in range(1000)
+            ]
+            categories.append(category.to_dict())
+
+        import_path = tmp_dir / "import.json"
+        import_path.write_text(json.dumps({"settings": {}, "categories": categories}), encoding='utf-8')
+
+        start = time.perf_counter()
+        assert config.import_config(import_path)
+        elapsed = time.perf_counter() - start
+
+        total = config.db.execute_query("SELECT COUNT(*) AS n FROM items")[0]['n']
+        assert total >= 20000
+        print(f"  20k items imported in {elapsed:.2f}s")
+        assert elapsed < 10
+        config.close()
+
+    print("[OK] 20k item import")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Bulk Insert / Nested Transactions")
+    print("=" * 60)
+
+    test_add_items_bulk_returns_ids()
+    test_nested_transaction_rollback()
+    test_execute_update_no_commit_inside_transaction()
+    test_import_20k_items()
+
+    print("\nAll bulk insert tests passed")
+
+
+if __name__ == '__main__':
+    main()
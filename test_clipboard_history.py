@@ -0,0 +1,244 @@
+"""
+Test ring-buffer clipboard history (deque + fixed-slot SQLite table)
+"""
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core import clipboard_history_store
+from core.clipboard_history_store import ClipboardHistoryStore
+from database.db_manager import DBManager
+from models.item import Item
+
+
+def make_item(i: int, sensitive: bool = False) -> Item:
+    """Create a test item"""
+    return Item(str(i), f"Item {i}", f"content {i}", is_sensitive=sensitive)
+
+
+def test_ring_wraps_and_persists():
+    """Only the newest `capacity` entries are kept, in memory and on disk"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "history.db")
+        db = DBManager(db_path)
+        store = ClipboardHistoryStore(db, capacity=20)
+
+        for i in range(1, 101):
+            store.append(make_item(i))
+        store.flush()
+
+        assert [entry.item.content for entry in store.get(3)] == ["content 100", "content 99", "content 98"]
+        assert len(store) == 20
+        assert db.execute_query("SELECT COUNT(*) AS n FROM clipboard_history_ring")[0]['n'] == 20
+        store.close()
+
+        # Reload from the database
+        reloaded = ClipboardHistoryStore(db, capacity=20)
+        assert [entry.seq for entry in reloaded.get()] == list(range(100, 80, -1))
+        assert reloaded.get(1)[0].item.content == "content 100"
+
+        # Sequence continues after reload
+        assert reloaded.append(make_item(101)).seq == 101
+        reloaded.close()
+        db.close()
+
+    print("[OK] Ring wraps and persists")
+
+
+def test_capacity_change_and_sensitive():
+    """Shrinking keeps the newest entries; sensitive content is not written"""
+    db = DBManager(":memory:")
+    store = ClipboardHistoryStore(db, capacity=10)
+    for i in range(1, 11):
+        store.append(make_item(i, sensitive=(i == 10)))
+
+    assert db.get_history(1)[0]['content'] == ""
+    assert store.get(1)[0].item.content == "content 10"
+
+    store.set_capacity(3)
+    assert [entry.seq for entry in store.get()] == [10, 9, 8]
+    assert [row['seq'] for row in db.get_history(50)] == [10, 9, 8]
+
+    store.append(make_item(11))
+    assert [row['seq'] for row in db.get_history(50)] == [11, 10, 9]
+
+    store.clear()
+    assert len(store) == 0 and db.get_history() == []
+    db.close()
+
+    print("[OK] Capacity change and sensitive entries")
+
+
+def test_legacy_history_migrated():
+    """Rows of the old clipboard_history table move into the ring"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "legacy.db")
+        DBManager(db_path).close()
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM clipboard_history_ring")
+        conn.executemany("INSERT INTO clipboard_history (item_id, content) VALUES (NULL, ?)",
+                         [(f"old {i}",) for i in range(5)])
+        conn.commit()
+        conn.close()
+
+        db = DBManager(db_path)
+        assert [row['content'] for row in db.get_history()] == [f"old {i}" for i in range(4, -1, -1)]
+        db.close()
+
+    print("[OK] Legacy history migrated")
+
+
+def test_clipboard_manager_uses_store():
+    """ClipboardManager records history in the shared (empty) store"""
+    from core.clipboard_manager import ClipboardManager
+
+    db = DBManager(":memory:")
+    store = ClipboardHistoryStore(db, capacity=5)
+    manager = ClipboardManager(history_store=store)
+    assert manager.history_store is store
+
+    manager.add_to_history(make_item(1))
+    assert manager.get_last_copied().content == "content 1"
+    assert db.get_history()[0]['content'] == "content 1"
+    db.close()
+
+    print("[OK] ClipboardManager uses the history store")
+
+
+def test_append_latency_independent_of_capacity():
+    """Copy latency does not grow with max_history"""
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+        for capacity in (20, 20000):
+            db = DBManager(str(Path(tmp) / f"latency_{capacity}.db"))
+            store = ClipboardHistoryStore(db, capacity=capacity)
+            start = time.perf_counter()
+            for i in range(2000):
+                store.append(make_item(i))
+            timings[capacity] = (time.perf_counter() - start) / 2000
+            store.close()
+            db.close()
+
+        print(f"  append: {timings[20] * 1e6:.1f} us (20) vs {timings[20000] * 1e6:.1f} us (20000)")
+        assert timings[20000] < 1e-3
+
+    print("[OK] Append latency")
+
+
+def test_concurrent_connections():
+    """The history writer and UI-thread writes wait for each other instead of failing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "concurrent.db")
+        db = DBManager(db_path)
+        cat_id = db.add_category("Concurrent", "🔒")
+        item_id = db.add_item(cat_id, "Item", "before")
+        other = DBManager(db_path)
+        errors = []
+
+        # Otra conexión lee y luego escribe dentro de una transacción (como write_history_slot)
+        def hold_transaction():
+            try:
+                with other.transaction() as conn:
+                    conn.execute("SELECT COUNT(*) FROM clipboard_history_ring").fetchone()
+                    time.sleep(0.3)
+                    other.write_history_slot(1, 20, None, "from writer")
+            except Exception as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=hold_transaction)
+        writer.start()
+        time.sleep(0.05)
+        db.update_item(item_id, content="after")  # Waits for the writer's commit
+        writer.join()
+
+        assert errors == []
+        assert db.get_item(item_id)['content'] == "after"
+        assert db.get_history()[0]['content'] == "from writer"
+
+        # Y al revés: el writer del historial espera a una transacción del hilo de UI
+        store = ClipboardHistoryStore(db, capacity=20)
+        with db.transaction() as conn:
+            conn.execute("SELECT COUNT(*) FROM items").fetchone()
+            store.append(make_item(7))
+            time.sleep(0.2)
+            db.update_item(item_id, label="Renamed")
+        store.flush()
+        assert db.get_history()[0]['content'] == "content 7"
+
+        store.close()
+        other.close()
+        db.close()
+
+    print("[OK] Concurrent connections")
+
+
+def test_locked_writes_are_retried():
+    """A locked history write is retried, and kept for later if it keeps failing"""
+    original_delay = clipboard_history_store.WRITE_RETRY_DELAY
+    clipboard_history_store.WRITE_RETRY_DELAY = 0.001
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DBManager(str(Path(tmp) / "retry.db"))
+            store = ClipboardHistoryStore(db, capacity=20)
+            calls = []
+
+            def locked_twice(writer_db):
+                calls.append('locked_twice')
+                if calls.count('locked_twice') <= 2:
+                    raise sqlite3.OperationalError("database is locked")
+                writer_db.write_history_slot(1, 20, None, "retried")
+
+            store._submit(locked_twice)
+            store.flush()
+            assert calls.count('locked_twice') == 3
+            assert db.get_history()[0]['content'] == "retried"
+
+            # Still locked after every retry: kept and written before the next write
+            locked = [True]
+
+            def locked_until_released(writer_db):
+                calls.append('kept')
+                if locked[0]:
+                    raise sqlite3.OperationalError("database is locked")
+                writer_db.write_history_slot(2, 20, None, "kept")
+
+            store._submit(locked_until_released)
+            store.flush()
+            assert calls.count('kept') == clipboard_history_store.WRITE_RETRIES
+            locked[0] = False
+            store._submit(lambda writer_db: writer_db.write_history_slot(3, 20, None, "next"))
+            store.flush()
+            assert [row['content'] for row in db.get_history()][:2] == ["next", "kept"]
+
+            store.close()
+            db.close()
+    finally:
+        clipboard_history_store.WRITE_RETRY_DELAY = original_delay
+
+    print("[OK] Locked writes are retried")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Clipboard History Ring")
+    print("=" * 60)
+
+    test_ring_wraps_and_persists()
+    test_capacity_change_and_sensitive()
+    test_legacy_history_migrated()
+    test_clipboard_manager_uses_store()
+    test_append_latency_independent_of_capacity()
+    test_concurrent_connections()
+    test_locked_writes_are_retried()
+
+    print("\nAll clipboard history tests passed")
+
+
+if __name__ == '__main__':
+    main()
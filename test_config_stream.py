@@ -0,0 +1,130 @@
+"""
+Test streaming config export/import (NDJSON, compression, legacy JSON)
+"""
+import gzip
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.config_manager import ConfigManager
+from core.config_stream import STREAM_FORMAT, iter_records
+
+
+def create_config_manager(tmp_dir: Path, name: str, items_per_category: int = 3) -> ConfigManager:
+    """Create a ConfigManager with two custom categories"""
+    config = ConfigManager(db_path=str(tmp_dir / name), base_dir=tmp_dir)
+    for c in range(2):
+        cat_id = config.db.add_category(f"Stream {c}", "🌊")
+        config.db.add_items_bulk([
+            {'category_id': cat_id, 'label': f"Item {c}-{i}", 'content': f"content {c}-{i}",
+             'item_type': 'URL' if i == 0 else 'TEXT', 'tags': ['s'], 'is_sensitive': i == 1}
+            for i in range(items_per_category)
+        ])
+    config.set_setting("theme", "dark")
+    return config
+
+
+def exported_snapshot(config: ConfigManager):
+    """Categories with their item labels/contents, by category name"""
+    return {
+        category.name: [(item.label, item.content, item.type.value, item.is_sensitive) for item in category.items]
+        for category in config.get_categories()
+        if category.name.startswith("Stream")
+    }
+
+
+def test_ndjson_gzip_roundtrip():
+    """Export to .ndjson.gz and import into an empty database"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        source = create_config_manager(tmp_dir, "source.db")
+        export_path = tmp_dir / "export.ndjson.gz"
+
+        progress = []
+        assert source.export_config(export_path, progress_callback=lambda done, total: progress.append((done, total)))
+        assert progress[-1][0] == progress[-1][1]
+
+        with gzip.open(export_path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+        assert header['format'] == STREAM_FORMAT
+
+        target = ConfigManager(db_path=str(tmp_dir / "target.db"), base_dir=tmp_dir)
+        import_progress = []
+        assert target.import_config(export_path, progress_callback=lambda done, total: import_progress.append((done, total)),
+                                    batch_size=2)
+        assert import_progress[-1] == progress[-1]
+
+        assert exported_snapshot(target) == exported_snapshot(source)
+        assert target.get_setting("theme") == "dark"
+        source.close()
+        target.close()
+
+    print("[OK] NDJSON gzip roundtrip")
+
+
+def test_legacy_json_export_and_import():
+    """The .json export is still a single JSON document, and legacy files import"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        source = create_config_manager(tmp_dir, "source.db")
+        export_path = tmp_dir / "export.json"
+        assert source.export_config(export_path)
+
+        data = json.loads(export_path.read_text(encoding='utf-8'))
+        assert data['version'] == "3.0.0"
+        stream_cats = [cat for cat in data['categories'] if cat['name'].startswith("Stream")]
+        assert [len(cat['items']) for cat in stream_cats] == [3, 3]
+
+        # File written the old way (json.dump with indent)
+        legacy_path = tmp_dir / "legacy.json"
+        legacy_path.write_text(json.dumps({"version": "3.0.0", "settings": {"opacity": 0.5},
+                                           "categories": stream_cats}, indent=2), encoding='utf-8')
+
+        target = ConfigManager(db_path=str(tmp_dir / "target.db"), base_dir=tmp_dir)
+        assert target.import_config(legacy_path)
+        assert exported_snapshot(target) == exported_snapshot(source)
+        assert target.get_setting("opacity") == 0.5
+        source.close()
+        target.close()
+
+    print("[OK] Legacy JSON export/import")
+
+
+def test_export_memory_is_bounded():
+    """Exporting 20k items does not hold them all in memory"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        config = create_config_manager(tmp_dir, "big.db", items_per_category=10000)
+        export_path = tmp_dir / "big.ndjson"
+
+        tracemalloc.start()
+        assert config.export_config(export_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        items = sum(1 for record_type, _ in iter_records(export_path) if record_type == 'item')
+        assert items == 20000
+        assert export_path.stat().st_size > 2 * peak, f"peak {peak} bytes"
+        config.close()
+
+    print(f"[OK] Export peak memory {peak / 1024:.0f} KB")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Streaming Config Export/Import")
+    print("=" * 60)
+
+    test_ndjson_gzip_roundtrip()
+    test_legacy_json_export_and_import()
+    test_export_memory_is_bounded()
+
+    print("\nAll config stream tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Test content-addressed storage of large item and clipboard history contents
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.content_store import BLOB_MIN_SIZE, CONTENT_REF_PREFIX
+from database.db_manager import DBManager
+
+BIG_TEXT = "def snippet():\n    return 42\n" * 400  # ~11 KB, compressible
+
+
+class in_tempdir:
+    """Run inside a temporary directory (sensitive items write the key to .env)"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def raw_contents(db: DBManager, table: str = 'items'):
+    """Raw content column values of a table"""
+    return [row['content'] for row in db.execute_query(f"SELECT content FROM {table}")]
+
+
+def test_items_share_blob():
+    """Identical large contents are stored once and read back transparently"""
+    with in_tempdir():
+        db = DBManager(":memory:")
+        cat_a = db.add_category("A", "🅰")
+        cat_b = db.add_category("B", "🅱")
+
+        item_a = db.add_item(cat_a, "Big A", BIG_TEXT)
+        db.add_items_bulk([{'category_id': cat_b, 'label': f"Big B{i}", 'content': BIG_TEXT} for i in range(3)])
+        db.create_list(cat_b, "Pasos", [{'label': "Paso", 'content': BIG_TEXT}])
+        small_id = db.add_item(cat_a, "Small", "short text")
+
+        assert all(value.startswith(CONTENT_REF_PREFIX) for value in raw_contents(db) if value != "short text")
+        stats = db.get_content_store_stats()
+        assert stats['blobs'] == 1 and stats['references'] == 5
+        assert stats['stored_bytes'] < len(BIG_TEXT) / 10  # zlib-compressed
+
+        assert db.get_item(item_a)['content'] == BIG_TEXT
+        assert db.get_item(small_id)['content'] == "short text"
+        assert all(item['content'] == BIG_TEXT for item in db.get_items_by_category(cat_b))
+        assert db.get_list_items(cat_b, "Pasos")[0]['content'] == BIG_TEXT
+        assert any(item['id'] == item_a for item in db.search_items("return 42"))
+        db.close()
+
+    print("[OK] Items share one blob")
+
+
+def test_reference_counting():
+    """Updates and deletes release blobs; the last reference deletes the blob"""
+    with in_tempdir():
+        db = DBManager(":memory:")
+        cat_id = db.add_category("Refs", "🔗")
+        first = db.add_item(cat_id, "One", BIG_TEXT)
+        second = db.add_item(cat_id, "Two", BIG_TEXT)
+
+        db.update_item(first, content="now small")
+        assert db.get_content_store_stats()['references'] == 1
+
+        db.update_item(second, label="Renamed")  # Content untouched
+        assert db.get_content_store_stats()['references'] == 1
+
+        # Saving the same content keeps the blob (no delete and recompression)
+        conn = db.connect()
+        conn.execute("CREATE TEMP TABLE deleted_blobs (hash TEXT)")
+        conn.execute("""
+            CREATE TEMP TRIGGER log_deleted_blobs AFTER DELETE ON content_blobs
+            BEGIN INSERT INTO deleted_blobs VALUES (old.hash); END
+        """)
+        db.update_item(second, content=BIG_TEXT)
+        assert conn.execute("SELECT COUNT(*) FROM deleted_blobs").fetchone()[0] == 0
+        assert db.get_content_store_stats()['references'] == 1
+        assert db.get_item(second)['content'] == BIG_TEXT
+
+        db.delete_item(second)
+        assert db.get_content_store_stats()['blobs'] == 0
+
+        # Deleting a category releases its items
+        db.add_item(cat_id, "Three", BIG_TEXT)
+        db.delete_category(cat_id)
+        assert db.get_content_store_stats()['blobs'] == 0
+
+        # Sensitive content stays encrypted inline
+        cat_id = db.add_category("Secrets", "🔒")
+        secret = db.add_item(cat_id, "Key", BIG_TEXT, is_sensitive=True)
+        assert not raw_contents(db)[0].startswith(CONTENT_REF_PREFIX)
+        assert db.get_item(secret)['content'] == BIG_TEXT
+
+        # Literal values that look like references are stored as blobs too
+        literal = CONTENT_REF_PREFIX + "not-a-hash"
+        literal_id = db.add_item(cat_id, "Literal", literal)
+        assert db.get_item(literal_id)['content'] == literal
+        db.close()
+
+    print("[OK] Reference counting")
+
+
+def test_history_dedup_and_garbage_collection():
+    """Repeated copies share a blob; overwritten ring slots release it"""
+    with in_tempdir():
+        db = DBManager(":memory:")
+        for seq in range(1, 11):
+            db.write_history_slot(seq, 5, None, BIG_TEXT)
+
+        assert len(raw_contents(db, 'clipboard_history_ring')) == 5
+        stats = db.get_content_store_stats()
+        assert stats['blobs'] == 1 and stats['references'] == 5
+        assert db.get_history(1)[0]['content'] == BIG_TEXT
+
+        db.trim_history(keep_latest=2)
+        assert db.get_content_store_stats()['references'] == 2
+
+        # Rows deleted with raw SQL are repaired by the garbage collector
+        db.execute_update("DELETE FROM clipboard_history_ring")
+        assert db.collect_content_garbage() == 1
+        assert db.get_content_store_stats()['blobs'] == 0
+        assert len(BIG_TEXT) >= BLOB_MIN_SIZE
+        db.close()
+
+    print("[OK] History dedup and garbage collection")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Content Store")
+    print("=" * 60)
+
+    test_items_share_blob()
+    test_reference_counting()
+    test_history_dedup_and_garbage_collection()
+
+    print("\nAll content store tests passed")
+
+
+if __name__ == '__main__':
+    main()
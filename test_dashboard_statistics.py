@@ -0,0 +1,58 @@
+"""
+Test the dashboard statistics (SQL aggregates, no item rows materialized)
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from core.dashboard_manager import DashboardManager
+
+
+def test_statistics_from_aggregates():
+    """Counts, types and tags match the items, including legacy CSV tags"""
+    db = DBManager(":memory:")
+    docker = db.add_category("Docker", "🐳")
+    empty = db.add_category("Empty", "📁")
+    db.add_items_bulk([
+        {'category_id': docker, 'label': f"compose {i}", 'content': "up", 'item_type': 'CODE' if i % 2 else 'TEXT',
+         'tags': ['docker', 'ops'] if i % 3 == 0 else ['docker'], 'is_favorite': i < 2, 'is_sensitive': i == 4}
+        for i in range(6)
+    ])
+    db.execute_update("UPDATE items SET tags = 'legacy, ops' WHERE label = 'compose 5'")
+
+    dashboard = DashboardManager(db)
+    structure = dashboard.get_structure_summary()
+    stats = dashboard.calculate_statistics(structure)
+
+    by_name = {c['name']: c for c in structure['categories']}
+    assert by_name['Empty']['items'] is None  # Nothing was loaded
+    assert by_name['Docker']['items'] is None
+
+    assert stats['total_items'] == 6
+    assert stats['total_favorites'] == 2 and stats['total_sensitive'] == 1
+    assert stats['type_distribution'] == {'CODE': 3, 'TEXT': 3}
+    assert stats['largest_category'] == {'name': 'Docker', 'item_count': 6}
+    assert stats['most_used_tag'] == 'docker'
+    # docker, ops, legacy + predefined category tags
+    category_tags = {tag for c in structure['categories'] for tag in c['tags']}
+    assert stats['total_unique_tags'] == len({'docker', 'ops', 'legacy'} | category_tags)
+    assert empty in by_name['Empty'].values()
+
+    db.close()
+    print("[OK] Statistics from aggregates")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Dashboard Statistics")
+    print("=" * 60)
+
+    test_statistics_from_aggregates()
+
+    print("\nAll dashboard statistics tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+"""
+Test the change-event bus (publication on commit, weak subscribers, patched caches)
+"""
+import gc
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.dashboard_manager import DashboardManager
+from core.event_bus import (
+    EventBus, event_bus, CategoryChanged, ItemAdded, ItemDeleted, ItemUpdated,
+    SettingChanged, UsageRecorded
+)
+from core.favorites_manager import FavoritesManager
+from core.usage_tracker import UsageTracker
+from database.db_manager import DBManager
+
+
+class Recorder:
+    """Collects the events it receives"""
+
+    def __init__(self, bus=event_bus, types=(ItemAdded, ItemUpdated, ItemDeleted, CategoryChanged,
+                                            SettingChanged, UsageRecorded)):
+        self.events = []
+        self.unsubscribe = bus.subscribe_many(types, self.on_event)
+
+    def on_event(self, event):
+        self.events.append(event)
+
+    def of(self, event_type):
+        return [event for event in self.events if isinstance(event, event_type)]
+
+
+def test_bus_subscriptions():
+    """Delivery by type, unsubscribe, weak bound methods and failing subscribers"""
+    bus = EventBus()
+    recorder = Recorder(bus)
+    received = []
+    unsubscribe = bus.subscribe(ItemAdded, received.append)
+
+    def broken(event):
+        raise ValueError("boom")
+    bus.subscribe(ItemAdded, broken)
+
+    bus.publish(ItemAdded((1,), frozenset({2})))
+    bus.publish(SettingChanged('opacity', 0.5))
+    assert received == [ItemAdded((1,), frozenset({2}))]  # The broken subscriber doesn't stop it
+    assert [type(event) for event in recorder.events] == [ItemAdded, SettingChanged]
+
+    unsubscribe()
+    bus.publish(ItemAdded((3,)))
+    assert len(received) == 1
+
+    # Bound methods are weak: a collected subscriber disappears
+    assert bus.subscriber_count(SettingChanged) == 1
+    del recorder
+    gc.collect()
+    assert bus.subscriber_count(SettingChanged) == 0
+    bus.publish(SettingChanged('opacity', 0.7))
+
+    print("[OK] Bus subscriptions")
+
+
+def test_events_follow_transactions():
+    """Write paths publish after commit; rolled-back changes publish nothing"""
+    db = DBManager(":memory:")
+    recorder = Recorder()
+    try:
+        cat_id = db.add_category("Events", "📦")
+        assert recorder.of(CategoryChanged) == [CategoryChanged(cat_id, 'added')]
+
+        item_id = db.add_item(cat_id, "One", "content")
+        assert recorder.of(ItemAdded) == [ItemAdded((item_id,), frozenset({cat_id}))]
+
+        ids = db.add_items_bulk([{'category_id': cat_id, 'label': f"Bulk {i}", 'content': "x"}
+                                 for i in range(3)])
+        assert recorder.of(ItemAdded)[-1].item_ids == tuple(ids)
+
+        db.update_item(item_id, label="Uno")
+        updated = recorder.of(ItemUpdated)[-1]
+        assert updated.item_ids == (item_id,) and updated.fields == frozenset({'label'})
+
+        # Nothing is seen while the transaction is open
+        recorder.events.clear()
+        with db.transaction():
+            db.update_item(ids[0], label="A")
+            assert recorder.events == []
+        assert len(recorder.of(ItemUpdated)) == 1
+
+        # Rollback drops the events of the transaction
+        recorder.events.clear()
+        try:
+            with db.transaction():
+                db.update_item(ids[1], label="B")
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        assert recorder.events == []
+
+        # Nested savepoint: only the inner events are dropped
+        with db.transaction():
+            db.update_item(ids[1], label="B")
+            try:
+                with db.transaction():
+                    db.delete_item(ids[2])
+                    raise RuntimeError("inner rollback")
+            except RuntimeError:
+                pass
+        assert [type(event) for event in recorder.events] == [ItemUpdated]
+        assert db.get_item(ids[2]) is not None
+
+        recorder.events.clear()
+        db.delete_item(ids[2])
+        db.set_setting('opacity', 0.8)
+        db.delete_category(cat_id)
+        assert recorder.of(ItemDeleted)[0] == ItemDeleted((ids[2],), frozenset({cat_id}))
+        assert set(recorder.of(ItemDeleted)[1].item_ids) == {item_id, ids[0], ids[1]}
+        assert recorder.of(SettingChanged) == [SettingChanged('opacity', 0.8)]
+        assert recorder.of(SettingChanged)[0].value == 0.8
+        assert recorder.of(CategoryChanged) == [CategoryChanged(cat_id, 'deleted')]
+    finally:
+        recorder.unsubscribe()
+        db.close()
+
+    print("[OK] Events follow transactions")
+
+
+def test_list_events():
+    """List creation, rename, reorder and deletion publish the affected items"""
+    db = DBManager(":memory:")
+    recorder = Recorder()
+    try:
+        cat_id = db.add_category("Lists", "📋")
+        steps = db.create_list(cat_id, "Deploy", [{'label': f"Paso {n}", 'content': "echo"} for n in range(4)])
+        assert recorder.of(ItemAdded)[-1].item_ids == tuple(steps)
+
+        recorder.events.clear()
+        assert db.update_list(cat_id, "Deploy", "Release")
+        assert set(recorder.of(ItemUpdated)[-1].item_ids) == set(steps)
+        assert recorder.of(ItemUpdated)[-1].fields == frozenset({'list_group'})
+
+        recorder.events.clear()
+        assert db.reorder_list_item(steps[0], 3)
+        assert set(recorder.of(ItemUpdated)[-1].item_ids) == set(steps[:3])
+
+        recorder.events.clear()
+        assert db.delete_list(cat_id, "Release")
+        assert set(recorder.of(ItemDeleted)[-1].item_ids) == set(steps)
+    finally:
+        recorder.unsubscribe()
+        db.close()
+
+    print("[OK] List events")
+
+
+def test_usage_and_favorites_events():
+    """UsageTracker and FavoritesManager publish their changes too"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "events.db")
+        db = DBManager(db_path)
+        recorder = Recorder()
+        try:
+            cat_id = db.add_category("Usage", "⚡")
+            item_id = db.add_item(cat_id, "Run", "echo run")
+            db.execute_update("""
+                CREATE TABLE IF NOT EXISTS item_usage_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, item_id INTEGER, used_at TIMESTAMP,
+                    execution_time_ms INTEGER, success INTEGER, error_message TEXT
+                )
+            """)
+            recorder.events.clear()
+
+            assert UsageTracker(db_path).track_usage(item_id)
+            assert [event.item_id for event in recorder.of(UsageRecorded)] == [item_id]
+            assert recorder.of(UsageRecorded)[0].frecency_delta > 0
+
+            favorites = FavoritesManager(db_path)
+            assert favorites.mark_as_favorite(item_id)
+            assert favorites.unmark_favorite(item_id)
+            assert [event.item_ids for event in recorder.of(ItemUpdated)] == [(item_id,), (item_id,)]
+        finally:
+            recorder.unsubscribe()
+            db.close()
+
+    print("[OK] Usage and favorites events")
+
+
+def test_dashboard_patches_changes():
+    """DashboardManager patches the changed items instead of reloading"""
+    db = DBManager(":memory:")
+    manager = DashboardManager(db)
+    try:
+        cat_a = db.add_category("A", "🅰")
+        cat_b = db.add_category("B", "🅱")
+        ids = db.add_items_bulk([{'category_id': cat_a, 'label': f"Item {i}", 'content': "x"} for i in range(50)])
+        db.add_items_bulk([{'category_id': cat_b, 'label': f"Other {i}", 'content': "y"} for i in range(5)])
+
+        structure = manager.get_structure_summary()
+        category_a = next(c for c in structure['categories'] if c['id'] == cat_a)
+        category_b = next(c for c in structure['categories'] if c['id'] == cat_b)
+        items = manager.load_category_items(category_a)
+        untouched = items[1]
+
+        db.update_item(ids[0], label="Edited")
+        assert manager.get_structure_summary() is structure  # Not reloaded
+        assert category_a['items'][0]['label'] == "Edited"
+        assert category_a['items'][1] is untouched  # Only the changed row was rebuilt
+
+        new_id = db.add_item(cat_a, "New", "z")
+        db.delete_item(ids[5])
+        assert category_a['items'][-1]['id'] == new_id
+        assert ids[5] not in {item['id'] for item in category_a['items']}
+        assert category_a['item_count'] == 50
+
+        # Unloaded categories only get their count updated
+        db.add_item(cat_b, "Other new", "w")
+        assert category_b['items'] is None and category_b['item_count'] == 6
+
+        # Category changes drop the structure (cheap summary reload)
+        db.update_category(cat_b, name="B2")
+        assert manager.get_structure_summary() is not structure
+    finally:
+        db.close()
+
+    print("[OK] Dashboard patches changes")
+
+
+def test_floating_panel_patches_changes():
+    """FloatingPanel re-reads only the changed items of its category"""
+    import os
+    from PyQt6.QtWidgets import QApplication
+    from core.config_manager import ConfigManager
+    from views.floating_panel import FloatingPanel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # Item buttons open widget_sidebar.db in the working directory
+        try:
+            DBManager("widget_sidebar.db").close()
+            config = ConfigManager(db_path=":memory:")
+            cat_id = config.db.add_category("Panel", "🪟")
+            other_id = config.db.add_category("Other", "🪟")
+            ids = config.db.add_items_bulk([{'category_id': cat_id, 'label': f"Item {i}", 'content': "x"}
+                                            for i in range(20)])
+            panel = FloatingPanel(config_manager=config)
+            panel.load_category(config.get_category(str(cat_id)))
+            untouched = panel.all_items[1]
+
+            # Every change of the same event-loop turn is applied in one pass
+            calls = []
+            original = config.db.get_item
+            config.db.get_item = lambda item_id: calls.append(item_id) or original(item_id)
+            config.db.update_item(ids[0], label="Edited")
+            new_id = config.db.add_item(cat_id, "New", "y")
+            config.db.delete_item(ids[2])
+            config.db.add_item(other_id, "Elsewhere", "z")
+            calls.clear()
+            app.processEvents()
+
+            labels = [item.label for item in panel.all_items]
+            assert labels[0] == "Edited" and labels[-1] == "New" and "Item 2" not in labels
+            assert "Elsewhere" not in labels and len(labels) == 20
+            assert panel.all_items[1] is untouched
+            edited = panel.all_items[0]
+            assert edited is config.item_store.get(ids[0]) and edited.id == str(ids[0])
+            assert panel.all_items[-1] is config.item_store.get(new_id)
+            assert sorted(calls) == sorted([ids[0], new_id])
+
+            config.db.get_item = original
+            panel.close()
+            config.close()
+        finally:
+            os.chdir(cwd)
+
+    print("[OK] FloatingPanel patches changes")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Event Bus")
+    print("=" * 60)
+
+    test_bus_subscriptions()
+    test_events_follow_transactions()
+    test_list_events()
+    test_usage_and_favorites_events()
+    test_dashboard_patches_changes()
+    test_floating_panel_patches_changes()
+
+    print("\nAll event bus tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+Test frecency scoring (decay-epoch weights, O(1) updates, indexed ranking)
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core import item_columns
+from core.advanced_filter_engine import AdvancedFilterEngine
+from core.favorites_manager import FavoritesManager
+from core.item_store import ItemStore
+from core.search_engine import SearchEngine
+from core.stats_manager import StatsManager
+from core.usage_tracker import UsageTracker
+from database.db_manager import DBManager
+from database.frecency import FRECENCY_HALF_LIFE, current_frecency, frecency_weight, initial_frecency
+from models.category import Category
+
+
+def create_db(tmp: str):
+    """File database with 6 items and the usage history table"""
+    db_path = str(Path(tmp) / "frecency.db")
+    db = DBManager(db_path)
+    cat_id = db.add_category("Frecency", "🔥")
+    ids = db.add_items_bulk([
+        {'category_id': cat_id, 'label': f"Item {i}", 'content': f"deploy {i}", 'is_favorite': i % 2 == 0}
+        for i in range(6)
+    ])
+    db.execute_update("""
+        CREATE TABLE IF NOT EXISTS item_usage_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, item_id INTEGER, used_at TIMESTAMP,
+            execution_time_ms INTEGER, success INTEGER, error_message TEXT
+        )
+    """)
+    return db, db_path, ids
+
+
+def test_weights_decay():
+    """Stored weights rank like decayed use counts"""
+    now = time.time()
+    assert abs(current_frecency(frecency_weight(now), now) - 1.0) < 1e-9
+
+    # Un uso de hace una vida media vale la mitad
+    old = frecency_weight(now - FRECENCY_HALF_LIFE)
+    assert abs(current_frecency(old, now) - 0.5) < 1e-9
+
+    # Un uso hoy gana a tres usos de hace dos vidas medias (3 * 0.25)
+    assert frecency_weight(now) > 3 * frecency_weight(now - 2 * FRECENCY_HALF_LIFE)
+    assert initial_frecency(0, "2026-01-01 10:00:00") == 0.0
+    assert initial_frecency(4, None) == 0.0
+    assert initial_frecency(4, "2026-01-01 10:00:00") == 4 * frecency_weight("2026-01-01 10:00:00")
+
+    print("[OK] Weights decay")
+
+
+def test_tracker_updates_in_place():
+    """Each tracked use adds one weight to the row and the in-memory item"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db, db_path, ids = create_db(tmp)
+        tracker = UsageTracker(db_path)
+        store = ItemStore()
+        item = store.upsert_row(db.get_item(ids[1]))
+        assert item.frecency == 0.0
+
+        before = frecency_weight()
+        assert tracker.track_usage(ids[1], item=item)
+        assert tracker.track_execution_end(ids[1], tracker.track_execution_start(ids[1]), item=item)
+        after = frecency_weight()
+
+        stored = db.execute_query("SELECT frecency, use_count FROM items WHERE id = ?", (ids[1],))[0]
+        assert stored['use_count'] == 2
+        assert 2 * before <= stored['frecency'] <= 2 * after
+        assert item.frecency == stored['frecency']
+
+        # Only the used row changed
+        others = db.execute_query("SELECT SUM(frecency) AS total FROM items WHERE id != ?", (ids[1],))[0]
+        assert others['total'] == 0
+        db.close()
+
+    print("[OK] Tracker updates in place")
+
+
+def test_backfill_existing_database():
+    """Opening a database without the column adds and backfills it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db, db_path, ids = create_db(tmp)
+        db.close()
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP INDEX idx_items_frecency")
+        conn.execute("DROP INDEX idx_items_favorite_frecency")
+        conn.execute("ALTER TABLE items DROP COLUMN frecency")
+        conn.execute("UPDATE items SET use_count = 3, last_used = '2026-03-01 12:00:00' WHERE id = ?", (ids[0],))
+        conn.execute("UPDATE items SET use_count = 1, last_used = '2026-05-01 12:00:00' WHERE id = ?", (ids[2],))
+        conn.commit()
+        conn.close()
+
+        db = DBManager(db_path)
+        rows = {row['id']: row['frecency'] for row in db.execute_query("SELECT id, frecency FROM items")}
+        assert rows[ids[0]] == initial_frecency(3, '2026-03-01 12:00:00')
+        assert rows[ids[2]] == initial_frecency(1, '2026-05-01 12:00:00')
+        assert rows[ids[2]] > rows[ids[0]] > 0  # 1 uso pesa ~2**4.4 veces más que uno de 61 días antes
+        assert sum(rows.values()) == rows[ids[0]] + rows[ids[2]]
+        db.close()
+
+    print("[OK] Backfill existing database")
+
+
+def test_readers_rank_by_frecency():
+    """Search, favorites, popular items and the keyset pages use the indexed score"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db, db_path, ids = create_db(tmp)
+        scores = {ids[0]: 1.0, ids[1]: 5.0, ids[2]: 3.0, ids[3]: 0.0, ids[4]: 4.0, ids[5]: 2.0}
+        for item_id, score in scores.items():
+            db.execute_update("UPDATE items SET frecency = ? WHERE id = ?", (score, item_id))
+        expected = sorted(ids, key=lambda item_id: -scores[item_id])
+
+        assert [row['id'] for row in db.search_items("deploy")] == expected
+
+        rows, cursor = db.get_items_page(limit=4, order_by='frecency')
+        rest, _ = db.get_items_page(after=cursor, limit=4, order_by='frecency')
+        assert [row['id'] for row in rows + rest] == expected
+
+        favorites = FavoritesManager(db_path).get_all_favorites(order_by='frecency')
+        assert [row['id'] for row in favorites] == [ids[4], ids[2], ids[0]]
+        assert FavoritesManager(db_path).auto_order_favorites(by='frecency')
+        manual = FavoritesManager(db_path).get_all_favorites()
+        assert [row['id'] for row in manual] == [ids[4], ids[2], ids[0]]
+
+        popular = StatsManager(db_path).get_top_frecency_items(limit=3)
+        assert [row['id'] for row in popular] == expected[:3]
+        assert all('frecency_score' in row for row in popular)
+
+        # Los rankings recorren el índice en vez de ordenar la tabla
+        for query in ("SELECT id FROM items WHERE frecency > 0 ORDER BY frecency DESC LIMIT 20",
+                      "SELECT id FROM items WHERE is_favorite = 1 ORDER BY frecency DESC, id DESC"):
+            plan = " ".join(str(row['detail']) for row in db.execute_query(f"EXPLAIN QUERY PLAN {query}"))
+            assert 'frecency' in plan and 'TEMP B-TREE' not in plan, plan
+
+        # In-memory ranking (sidebar search and the column engine)
+        store = ItemStore()
+        items = store.upsert_rows(db.get_items_by_category(db.get_categories()[0]['id']))
+        category = Category("1", "Frecency")
+        category.items = items
+        assert [int(item.id) for item in SearchEngine().search("deploy", [category])] == expected
+        assert [int(item.id) for item in SearchEngine().search_in_category("Item", category)] == expected
+
+        for use_numpy in (True, False) if item_columns.HAS_NUMPY else (False,):
+            item_columns.HAS_NUMPY = use_numpy
+            try:
+                result = AdvancedFilterEngine(item_store=store).apply_filters(items, {'sort_by': 'frecency'})
+                assert [int(item.id) for item in result] == expected
+            finally:
+                item_columns.HAS_NUMPY = item_columns.np is not None
+        db.close()
+
+    print("[OK] Readers rank by frecency")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Frecency")
+    print("=" * 60)
+
+    test_weights_decay()
+    test_tracker_updates_in_place()
+    test_backfill_existing_database()
+    test_readers_rank_by_frecency()
+
+    print("\nAll frecency tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Test the fuzzy matching engine (subsequence scoring, typo candidates, ranking)
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.dashboard_manager import DashboardManager
+from core.fuzzy_index import BKTree, FuzzyIndex, edit_distance
+from core.search_engine import SearchEngine
+from models.category import Category
+from models.item import Item
+
+WORDS = ["docker", "deploy", "backup", "server", "github", "notes", "config", "logs",
+         "python", "kubectl", "nginx", "postgres", "redis", "terraform", "ansible", "compose"]
+
+
+def test_edit_distance_and_bk_tree():
+    """OSA distance counts transpositions; the BK-tree finds close words"""
+    assert edit_distance("dcoker", "docker") == 1
+    assert edit_distance("docker", "docker") == 0
+    assert edit_distance("dokcre", "docker") == 2
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("a", "abcdef", limit=2) == 3
+
+    tree = BKTree(WORDS + ["docker"])
+    assert len(tree) == len(WORDS)
+    assert tree.search("dcoker", 1) == [("docker", 1)]
+    assert sorted(word for word, _ in tree.search("redsi", 2)) == ["redis"]
+    assert tree.search("zzzzzz", 2) == []
+
+    print("[OK] Edit distance and BK-tree")
+
+
+def test_typos_and_subsequences():
+    """Typos, abbreviations and exact matches are found and ranked"""
+    index = FuzzyIndex([
+        (1, "Docker compose up"),
+        (2, "git status"),
+        (3, "Backup DB"),
+        (4, "docker_logs"),
+        (5, "Deploy server"),
+    ])
+
+    assert {match.key for match in index.search("dcoker")} == {1, 4}
+    assert index.search("dcoker")[0].positions == (0, 1, 2, 3, 4, 5)
+
+    match = index.search("dkr cmp")[0]
+    assert match.key == 1
+    assert "".join("Docker compose up"[p] for p in match.positions).lower() == "dkrcmp"
+
+    assert index.search("gst")[0].key == 2
+    assert [match.key for match in index.search("bkup")] == [3]
+
+    # Exact word-start matches beat scattered ones
+    assert [match.key for match in index.search("logs")] == [4]
+    assert index.search("dep")[0].key == 5
+
+    # Every token must match
+    assert index.search("docker nothing") == []
+    assert index.search("") == []
+
+    print("[OK] Typos and subsequences")
+
+
+def test_search_engine_fuzzy():
+    """SearchEngine.search_fuzzy ranks items and reuses its index"""
+    category = Category("1", "Dev")
+    category.items = [
+        Item("1", "Docker prune", "docker system prune", tags=["cleanup"]),
+        Item("2", "Git log", "git log --oneline", tags=["history"]),
+        Item("3", "Restart nginx", "systemctl restart nginx", tags=["server"]),
+    ]
+    engine = SearchEngine()
+
+    results = engine.search_fuzzy("dcoker", [category])
+    assert [match.key.id for match in results] == ["1"]
+    assert all(p < len("Docker prune") for p in results[0].positions)  # Label highlight
+
+    index = engine._fuzzy_index
+    assert engine.search_fuzzy("hstory", [category])[0].key.id == "2"  # Tag match
+    assert engine._fuzzy_index is index  # Not rebuilt
+
+    category.items = category.items + [Item("4", "Docker build", "docker build .")]
+    assert {match.key.id for match in engine.search_fuzzy("dcoker", [category])} == {"1", "4"}
+    assert engine._fuzzy_index is not index
+
+    print("[OK] SearchEngine fuzzy search")
+
+
+def test_dashboard_fuzzy_scope():
+    """The dashboard fuzzy scope returns typed matches, best first"""
+    structure = {'categories': [
+        {'name': "Docker tools", 'tags': ["containers"], 'items': [
+            {'label': "Compose up", 'content': "docker compose up", 'tags': ["dokcer"],
+             'is_sensitive': False, 'is_list': False, 'list_group': None},
+            {'label': "Prune images", 'content': "x", 'tags': [],
+             'is_sensitive': False, 'is_list': True, 'list_group': "Docker cleanup"},
+        ]},
+        {'name': "Git", 'tags': [], 'items': [
+            {'label': "Docker login", 'content': "x", 'tags': [],
+             'is_sensitive': False, 'is_list': False, 'list_group': None},
+        ]},
+    ]}
+    manager = DashboardManager(db_manager=None)
+
+    highlights = {}
+    matches = manager.search("dcoker", {'fuzzy': True}, structure, highlights)
+    assert set(matches) == {('category', 0, -1), ('tag', 0, 0), ('list', 0, 1), ('item', 1, 0)}
+
+    # Matched characters per field, for the highlight delegate
+    assert highlights[(1, 0)] == (("Docker login", ((0, 6),)),)
+    assert highlights[(0, 1)] == (("Docker cleanup", ((0, 6),)),)
+    assert set(highlights) == {(0, -1), (0, 0), (0, 1), (1, 0)}
+
+    # Scopes still apply
+    matches = manager.search("dcoker", {'fuzzy': True, 'tags': False, 'lists': False}, structure)
+    assert set(matches) == {('category', 0, -1), ('item', 1, 0)}
+
+    # Substring mode is unchanged: no typo tolerance
+    assert manager.search("dcoker", {}, structure) == []
+
+    print("[OK] Dashboard fuzzy scope")
+
+
+def test_latency_50k():
+    """Fuzzy queries over 50k labels only score the indexed candidates"""
+    rng = random.Random(43)
+    suffixes = ["", "s", "er", "ing", "-prod", "-dev"]
+    documents = [(i, " ".join(rng.choice(WORDS) + rng.choice(suffixes) for _ in range(3)) + f" {i}")
+                 for i in range(50_000)]
+
+    start = time.perf_counter()
+    index = FuzzyIndex(documents)
+    build = time.perf_counter() - start
+    print(f"  Build over {len(index)} labels: {build * 1e3:.0f} ms")
+
+    for query in ("dcoker", "kubctl logs", "postgers", "tfrm ans", "redis-prod 4"):
+        start = time.perf_counter()
+        results = index.search(query, limit=50)
+        elapsed = time.perf_counter() - start
+        print(f"  {query!r}: {len(results)} results in {elapsed * 1e3:.1f} ms")
+        assert results, query
+
+    # Typos are resolved through the BK-tree, not a distance per document
+    best = index.search("postgers", limit=1)[0]
+    assert "postgres" in documents[best.key][1]
+
+    print("[OK] Latency at 50k labels")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Fuzzy Index")
+    print("=" * 60)
+
+    test_edit_distance_and_bk_tree()
+    test_typos_and_subsequences()
+    test_search_engine_fuzzy()
+    test_dashboard_fuzzy_scope()
+    test_latency_50k()
+
+    print("\nAll fuzzy index tests passed")
+
+
+if __name__ == '__main__':
+    main()
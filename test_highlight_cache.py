@@ -0,0 +1,143 @@
+"""
+Test cached highlight rendering (HighlightDelegate LRU and shared query patterns)
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication, QTreeWidget, QTreeWidgetItem
+
+from core.search_engine import SearchEngine, compile_query_pattern
+from views.dashboard.highlight_delegate import HighlightDelegate
+
+
+_app = None
+
+
+def get_app():
+    """Create the QApplication once and keep it alive for the whole module"""
+    global _app
+    _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
+
+def test_shared_query_pattern():
+    """One compiled pattern per query, shared by the engine and the delegate"""
+    get_app()
+    engine = SearchEngine()
+    assert compile_query_pattern("docker") is compile_query_pattern("docker")
+
+    assert engine.highlight_matches("Docker run docker", "docker ") == \
+        "<mark>Docker</mark> run <mark>docker</mark>"
+    assert engine.highlight_matches("a.b axb", "a.b") == "<mark>a.b</mark> axb"  # Literal, not regex
+    assert engine.highlight_matches("text", "  ") == "text"
+
+    delegate = HighlightDelegate()
+    delegate.set_search_query("Docker")
+    assert delegate._pattern is compile_query_pattern("docker")
+
+    # Matches are found before escaping, so '<' and '&' in queries work
+    html = delegate._create_highlighted_html("a <b> & c", "<b>")
+    assert html.startswith("a <span") and "&lt;b&gt;</span> &amp; c" in html
+
+    print("[OK] Shared query pattern")
+
+
+def make_tree(rows: int):
+    tree = QTreeWidget()
+    tree.setHeaderLabels(["Nombre", "Tipo", "Info"])
+    tree.setColumnWidth(0, 300)
+    tree.resize(800, 600)
+    for i in range(rows):
+        QTreeWidgetItem(tree, [f"docker compose {i}", "CODE", f"docker run image-{i % 50}"])
+    delegate = HighlightDelegate(tree, cache_size=128)
+    tree.setItemDelegateForColumn(0, delegate)
+    tree.setItemDelegateForColumn(2, delegate)
+    return tree, delegate
+
+
+def test_document_cache_lru():
+    """Repainting reuses laid-out documents; the LRU stays bounded"""
+    get_app()
+    tree, delegate = make_tree(200)
+    delegate.set_search_query("docker")
+    tree.show()
+
+    tree.viewport().grab()
+    misses = delegate.cache_misses
+    assert misses > 0 and delegate.cache_hits == 0
+
+    tree.viewport().grab()
+    assert delegate.cache_misses == misses  # Second frame: all cached
+    assert delegate.cache_hits >= misses
+
+    # Resizing a column doesn't invalidate (layout doesn't depend on width)
+    tree.setColumnWidth(0, 250)
+    tree.viewport().grab()
+    assert delegate.cache_misses == misses
+
+    # Scrolling through the whole tree evicts old entries
+    scrollbar = tree.verticalScrollBar()
+    for value in range(0, scrollbar.maximum() + 1, 10):
+        scrollbar.setValue(value)
+        tree.viewport().grab()
+    assert len(delegate._documents) == delegate.cache_size
+
+    # A new query builds new documents
+    delegate.set_search_query("compose")
+    misses = delegate.cache_misses
+    tree.viewport().grab()
+    assert delegate.cache_misses > misses
+
+    tree.close()
+    print("[OK] Document cache LRU")
+
+
+def test_scroll_frame_time():
+    """Scrolling back and forth with an active search repaints from the cache"""
+    get_app()
+    tree, delegate = make_tree(5_000)
+    delegate.cache_size = 512
+    delegate.set_search_query("docker")
+    tree.show()
+    scrollbar = tree.verticalScrollBar()
+
+    # Warm-up pass over a window of rows
+    for value in range(0, 400, 4):
+        scrollbar.setValue(value)
+        tree.viewport().grab()
+
+    hits, misses = delegate.cache_hits, delegate.cache_misses
+    frames = 0
+    start = time.perf_counter()
+    for _ in range(3):
+        for value in list(range(0, 400, 4)) + list(range(400, 0, -4)):
+            scrollbar.setValue(value)
+            tree.viewport().grab()
+            frames += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"  {frames} frames in {elapsed * 1e3:.0f} ms "
+          f"({elapsed / frames * 1e3:.2f} ms/frame, {frames / elapsed:.0f} fps)")
+    assert delegate.cache_misses - misses < (delegate.cache_hits - hits) / 20
+
+    tree.close()
+    print("[OK] Scroll frame time")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Highlight Cache")
+    print("=" * 60)
+
+    test_shared_query_pattern()
+    test_document_cache_lru()
+    test_scroll_frame_time()
+
+    print("\nAll highlight cache tests passed")
+
+
+if __name__ == '__main__':
+    main()
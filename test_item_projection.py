@@ -0,0 +1,118 @@
+"""
+Test projection-aware item readers (list views don't read heavy columns)
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.favorites_manager import FavoritesManager
+from core.stats_manager import StatsManager
+from database.db_manager import DBManager, HEAVY_ITEM_COLUMNS, ITEM_SUMMARY_COLUMNS
+
+
+def create_db(db_path: str = ":memory:"):
+    """Database with one category of items, one of them sensitive"""
+    db = DBManager(db_path)
+    cat_id = db.add_category("Projection", "📐")
+    db.add_items_bulk([
+        {'category_id': cat_id, 'label': f"Item {i}", 'content': "x" * 5000 + str(i),
+         'description': "long description", 'tags': ['a', 'b'], 'is_sensitive': i == 0}
+        for i in range(5)
+    ])
+    return db, cat_id
+
+
+def test_summary_columns():
+    """Summary readers return light rows with parsed tags"""
+    db, cat_id = create_db()
+
+    items = db.get_items_by_category(cat_id, columns=ITEM_SUMMARY_COLUMNS)
+    assert len(items) == 5
+    assert set(items[0]) == set(ITEM_SUMMARY_COLUMNS)
+    assert items[1]['tags'] == ['a', 'b']
+
+    grouped = db.get_items_by_categories([cat_id], columns=['id', 'label'])
+    assert [item['label'] for item in grouped[cat_id]] == [f"Item {i}" for i in range(5)]
+
+    all_items = db.get_all_items(columns=ITEM_SUMMARY_COLUMNS)
+    assert all('content' not in item and item['category_name'] for item in all_items)
+
+    # Full rows are unchanged
+    assert db.get_items_by_category(cat_id)[0]['content'] == "x" * 5000 + "0"
+
+    try:
+        db.get_items_by_category(cat_id, columns=['id', 'label; DROP TABLE items'])
+        assert False, "Unknown columns must be rejected"
+    except ValueError:
+        pass
+    db.close()
+
+    print("[OK] Summary columns")
+
+
+def test_content_on_demand():
+    """get_item_content resolves blobs and decrypts sensitive items"""
+    db, cat_id = create_db()
+    items = db.get_items_by_category(cat_id, columns=ITEM_SUMMARY_COLUMNS)
+
+    assert db.get_item_content(items[0]['id']) == "x" * 5000 + "0"  # Sensitive
+    assert db.get_item_content(items[3]['id']) == "x" * 5000 + "3"  # Content store
+    assert db.get_item_content(999999) is None
+    db.close()
+
+    print("[OK] Content on demand")
+
+
+def test_summary_reads_use_covering_index():
+    """The category listing is answered from idx_items_category_summary"""
+    db, cat_id = create_db()
+    plan = db.execute_query(
+        f"EXPLAIN QUERY PLAN SELECT {', '.join(ITEM_SUMMARY_COLUMNS)} FROM items WHERE category_id = ? ORDER BY created_at",
+        (cat_id,)
+    )
+    detail = " ".join(row['detail'] for row in plan)
+    assert "COVERING INDEX idx_items_category_summary" in detail, detail
+    db.close()
+
+    print("[OK] Covering index")
+
+
+def test_stats_and_favorites_skip_heavy_columns():
+    """Stats and favorites listings don't load content/description"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "projection.db")
+        db, cat_id = create_db(db_path)
+        item_id = db.get_items_by_category(cat_id, columns=['id'])[0]['id']
+        db.close()
+
+        favorites = FavoritesManager(db_path)
+        favorites.mark_as_favorite(item_id)
+        rows = favorites.get_all_favorites() + favorites.get_favorites_by_category(cat_id)
+        assert rows and all(not set(HEAVY_ITEM_COLUMNS) & set(row) for row in rows)
+        assert rows[0]['label'] == "Item 0" and 'use_count' in rows[0]
+        assert favorites.get_favorites_count() == 1
+
+        stats = StatsManager(db_path)
+        rows = stats.get_never_used_items() + stats.get_most_used_items(limit=3) + stats.get_least_used_items()
+        assert rows and all(not set(HEAVY_ITEM_COLUMNS) & set(row) for row in rows)
+
+    print("[OK] Stats and favorites projections")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Item Projections")
+    print("=" * 60)
+
+    test_summary_columns()
+    test_content_on_demand()
+    test_summary_reads_use_covering_index()
+    test_stats_and_favorites_skip_heavy_columns()
+
+    print("\nAll item projection tests passed")
+
+
+if __name__ == '__main__':
+    main()
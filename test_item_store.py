@@ -0,0 +1,152 @@
+"""
+Test the shared compact item store (identity map + typed columns)
+"""
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.config_manager import ConfigManager
+from core.item_store import FLAG_ACTIVE, FLAG_FAVORITE, FLAG_SENSITIVE, FLAG_TAGGED, ItemStore, TYPE_CODES
+from models.item import Item, ItemType
+
+
+def make_row(i: int, **overrides):
+    """Item row as returned by DBManager readers (fresh strings every call)"""
+    row = {
+        'id': i, 'category_id': 1 + i % 3, 'label': "".join(["Item ", str(i)]),
+        'content': "".join(["content ", str(i)]), 'type': 'URL' if i % 2 else 'TEXT',
+        'icon': "".join(["📄"]), 'is_sensitive': 0, 'is_favorite': int(i % 5 == 0),
+        'tags': ["".join(["tag", str(i % 4)])], 'is_active': 1, 'is_archived': 0,
+        'use_count': i, 'last_used': '2026-01-02 03:04:05', 'created_at': '2025-01-02 03:04:05',
+        'category_name': "".join(["Category ", str(i % 3)]),
+    }
+    row.update(overrides)
+    return row
+
+
+def test_item_slots_and_type_parse():
+    """Item has no per-instance __dict__ and type parsing never raises"""
+    item = Item("1", "Label", "content", item_type="url")
+    assert not hasattr(item, '__dict__')
+    assert item.type is ItemType.URL and item.created_at is item.last_used
+    assert ItemType.parse("CODE") is ItemType.CODE
+    assert ItemType.parse("unknown") is ItemType.TEXT
+    assert Item.from_dict({'label': "X", 'type': "PATH"}).type is ItemType.PATH
+
+    print("[OK] Item slots and type parsing")
+
+
+def test_identity_map_and_columns():
+    """The same id always returns the same Item, refreshed in place"""
+    store = ItemStore()
+    first = store.upsert_rows([make_row(i) for i in range(10)])
+    second = store.upsert_rows([make_row(i) for i in range(10)])
+    assert all(a is b for a, b in zip(first, second))
+    assert len(store) == 10
+
+    # Interned strings are shared between items
+    assert first[0].category_name is first[3].category_name
+    assert first[1].tags[0] is first[5].tags[0]
+
+    row = store.row_of("5")
+    assert store.ids[row] == 5 and store.use_counts[row] == 5
+    assert store.type_codes[row] == TYPE_CODES[ItemType.URL]
+    assert store.flags[row] == FLAG_FAVORITE | FLAG_ACTIVE | FLAG_TAGGED
+    assert store.last_used[row] > store.created_at[row] > 0
+
+    # Projected rows don't blank out the content
+    updated = store.upsert_row({'id': 5, 'label': "Renamed", 'is_sensitive': 1})
+    assert updated is first[5] and updated.label == "Renamed" and updated.content == "content 5"
+    assert store.flags[row] & FLAG_SENSITIVE
+
+    # In-place edits are picked up by refresh()
+    updated.is_favorite = False
+    store.refresh(updated)
+    assert not store.flags[row] & FLAG_FAVORITE
+
+    print("[OK] Identity map and columns")
+
+
+def test_remove_keeps_columns_aligned():
+    """Removing moves the last row into the hole"""
+    store = ItemStore()
+    store.upsert_rows([make_row(i) for i in range(6)])
+
+    assert store.remove(1) and not store.remove(1)
+    assert "1" not in store and len(store) == 5
+    for row in range(len(store)):
+        assert store.ids[row] == int(store.item_at(row).id)
+
+    assert store.remove_category(1) == 2  # Items 0 and 3
+    assert sorted(item.id for item in store.items()) == ["2", "4", "5"]
+    store.clear()
+    assert len(store) == 0 and len(store.flags) == 0
+
+    print("[OK] Remove keeps columns aligned")
+
+
+def test_config_manager_shares_items():
+    """ConfigManager readers and the global search share Item objects"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = ConfigManager(db_path=str(Path(tmp) / "store.db"), base_dir=Path(tmp))
+        cat_id = config.db.add_category("Shared", "🔗")
+        config.db.add_items_bulk([{'category_id': cat_id, 'label': f"Item {i}", 'content': "x"} for i in range(3)])
+
+        category = config.get_category(cat_id)
+        rows, _ = config.db.get_items_page(filters={'category_id': cat_id})
+        searched = config.item_store.upsert_rows(rows)
+        assert {id(item) for item in searched} == {id(item) for item in category.items}
+        assert category.items[0].category_name == "Shared"
+
+        # Deleted items leave the store
+        removed = category.items.pop()
+        assert config.update_category(str(cat_id), category)
+        assert removed.id not in config.item_store
+
+        assert config.delete_category(str(cat_id))
+        assert len(config.item_store) == 0
+        config.close()
+
+    print("[OK] ConfigManager shares items")
+
+
+def test_memory_at_100k_items():
+    """Two views loading 100k items keep a single compact copy"""
+    def load():
+        store = ItemStore()
+        sidebar = store.upsert_rows(make_row(i) for i in range(100_000))
+        search = store.upsert_rows(make_row(i) for i in range(100_000))
+        return store, sidebar, search
+
+    tracemalloc.start()
+    kept = load()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_item = current / 100_000
+    print(f"  100k items, two views: {current / 1e6:.1f} MB ({per_item:.0f} B/item)")
+    assert kept[1][0] is kept[2][0]
+    assert per_item < 900
+
+    print("[OK] Memory at 100k items")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Item Store")
+    print("=" * 60)
+
+    test_item_slots_and_type_parse()
+    test_identity_map_and_columns()
+    test_remove_keeps_columns_aligned()
+    test_config_manager_shares_items()
+    test_memory_at_100k_items()
+
+    print("\nAll item store tests passed")
+
+
+if __name__ == '__main__':
+    main()
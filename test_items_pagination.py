@@ -0,0 +1,204 @@
+"""
+Test keyset-paginated item iterators and the streaming global search panel
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+
+
+def create_db(count: int = 250, db_path: str = ":memory:"):
+    """Database with items spread over an active and an inactive category"""
+    db = DBManager(db_path)
+    active = db.add_category("Active", "✅")
+    inactive = db.add_category("Inactive", "⛔")
+    db.execute_update("UPDATE categories SET is_active = 0 WHERE id = ?", (inactive,))
+    db.add_items_bulk([
+        {'category_id': active, 'label': f"Item {i:03d}", 'content': f"content {i}",
+         'tags': ['even'] if i % 2 == 0 else [], 'is_favorite': i % 10 == 0}
+        for i in range(count)
+    ])
+    db.add_items_bulk([{'category_id': inactive, 'label': "Hidden", 'content': "hidden"}])
+    return db, active
+
+
+def test_keyset_pages_cover_everything_once():
+    """Walking the cursors returns every visible item once, in order"""
+    db, _ = create_db()
+
+    pages, cursor = [], None
+    while True:
+        rows, cursor = db.get_items_page(after=cursor, limit=100)
+        pages.append(rows)
+        if cursor is None:
+            break
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    ids = [row['id'] for page in pages for row in page]
+    assert len(set(ids)) == 250
+    assert ids == sorted(ids, reverse=True)  # Same created_at: newest id first
+    assert all(row['category_name'] == "Active" for page in pages for row in page)
+    assert pages[0][0]['tags'] == [] and pages[0][1]['tags'] == ['even']
+
+    # Ascending by label, with a projection
+    rows, cursor = db.get_items_page(limit=3, columns=['label'], order_by='label', descending=False)
+    assert [row['label'] for row in rows] == ["Item 000", "Item 001", "Item 002"]
+    rows, _ = db.get_items_page(after=cursor, limit=1, columns=['label'], order_by='label', descending=False)
+    assert rows[0]['label'] == "Item 003"
+    db.close()
+
+    print("[OK] Keyset pages")
+
+
+def test_iter_items_filters():
+    """iter_items streams in batches and applies filters"""
+    db, active = create_db()
+
+    batches = list(db.iter_items(batch_size=64))
+    assert [len(batch) for batch in batches] == [64, 64, 64, 58]
+
+    favorites = [row for batch in db.iter_items({'is_favorite': True}) for row in batch]
+    assert len(favorites) == 25
+
+    everything = [row for batch in db.iter_items({'include_inactive': True}) for row in batch]
+    assert len(everything) == 251
+
+    by_category = [row for batch in db.iter_items({'category_id': [active]}) for row in batch]
+    assert len(by_category) == 250
+
+    # Continue a paginated walk
+    first_page, cursor = db.get_items_page(limit=200)
+    rest = [row for batch in db.iter_items(after=cursor) for row in batch]
+    assert len(first_page) + len(rest) == 250
+
+    try:
+        list(db.iter_items({'content': 'x'}))
+        assert False, "Unknown filters must be rejected"
+    except ValueError:
+        pass
+    db.close()
+
+    print("[OK] iter_items filters")
+
+
+def test_global_search_streams_pages():
+    """The panel shows the first page, loads the rest on scroll and searches every item on the worker"""
+    from PyQt6.QtWidgets import QApplication
+    from views.global_search_panel import GlobalSearchPanel, PAGE_SIZE
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+
+    # ItemButton's usage tracker opens widget_sidebar.db in the working directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            db, _ = create_db(db_path="widget_sidebar.db")
+            panel = GlobalSearchPanel(db_manager=db)
+            panel.load_all_items()
+
+            assert len(panel.all_items) == PAGE_SIZE
+            assert panel.items_layout.count() - 1 == PAGE_SIZE
+
+            panel.show_more_items()  # What scrolling to the end does
+            assert len(panel.all_items) == 2 * PAGE_SIZE
+            assert panel.items_layout.count() - 1 == 2 * PAGE_SIZE
+
+            panel.on_search_changed("Item 00")
+            panel.search_executor.wait()  # Loading, filtering and the text search run on the search worker
+            app.processEvents()
+            assert len(panel.all_items) == 2 * PAGE_SIZE  # No pages loaded on the UI thread
+            assert len(panel._shown_items) == 10
+            assert all("Item 00" in item.label for item in panel._shown_items)
+
+            # Commits from other connections refresh the worker's snapshot
+            snapshot = panel._snapshot
+            panel.on_search_changed("Item 01")
+            panel.search_executor.wait()
+            assert panel._snapshot is snapshot
+            other = DBManager("widget_sidebar.db")
+            other.add_item(db.get_categories()[0]['id'], "Item 00 new", "x")
+            other.close()
+            panel.on_search_changed("Item 00")
+            panel.search_executor.wait()
+            app.processEvents()
+            assert panel._snapshot is not snapshot
+            assert "Item 00 new" in [item.label for item in panel._shown_items]
+
+            panel.close()
+            db.close()
+        finally:
+            os.chdir(cwd)
+
+    print("[OK] Global search streams pages")
+
+
+def test_tag_filters_survive_loading():
+    """Loading pages only adds tag checkboxes; checked tags stay checked"""
+    from PyQt6.QtWidgets import QApplication
+    from views.global_search_panel import GlobalSearchPanel, PAGE_SIZE
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            db, active = create_db(db_path="widget_sidebar.db")
+            db.add_items_bulk([{'category_id': active, 'label': f"Late {i}", 'content': "late",
+                                'tags': ['late']} for i in range(5)])
+            panel = GlobalSearchPanel(db_manager=db)
+            tag_panel = panel.filters_window.filter_panel
+            panel.load_all_items()
+
+            even = tag_panel.tag_checkboxes['even']
+            even.setChecked(True)
+
+            panel.show_more_items()
+            assert tag_panel.tag_checkboxes['even'] is even  # Not recreated
+            assert even.isChecked()
+
+            panel.on_search_changed("Late")  # The worker's snapshot brings the tags of every item
+            panel.search_executor.wait()
+            app.processEvents()
+            assert sorted(tag_panel.tag_checkboxes) == ['even', 'late']
+            assert tag_panel.available_tags == ['even', 'late']
+            assert tag_panel.tag_checkboxes['even'] is even and even.isChecked()
+            tag_panel.collect_active_filters()
+            assert tag_panel.get_active_filters()['tags']['values'] == ['even']
+
+            # Reconciliación: los tags que desaparecen se quitan, los marcados siguen marcados
+            tag_panel.update_available_tags(panel.all_items[:PAGE_SIZE])
+            assert 'even' in tag_panel.tag_checkboxes and even.isChecked()
+
+            panel.close()
+            db.close()
+        finally:
+            os.chdir(cwd)
+
+    print("[OK] Tag filters survive loading")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Items Pagination")
+    print("=" * 60)
+
+    test_keyset_pages_cover_everything_once()
+    test_iter_items_filters()
+    test_global_search_streams_pages()
+    test_tag_filters_survive_loading()
+
+    print("\nAll items pagination tests passed")
+
+
+if __name__ == '__main__':
+    main()
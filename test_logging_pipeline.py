@@ -0,0 +1,153 @@
+"""
+Test the queue-based logging pipeline (background writer, rotation, runtime level)
+"""
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from utils.logger import set_log_level, setup_logging, stop_logging
+
+
+class saved_root_logger:
+    """Restore the root logger handlers and level after a test"""
+
+    def __enter__(self):
+        root = logging.getLogger()
+        self.handlers, self.level = root.handlers[:], root.level
+        return self
+
+    def __exit__(self, *exc_info):
+        stop_logging()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in self.handlers:
+            root.addHandler(handler)
+        root.setLevel(self.level)
+
+
+def test_queue_pipeline():
+    """Records from any thread reach the file through the listener thread"""
+    with tempfile.TemporaryDirectory() as tmp, saved_root_logger():
+        log_file = Path(tmp) / "app.log"
+        listener = setup_logging(log_file, level='INFO', console=False)
+        root = logging.getLogger()
+        assert [type(handler).__name__ for handler in root.handlers] == ['QueueHandler']
+        assert listener._thread is not None
+
+        test_logger = logging.getLogger("test.pipeline")
+        test_logger.info("from main thread")
+        worker = threading.Thread(target=lambda: test_logger.warning("from worker"))
+        worker.start()
+        worker.join()
+        test_logger.debug("hidden at INFO")
+
+        stop_logging()  # Flushes the queue
+        text = log_file.read_text(encoding='utf-8')
+        assert "test.pipeline - INFO - from main thread" in text
+        assert "WARNING - from worker" in text
+        assert "hidden at INFO" not in text
+
+    print("[OK] Queue pipeline")
+
+
+def test_runtime_level():
+    """The level can be switched while running; unknown names fall back to INFO"""
+    with tempfile.TemporaryDirectory() as tmp, saved_root_logger():
+        log_file = Path(tmp) / "app.log"
+        setup_logging(log_file, level='INFO', console=False)
+        test_logger = logging.getLogger("test.level")
+
+        test_logger.debug("before switch")
+        assert set_log_level('debug') == logging.DEBUG
+        assert test_logger.isEnabledFor(logging.DEBUG)
+        test_logger.debug("after switch")
+        assert set_log_level('verbose') == logging.INFO
+        assert not test_logger.isEnabledFor(logging.DEBUG)
+
+        stop_logging()
+        text = log_file.read_text(encoding='utf-8')
+        assert "before switch" not in text and "after switch" in text
+
+    print("[OK] Runtime level")
+
+
+def test_rotation():
+    """The log file is rotated instead of growing without bound"""
+    with tempfile.TemporaryDirectory() as tmp, saved_root_logger():
+        log_file = Path(tmp) / "app.log"
+        setup_logging(log_file, console=False, max_bytes=2_000, backup_count=2)
+        test_logger = logging.getLogger("test.rotation")
+        for i in range(200):
+            test_logger.info(f"line {i} " + "x" * 40)
+        stop_logging()
+
+        files = sorted(path.name for path in Path(tmp).iterdir())
+        assert files == ["app.log", "app.log.1", "app.log.2"]
+        assert all(path.stat().st_size <= 2_000 for path in Path(tmp).iterdir())
+
+    print("[OK] Rotation")
+
+
+def test_hot_path_cost():
+    """At INFO, guarded per-item debug logging costs almost nothing"""
+    with tempfile.TemporaryDirectory() as tmp, saved_root_logger():
+        setup_logging(Path(tmp) / "app.log", level='INFO', console=False)
+        test_logger = logging.getLogger("test.hot")
+
+        class Label:
+            formatted = 0
+
+            def __format__(self, spec):
+                Label.formatted += 1
+                return "label"
+
+        label, n = Label(), 50_000
+        start = time.perf_counter()
+        for i in range(n):
+            test_logger.debug(f"Creating button {i}: {label}")
+        unguarded = time.perf_counter() - start
+        assert Label.formatted == n  # The f-string is built even though nothing is logged
+
+        Label.formatted = 0
+        start = time.perf_counter()
+        log_items = test_logger.isEnabledFor(logging.DEBUG)
+        for i in range(n):
+            if log_items:
+                test_logger.debug(f"Creating button {i}: {label}")
+        guarded = time.perf_counter() - start
+        assert Label.formatted == 0
+
+        # Emitting is only a queue put on the calling thread
+        start = time.perf_counter()
+        for i in range(5_000):
+            test_logger.info("emitted %d", i)
+        emitted = (time.perf_counter() - start) / 5_000
+
+        print(f"  {n} disabled debug calls: {unguarded * 1e3:.1f} ms unguarded, {guarded * 1e3:.2f} ms guarded")
+        print(f"  logger.info through the queue: {emitted * 1e6:.1f} us per record")
+        assert guarded < unguarded
+
+    print("[OK] Hot path cost")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Logging Pipeline")
+    print("=" * 60)
+
+    test_queue_pipeline()
+    test_runtime_level()
+    test_rotation()
+    test_hot_path_cost()
+
+    print("\nAll logging pipeline tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+"""
+Test the metrics registry (counters, histograms, timers, profiling) and the instrumented hot paths
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.metrics import MetricsRegistry, metrics
+from core.search_engine import SearchEngine
+from database.db_manager import DBManager
+from models.category import Category
+from models.item import Item
+
+
+def test_counters_and_histograms():
+    """Counts, totals, extremes and nearest-rank percentiles"""
+    registry = MetricsRegistry()
+    registry.inc('hits')
+    registry.inc('hits', 4)
+    for value in range(1, 101):
+        registry.observe('latency', float(value))
+
+    histogram = registry.histogram('latency')
+    assert registry.counter('hits').value == 5
+    assert histogram.count == 100 and histogram.total == 5050.0
+    assert histogram.min == 1.0 and histogram.max == 100.0
+    assert histogram.percentile(0.50) == 50.0
+    assert histogram.percentile(0.95) == 95.0
+    assert histogram.percentile(1.0) == 100.0
+    assert registry.histogram('empty').percentile(0.5) is None
+
+    print("[OK] Counters and histograms")
+
+
+def test_timers():
+    """Context manager and decorator record milliseconds; disabled registry records nothing"""
+    registry = MetricsRegistry()
+    with registry.timer('block'):
+        time.sleep(0.01)
+
+    @registry.timed('func')
+    def double(value):
+        """Doubles"""
+        return value * 2
+
+    assert double(21) == 42
+    assert double.__doc__ == "Doubles"
+    try:
+        with registry.timer('failing'):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    snapshot = registry.snapshot()['histograms']
+    assert snapshot['block']['count'] == 1 and snapshot['block']['min'] >= 9.0
+    assert snapshot['func']['count'] == 1
+    assert snapshot['failing']['count'] == 1  # Errors are timed too
+
+    disabled = MetricsRegistry(enabled=False)
+    with disabled.timer('block'):
+        pass
+    disabled.inc('hits')
+    disabled.timed('func')(lambda: None)()
+    assert disabled.snapshot()['histograms'] == {} and disabled.snapshot()['counters'] == {}
+
+    print("[OK] Timers")
+
+
+def test_snapshot_and_dump():
+    """The JSON dump round-trips the snapshot; reset forgets everything"""
+    registry = MetricsRegistry()
+    registry.inc('command.failed')
+    registry.observe('db.query', 1.5)
+    registry.observe('db.query', 2.5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = registry.dump_json(Path(tmp) / "metrics.json")
+        data = json.loads(path.read_text(encoding='utf-8'))
+
+    assert data['counters'] == {'command.failed': {'count': 1}}
+    assert data['histograms']['db.query']['mean'] == 2.0
+    assert data['histograms']['db.query']['unit'] == 'ms'
+    assert 'generated_at' in data
+
+    registry.reset()
+    assert registry.snapshot()['counters'] == {} and registry.snapshot()['histograms'] == {}
+
+    print("[OK] Snapshot and dump")
+
+
+def test_profiling():
+    """cProfile capture can be toggled and summarized"""
+    registry = MetricsRegistry()
+    assert registry.stop_profiling() == ''
+    assert registry.start_profiling()
+    assert not registry.start_profiling()  # Already running
+    assert registry.profiling
+
+    def busy_function():
+        return sum(i * i for i in range(10_000))
+    busy_function()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prof_path = Path(tmp) / "capture.prof"
+        text = registry.stop_profiling(prof_path, limit=10)
+        assert prof_path.exists()
+    assert not registry.profiling
+    assert "busy_function" in text
+
+    print("[OK] Profiling")
+
+
+def test_instrumented_hot_paths():
+    """DBManager queries/updates and searches record into the app registry"""
+    metrics.reset()
+    db = DBManager(":memory:")
+    try:
+        cat_id = db.add_category("Metrics", "📊")
+        db.add_item(cat_id, "Docker ps", "docker ps")
+        db.get_items_by_category(cat_id)
+    finally:
+        db.close()
+
+    category = Category(str(cat_id), "Metrics", "📊")
+    category.items = [Item(str(i), f"Item {i}", "content") for i in range(20)]
+    engine = SearchEngine()
+    engine.search("item 1", [category])
+    engine.search_in_category("item", category)
+    engine.search_fuzzy("itme", [category])
+
+    histograms = metrics.snapshot()['histograms']
+    for name in ('db.query', 'db.update', 'search.global', 'search.category', 'search.fuzzy'):
+        assert histograms.get(name, {}).get('count', 0) >= 1, name
+    metrics.reset()
+
+    print("[OK] Instrumented hot paths")
+
+
+_app = None  # Kept alive for the widget tests
+
+
+def test_dashboard_metrics_tab():
+    """The Stats Dashboard lists the registry in its metrics tab"""
+    import os
+    from PyQt6.QtWidgets import QApplication
+    from views.dialogs.stats_dashboard import StatsDashboard
+
+    global _app
+    _app = QApplication.instance() or QApplication(sys.argv)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # The dashboard managers open widget_sidebar.db in the working directory
+        try:
+            DBManager("widget_sidebar.db").close()
+            metrics.reset()
+            metrics.observe('db.query', 3.0)
+            metrics.inc('command.failed')
+
+            dashboard = StatsDashboard()
+            table = dashboard.metrics_table
+            rows = {table.item(row, 0).text(): table.item(row, 1).text() for row in range(table.rowCount())}
+            assert rows.get('db.query') == "Tiempo"
+            assert rows.get('command.failed') == "Contador"
+
+            dashboard.reset_metrics()
+            assert 'command.failed' not in {table.item(row, 0).text() for row in range(table.rowCount())}
+            dashboard.close()
+            metrics.reset()
+        finally:
+            os.chdir(cwd)
+
+    print("[OK] Dashboard metrics tab")
+
+
+def test_timer_overhead():
+    """A timed block costs a few microseconds"""
+    registry = MetricsRegistry()
+    n = 20_000
+
+    start = time.perf_counter()
+    for _ in range(n):
+        with registry.timer('overhead'):
+            pass
+    enabled = (time.perf_counter() - start) / n
+
+    registry.enabled = False
+    start = time.perf_counter()
+    for _ in range(n):
+        with registry.timer('overhead'):
+            pass
+    disabled = (time.perf_counter() - start) / n
+
+    print(f"  timer: {enabled * 1e6:.2f} us enabled, {disabled * 1e6:.2f} us disabled")
+    assert disabled < enabled
+    assert enabled < 50e-6
+
+    print("[OK] Timer overhead")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Metrics")
+    print("=" * 60)
+
+    test_counters_and_histograms()
+    test_timers()
+    test_snapshot_and_dump()
+    test_profiling()
+    test_instrumented_hot_paths()
+    test_dashboard_metrics_tab()
+    test_timer_overhead()
+
+    print("\nAll metrics tests passed")
+
+
+if __name__ == '__main__':
+    main()
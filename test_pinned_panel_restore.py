@@ -0,0 +1,146 @@
+"""
+Test the staggered restore of pinned panels on startup (one shell per event-loop turn)
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ.setdefault('PYNPUT_BACKEND', 'dummy')  # Global hotkeys without an X server
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from database.db_manager import DBManager
+
+ITEMS_PER_CATEGORY = 30
+
+_app = None
+
+
+def get_app():
+    """Create the QApplication once and keep it alive for the whole module"""
+    global _app
+    _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
+
+class in_tempdir:
+    """Run inside a temporary directory (the controller opens widget_sidebar.db there)"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def create_panels() -> dict:
+    """Four categories with a pinned panel each; the most recently opened ones are not visible"""
+    db = DBManager("widget_sidebar.db")
+    panels = {}
+    layout = {
+        'minimized': (10, 10, True),
+        'off_screen': (-5000, -5000, False),
+        'visible_a': (20, 20, False),
+        'visible_b': (200, 20, False),
+    }
+    for minutes_ago, (name, (x, y, minimized)) in enumerate(layout.items()):
+        cat_id = db.add_category(f"Panel {name}", "📌")
+        db.add_items_bulk([
+            {'category_id': cat_id, 'label': f"{name} {n}", 'content': f"content {n}"}
+            for n in range(ITEMS_PER_CATEGORY)
+        ])
+        panels[name] = db.execute_update(
+            """
+            INSERT INTO pinned_panels (category_id, x_position, y_position, width, height,
+                                       is_minimized, last_opened)
+            VALUES (?, ?, ?, 300, 400, ?, datetime('now', ?))
+            """,
+            (cat_id, x, y, minimized, f"-{minutes_ago} minutes")
+        )
+    db.close()
+    return panels
+
+
+def test_staggered_restore():
+    """All panels come back, visible ones first, one shell per event-loop turn"""
+    app = get_app()
+    from controllers.main_controller import MainController
+    from views.main_window import MainWindow
+    from views.widgets.item_widget import ItemButton
+
+    with in_tempdir():
+        panels = create_panels()
+        controller = MainController()
+        window = MainWindow(controller)
+        try:
+            # Restored in last_opened order: the hidden panels come first from the database
+            stored_order = [panel['id'] for panel in controller.pinned_panels_manager.restore_panels_on_startup()]
+            assert stored_order == [panels['minimized'], panels['off_screen'], panels['visible_a'], panels['visible_b']]
+
+            bulk_calls = []
+            get_categories_by_ids = controller.get_categories_by_ids
+            controller.get_categories_by_ids = lambda ids: bulk_calls.append(list(ids)) or get_categories_by_ids(ids)
+
+            window.restore_pinned_panels_on_startup()
+            assert len(bulk_calls) == 1 and len(bulk_calls[0]) == 4  # One query for every category
+            assert window.pinned_panels == []  # Nothing is created synchronously
+
+            # One panel shell per event-loop turn
+            counts = []
+            while window._pending_panel_shells:
+                app.processEvents()
+                counts.append(len(window.pinned_panels))
+            assert counts == [1, 2, 3, 4]
+
+            # Visible panels first, minimized/off-screen ones last
+            created_order = [panel.panel_id for panel in window.pinned_panels]
+            assert created_order[:2] == [panels['visible_a'], panels['visible_b']]
+            assert set(created_order[2:]) == {panels['minimized'], panels['off_screen']}
+            assert all(not panel.findChildren(ItemButton) for panel in window.pinned_panels)
+
+            # Filling a panel clears its search bar without emitting a search
+            searches = []
+            for panel in window.pinned_panels:
+                panel.search_bar.search_changed.connect(searches.append)
+
+            for _ in range(500):
+                app.processEvents()
+                if all(len(panel.findChildren(ItemButton)) == ITEMS_PER_CATEGORY for panel in window.pinned_panels):
+                    break
+            assert [len(panel.findChildren(ItemButton)) for panel in window.pinned_panels] == [ITEMS_PER_CATEGORY] * 4
+            assert not window._pending_panel_fills
+            assert searches == []
+        finally:
+            for unsubscribe in window._unsubscribe:
+                unsubscribe()
+            for panel in list(window.pinned_panels):
+                panel.hide()
+                panel.deleteLater()
+            window.tray_manager.cleanup()
+            window.deleteLater()
+            app.processEvents()
+            controller.config_manager.close()
+
+    print("[OK] Staggered pinned panel restore")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Pinned Panel Restore")
+    print("=" * 60)
+
+    test_staggered_restore()
+
+    print("\nAll pinned panel restore tests passed")
+
+
+if __name__ == '__main__':
+    main()
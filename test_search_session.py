@@ -0,0 +1,195 @@
+"""
+Test incremental search sessions (memoized queries and prefix refinement)
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.dashboard_manager import DashboardManager
+from core.search_engine import SearchEngine
+from core.search_session import SearchSession
+from models.category import Category
+from models.item import Item
+
+WORDS = ["docker", "deploy", "dock", "backup", "doctor", "git", "server", "docs"]
+
+
+def make_items(count: int):
+    return [
+        Item(str(i), f"{WORDS[i % 8]} {WORDS[(i // 8) % 8]} {i}", f"run {WORDS[(i * 3) % 8]}",
+             tags=[WORDS[(i * 5) % 8]] if i % 2 else [])
+        for i in range(count)
+    ]
+
+
+def brute_force(items, query):
+    query = query.lower()
+    return [item for item in items
+            if query in item.label.lower() or query in item.content.lower()
+            or any(query in tag.lower() for tag in item.tags)]
+
+
+def test_session_refines_and_memoizes():
+    """Typing refines the previous matches; deleting hits the cache"""
+    labels = [f"{WORDS[i % 8]}-{i}" for i in range(10_000)]
+    session = SearchSession(lambda label, query: label if query in label else None)
+
+    previous = len(labels)
+    for query in ("d", "do", "doc", "dock", "docke", "docker"):
+        result = session.search(query, labels, source=labels, version=len(labels))
+        assert result == [label for label in labels if query in label]
+        assert session.last_scanned == previous  # Only the previous matches were checked
+        previous = len(result)
+
+    assert session.search("dock", labels, source=labels, version=len(labels))
+    assert session.last_scanned == 0  # Backspace: cached
+
+    session.search("git", labels, source=labels, version=len(labels))
+    assert session.last_scanned == len(labels)  # Non-refining change: full scan
+
+    # Substring refinement, not only prefixes
+    result = session.search("git-1", labels, source=labels, version=len(labels))
+    assert session.last_scanned == len(labels) // 8 and result == [l for l in labels if "git-1" in l]
+
+    # A new version of the corpus resets the cache
+    labels.append("docker-new")
+    assert session.search("docker", labels, source=labels, version=len(labels))[-1] == "docker-new"
+    assert session.last_scanned == len(labels)
+
+    # LRU bound
+    small = SearchSession(lambda label, query: label if query in label else None, cache_size=2)
+    for query in ("a", "b", "c"):
+        small.search(query, labels, source=labels)
+    assert list(small._cache) == ["b", "c"]
+
+    print("[OK] Session refines and memoizes")
+
+
+def test_search_engine_matches_full_scan():
+    """SearchEngine results are unchanged by the session"""
+    items = make_items(2_000)
+    categories = [Category(str(n), f"Cat {n}") for n in range(4)]
+    for n, category in enumerate(categories):
+        category.items = items[n::4]
+    categories[3].is_active = False
+    active = [item for category in categories[:3] for item in category.items]
+
+    engine = SearchEngine()
+    for query in ("d", "do", "doc", "docs", "DOCS 1", "do", "backup", "  git  "):
+        expected = sorted(brute_force(active, query.strip()), key=lambda item: -item.frecency)
+        assert engine.search(query, categories) == expected, query
+        in_category = engine.search_in_category(query, categories[0], rank=False)
+        assert in_category == brute_force(categories[0].items, query.strip()), query
+
+    # Replacing a category's items invalidates the memoized results
+    categories[0].items = categories[0].items + [Item("new", "docs extra", "x")]
+    assert any(item.id == "new" for item in engine.search("docs", categories))
+
+    print("[OK] SearchEngine matches full scan")
+
+
+def legacy_dashboard_search(query, scope_filters, structure):
+    """Previous DashboardManager.search loop (reference)"""
+    query_lower = query.lower()
+    matches = []
+    for cat_idx, category in enumerate(structure['categories']):
+        if scope_filters.get('categories', True) and query_lower in category['name'].lower():
+            matches.append(('category', cat_idx, -1))
+        if scope_filters.get('tags', True):
+            for tag in category['tags']:
+                if query_lower in tag.lower():
+                    matches.append(('tag', cat_idx, -1))
+                    break
+        for item_idx, item in enumerate(category['items']):
+            if scope_filters.get('items', True) and query_lower in item['label'].lower():
+                matches.append(('item', cat_idx, item_idx))
+                continue
+            if scope_filters.get('lists', True) and item.get('is_list') and item.get('list_group'):
+                if query_lower in item['list_group'].lower():
+                    matches.append(('list', cat_idx, item_idx))
+                    continue
+            if scope_filters.get('tags', True):
+                for tag in item['tags']:
+                    if query_lower in tag.lower():
+                        matches.append(('tag', cat_idx, item_idx))
+                        break
+            if scope_filters.get('content', True) and not item['is_sensitive'] and item['content']:
+                if query_lower in item['content'].lower():
+                    matches.append(('content', cat_idx, item_idx))
+    return matches
+
+
+def test_dashboard_search_matches_legacy():
+    """DashboardManager.search gives the same matches, in the same order"""
+    structure = {'categories': [
+        {'name': f"{WORDS[c]} tools", 'tags': [WORDS[(c + 1) % 8]], 'items': [
+            {'label': f"{WORDS[(c + i) % 8]} {i}", 'content': f"{WORDS[(c * i) % 8]} cmd",
+             'tags': [WORDS[i % 8]] if i % 3 else [], 'is_sensitive': i % 7 == 0,
+             'is_list': i % 5 == 0, 'list_group': f"{WORDS[(i + 2) % 8]} list"}
+            for i in range(60)
+        ]}
+        for c in range(8)
+    ]}
+    manager = DashboardManager(db_manager=None)
+
+    scopes = [{}, {'items': False}, {'content': False, 'tags': False}, {'categories': False, 'lists': False}]
+    for scope_filters in scopes:
+        for query in ("d", "do", "doc", "dock", "docke", "do", "s", "se", "server", "Git"):
+            assert manager.search(query, scope_filters, structure) == \
+                legacy_dashboard_search(query, scope_filters, structure), (query, scope_filters)
+
+    print("[OK] Dashboard search matches legacy")
+
+
+def test_typing_cost_100k():
+    """Typing a long query scans roughly the shrinking candidate set"""
+    vocabulary = [f"{prefix}{suffix}" for prefix in ("dock", "dep", "back", "serv", "git", "note", "conf", "log")
+                  for suffix in ("er", "loy", "up", "ice", "hub", "book", "ig", "s")]
+    items = [Item(str(i), f"{vocabulary[i % 64]} {vocabulary[(i * 7) % 61]} {i}", f"cmd {vocabulary[(i * 13) % 59]}")
+             for i in range(100_000)]
+    category = Category("1", "Big")
+    category.items = items
+    engine = SearchEngine()
+    session = engine._category_session
+
+    query, scanned, full = "", 0, 0
+    start = time.perf_counter()
+    for char in "docker backup 1":
+        query += char
+        engine.search_in_category(query, category, rank=False)
+        scanned += session.last_scanned
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    query = ""
+    for char in "docker backup 1":
+        query += char
+        full += len(items)
+        brute_force(items, query)
+    full_elapsed = time.perf_counter() - start
+
+    print(f"  15 keystrokes over 100k items: {scanned} entries scanned ({elapsed * 1e3:.0f} ms) "
+          f"vs {full} ({full_elapsed * 1e3:.0f} ms) rescanning")
+    assert scanned < full / 4
+    assert engine.search_in_category("docker backup 1", category, rank=False) == brute_force(items, "docker backup 1")
+
+    print("[OK] Typing cost")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Search Session")
+    print("=" * 60)
+
+    test_session_refines_and_memoizes()
+    test_search_engine_matches_full_scan()
+    test_dashboard_search_matches_legacy()
+    test_typing_cost_100k()
+
+    print("\nAll search session tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Test the background search executor (chunked streaming, generation cancellation)
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from core import search_worker
+from core.search_worker import SearchExecutor
+from database.db_manager import DBManager
+
+
+def get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def collect(executor):
+    """Record the signals delivered to the UI thread"""
+    received = {'chunks': [], 'finished': [], 'threads': set()}
+
+    def on_chunk(generation, chunk):
+        received['chunks'].append((generation, list(chunk)))
+        received['threads'].add(threading.get_ident())
+
+    executor.chunk_ready.connect(on_chunk)
+    executor.search_finished.connect(lambda generation, total: received['finished'].append((generation, total)))
+    return received
+
+
+def test_streams_chunks_on_ui_thread():
+    """Results arrive in chunks, on the UI thread, followed by the total"""
+    app = get_app()
+    executor = SearchExecutor(chunk_size=100)
+    received = collect(executor)
+    worker_threads = set()
+
+    def produce():
+        worker_threads.add(threading.get_ident())
+        return (n if n % 3 == 0 else None for n in range(1, 1001))
+
+    generation = executor.submit(produce)
+    assert executor.wait(5000)
+    app.processEvents()
+
+    assert [len(chunk) for _, chunk in received['chunks']] == [100, 100, 100, 33]
+    assert [n for _, chunk in received['chunks'] for n in chunk] == list(range(3, 1001, 3))
+    assert received['finished'] == [(generation, 333)]
+    assert received['threads'] == {threading.get_ident()}
+    assert threading.get_ident() not in worker_threads
+
+    print("[OK] Streams chunks on the UI thread")
+
+
+def test_superseded_generations_are_dropped():
+    """A new search stops the running one and skips the queued ones"""
+    app = get_app()
+    executor = SearchExecutor(chunk_size=10)
+    received = collect(executor)
+    steps = {'slow': 0, 'queued': 0}
+    started = threading.Event()
+
+    def slow():
+        for n in range(1_000_000):
+            steps['slow'] += 1
+            started.set()
+            if n % 64 == 0:
+                time.sleep(0.0001)
+            yield None  # Nunca coincide: solo recorre
+
+    def queued():
+        steps['queued'] += 1
+        return [1, 2, 3]
+
+    first = executor.submit(slow)
+    started.wait(5)
+    second = executor.submit(queued)  # Queued behind the slow search
+    third = executor.submit(lambda: ["a", "b"])
+    assert executor.wait(10000)
+    app.processEvents()
+
+    assert steps['slow'] < 1_000_000  # Cancelled mid-scan
+    assert steps['slow'] % search_worker.CANCEL_CHECK_INTERVAL == 0
+    assert steps['queued'] == 0  # Superseded before it started
+    assert received['chunks'] == [(third, ["a", "b"])]
+    assert received['finished'] == [(third, 2)]
+    assert not executor.is_current(first) and not executor.is_current(second)
+
+    executor.cancel()
+    assert not executor.is_current(third)
+
+    print("[OK] Superseded generations are dropped")
+
+
+def test_global_search_panel_applies_latest_query():
+    """The global search panel shows only the results of the last query"""
+    from views.global_search_panel import GlobalSearchPanel
+
+    app = get_app()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            db = DBManager("widget_sidebar.db")
+            cat_id = db.add_category("Worker", "🧵")
+            db.add_items_bulk([{'category_id': cat_id, 'label': f"{'alpha' if i % 2 else 'beta'} {i}",
+                                'content': "x"} for i in range(450)])
+            panel = GlobalSearchPanel(db_manager=db)
+            panel.load_all_items()
+
+            panel.on_search_changed("alpha")
+            panel.on_search_changed("beta 1")  # Supersedes the first search
+            panel.search_executor.wait()
+            app.processEvents()
+
+            expected = sorted(i for i in range(0, 450, 2) if str(i).startswith("1"))
+            assert sorted(int(item.label.split()[1]) for item in panel._shown_items) == expected
+            assert panel.items_layout.count() - 1 == min(len(expected), 100)
+
+            panel.on_search_changed("no such item")
+            panel.search_executor.wait()
+            app.processEvents()
+            assert panel._shown_items == [] and panel.items_layout.count() == 1
+
+            panel.close()
+            db.close()
+        finally:
+            os.chdir(cwd)
+
+    print("[OK] Global search panel applies the latest query")
+
+
+def test_structure_dashboard_searches_in_background():
+    """The structure dashboard applies the worker's matches to the tree"""
+    from views.dashboard.structure_dashboard import StructureDashboard
+
+    app = get_app()
+    db = DBManager(":memory:")
+    cat_id = db.add_category("Docker", "🐳")
+    db.add_items_bulk([{'category_id': cat_id, 'label': f"compose {i}", 'content': "up -d"} for i in range(5)])
+    dashboard = StructureDashboard(db)
+
+    dashboard.on_search_changed("compose 3", {})
+    assert dashboard.current_matches == []  # Not applied until the worker finishes
+    dashboard.search_executor.wait()
+    app.processEvents()
+
+    cat_idx = [c['name'] for c in dashboard.displayed_structure['categories']].index("Docker")
+    assert [match[:2] for match in dashboard.current_matches] == [('item', cat_idx)]
+
+    # Fuzzy matches hand the matched characters to the highlight delegate
+    from views.dashboard.highlight_delegate import HIGHLIGHT_SPANS_ROLE
+    dashboard.on_search_changed("cmopose 3", {'fuzzy': True})
+    dashboard.search_executor.wait()
+    app.processEvents()
+    item_idx = next(match[2] for match in dashboard.current_matches if match[1] == cat_idx)
+    node = dashboard._get_node(cat_idx, item_idx)
+    spans = node.data(0, HIGHLIGHT_SPANS_ROLE)
+    assert spans and "".join(node.text(0)[start:end] for start, end in spans) in ("compose3", "compose 3")
+    html = dashboard.highlight_delegate._create_highlighted_html(node.text(0), "cmopose 3", spans)
+    assert "compose</span>" in html
+
+    dashboard.on_search_changed("", {})
+    assert node.data(0, HIGHLIGHT_SPANS_ROLE) is None
+
+    dashboard.close()
+    db.close()
+
+    print("[OK] Structure dashboard searches in background")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Search Worker")
+    print("=" * 60)
+
+    test_streams_chunks_on_ui_thread()
+    test_superseded_generations_are_dropped()
+    test_global_search_panel_applies_latest_query()
+    test_structure_dashboard_searches_in_background()
+
+    print("\nAll search worker tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+Test the DBManager settings cache (write-through, data_version invalidation)
+"""
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.event_bus import event_bus, SettingChanged
+from database import db_manager
+from database.db_manager import DBManager
+
+
+def trace_statements(db: DBManager) -> list:
+    """Record the SQL statements run on the connection of a DBManager"""
+    statements = []
+    db.connect().set_trace_callback(statements.append)
+    return statements
+
+
+def test_reads_are_lookups():
+    """After the first read, get_setting doesn't run any SQL"""
+    db = DBManager(":memory:")
+    try:
+        assert db.get_setting('max_history') == 20
+        statements = trace_statements(db)
+        for _ in range(100):
+            assert db.get_setting('max_history') == 20
+            assert db.get_setting('missing', 'fallback') == 'fallback'
+        assert statements == []
+
+        # Mutable values are copies: callers can't corrupt the cache
+        db.set_setting('recent', [1, 2])
+        db.get_setting('recent').append(3)
+        assert db.get_setting('recent') == [1, 2]
+        db.get_all_settings()['recent'] = None
+        assert db.get_setting('recent') == [1, 2]
+    finally:
+        db.close()
+
+    print("[OK] Reads are lookups")
+
+
+def test_write_through():
+    """set_setting/set_settings update the cache and publish SettingChanged"""
+    db = DBManager(":memory:")
+    received = []
+    unsubscribe = event_bus.subscribe(SettingChanged, received.append)
+    try:
+        db.get_setting('opacity')
+        db.set_setting('panel_width', 640)
+        db.set_settings({'opacity': 0.8, 'window_position': (10, 20)})
+        statements = trace_statements(db)
+        assert db.get_setting('panel_width') == 640
+        assert db.get_setting('opacity') == 0.8
+        assert db.get_setting('window_position') == [10, 20]  # As read back from JSON
+        assert statements == []
+        assert [event.key for event in received] == ['panel_width', 'opacity', 'window_position']
+
+        # A rolled-back write doesn't stay in the cache
+        try:
+            with db.transaction():
+                db.set_setting('panel_width', 999)
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        assert db.get_setting('panel_width') == 640
+
+        # Inside a transaction the write is visible; an enclosing rollback drops it
+        try:
+            with db.transaction():
+                with db.transaction():
+                    db.set_setting('panel_width', 700)
+                assert db.get_setting('panel_width') == 700
+                raise RuntimeError("rollback")
+        except RuntimeError:
+            pass
+        statements = trace_statements(db)
+        assert db.get_setting('panel_width') == 640
+        assert statements == []  # Still served from the cache
+
+        # A failed savepoint is dropped, the rest of the transaction is kept
+        with db.transaction():
+            db.set_setting('opacity', 0.5)
+            try:
+                with db.transaction():
+                    db.set_setting('panel_width', 800)
+                    raise RuntimeError("savepoint")
+            except RuntimeError:
+                pass
+        assert db.get_setting('panel_width') == 640
+        assert db.get_setting('opacity') == 0.5
+        assert db.execute_query("SELECT value FROM settings WHERE key = 'panel_width'")[0]['value'] == '640'
+    finally:
+        unsubscribe()
+        db.close()
+
+    print("[OK] Write-through")
+
+
+def test_external_changes():
+    """Commits of another connection are picked up through PRAGMA data_version"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "settings.db")
+        db = DBManager(db_path)
+        try:
+            assert db.get_setting('max_history') == 20
+
+            other = sqlite3.connect(db_path)
+            other.execute("UPDATE settings SET value = '50' WHERE key = 'max_history'")
+            other.commit()
+            other.close()
+
+            # Within the recheck interval the cached value is served...
+            assert db.get_setting('max_history') == 20
+
+            # ...and the next check sees the new data_version
+            db._settings_checked_at -= db_manager.SETTINGS_RECHECK_SECONDS
+            assert db.get_setting('max_history') == 50
+
+            # Own writes don't force a reload
+            db.set_setting('max_history', 30)
+            db._settings_checked_at -= db_manager.SETTINGS_RECHECK_SECONDS
+            statements = trace_statements(db)
+            assert db.get_setting('max_history') == 30
+            assert statements == ["PRAGMA data_version"]
+        finally:
+            db.close()
+
+    print("[OK] External changes")
+
+
+def test_read_benchmark():
+    """Time cached reads against a query + json.loads per read"""
+    db = DBManager(":memory:")
+    try:
+        n = 20_000
+        start = time.perf_counter()
+        for _ in range(n):
+            db.get_setting('max_history')
+        cached = (time.perf_counter() - start) / n
+
+        # Lectura anterior: una consulta y json.loads por llamada
+        query = "SELECT value FROM settings WHERE key = ?"
+        start = time.perf_counter()
+        for _ in range(n):
+            json.loads(db.execute_query(query, ('max_history',))[0]['value'])
+        uncached = (time.perf_counter() - start) / n
+
+        print(f"  get_setting: {cached * 1e6:.2f} us (cached) vs {uncached * 1e6:.2f} us (query per read)")
+        assert cached < uncached
+    finally:
+        db.close()
+
+    print("[OK] Read benchmark")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Settings Cache")
+    print("=" * 60)
+
+    test_reads_are_lookups()
+    test_write_through()
+    test_external_changes()
+    test_read_benchmark()
+
+    print("\nAll settings cache tests passed")
+
+
+if __name__ == '__main__':
+    main()
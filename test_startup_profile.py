@@ -0,0 +1,137 @@
+"""
+Test the startup profile mode (--profile-startup) and the deferred startup subsystems
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+# Imports main.py the way `python main.py` does (without running main()) and writes
+# the profile through the same helpers main() uses after the first paint
+PROFILE_SCRIPT = """
+import sys
+from pathlib import Path
+sys.argv = ['main.py'] + sys.argv[1:]
+sys.path.insert(0, {root!r})
+import main
+print('flag left in argv' if '--profile-startup' in sys.argv else 'argv clean')
+if main.startup_profiler is None:
+    print('profiler off')
+    raise SystemExit(0)
+main.mark_startup('module imports done')
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+main.mark_startup('QApplication created')
+main.finish_startup_profile(Path.cwd())
+for _ in range(3):
+    app.processEvents()
+print('profiler on')
+"""
+
+
+class in_tempdir:
+    """Run inside a temporary directory (the controller opens widget_sidebar.db there)"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def run_main_import(tmp: Path, args=(), profile_env: bool = False) -> str:
+    """Import main.py in a fresh interpreter inside tmp and return its output"""
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYNPUT_BACKEND='dummy')
+    env.pop('WIDGET_SIDEBAR_PROFILE_STARTUP', None)
+    if profile_env:
+        env['WIDGET_SIDEBAR_PROFILE_STARTUP'] = '1'
+    result = subprocess.run(
+        [sys.executable, '-c', PROFILE_SCRIPT.format(root=str(ROOT)), *args],
+        cwd=tmp, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result.stdout
+
+
+def check_report(report_path: Path):
+    """The report has the milestones, the slowest imports and the import tree"""
+    report = report_path.read_text(encoding='utf-8')
+    for milestone in ('module imports done', 'QApplication created', 'first paint', 'deferred startup done'):
+        assert milestone in report, milestone
+    assert "Total import time:" in report
+    assert "Slowest 30 imports (cumulative):" in report
+    assert "import time: self [us] | cumulative | imported package" in report
+    assert any(line.startswith("import time:") and line.endswith("PyQt6.QtWidgets") for line in report.splitlines())
+    assert "controllers.main_controller" in report
+
+
+def test_profile_startup_flag():
+    """--profile-startup writes startup_profile.txt and is removed from argv"""
+    with in_tempdir() as tmp:
+        output = run_main_import(tmp, args=['--profile-startup'])
+        assert 'argv clean' in output and 'profiler on' in output
+        check_report(tmp / "startup_profile.txt")
+
+    print("[OK] --profile-startup report")
+
+
+def test_profile_startup_env():
+    """WIDGET_SIDEBAR_PROFILE_STARTUP enables the same report; without it nothing is written"""
+    with in_tempdir() as tmp:
+        output = run_main_import(tmp, profile_env=True)
+        assert 'profiler on' in output
+        check_report(tmp / "startup_profile.txt")
+
+    with in_tempdir() as tmp:
+        output = run_main_import(tmp)
+        assert 'profiler off' in output
+        assert not (tmp / "startup_profile.txt").exists()
+
+    print("[OK] WIDGET_SIDEBAR_PROFILE_STARTUP report")
+
+
+def test_category_filter_engine_is_lazy():
+    """MainController builds the category filter engine once, on first access"""
+    from controllers.main_controller import MainController
+    from core.category_filter_engine import CategoryFilterEngine
+
+    with in_tempdir():
+        controller = MainController()
+        try:
+            assert controller._category_filter_engine is None
+
+            engine = controller.category_filter_engine
+            assert isinstance(engine, CategoryFilterEngine)
+            assert controller.category_filter_engine is engine
+
+            # Deferred startup initialization keeps the engine created on first access
+            controller.init_category_filter_engine()
+            assert controller.category_filter_engine is engine
+        finally:
+            controller.config_manager.close()
+
+    print("[OK] Lazy category filter engine")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Startup Profile")
+    print("=" * 60)
+
+    test_profile_startup_flag()
+    test_profile_startup_env()
+    test_category_filter_engine_is_lazy()
+
+    print("\nAll startup profile tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+Test startup snapshot (write on shutdown, load without DB hydrate, reconcile)
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.config_manager import ConfigManager
+from core.startup_snapshot import SNAPSHOT_FILENAME
+
+
+class in_tempdir:
+    """Run inside a temporary directory (sensitive items write the key to .env)"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def create_config_manager(tmp_dir: Path) -> ConfigManager:
+    """Create a ConfigManager on a temporary database with sample data"""
+    config = ConfigManager(db_path=str(tmp_dir / "snapshot_test.db"), base_dir=tmp_dir)
+    db = config.db
+
+    cat_id = db.add_category("Snapshot Cat", "📸")
+    db.add_item(cat_id, "Public item", "public content", "TEXT")
+    db.add_item(cat_id, "Secret item", "super-secret-value", "TEXT", is_sensitive=True)
+    db.add_item(cat_id, "Docs", "https://example.com", "URL")
+    return config
+
+
+def test_snapshot_roundtrip():
+    """Snapshot keeps categories, ordering and labels but no content"""
+    with in_tempdir() as tmp_dir:
+        config = create_config_manager(tmp_dir)
+
+        assert config.save_startup_snapshot()
+        snapshot_file = tmp_dir / SNAPSHOT_FILENAME
+        assert snapshot_file.exists()
+
+        raw = snapshot_file.read_text(encoding='utf-8')
+        assert "super-secret-value" not in raw
+        assert "public content" not in raw
+
+        categories = config.load_snapshot_categories()
+        db_categories = config.get_categories()
+
+        assert [c.id for c in categories] == [c.id for c in db_categories]
+        assert [c.name for c in categories] == [c.name for c in db_categories]
+
+        snap_cat = next(c for c in categories if c.name == "Snapshot Cat")
+        assert [i.label for i in snap_cat.items] == ["Public item", "Secret item", "Docs"]
+        assert snap_cat.items[1].is_sensitive
+        assert snap_cat.items[2].type.value == "url"
+        assert all(i.content == "" for i in snap_cat.items)
+
+        assert config.is_snapshot_current()
+        config.close()
+
+    print("[OK] Snapshot roundtrip")
+
+
+def test_snapshot_detects_changes():
+    """Watermark mismatch after inserts, edits and deletes"""
+    with in_tempdir() as tmp_dir:
+        config = create_config_manager(tmp_dir)
+        db = config.db
+        cat_id = int(config.get_categories()[-1].id)
+
+        # Insert
+        config.save_startup_snapshot()
+        config.load_snapshot_categories()
+        item_id = db.add_item(cat_id, "New item", "x", "TEXT")
+        assert not config.is_snapshot_current()
+
+        # Delete
+        config.save_startup_snapshot()
+        config.load_snapshot_categories()
+        db.delete_item(item_id)
+        assert not config.is_snapshot_current()
+
+        # Edit (updated_at moves forward)
+        config.save_startup_snapshot()
+        config.load_snapshot_categories()
+        db.execute_update(
+            "UPDATE categories SET name = ?, updated_at = datetime('now', '+1 minute') WHERE id = ?",
+            ("Renamed", cat_id)
+        )
+        assert not config.is_snapshot_current()
+
+        # Reordering a list (only orden_lista changes)
+        db.add_items_bulk([{'category_id': cat_id, 'label': f"Step {n}", 'content': "x", 'is_list': True,
+                            'list_group': "Deploy", 'orden_lista': n} for n in (1, 2, 3)])
+        db.execute_update("UPDATE items SET updated_at = datetime('now', '-1 minute')")
+        db.execute_update("UPDATE categories SET updated_at = datetime('now', '-1 minute')")
+        config.save_startup_snapshot()
+        config.load_snapshot_categories()
+        step_id = db.execute_query("SELECT id FROM items WHERE label = 'Step 3'")[0]['id']
+        assert db.reorder_list_item(step_id, 1)
+        assert not config.is_snapshot_current()
+        config.close()
+
+    print("[OK] Snapshot change detection")
+
+
+def test_reconcile_rows_read_off_thread():
+    """The reconcile rows are read on another thread and applied on this one"""
+    import threading
+
+    with in_tempdir() as tmp_dir:
+        config = create_config_manager(tmp_dir)
+        config.save_startup_snapshot()
+        config.load_snapshot_categories()
+
+        result = {}
+        reader = threading.Thread(target=lambda: result.update(data=config.read_category_rows()))
+        reader.start()
+        reader.join()
+        data = result['data']
+
+        assert config.is_snapshot_current(data['watermark'])
+        categories = config.load_categories_from_rows(data)
+        assert config.get_categories() is categories  # Cached like a regular load
+        cat = next(c for c in categories if c.name == "Snapshot Cat")
+        assert [i.content for i in cat.items][1] == "super-secret-value"
+        assert cat.items[0] is config.item_store.get(cat.items[0].id)
+        config.close()
+
+    print("[OK] Reconcile rows read off thread")
+
+
+def test_invalid_snapshot_ignored():
+    """Corrupt snapshot files are ignored"""
+    with in_tempdir() as tmp_dir:
+        config = create_config_manager(tmp_dir)
+        (tmp_dir / SNAPSHOT_FILENAME).write_text("{not json", encoding='utf-8')
+        assert config.load_snapshot_categories() is None
+        assert not config.is_snapshot_current()
+        config.close()
+
+    print("[OK] Invalid snapshot ignored")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Startup Snapshot")
+    print("=" * 60)
+
+    test_snapshot_roundtrip()
+    test_snapshot_detects_changes()
+    test_reconcile_rows_read_off_thread()
+    test_invalid_snapshot_ignored()
+
+    print("\nAll startup snapshot tests passed")
+
+
+if __name__ == '__main__':
+    main()
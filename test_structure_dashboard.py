@@ -0,0 +1,242 @@
+"""
+Test the structure dashboard tree (incremental search highlighting and filtering)
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication, QTreeWidgetItem
+
+from database.db_manager import DBManager
+
+_app = None
+
+
+def get_app():
+    """Create the QApplication once and keep it alive for the whole module"""
+    global _app
+    _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
+
+class in_tempdir:
+    """Run inside a temporary directory (reading item contents writes the key to .env)"""
+
+    def __enter__(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+def create_dashboard():
+    """Dashboard over two categories: 'Docker' (10 compose items) and 'Git' (5 commit items)"""
+    from views.dashboard.structure_dashboard import StructureDashboard
+
+    db = DBManager(":memory:")
+    docker = db.add_category("Docker", "🐳")
+    git = db.add_category("Git", "🌿")
+    db.add_items_bulk(
+        [{'category_id': docker, 'label': f"compose {i}", 'content': "up -d"} for i in range(10)] +
+        [{'category_id': git, 'label': f"commit {i}", 'content': "git commit"} for i in range(5)]
+    )
+    return db, StructureDashboard(db)
+
+
+def run_search(dashboard, query: str):
+    """Run a dashboard search to completion"""
+    dashboard.on_search_changed(query, {})
+    if query:
+        dashboard.search_executor.wait()
+    get_app().processEvents()
+
+
+class TreeChanges:
+    """Records the nodes repainted or shown/hidden by the dashboard"""
+
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+        self.painted = []
+        self.hidden = []
+        self.set_node_background = dashboard._set_node_background
+        self.set_hidden = QTreeWidgetItem.setHidden
+        self.set_hidden_descriptor = QTreeWidgetItem.__dict__['setHidden']  # Restored as is
+
+    def node_key(self, node):
+        parent = node.parent()
+        if parent is None:
+            return (self.dashboard.tree_widget.indexOfTopLevelItem(node), -1)
+        return (self.dashboard.tree_widget.indexOfTopLevelItem(parent), parent.indexOfChild(node))
+
+    def __enter__(self):
+        def set_node_background(node, brush):
+            self.painted.append(self.node_key(node))
+            self.set_node_background(node, brush)
+
+        def set_hidden(node, hidden):
+            self.hidden.append((self.node_key(node), hidden))
+            self.set_hidden(node, hidden)
+
+        self.dashboard._set_node_background = set_node_background
+        QTreeWidgetItem.setHidden = set_hidden
+        return self
+
+    def __exit__(self, *exc_info):
+        QTreeWidgetItem.setHidden = self.set_hidden_descriptor
+        del self.dashboard._set_node_background
+
+
+def test_incremental_search_highlighting():
+    """A refined search only touches the nodes whose match state changed"""
+    from views.dashboard.structure_dashboard import DEFAULT_BACKGROUND, HIGHLIGHT_BACKGROUND
+
+    get_app()
+    with in_tempdir():
+        db, dashboard = create_dashboard()
+        names = [category['name'] for category in dashboard.displayed_structure['categories']]
+        docker, git = names.index("Docker"), names.index("Git")
+        compose = {(docker, i) for i in range(10)}
+
+        # First search: every compose item is highlighted, Git is hidden
+        with TreeChanges(dashboard) as changes:
+            run_search(dashboard, "compose")
+        assert dashboard._highlighted_nodes == compose
+        assert sorted(changes.painted) == sorted(compose)
+        assert git in dashboard._hidden_categories and dashboard.tree_widget.topLevelItem(git).isHidden()
+        assert dashboard._visible_items == {docker: set(range(10))}
+        assert ((docker, -1), True) not in changes.hidden
+
+        # Refined search: only the nine items that stopped matching are repainted and hidden
+        with TreeChanges(dashboard) as changes:
+            run_search(dashboard, "compose 7")
+        assert dashboard._highlighted_nodes == {(docker, 7)}
+        assert sorted(changes.painted) == sorted(compose - {(docker, 7)})
+        assert sorted(changes.hidden) == sorted((node, True) for node in compose - {(docker, 7)})
+        assert dashboard._visible_items == {docker: {7}}
+        for node in compose:
+            assert dashboard._get_node(*node).background(0) == (
+                HIGHLIGHT_BACKGROUND if node == (docker, 7) else DEFAULT_BACKGROUND
+            )
+
+        # Clearing the search restores the default background and unhides only the hidden nodes
+        with TreeChanges(dashboard) as changes:
+            run_search(dashboard, "")
+        assert changes.painted == [(docker, 7)]
+        assert sorted(changes.hidden) == sorted(
+            [((git, -1), False)] + [(node, False) for node in compose - {(docker, 7)}]
+        )
+        assert dashboard._highlighted_nodes == set() and dashboard._hidden_categories == set()
+        assert dashboard._visible_items == {}
+        for node in compose:
+            assert dashboard._get_node(*node).background(0) == DEFAULT_BACKGROUND
+            assert not dashboard._get_node(*node).isHidden()
+        assert not dashboard.tree_widget.topLevelItem(git).isHidden()
+
+        dashboard.close()
+        db.close()
+
+    print("[OK] Incremental search highlighting")
+
+
+def test_expanding_materializes_only_that_category():
+    """Expanding a category loads and creates the rows of that category only"""
+    get_app()
+    with in_tempdir():
+        db, dashboard = create_dashboard()
+        categories = dashboard.displayed_structure['categories']
+        names = [category['name'] for category in categories]
+        docker, git = names.index("Docker"), names.index("Git")
+        assert all(category['items'] is None for category in categories)
+        assert all(dashboard.tree_widget.topLevelItem(i).childCount() == 0 for i in range(len(categories)))
+
+        dashboard.tree_widget.topLevelItem(docker).setExpanded(True)
+        assert len(categories[docker]['items']) == 10
+        assert dashboard.tree_widget.topLevelItem(docker).childCount() == 10
+        assert dashboard._materialized_categories == {docker}
+        assert categories[git]['items'] is None
+        assert dashboard.tree_widget.topLevelItem(git).childCount() == 0
+
+        # Collapsing and expanding again doesn't duplicate the rows
+        dashboard.tree_widget.topLevelItem(docker).setExpanded(False)
+        dashboard.tree_widget.topLevelItem(docker).setExpanded(True)
+        assert dashboard.tree_widget.topLevelItem(docker).childCount() == 10
+
+        dashboard.close()
+        db.close()
+
+    print("[OK] Expanding materializes only that category")
+
+
+def test_search_loads_only_candidate_categories():
+    """A search loads the categories with SQL candidate rows, not every category"""
+    from core.dashboard_manager import DashboardManager
+
+    with in_tempdir():
+        db = DBManager(":memory:")
+        ids = {name: db.add_category(name, "📁") for name in ("Docker", "Git", "Notes", "Secrets", "Misc_1")}
+        db.add_items_bulk(
+            [{'category_id': ids["Docker"], 'label': f"compose {i}", 'content': "up -d"} for i in range(3)] +
+            [{'category_id': ids["Git"], 'label': "commit", 'content': "git commit -m"}] +
+            [{'category_id': ids["Notes"], 'label': "big", 'content': "x" * 5000 + " needle"}] +
+            [{'category_id': ids["Secrets"], 'label': "token", 'content': "needle", 'is_sensitive': True}] +
+            [{'category_id': ids["Misc_1"], 'label': "misc", 'content': "100% done", 'tags': ["ops"]}]
+        )
+        manager = DashboardManager(db)
+
+        def loaded(structure):
+            return {category['name'] for category in structure['categories'] if category['items'] is not None}
+
+        structure = manager.get_structure_summary()
+        matches = manager.search("COMPOSE", {}, structure)
+        assert loaded(structure) == {"Docker"}
+        assert [match[0] for match in matches] == ['item'] * 3
+
+        # Content matches, also inside content-store blobs; sensitive content is never searched
+        matches = manager.search("needle", {}, structure)
+        assert loaded(structure) == {"Docker", "Notes"}
+        assert [(match[0], structure['categories'][match[1]]['name']) for match in matches] == [('content', "Notes")]
+
+        # Category names and tags match without loading items; LIKE wildcards are literal
+        manager.search("misc_", {'items': False, 'content': False, 'tags': False, 'lists': False}, structure)
+        assert loaded(structure) == {"Docker", "Notes"}
+        manager.search("0%", {}, structure)
+        assert loaded(structure) == {"Docker", "Notes", "Misc_1"}
+        manager.search("ops", {'tags': True, 'items': False, 'content': False, 'lists': False}, structure)
+        assert loaded(structure) == {"Docker", "Notes", "Misc_1"}
+
+        # Fuzzy searches need every label
+        manager.search("comit", {'fuzzy': True}, structure)
+        assert manager.is_fully_loaded(structure)
+
+        # Same matches as a search over the fully loaded structure
+        for query in ("compose 1", "git", "needle", "o", "0%", "misc_"):
+            lazy = DashboardManager(db)
+            full = DashboardManager(db)
+            assert lazy.search(query, {}, lazy.get_structure_summary()) == \
+                full.search(query, {}, full.get_full_structure()), query
+        db.close()
+
+    print("[OK] Search loads only candidate categories")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Structure Dashboard")
+    print("=" * 60)
+
+    test_incremental_search_highlighting()
+    test_expanding_materializes_only_that_category()
+    test_search_loads_only_candidate_categories()
+
+    print("\nAll structure dashboard tests passed")
+
+
+if __name__ == '__main__':
+    main()
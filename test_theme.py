@@ -0,0 +1,175 @@
+"""
+Test the application theme (compiled stylesheet, dynamic-property states)
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+
+from database.db_manager import DBManager
+from models.item import Item, ItemType
+from views import theme
+from views.theme import apply_theme, compile_stylesheet, set_state
+
+
+def get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def background(widget, x=None, y=2) -> str:
+    """Color of a pixel of the rendered widget"""
+    image = widget.grab().toImage()
+    x = image.width() - 3 if x is None else x
+    return QColor(image.pixel(x, y)).name()
+
+
+def test_compiled_stylesheet():
+    """The stylesheet is compiled once and installed once"""
+    app = get_app()
+    sheet = compile_stylesheet()
+    assert compile_stylesheet() is sheet
+    assert 'ItemButton[state="copied"]' in sheet
+    assert 'ItemButton QPushButton[action="execute"][state="success"]' in sheet
+    assert '$' not in sheet  # Every token substituted
+
+    app.setProperty('widgetSidebarTheme', None)
+    assert apply_theme(app) is True
+    assert apply_theme(app) is False
+    assert app.styleSheet() == sheet
+
+    print("[OK] Compiled stylesheet")
+
+
+def test_item_button_states():
+    """ItemButton states switch by property, without stylesheet strings"""
+    from views.widgets.item_widget import ItemButton
+
+    app = get_app()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            DBManager("widget_sidebar.db").close()
+            colors = theme.THEMES['dark']['colors']
+
+            button = ItemButton(Item("1", "Deploy", "echo deploy", ItemType.CODE, tags=["ops"]))
+            sensitive = ItemButton(Item("2", "Token", "secret", ItemType.TEXT, is_sensitive=True))
+            for widget in (button, sensitive):
+                widget.resize(400, 60)
+                widget.show()
+            app.processEvents()
+
+            # No per-widget stylesheets
+            assert button.styleSheet() == "" and sensitive.styleSheet() == ""
+            assert all(child.styleSheet() == "" for child in button.findChildren(QWidget))
+
+            # (The offscreen cursor may hover the frames)
+            assert background(button) in (colors['surface'], colors['surface_hover'])
+            assert background(sensitive) in (colors['sensitive'], colors['sensitive_hover'])
+
+            button.show_copied_feedback()
+            sensitive.show_copied_feedback()
+            assert background(button) == colors['accent']
+            assert background(sensitive) == colors['warning']
+            label = button.label_widget
+            assert label.palette().color(label.foregroundRole()).name() == colors['text_strong']
+
+            button.reset_style()
+            sensitive.reset_style()
+            assert background(button) in (colors['surface'], colors['surface_hover'])
+            assert background(sensitive) in (colors['sensitive'], colors['sensitive_hover'])
+            assert label.palette().color(label.foregroundRole()).name() == colors['text']
+
+            # Action button flash states
+            execute = button.execute_button
+            assert background(execute, 5, 30) == theme.THEMES['dark']['actions']['execute'][0]
+            set_state(execute, "success")
+            assert background(execute, 5, 30) == "#00ff00"
+            set_state(execute, "")
+            assert background(execute, 5, 30) == theme.THEMES['dark']['actions']['execute'][0]
+
+            # Tags keep their own rule
+            tag = next(child for child in button.findChildren(QLabel) if child.text() == "ops")
+            assert background(tag, 3, 3) == colors['accent']
+
+            button.close()
+            sensitive.close()
+        finally:
+            os.chdir(cwd)
+
+    print("[OK] ItemButton states")
+
+
+def test_list_widget_theme():
+    """ListWidget and its steps take their rules from the app stylesheet"""
+    from views.widgets.list_widget import ListWidget
+
+    app = get_app()
+    steps = [{'orden_lista': n, 'label': f"Paso {n}", 'content': "echo", 'type': "CODE"} for n in range(3)]
+    widget = ListWidget({'list_group': "Deploy", 'item_count': 3}, 1, steps)
+    widget.resize(400, 80)
+    widget.show()
+    app.processEvents()
+
+    assert widget.styleSheet() == ""
+    assert all(child.styleSheet() == "" for child in widget.findChildren(QWidget))
+    assert background(widget, 20, 20) == theme.THEMES['dark']['colors']['list_surface']
+
+    widget.close()
+    print("[OK] ListWidget theme")
+
+
+def test_creation_benchmark():
+    """Time the creation of a panel of ItemButtons"""
+    from views.widgets.item_widget import ItemButton
+
+    app = get_app()
+    cwd = os.getcwd()
+    types = [ItemType.CODE, ItemType.URL, ItemType.PATH, ItemType.TEXT]
+    items = [Item(str(i), f"item {i}", f"echo {i}", types[i % 4], tags=["a", "b"] if i % 2 else [],
+                  is_sensitive=i % 10 == 0) for i in range(300)]
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            DBManager("widget_sidebar.db").close()
+            host = QWidget()
+            layout = QVBoxLayout(host)
+            start = time.perf_counter()
+            for item in items:
+                layout.addWidget(ItemButton(item))
+            host.resize(400, 800)
+            host.show()
+            app.processEvents()
+            elapsed = time.perf_counter() - start
+            host.close()
+        finally:
+            os.chdir(cwd)
+
+    print(f"  300 ItemButtons created and shown in {elapsed * 1e3:.0f} ms")
+    print("[OK] Creation benchmark")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Theme")
+    print("=" * 60)
+
+    test_compiled_stylesheet()
+    test_item_button_states()
+    test_list_widget_theme()
+    test_creation_benchmark()
+
+    print("\nAll theme tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Test diff-based ConfigManager.update_category (only changed rows are written)
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.config_manager import ConfigManager
+from models.item import Item, ItemType
+
+
+def create_category(config: ConfigManager, count: int) -> str:
+    """Create a category with `count` items (one of them sensitive) and return its ID"""
+    cat_id = config.db.add_category("Diff Cat", "🧮")
+    config.db.add_items_bulk([
+        {'category_id': cat_id, 'label': f"Item {i}", 'content': f"content {i}",
+         'tags': ['t'], 'is_sensitive': i == 0}
+        for i in range(count)
+    ])
+    return str(cat_id)
+
+
+def test_single_edit_writes_one_row():
+    """Editing one label of a 2,000-item category writes one row"""
+    config = ConfigManager(db_path=":memory:")
+    cat_id = create_category(config, 2000)
+    category = config.get_category(cat_id)
+    ids_before = [item.id for item in category.items]
+    secret_before = config.db.execute_query(
+        "SELECT content FROM items WHERE id = ?", (int(ids_before[0]),)
+    )[0]['content']
+
+    category.items[500].label = "Edited"
+    conn = config.db.connect()
+    changes_before = conn.total_changes
+    assert config.update_category(cat_id, category)
+    assert conn.total_changes - changes_before == 1
+
+    category = config.get_category(cat_id)
+    assert [item.id for item in category.items] == ids_before
+    assert category.items[500].label == "Edited"
+
+    # Sensitive content was not re-encrypted
+    secret_after = config.db.execute_query(
+        "SELECT content FROM items WHERE id = ?", (int(ids_before[0]),)
+    )[0]['content']
+    assert secret_after == secret_before
+    config.close()
+
+    print("[OK] Single edit writes one row")
+
+
+def test_insert_update_delete():
+    """Added items are inserted, removed items deleted, unchanged items kept"""
+    config = ConfigManager(db_path=":memory:")
+    cat_id = create_category(config, 5)
+    category = config.get_category(cat_id)
+
+    removed = category.items.pop(1)
+    category.items[0].is_sensitive = False  # Content must be stored decrypted
+    new_item = Item("item_new", "Brand new", "fresh", ItemType.URL)
+    category.items.append(new_item)
+
+    assert config.update_category(cat_id, category)
+    assert new_item.id.isdigit()
+
+    stored = config.db.get_items_by_category(int(cat_id))
+    stored_ids = [str(row['id']) for row in stored]
+    assert removed.id not in stored_ids
+    assert stored_ids == [item.id for item in category.items]
+    assert stored[0]['content'] == "content 0" and not stored[0]['is_sensitive']
+    assert stored[-1]['type'] == "URL"
+
+    # Saving again without changes writes nothing
+    conn = config.db.connect()
+    changes_before = conn.total_changes
+    assert config.update_category(cat_id, config.get_category(cat_id))
+    assert conn.total_changes == changes_before
+    config.close()
+
+    print("[OK] Insert/update/delete reconciliation")
+
+
+def test_list_items_preserved():
+    """List membership survives a category update"""
+    config = ConfigManager(db_path=":memory:")
+    cat_id = int(create_category(config, 2))
+    config.db.create_list(cat_id, "Pasos", [{'label': "Paso 1", 'content': "a"}, {'label': "Paso 2", 'content': "b"}])
+
+    category = config.get_category(str(cat_id))
+    assert config.update_category(str(cat_id), category)
+    assert len(config.db.get_list_items(cat_id, "Pasos")) == 2
+    config.close()
+
+    print("[OK] List items preserved")
+
+
+def test_editor_copies_leave_shared_items_untouched():
+    """Edits on the category editor copies reach the shared Items only on save"""
+    from core.item_store import FLAG_FAVORITE
+    from views.category_editor import CategoryEditor
+
+    config = ConfigManager(db_path=":memory:")
+    cat_id = config.db.add_category("Editor Cat", "✏️")
+    config.db.add_items_bulk([
+        {'category_id': cat_id, 'label': f"Item {i}", 'content': f"content {i}", 'tags': ['t']}
+        for i in range(3)
+    ])
+    shared = config.get_category(str(cat_id))
+    copy = CategoryEditor._editable_copy(shared)
+    shared_item = config.item_store.get(copy.items[1].id)
+    assert copy.items[1] is not shared_item
+    row = config.item_store.row_of(shared_item.id)
+
+    # Unsaved edits (or a cancelled dialog) do not leak into the shared store
+    copy.items[1].label = "Edited"
+    copy.items[1].is_favorite = True
+    copy.items[1].tags.append("nuevo")
+    assert shared_item.label == "Item 1" and shared_item.tags == ['t']
+    assert not config.item_store.flags[row] & FLAG_FAVORITE
+
+    # Saving writes back through update_category and refreshes the store
+    assert config.update_category(str(cat_id), copy)
+    assert config.item_store.get(shared_item.id) is shared_item
+    assert shared_item.label == "Edited" and shared_item.tags == ['t', 'nuevo']
+    assert config.item_store.flags[row] & FLAG_FAVORITE
+    config.close()
+
+    print("[OK] Editor copies leave shared items untouched")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Diff-based update_category")
+    print("=" * 60)
+
+    test_single_edit_writes_one_row()
+    test_insert_update_delete()
+    test_list_items_preserved()
+    test_editor_copies_leave_shared_items_untouched()
+
+    print("\nAll update_category diff tests passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""
+Test vectorized (NumPy) filtering and ranking over the item store columns
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core import item_columns, stats_manager
+from core.advanced_filter_engine import AdvancedFilterEngine
+from core.item_store import ItemStore
+from database.db_manager import DBManager
+
+
+def make_row(i: int):
+    """Item row with varied type, flags, tags and usage"""
+    return {
+        'id': i + 1, 'category_id': 1, 'label': f"Item {i:05d}", 'content': f"content {i}",
+        'type': ('TEXT', 'URL', 'CODE', 'PATH')[i % 4], 'is_sensitive': int(i % 9 == 0),
+        'is_favorite': int(i % 5 == 0), 'tags': ['git'] if i % 3 == 0 else (['docker'] if i % 3 == 1 else []),
+        'is_list': int(i % 11 == 0), 'use_count': (i * 7) % 50,
+        'last_used': f"2026-0{1 + i % 9}-15 10:00:00" if i % 6 else None,
+        'created_at': f"2025-0{1 + i % 9}-01 08:00:00",
+    }
+
+
+def create_store(count: int):
+    store = ItemStore()
+    items = store.upsert_rows(make_row(i) for i in range(count))
+    return store, items
+
+
+FILTER_CASES = [
+    {'type': ['URL', 'code']},
+    {'is_favorite': True, 'has_tags': True},
+    {'is_sensitive': False, 'is_list': False, 'sort_by': 'label_desc', 'top_n': 7},
+    {'tags': {'values': ['git'], 'mode': 'OR'}, 'type': ['TEXT']},
+    {'use_count': {'operator': '>=', 'value': 40}, 'sort_by': 'use_count_desc'},
+    {'use_count': {'operator': '>', 'value': 10}, 'sort_by': 'use_count_asc', 'top_n': 15},
+    {'last_used': {'preset': 'never'}},
+    {'created_at': {'custom_from': item_columns.datetime(2025, 3, 1), 'custom_to': item_columns.datetime(2025, 5, 1)},
+     'sort_by': 'oldest'},
+    {'last_used': {'custom_from': item_columns.datetime(2026, 2, 1), 'custom_to': item_columns.datetime(2026, 12, 31)},
+     'sort_by': 'recent', 'top_n': 20},
+]
+
+
+def expected_labels(rows, filters):
+    """Reference implementation over the raw rows"""
+    def keep(row):
+        if filters.get('type') and row['type'] not in [t.upper() for t in filters['type']]:
+            return False
+        for key in ('is_favorite', 'is_sensitive', 'is_list'):
+            if key in filters and bool(row[key]) != filters[key]:
+                return False
+        if 'has_tags' in filters and bool(row['tags']) != filters['has_tags']:
+            return False
+        if 'tags' in filters and not set(filters['tags']['values']) & set(row['tags']):
+            return False
+        if 'use_count' in filters:
+            op = item_columns.COMPARISONS[filters['use_count']['operator']]
+            if not op(row['use_count'], filters['use_count']['value']):
+                return False
+        for key in ('last_used', 'created_at'):
+            if key not in filters:
+                continue
+            if filters[key].get('preset') == 'never':
+                if row['use_count'] != 0:
+                    return False
+                continue
+            value = item_columns.datetime.fromisoformat(row[key]) if row[key] else None
+            if value is None or not filters[key]['custom_from'] <= value <= filters[key]['custom_to']:
+                return False
+        return True
+
+    result = [row for row in rows if keep(row)]
+    sort_by = filters.get('sort_by')
+    keys = {
+        'use_count_desc': (lambda r: r['use_count'], True), 'use_count_asc': (lambda r: r['use_count'], False),
+        'recent': (lambda r: r['last_used'] or '', True), 'oldest': (lambda r: r['created_at'], False),
+        'label_desc': (lambda r: r['label'].lower(), True),
+    }
+    if sort_by:
+        key, reverse = keys[sort_by]
+        result = sorted(result, key=key, reverse=reverse)
+    if filters.get('top_n'):
+        result = result[:filters['top_n']]
+    return [row['label'] for row in result]
+
+
+def test_column_filters_match_reference():
+    """Column filters (NumPy and pure-Python fallback) give the reference results"""
+    rows = [make_row(i) for i in range(600)]
+    store, items = create_store(600)
+
+    for use_numpy in (True, False) if item_columns.HAS_NUMPY else (False,):
+        item_columns.HAS_NUMPY = use_numpy
+        try:
+            engine = AdvancedFilterEngine(item_store=store)
+            for filters in FILTER_CASES:
+                result = [item.label for item in engine.apply_filters(items, filters)]
+                assert result == expected_labels(rows, filters), filters
+        finally:
+            item_columns.HAS_NUMPY = item_columns.np is not None
+
+    # Items that aren't the store's shared objects use the per-item filters
+    engine = AdvancedFilterEngine(item_store=store)
+    detached = [item_columns.ItemStore().upsert_row(make_row(0))]
+    assert engine.apply_filters(detached, {'type': ['TEXT']}) == detached
+
+    print("[OK] Column filters match the reference")
+
+
+def test_top_k():
+    """top_k returns the highest scores first, ties by lowest index"""
+    scores = [5, 1, 9, 5, 7, 9, 0, 5]
+    assert list(item_columns.top_k(scores, 4)) == [2, 5, 4, 0]
+    assert list(item_columns.top_k(scores, 6)) == [2, 5, 4, 0, 3, 7]
+    assert list(item_columns.top_k(scores, None)) == [2, 5, 4, 0, 3, 7, 1, 6]
+    assert list(item_columns.top_k(scores, 0)) == []
+
+    print("[OK] top_k")
+
+
+def test_stats_ranking_matches_sql():
+    """The NumPy ranking returns the same items as the SQL aggregations"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "stats.db")
+        db = DBManager(db_path)
+        cat_id = db.add_category("Stats", "📊")
+        ids = db.add_items_bulk([{'category_id': cat_id, 'label': f"Item {i}", 'content': "x"} for i in range(40)])
+        db.close()
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS item_usage_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, item_id INTEGER, used_at TIMESTAMP,
+                execution_time_ms INTEGER, success INTEGER, error_message TEXT
+            )
+        """)
+        for n, item_id in enumerate(ids):
+            conn.execute("UPDATE items SET use_count = ?, last_used = datetime('now', ?) WHERE id = ?",
+                         (n * 3 + 11, f"-{n} minutes", item_id))
+            for k in range(n % 9):
+                # Usos repartidos entre hoy, esta semana y este mes
+                conn.execute("INSERT INTO item_usage_history (item_id, used_at) VALUES (?, datetime('now', ?))",
+                             (item_id, f"-{(k * 5 + n) % 25} days"))
+        conn.execute("INSERT INTO item_usage_history (item_id, used_at) VALUES (99999, datetime('now'))")
+        conn.commit()
+        conn.close()
+
+        stats = stats_manager.StatsManager(db_path)
+        ranked = stats.get_most_used_by_period(limit=8)
+        suggestions = stats.suggest_favorites(limit=5)
+
+        stats_manager.HAS_NUMPY = False
+        try:
+            for period, items in ranked.items():
+                expected = stats.get_most_used_items(limit=8, period=period)
+                assert [item['id'] for item in items] == [item['id'] for item in expected], period
+                assert all(item.get('recent_uses') == ref.get('recent_uses') for item, ref in zip(items, expected))
+            expected = stats.suggest_favorites(limit=5)
+            assert [(i['id'], i['uses_last_30_days']) for i in suggestions] == \
+                   [(i['id'], i['uses_last_30_days']) for i in expected]
+            assert suggestions
+        finally:
+            stats_manager.HAS_NUMPY = item_columns.HAS_NUMPY
+
+    print("[OK] Stats ranking matches SQL")
+
+
+def test_filter_benchmark_100k():
+    """Filter masks over 100k items take well under a millisecond"""
+    store, _ = create_store(100_000)
+    columns = item_columns.snapshot(store)
+    filters = {'type': ['URL', 'CODE'], 'is_favorite': False, 'use_count': {'operator': '>', 'value': 5},
+               'last_used': {'preset': 'last_90_days'}}
+
+    timings = []
+    for _ in range(20):
+        start = time.perf_counter()
+        mask = item_columns.build_mask(columns, filters)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    median = timings[len(timings) // 2]
+
+    start = time.perf_counter()
+    top = item_columns.top_k(columns.use_counts, 20)
+    top_time = time.perf_counter() - start
+
+    backend = "NumPy" if item_columns.HAS_NUMPY else "Python"
+    print(f"  [{backend}] mask: {median * 1e3:.3f} ms, top-20: {top_time * 1e3:.3f} ms "
+          f"({int(sum(mask))} matches of 100k)")
+    assert len(top) == 20
+    if item_columns.HAS_NUMPY:
+        assert median < 0.005
+
+    print("[OK] Filter benchmark")
+
+
+def main():
+    print("=" * 60)
+    print("TEST: Vectorized Filters")
+    print("=" * 60)
+
+    test_column_filters_match_reference()
+    test_top_k()
+    test_stats_ranking_matches_sql()
+    test_filter_benchmark_100k()
+
+    print("\nAll vectorized filter tests passed")
+
+
+if __name__ == '__main__':
+    main()